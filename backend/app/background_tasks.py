@@ -1,13 +1,15 @@
 """
 Background Tasks for Periodic Operations
-Handles automatic Obsidian sync every 1-2 hours
+Handles automatic Obsidian sync every 1-2 hours and periodic retraining
+of the Uncertainty Map ML predictor
 """
 
 import asyncio
 import logging
+from concurrent.futures import Executor, ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 import subprocess
 
 logger = logging.getLogger(__name__)
@@ -205,3 +207,175 @@ async def stop_background_sync():
     if background_sync_task is not None:
         await background_sync_task.stop()
         background_sync_task = None
+
+
+class PredictorTrainingTask:
+    """
+    Periodic retraining of the Uncertainty Map ML predictor
+
+    Fitting runs in a worker process so API requests keep being served by
+    the current model; a new model is swapped in only if its holdout score
+    passes ``min_holdout_r2``.
+    """
+
+    def __init__(
+        self,
+        uncertainty_map,
+        interval_seconds: int = 3600,
+        min_samples: int = 50,
+        holdout_fraction: float = 0.2,
+        min_holdout_r2: float = 0.0,
+        executor: Optional[Executor] = None,
+    ):
+        """
+        Initialize predictor training task
+
+        Args:
+            uncertainty_map: Live UncertaintyMapV3 instance to retrain
+            interval_seconds: Seconds between training runs (default: 1 hour)
+            min_samples: Skip training until this many samples exist
+            holdout_fraction: Share of samples held out for validation
+            min_holdout_r2: Minimum holdout R^2 required to install a model
+            executor: Executor for fitting (default: single-worker process pool)
+        """
+        self.uncertainty_map = uncertainty_map
+        self.interval_seconds = interval_seconds
+        self.min_samples = min_samples
+        self.holdout_fraction = holdout_fraction
+        self.min_holdout_r2 = min_holdout_r2
+        self.executor = executor
+        self._owns_executor = executor is None
+        self.task: Optional[asyncio.Task] = None
+        self.running = False
+        self.last_run: Optional[datetime] = None
+        self.last_result: Optional[Dict[str, Any]] = None
+
+    async def start(self):
+        """Start the background training task"""
+        if self.running:
+            logger.warning("Predictor training task already running")
+            return
+
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=1)
+        self.running = True
+        self.task = asyncio.create_task(self._training_loop())
+        logger.info(f"[OK] Predictor training started (interval: {self.interval_seconds}s)")
+
+    async def stop(self):
+        """Stop the background training task"""
+        if not self.running:
+            return
+
+        self.running = False
+        if self.task:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+        if self._owns_executor and self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+        logger.info("[*] Predictor training stopped")
+
+    async def _training_loop(self):
+        """Main training loop - runs every interval"""
+        try:
+            while self.running:
+                await asyncio.sleep(self.interval_seconds)
+                await self.train_once()
+
+        except asyncio.CancelledError:
+            logger.info("Predictor training loop cancelled")
+        except Exception as e:
+            logger.error(f"Error in predictor training loop: {e}")
+
+    async def train_once(self) -> Dict[str, Any]:
+        """
+        Fit a new predictor off the event loop and install it if it validates
+
+        Returns:
+            Result dict with "status" (skipped/rejected/installed/failed) and metrics
+        """
+        # Same module copy integrated_udo_system loaded the live map from (src/ is on sys.path)
+        try:
+            from uncertainty_map_v3 import fit_uncertainty_predictor
+        except ImportError:
+            from src.uncertainty_map_v3 import fit_uncertainty_predictor
+
+        self.last_run = datetime.now()
+        # Building the training set walks every stored observation; keep it off the event loop
+        features, labels = await asyncio.to_thread(self.uncertainty_map.training_data)
+
+        if len(labels) < self.min_samples:
+            result = {"status": "skipped", "samples": len(labels), "min_samples": self.min_samples}
+        else:
+            try:
+                loop = asyncio.get_running_loop()
+                fitted = await loop.run_in_executor(
+                    self.executor, fit_uncertainty_predictor, features, labels, self.holdout_fraction
+                )
+                metrics = {k: v for k, v in fitted.items() if k not in ("scaler", "predictor")}
+
+                if fitted["holdout_r2"] < self.min_holdout_r2:
+                    result = {"status": "rejected", **metrics}
+                else:
+                    self.uncertainty_map.install_predictor(
+                        fitted["scaler"], fitted["predictor"], fitted["feature_count"], metrics=metrics
+                    )
+                    result = {"status": "installed", **metrics}
+            except Exception as e:
+                logger.error(f"Predictor training failed: {e}")
+                result = {"status": "failed", "error": str(e)}
+
+        self.last_result = result
+        logger.info(f"[*] Predictor training run: {result['status']}")
+        return result
+
+    def get_status(self) -> dict:
+        """Get current status of predictor training"""
+        return {
+            "running": self.running,
+            "interval_seconds": self.interval_seconds,
+            "last_run": self.last_run.isoformat() if self.last_run else None,
+            "last_result": self.last_result,
+        }
+
+
+# Global instance
+predictor_training_task: Optional[PredictorTrainingTask] = None
+
+
+def get_predictor_training() -> Optional[PredictorTrainingTask]:
+    """Get global predictor training task instance"""
+    return predictor_training_task
+
+
+async def start_predictor_training(uncertainty_map, interval_seconds: int = 3600):
+    """
+    Start periodic predictor training for an UncertaintyMapV3 instance
+
+    Args:
+        uncertainty_map: Live UncertaintyMapV3 instance
+        interval_seconds: Seconds between training runs (default: 3600)
+    """
+    global predictor_training_task
+
+    if predictor_training_task is not None:
+        logger.warning("Predictor training already initialized")
+        return predictor_training_task
+
+    predictor_training_task = PredictorTrainingTask(uncertainty_map, interval_seconds=interval_seconds)
+    await predictor_training_task.start()
+
+    return predictor_training_task
+
+
+async def stop_predictor_training():
+    """Stop predictor training task"""
+    global predictor_training_task
+
+    if predictor_training_task is not None:
+        await predictor_training_task.stop()
+        predictor_training_task = None
@@ -3,15 +3,18 @@ Cache Manager with 50MB limit and LRU eviction policy (P0 Critical Issue #2).
 
 Features:
 - Maximum 50MB memory limit
+- Optional entry-count limit
 - LRU (Least Recently Used) eviction policy
-- Automatic eviction when size limit exceeded
+- Automatic eviction when size or count limit exceeded
+- Negative caching of known misses (with TTL)
 - Thread-safe operations
 """
 
 import sys
+import time
 from collections import OrderedDict
 from threading import Lock
-from typing import Any, Optional
+from typing import Any, List, Optional
 
 
 class CacheManager:
@@ -28,16 +31,30 @@ class CacheManager:
     """
 
     MAX_SIZE_BYTES = 50 * 1024 * 1024  # 50MB default
-
-    def __init__(self, max_size_bytes: Optional[int] = None):
+    MAX_NEGATIVE_ENTRIES = 1024
+    NEGATIVE_TTL_SECONDS = 60.0
+
+    def __init__(
+        self,
+        max_size_bytes: Optional[int] = None,
+        max_entries: Optional[int] = None,
+        negative_ttl_seconds: Optional[float] = None,
+    ):
         """
         Initialize cache manager.
 
         Args:
             max_size_bytes: Maximum cache size in bytes (default: 50MB)
+            max_entries: Maximum number of entries (default: unbounded)
+            negative_ttl_seconds: Lifetime of a known-miss marker (default: 60s)
         """
         self.max_size_bytes = max_size_bytes or self.MAX_SIZE_BYTES
+        self.max_entries = max_entries
+        self.negative_ttl_seconds = (
+            self.NEGATIVE_TTL_SECONDS if negative_ttl_seconds is None else negative_ttl_seconds
+        )
         self._cache: OrderedDict[str, tuple[Any, int]] = OrderedDict()
+        self._negative: OrderedDict[str, float] = OrderedDict()  # key -> expiry
         self._current_size = 0
         self._lock = Lock()
 
@@ -45,6 +62,7 @@ class CacheManager:
         self._hits = 0
         self._misses = 0
         self._evictions = 0
+        self._negative_hits = 0
 
     def get(self, key: str) -> Optional[Any]:
         """
@@ -70,19 +88,21 @@ class CacheManager:
 
             return value
 
-    def set(self, key: str, value: Any) -> None:
+    def set(self, key: str, value: Any, size: Optional[int] = None) -> None:
         """
         Set value in cache with automatic eviction if needed.
 
         Args:
             key: Cache key
             value: Value to cache
+            size: Size in bytes to account for the value (default: sys.getsizeof,
+                which is shallow - pass a serialized size for nested objects)
 
         Raises:
             ValueError: If single value exceeds max_size_bytes
         """
         with self._lock:
-            value_size = sys.getsizeof(value)
+            value_size = sys.getsizeof(value) if size is None else size
 
             # Check if single value exceeds max size
             if value_size > self.max_size_bytes:
@@ -102,11 +122,16 @@ class CacheManager:
                 if not self._cache:
                     break  # Safety check
                 self._evict_lru()
+            while self.max_entries is not None and len(self._cache) >= self.max_entries:
+                if not self._cache:
+                    break  # Safety check
+                self._evict_lru()
 
             # Add new entry
             self._cache[key] = (value, value_size)
             self._cache.move_to_end(key)
             self._current_size += value_size
+            self._negative.pop(key, None)
 
     def delete(self, key: str) -> bool:
         """
@@ -119,6 +144,7 @@ class CacheManager:
             True if key existed and was deleted, False otherwise
         """
         with self._lock:
+            self._negative.pop(key, None)
             if key not in self._cache:
                 return False
 
@@ -131,8 +157,50 @@ class CacheManager:
         """Clear all entries from cache."""
         with self._lock:
             self._cache.clear()
+            self._negative.clear()
             self._current_size = 0
 
+    def values(self) -> List[Any]:
+        """Snapshot of cached values, least recently used first."""
+        with self._lock:
+            return [value for value, _ in self._cache.values()]
+
+    def mark_missing(self, key: str) -> None:
+        """
+        Remember that key is absent from the backing store (negative caching).
+
+        The marker expires after negative_ttl_seconds and is cleared by set()
+        or delete(); the oldest markers are dropped beyond MAX_NEGATIVE_ENTRIES.
+
+        Args:
+            key: Cache key known to be missing
+        """
+        with self._lock:
+            self._negative[key] = time.monotonic() + self.negative_ttl_seconds
+            self._negative.move_to_end(key)
+            while len(self._negative) > self.MAX_NEGATIVE_ENTRIES:
+                self._negative.popitem(last=False)
+
+    def is_missing(self, key: str) -> bool:
+        """
+        Check for an unexpired negative-cache marker.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if key was recently marked missing
+        """
+        with self._lock:
+            expires_at = self._negative.get(key)
+            if expires_at is None:
+                return False
+            if expires_at <= time.monotonic():
+                del self._negative[key]
+                return False
+            self._negative_hits += 1
+            return True
+
     def _evict_lru(self) -> None:
         """
         Evict least recently used entry.
@@ -186,6 +254,9 @@ class CacheManager:
             "max_size_bytes": self.max_size_bytes,
             "utilization": self.utilization,
             "entry_count": self.count,
+            "max_entries": self.max_entries,
+            "negative_hits": self._negative_hits,
+            "negative_entry_count": len(self._negative),
         }
 
     def reset_statistics(self) -> None:
@@ -194,6 +265,7 @@ class CacheManager:
             self._hits = 0
             self._misses = 0
             self._evictions = 0
+            self._negative_hits = 0
 
 
 # Global cache instance (can be imported and used across application)
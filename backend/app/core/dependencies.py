@@ -48,10 +48,13 @@ def get_time_tracking_service(
     """
     global _time_tracking_service
 
-    # Create new instance if pool is available
+    # Reuse one instance per pool so in-memory state (pause/resume sessions,
+    # metrics store) survives across requests
     if db and db._initialized:
         pool = db.get_pool()
-        return TimeTrackingService(pool=pool, obsidian_service=obsidian)
+        if _time_tracking_service is None or _time_tracking_service.pool is not pool:
+            _time_tracking_service = TimeTrackingService(pool=pool, obsidian_service=obsidian)
+        return _time_tracking_service
 
     # Return cached instance or create mock instance
     if _time_tracking_service is None:
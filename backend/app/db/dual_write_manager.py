@@ -6,24 +6,170 @@ Implements migration strategy from PRD_UNIFIED_ENHANCED Section 3.
 import asyncio
 import json
 import logging
+import random
 from datetime import UTC, datetime
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import asyncpg
-from redis import Redis
+
+from app.services.redis_client import RedisClient, RedisConfig
 
 logger = logging.getLogger(__name__)
 
 
+def context_file_key(data: Dict[str, Any]) -> str:
+    """file_path a context chunk is stored under (Redis hash field and PostgreSQL key)"""
+    return data.get("file_path") or ""
+
+
+class ConsistencyVerifier:
+    """
+    Sampled, rate-limited consistency verification between Redis and PostgreSQL.
+
+    Writes are sampled at ``sample_rate`` and queued on a bounded queue
+    (samples are dropped, not awaited, when it is full). A single background
+    worker drains the queue in batches and verifies each batch with one
+    pipelined Redis read and one PostgreSQL query.
+    """
+
+    def __init__(
+        self,
+        manager: "DualWriteManager",
+        sample_rate: float = 0.1,
+        max_queue_size: int = 1000,
+        batch_size: int = 50,
+    ):
+        self.manager = manager
+        self.sample_rate = sample_rate
+        self.batch_size = batch_size
+        self.max_queue_size = max_queue_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self.stats = {"submitted": 0, "sampled": 0, "dropped": 0, "checked": 0, "mismatches": 0, "missing": 0}
+
+    def submit(self, project_id: str, data: Dict[str, Any]) -> bool:
+        """Sample a successful write for verification. Returns True if queued."""
+        self.stats["submitted"] += 1
+        if random.random() >= self.sample_rate:
+            return False
+
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+        try:
+            self._queue.put_nowait((project_id, data))
+        except asyncio.QueueFull:
+            self.stats["dropped"] += 1
+            return False
+
+        self.stats["sampled"] += 1
+        return True
+
+    async def drain(self):
+        """Wait until every queued sample has been verified"""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def stop(self):
+        """Cancel the background worker"""
+        if self._worker and not self._worker.done():
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        self._worker = None
+
+    def get_status(self) -> Dict[str, Any]:
+        """Verification counters and mismatch rate for monitoring"""
+        checked = self.stats["checked"]
+        return {
+            **self.stats,
+            "sample_rate": self.sample_rate,
+            "queue_depth": self._queue.qsize() if self._queue else 0,
+            "mismatch_rate": self.stats["mismatches"] / checked if checked else 0.0,
+        }
+
+    async def _run(self):
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            try:
+                await self.verify_batch(batch)
+            except Exception as e:
+                logger.error(f"Consistency verification error: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def verify_batch(self, batch: List[Tuple[str, Dict[str, Any]]]):
+        """Verify a batch of writes with one Redis pipeline and one PostgreSQL query"""
+        keys = [(project_id, context_file_key(data)) for project_id, data in batch]
+
+        redis_rows = await self._read_redis_batch(keys)
+        postgres_rows = await self._read_postgres_batch(keys)
+
+        now = datetime.now(UTC)
+        for key, redis_data in zip(keys, redis_rows):
+            postgres_data = postgres_rows.get(key)
+            if not postgres_data or not redis_data:
+                self.stats["missing"] += 1
+                continue
+
+            # Chunks without a file_path are stored under "" in PostgreSQL and omit it in Redis
+            consistent = postgres_data.get("content_chunk") == redis_data.get("content") and (
+                postgres_data.get("file_path") or ""
+            ) == context_file_key(redis_data)
+
+            self.stats["checked"] += 1
+            if not consistent:
+                self.stats["mismatches"] += 1
+                logger.warning(f"Consistency check failed for {key[0]} ({key[1]})")
+
+            self.manager.consistency_checks.append({"timestamp": now, "consistent": consistent, "project_id": key[0]})
+
+        # Keep only last 100 checks
+        del self.manager.consistency_checks[:-100]
+
+    async def _read_redis_batch(self, keys: List[Tuple[str, str]]) -> List[Optional[Dict[str, Any]]]:
+        client = await self.manager._redis()
+        async with client.pipeline(transaction=False) as pipe:
+            for project_id, file_path in keys:
+                pipe.hget(f"project:{project_id}:context", file_path)
+            raw_rows = await pipe.execute()
+        return [json.loads(raw) if raw else None for raw in raw_rows]
+
+    async def _read_postgres_batch(self, keys: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        async with self.manager.postgres_pool.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT pc.project_id::text AS project_id, pc.file_path, pc.content_chunk
+                FROM project_contexts pc
+                JOIN unnest($1::text[], $2::text[]) AS k(project_id, file_path)
+                  ON pc.project_id = k.project_id::uuid AND pc.file_path = k.file_path
+            """,
+                [project_id for project_id, _ in keys],
+                [file_path for _, file_path in keys],
+            )
+        return {(row["project_id"], row["file_path"]): dict(row) for row in rows}
+
+
 class DualWriteManager:
     """
     Manages dual-write pattern during migration period.
     Provides safe transition from Redis/Mock to PostgreSQL with fallback.
     """
 
-    def __init__(self, postgres_url: str, redis_url: str):
+    # Redis context cache expiry (seconds)
+    REDIS_CONTEXT_TTL = 3600
+
+    def __init__(self, postgres_url: str, redis_url: str, verification_sample_rate: float = 0.1):
         self.postgres_url = postgres_url
-        self.redis = Redis.from_url(redis_url, decode_responses=True)
+        self.redis_client = RedisClient(RedisConfig.from_url(redis_url))
         self.postgres_pool: Optional[asyncpg.Pool] = None
 
         # Migration state tracking
@@ -32,10 +178,14 @@ class DualWriteManager:
 
         # Consistency verification
         self.consistency_checks = []
+        self.verifier = ConsistencyVerifier(self, sample_rate=verification_sample_rate)
         self.promotion_criteria = {"min_writes": 100, "success_rate": 0.95, "consistency_rate": 0.99}
 
     async def initialize(self):
         """Initialize database connections with retry logic"""
+        if not await self.redis_client.connect():
+            logger.warning("Redis not available for dual-write; Redis writes will fail until it reconnects")
+
         max_retries = 3
         retry_delay = 1.0
 
@@ -57,9 +207,16 @@ class DualWriteManager:
 
     async def close(self):
         """Gracefully close connections"""
+        await self.verifier.stop()
         if self.postgres_pool:
             await self.postgres_pool.close()
-        self.redis.close()
+        await self.redis_client.disconnect()
+
+    async def _redis(self):
+        """Return the connected async Redis connection"""
+        if not await self.redis_client.connect():
+            raise ConnectionError("Redis not available")
+        return self.redis_client._client
 
     async def write_project_context(self, project_id: str, data: Dict[str, Any]) -> Tuple[bool, str]:
         """
@@ -79,9 +236,9 @@ class DualWriteManager:
         # Execute writes in parallel
         results = await asyncio.gather(*write_tasks, return_exceptions=True)
 
-        # Process results
-        redis_success = not isinstance(results[0], Exception)
-        postgres_success = not isinstance(results[1], Exception)
+        # Process results (writers return False on handled errors)
+        redis_success = results[0] is True
+        postgres_success = results[1] is True
 
         # Update statistics
         if redis_success:
@@ -96,9 +253,9 @@ class DualWriteManager:
             self.write_stats["postgres"]["failure"] += 1
             logger.error(f"PostgreSQL write failed: {results[1]}")
 
-        # Verify consistency if both succeeded
-        if redis_success and postgres_success and not self.shadow_mode:
-            asyncio.create_task(self._verify_consistency(project_id, data))
+        # Sample for consistency verification if both succeeded
+        if redis_success and postgres_success:
+            self.verifier.submit(project_id, data)
 
         # Check promotion criteria periodically
         if self._should_check_promotion():
@@ -120,6 +277,113 @@ class DualWriteManager:
             else:
                 return False, "none"
 
+    async def write_project_contexts_bulk(self, project_id: str, items: List[Dict[str, Any]]) -> Tuple[bool, str]:
+        """
+        Dual-write many context chunks for one project as bulk operations.
+
+        Redis receives a single pipelined HSET + EXPIRE; PostgreSQL receives
+        one COPY into a staging table followed by one upsert. Returns
+        (success, primary_source) like write_project_context.
+        """
+        if not items:
+            return True, "redis" if self.shadow_mode else "postgres"
+
+        # Later chunks for the same file_path win, matching sequential writes
+        deduped = list({context_file_key(data): data for data in items}.values())
+
+        results = await asyncio.gather(
+            self._write_many_to_redis(project_id, deduped),
+            self._write_many_to_postgres(project_id, deduped),
+            return_exceptions=True,
+        )
+
+        redis_success = results[0] is True
+        postgres_success = results[1] is True
+
+        if redis_success:
+            self.write_stats["redis"]["success"] += len(deduped)
+        else:
+            self.write_stats["redis"]["failure"] += len(deduped)
+            logger.error(f"Redis bulk write failed for {project_id}: {results[0]}")
+
+        if postgres_success:
+            self.write_stats["postgres"]["success"] += len(deduped)
+        else:
+            self.write_stats["postgres"]["failure"] += len(deduped)
+            logger.error(f"PostgreSQL bulk write failed for {project_id}: {results[1]}")
+
+        if redis_success and postgres_success:
+            for data in deduped:
+                self.verifier.submit(project_id, data)
+
+        if self.shadow_mode:
+            return redis_success, "redis"
+        if postgres_success:
+            return True, "postgres"
+        if redis_success:
+            logger.warning("PostgreSQL bulk write failed, falling back to Redis")
+            return True, "redis_fallback"
+        return False, "none"
+
+    async def _write_many_to_postgres(self, project_id: str, items: List[Dict[str, Any]]) -> bool:
+        """COPY chunks into a staging table, then upsert them in one statement"""
+        now = datetime.now(UTC)
+        records = [
+            (
+                project_id,
+                context_file_key(data),
+                data.get("content", ""),
+                json.dumps(data.get("metadata", {})),
+                (
+                    "[" + ",".join(str(float(x)) for x in data["embedding"]) + "]"
+                    if isinstance(data.get("embedding"), list)
+                    else None
+                ),
+                now,
+            )
+            for data in items
+        ]
+
+        try:
+            async with self.postgres_pool.acquire() as conn:
+                async with conn.transaction():
+                    await conn.execute(
+                        """
+                        CREATE TEMP TABLE project_contexts_stage (
+                            project_id TEXT,
+                            file_path TEXT,
+                            content_chunk TEXT,
+                            metadata TEXT,
+                            embedding TEXT,
+                            created_at TIMESTAMPTZ
+                        ) ON COMMIT DROP
+                    """
+                    )
+                    await conn.copy_records_to_table(
+                        "project_contexts_stage",
+                        records=records,
+                        columns=["project_id", "file_path", "content_chunk", "metadata", "embedding", "created_at"],
+                    )
+                    await conn.execute(
+                        """
+                        INSERT INTO project_contexts
+                        (project_id, file_path, content_chunk, metadata, embedding, created_at)
+                        SELECT project_id::uuid, file_path, content_chunk, metadata::jsonb,
+                               embedding::vector, created_at
+                        FROM project_contexts_stage
+                        ON CONFLICT (project_id, file_path)
+                        DO UPDATE SET
+                            content_chunk = EXCLUDED.content_chunk,
+                            metadata = EXCLUDED.metadata,
+                            embedding = COALESCE(EXCLUDED.embedding, project_contexts.embedding),
+                            created_at = EXCLUDED.created_at
+                    """
+                    )
+            return True
+        except Exception as e:
+            logger.error(f"PostgreSQL bulk write error: {e}", exc_info=True)
+            return False
+
     async def _write_to_postgres(self, project_id: str, data: Dict[str, Any]) -> bool:
         """Write to PostgreSQL (primary mode)"""
         try:
@@ -137,7 +401,7 @@ class DualWriteManager:
                         created_at = EXCLUDED.created_at
                 """,
                     project_id,
-                    data.get("file_path", ""),
+                    context_file_key(data),
                     data.get("content", ""),
                     json.dumps(data.get("metadata", {})),
                     datetime.now(UTC),
@@ -156,7 +420,7 @@ class DualWriteManager:
                         """,
                             embedding,
                             project_id,
-                            data.get("file_path", ""),
+                            context_file_key(data),
                         )
 
             return True
@@ -179,16 +443,23 @@ class DualWriteManager:
 
     async def _write_to_redis(self, project_id: str, data: Dict[str, Any]) -> bool:
         """Write to Redis (current system)"""
+        return await self._write_many_to_redis(project_id, [data])
+
+    async def _write_many_to_redis(self, project_id: str, items: List[Dict[str, Any]]) -> bool:
+        """Write context chunks to Redis with one pipelined HSET + EXPIRE"""
         try:
             # Create Redis key
             key = f"project:{project_id}:context"
 
             # Store as hash with file_path as field
-            file_path = data.get("file_path", "default")
-            self.redis.hset(key, file_path, json.dumps(data))
+            mapping = {context_file_key(data): json.dumps(data) for data in items}
 
-            # Set expiry for cache (1 hour)
-            self.redis.expire(key, 3600)
+            client = await self._redis()
+            async with client.pipeline(transaction=False) as pipe:
+                pipe.hset(key, mapping=mapping)
+                # Set expiry for cache (1 hour)
+                pipe.expire(key, self.REDIS_CONTEXT_TTL)
+                await pipe.execute()
 
             return True
         except Exception as e:
@@ -258,13 +529,14 @@ class DualWriteManager:
         """Read from Redis"""
         try:
             key = f"project:{project_id}:context"
+            client = await self._redis()
 
             if file_path:
-                data = self.redis.hget(key, file_path)
+                data = await client.hget(key, file_path)
                 if data:
                     return json.loads(data)
             else:
-                all_data = self.redis.hgetall(key)
+                all_data = await client.hgetall(key)
                 if all_data:
                     return {k: json.loads(v) for k, v in all_data.items()}
 
@@ -274,33 +546,12 @@ class DualWriteManager:
 
     async def _verify_consistency(self, project_id: str, data: Dict[str, Any]):
         """
-        Verify data consistency between PostgreSQL and Redis.
-        Part of migration validation strategy.
+        Verify data consistency between PostgreSQL and Redis for one write.
+        Part of migration validation strategy; bulk traffic goes through
+        the sampled ConsistencyVerifier instead.
         """
         try:
-            # Read from both sources
-            postgres_data = await self._read_from_postgres(project_id, data.get("file_path"))
-            redis_data = await self._read_from_redis(project_id, data.get("file_path"))
-
-            # Compare core fields
-            if postgres_data and redis_data:
-                consistent = postgres_data.get("content_chunk") == redis_data.get("content") and postgres_data.get(
-                    "file_path"
-                ) == redis_data.get("file_path")
-
-                self.consistency_checks.append(
-                    {"timestamp": datetime.now(UTC), "consistent": consistent, "project_id": project_id}
-                )
-
-                # Keep only last 100 checks
-                if len(self.consistency_checks) > 100:
-                    self.consistency_checks.pop(0)
-
-                if not consistent:
-                    logger.warning(
-                        f"Consistency check failed for {project_id}", postgres_data=postgres_data, redis_data=redis_data
-                    )
-
+            await self.verifier.verify_batch([(project_id, data)])
         except Exception as e:
             logger.error(f"Consistency verification error: {e}")
 
@@ -384,4 +635,5 @@ class DualWriteManager:
             "recent_consistency": len([c for c in self.consistency_checks[-10:] if c["consistent"]])
             / max(len(self.consistency_checks[-10:]), 1),
             "ready_for_promotion": pg_success_rate >= self.promotion_criteria["success_rate"],
+            "consistency_verification": self.verifier.get_status(),
         }
@@ -6,7 +6,7 @@ API models for Uncertainty Map v3.0 integration
 
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -220,6 +220,21 @@ class ContextAnalysisRequest(BaseModel):
         }
 
 
+class BatchContextAnalysisRequest(BaseModel):
+    """Request for analyzing many contexts in one call"""
+
+    contexts: List[ContextAnalysisRequest] = Field(..., min_length=1, max_length=1000)
+    hours: int = Field(default=24, ge=1, le=720, description="Prediction horizon in hours")
+
+
+class BatchUncertaintyStatusResponse(BaseModel):
+    """Per-context uncertainty assessments, in request order"""
+
+    results: List[UncertaintyStatusResponse]
+    count: int
+    timestamp: datetime
+
+
 # ============================================================================
 # Bayesian Confidence Scoring Models
 # ============================================================================
@@ -334,3 +349,42 @@ class BayesianConfidenceResponse(BaseModel):
                 "timestamp": "2025-12-01T02:30:00Z",
             }
         }
+
+
+class BatchBayesianConfidenceRequest(BaseModel):
+    """Request for scoring many contexts in one call"""
+
+    items: List[BayesianConfidenceRequest] = Field(..., min_length=1, max_length=1000)
+
+
+class BatchBayesianConfidenceResponse(BaseModel):
+    """Per-item Bayesian confidence analyses, in request order"""
+
+    results: List[BayesianConfidenceResponse]
+    count: int
+    timestamp: datetime
+
+
+# ============================================================================
+# ML Batch Prediction Models
+# ============================================================================
+
+
+class MLBatchPredictionRequest(BaseModel):
+    """Scenarios to score with one ML model call"""
+
+    model_name: str = Field(
+        default="confidence_predictor",
+        description="uncertainty_predictor / phase_classifier / confidence_predictor",
+    )
+    inputs: List[Dict[str, Any]] = Field(..., min_length=1, max_length=5000, description="Raw feature dicts")
+
+
+class MLBatchPredictionResponse(BaseModel):
+    """Per-scenario predictions, in request order"""
+
+    model_name: str
+    predictions: List[float]
+    probabilities: Optional[List[List[float]]] = Field(None, description="Class probabilities (classifiers only)")
+    count: int
+    timestamp: datetime
@@ -92,6 +92,11 @@ class VersionHistory(BaseModel):
         default=None, description="Date of last commit"
     )
 
+    # Keyset pagination (set when served from the version_history table)
+    next_cursor: Optional[str] = Field(
+        default=None, description="Cursor for the next page (None on the last page)"
+    )
+
     class Config:
         arbitrary_types_allowed = True
         populate_by_name = True
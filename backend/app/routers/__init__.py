@@ -40,6 +40,16 @@ except ImportError as e:
     projects_router = None
     project_context_router = None
 
+# Context Search Router
+try:
+    from .context_search import router as context_search_router
+
+    context_search_available = True
+except ImportError as e:
+    logger.warning(f"Context search router not available: {e}")
+    context_search_available = False
+    context_search_router = None
+
 # WebSocket Handler
 try:
     from . import websocket_handler
@@ -219,6 +229,7 @@ def get_all_routers() -> List[Tuple[Optional[APIRouter], str, bool]]:
         # Optional routers
         (project_context_router, "project_context", project_context_available),
         (projects_router, "projects", project_context_available),
+        (context_search_router, "context_search", context_search_available),
         (auth_router, "auth", auth_available),
         (modules_router, "modules", modules_available),
         (tasks_router, "tasks", tasks_available),
@@ -318,6 +329,7 @@ __all__ = [
     # Optional routers (may be None)
     "project_context_router",
     "projects_router",
+    "context_search_router",
     "auth_router",
     "modules_router",
     "tasks_router",
@@ -340,6 +352,7 @@ __all__ = [
     "get_connection_manager",
     # Availability flags
     "project_context_available",
+    "context_search_available",
     "websocket_available",
     "auth_available",
     "modules_available",
@@ -425,5 +425,6 @@ async def health_check() -> dict:
             "obsidian_sync": ck_theory_service.obsidian_service is not None,
             "caching": ck_theory_service.cache_service is not None,
             "feedback_learning": True,
-        }
+        },
+        "cache": ck_theory_service.get_cache_statistics(),
     }
@@ -0,0 +1,99 @@
+"""
+Context Search Router
+
+k-NN similarity search over project context chunk embeddings.
+
+Endpoints:
+- POST /api/context-search/query - Nearest chunks for a query embedding
+- POST /api/context-search/index - Index a chunk (local/mock mode only)
+"""
+
+import logging
+from typing import Any, Dict, List
+
+from app.services.context_search_service import ContextSearchService, get_context_search_service
+from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/context-search", tags=["Context Search"])
+
+
+# ============================================================================
+# Pydantic Models
+# ============================================================================
+
+
+class ContextSearchRequest(BaseModel):
+    """k-NN query for one project"""
+
+    project_id: str = Field(..., description="Project to search within")
+    embedding: List[float] = Field(..., min_length=1, description="Query embedding")
+    k: int = Field(5, ge=1, le=100, description="Number of neighbours to return")
+
+
+class ContextChunkRequest(BaseModel):
+    """Chunk to add to the local index"""
+
+    project_id: str
+    file_path: str
+    content: str = ""
+    embedding: List[float] = Field(..., min_length=1)
+    metadata: Dict[str, Any] = Field(default_factory=dict)
+
+
+class ContextMatchResponse(BaseModel):
+    file_path: str
+    content: str
+    distance: float
+    similarity: float
+    metadata: Dict[str, Any] = Field(default_factory=dict)
+
+
+class ContextSearchResponse(BaseModel):
+    project_id: str
+    mode: str = Field(description="'postgres' (pgvector index) or 'local' (NumPy fallback)")
+    results: List[ContextMatchResponse]
+
+
+# ============================================================================
+# Endpoints
+# ============================================================================
+
+
+@router.post("/query", response_model=ContextSearchResponse)
+async def search_context(
+    request: ContextSearchRequest,
+    service: ContextSearchService = Depends(get_context_search_service),
+) -> ContextSearchResponse:
+    """Return the k context chunks of a project closest to the query embedding"""
+    try:
+        matches = await service.search(request.project_id, request.embedding, request.k)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.error(f"[FAIL] Context search failed: {e}")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Context search failed")
+
+    return ContextSearchResponse(
+        project_id=request.project_id,
+        mode=service.mode,
+        results=[ContextMatchResponse(**match.to_dict()) for match in matches],
+    )
+
+
+@router.post("/index", status_code=status.HTTP_201_CREATED)
+async def index_context_chunk(
+    chunk: ContextChunkRequest,
+    service: ContextSearchService = Depends(get_context_search_service),
+) -> Dict[str, Any]:
+    """Add a chunk to the local index (PostgreSQL chunks are written via dual-write)"""
+    if service.mode != "local":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="PostgreSQL mode: chunks are indexed through the dual-write pipeline",
+        )
+
+    await service.index_chunk(chunk.project_id, chunk.file_path, chunk.content, chunk.embedding, chunk.metadata)
+    return {"project_id": chunk.project_id, "file_path": chunk.file_path, "indexed": True}
@@ -5,13 +5,17 @@ API endpoints for Genius Insight Formula (5-stage insight generation)
 """
 
 from fastapi import APIRouter, HTTPException, Query, Path
-from typing import Optional, List
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, Optional, List
+import json
 import logging
 
 from ..models.gi_formula import (
     GIFormulaRequest,
     GIFormulaResult,
     GIInsightSummary,
+    StageResult,
 )
 from ..services.gi_formula_service import gi_formula_service
 
@@ -122,6 +126,48 @@ async def generate_insight(request: GIFormulaRequest) -> GIFormulaResult:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+@router.post(
+    "/stream",
+    summary="Stream insight generation (Server-Sent Events)",
+    description="""
+    Generate an insight and stream each stage result as soon as it completes.
+
+    **Events** (`text/event-stream`):
+    - `stage`: a completed StageResult (observation, connection, pattern, synthesis, bias_check)
+    - `result`: the complete GIFormulaResult (last event)
+    - `error`: generation failed (last event)
+    """,
+    response_description="Server-Sent Events stream of stage results",
+)
+async def stream_insight(request: GIFormulaRequest) -> StreamingResponse:
+    """
+    Stream insight generation as Server-Sent Events
+
+    Args:
+        request: GI Formula request with problem and optional context
+
+    Returns:
+        Streaming response emitting one event per completed stage, then the result
+    """
+    logger.info(f"Streaming insight for: {request.problem[:50]}...")
+
+    async def events() -> AsyncIterator[str]:
+        try:
+            async for item in gi_formula_service.stream_insight(request):
+                event = "stage" if isinstance(item, StageResult) else "result"
+                yield _sse(event, jsonable_encoder(item))
+        except Exception as e:
+            logger.error(f"Streaming error: {e}", exc_info=True)
+            yield _sse("error", {"detail": f"Insight generation failed: {str(e)}"})
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
+def _sse(event: str, data: dict) -> str:
+    """Format a Server-Sent Event"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
 @router.get(
     "/{insight_id}",
     response_model=GIFormulaResult,
@@ -268,4 +314,5 @@ async def health_check() -> dict:
             "obsidian_sync": gi_formula_service.obsidian_service is not None,
             "caching": gi_formula_service.cache_service is not None,
         },
+        "cache": gi_formula_service.get_cache_statistics(),
     }
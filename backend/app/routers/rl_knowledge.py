@@ -193,14 +193,12 @@ async def get_domain_patterns(
     """
     try:
         optimizer = get_optimizer()
-        patterns = optimizer.get_domain_patterns(domain)
+        # Already ranked best first; only the top `limit` are materialized
+        sorted_patterns = optimizer.get_domain_patterns(domain, limit=limit)
 
-        if not patterns:
+        if not sorted_patterns:
             return []
 
-        # Sort by score descending
-        sorted_patterns = sorted(patterns, key=lambda x: x.get("score", 0), reverse=True)
-
         return [
             PatternResponse(
                 domain=p["pattern"].domain,
@@ -212,7 +210,7 @@ async def get_domain_patterns(
                 solution_description=p["pattern"].solution_description,
                 tags=p["pattern"].tags,
             )
-            for p in sorted_patterns[:limit]
+            for p in sorted_patterns
         ]
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get patterns: {str(e)}")
@@ -280,11 +278,8 @@ async def get_best_solution(
             return BestSolutionResponse(found=False, domain=domain)
 
         # Get alternatives (top 3 excluding best)
-        all_patterns = optimizer.get_domain_patterns(domain)
-        alternatives = [
-            {"name": p["pattern"].name, "score": p["score"]}
-            for p in sorted(all_patterns, key=lambda x: x["score"], reverse=True)[1:4]
-        ]
+        top_patterns = optimizer.get_domain_patterns(domain, limit=4)
+        alternatives = [{"name": p["pattern"].name, "score": p["score"]} for p in top_patterns[1:4]]
 
         return BestSolutionResponse(
             found=True,
@@ -283,6 +283,65 @@ async def get_bottlenecks(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/overruns")
+async def get_overruns(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    by: str = Query("phase", regex="^(phase|task_type)$"),
+    service: TimeTrackingService = Depends(get_time_tracking_service),
+):
+    """
+    Get baseline overrun ratios
+
+    Share of completed tasks whose duration exceeded the overrun threshold
+    (1.2x baseline by default), per phase or task type.
+
+    **Example Response:**
+    ```json
+    {
+        "implementation": {"tasks": 12, "overrun_tasks": 3, "overrun_ratio": 0.25}
+    }
+    ```
+    """
+    try:
+        return await service.get_overrun_ratios(start_date=start_date, end_date=end_date, by=by)
+
+    except Exception as e:
+        logger.error(f"Failed to get overrun ratios: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/metrics/rebuild")
+async def rebuild_metrics(
+    start_date: date,
+    end_date: Optional[date] = None,
+    service: TimeTrackingService = Depends(get_time_tracking_service),
+):
+    """
+    Rebuild dashboard aggregates (backfill)
+
+    Recomputes the task_daily_rollups rows for the range and reloads the
+    in-memory metrics store. Use after importing or correcting task sessions.
+    """
+    try:
+        if end_date is None:
+            end_date = date.today()
+
+        rollup_rows = await service.rebuild_daily_rollups(start_date, end_date)
+        store_groups = await service.rebuild_metrics_store()
+
+        return {
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat(),
+            "rollup_rows": rollup_rows,
+            "metrics_store_groups": store_groups,
+        }
+
+    except Exception as e:
+        logger.error(f"Failed to rebuild metrics: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/report/weekly", response_model=WeeklyReport)
 async def get_weekly_report(
     service: TimeTrackingService = Depends(get_time_tracking_service),
@@ -343,28 +402,26 @@ async def get_trends(
         end_date = date.today()
         start_date = end_date - timedelta(days=days)
 
-        # Get tasks for period
-        tasks = await service._get_tasks_for_period(start_date, end_date)
+        # Get per-day aggregates for period
+        groups = await service._get_period_aggregates(start_date, end_date, by_day=True)
 
         # Group by day
         daily_stats = {}
-        for task in tasks:
-            task_date = task["start_time"].date()
+        for group in groups:
+            task_date = group["day"]
             if task_date not in daily_stats:
                 daily_stats[task_date] = {
                     "date": task_date.isoformat(),
-                    "tasks": [],
                     "tasks_completed": 0,
                     "time_saved_seconds": 0,
                     "duration_seconds": 0,
                     "baseline_seconds": 0,
                 }
 
-            daily_stats[task_date]["tasks"].append(task)
-            daily_stats[task_date]["tasks_completed"] += 1
-            daily_stats[task_date]["time_saved_seconds"] += task["time_saved_seconds"]
-            daily_stats[task_date]["duration_seconds"] += task["duration_seconds"]
-            daily_stats[task_date]["baseline_seconds"] += task["baseline_seconds"]
+            daily_stats[task_date]["tasks_completed"] += group["tasks"]
+            daily_stats[task_date]["time_saved_seconds"] += group["time_saved_seconds"]
+            daily_stats[task_date]["duration_seconds"] += group["duration_seconds"]
+            daily_stats[task_date]["baseline_seconds"] += group["baseline_seconds"]
 
         # Calculate metrics for each day
         data_points = []
@@ -7,16 +7,22 @@ Provides real-time uncertainty status, predictions, and mitigation strategies
 
 import logging
 from datetime import datetime
-from typing import Tuple
+from typing import Optional, Tuple
 
 from app.core.circuit_breaker import CircuitBreaker, SimpleTTLCache
 from app.models.uncertainty import (
+    BatchBayesianConfidenceRequest,
+    BatchBayesianConfidenceResponse,
+    BatchContextAnalysisRequest,
+    BatchUncertaintyStatusResponse,
     BayesianConfidenceRequest,
     BayesianConfidenceResponse,
     ContextAnalysisRequest,
     MitigationAckRequest,
     MitigationAckResponse,
     MitigationStrategyResponse,
+    MLBatchPredictionRequest,
+    MLBatchPredictionResponse,
     PredictiveModelResponse,
     UncertaintyStateEnum,
     UncertaintyStatusResponse,
@@ -27,7 +33,7 @@ from app.models.uncertainty_time_integration import (
     UncertaintyAwareTrackingRequest,
     UncertaintyAwareTrackingResponse,
 )
-from app.services.bayesian_confidence import calculate_bayesian_confidence
+from app.services.bayesian_confidence import calculate_bayesian_confidence, calculate_bayesian_confidence_batch
 from app.services.session_manager_v2 import get_session_manager
 from fastapi import APIRouter, Depends, HTTPException
 
@@ -86,6 +92,22 @@ def get_uncertainty_map():
     return uncertainty_map
 
 
+def get_ml_system():
+    """Dependency to get the MLTrainingSystem instance from the global UDO system"""
+    import sys
+
+    main_module = sys.modules.get("backend.main") or sys.modules.get("main")
+    udo_system = getattr(main_module, "udo_system", None) if main_module else None
+    if not udo_system:
+        raise HTTPException(status_code=503, detail="UDO system not initialized. ML system unavailable.")
+
+    ml_system = udo_system.components.get("ml_system")
+    if not ml_system:
+        raise HTTPException(status_code=503, detail="ML Training System component not initialized")
+
+    return ml_system
+
+
 def _build_context() -> Tuple[str, dict]:
     """Build a lightweight context from UDO if available."""
     import sys
@@ -115,27 +137,12 @@ def _get_ttl_for_state(state_enum: UncertaintyStateEnum) -> int:
     return STATE_TTL_SECONDS.get(state_enum.name, 300)
 
 
-@router.get("/status", response_model=UncertaintyStatusResponse)
-@uncertainty_breaker
-async def get_uncertainty_status(uncertainty_map=Depends(get_uncertainty_map)):
-    """
-    Get current uncertainty status with predictions and mitigation strategies.
-    Applies lightweight TTL caching and circuit breaker for resilience.
-    """
-    try:
-        # Cache hit check
-        cached = status_cache.get("status")
-        if cached:
-            return cached
-
-        current_phase, context = _build_context()
-
-        vector, state = uncertainty_map.analyze_context(context)
-        prediction_model = uncertainty_map.predict_evolution(vector, phase=current_phase, hours=24)
-        mitigations = uncertainty_map.generate_mitigations(vector, state)
-        mitigations.sort(key=lambda m: m.roi(), reverse=True)
-
-        vector_response = UncertaintyVectorResponse(
+def _to_status_response(
+    vector, state, prediction_model, mitigations, timestamp: Optional[datetime] = None
+) -> UncertaintyStatusResponse:
+    """Convert UncertaintyMapV3 results to the API response model"""
+    return UncertaintyStatusResponse(
+        vector=UncertaintyVectorResponse(
             technical=vector.technical,
             market=vector.market,
             resource=vector.resource,
@@ -143,9 +150,18 @@ async def get_uncertainty_status(uncertainty_map=Depends(get_uncertainty_map)):
             quality=vector.quality,
             magnitude=vector.magnitude(),
             dominant_dimension=vector.dominant_dimension(),
-        )
-
-        mitigation_responses = [
+        ),
+        state=UncertaintyStateEnum(state.value),
+        confidence_score=1.0 - vector.magnitude(),
+        prediction=PredictiveModelResponse(
+            trend=prediction_model.trend,
+            velocity=prediction_model.velocity,
+            acceleration=prediction_model.acceleration,
+            predicted_resolution=prediction_model.predicted_resolution,
+            confidence_interval_lower=prediction_model.confidence_interval[0],
+            confidence_interval_upper=prediction_model.confidence_interval[1],
+        ),
+        mitigations=[
             MitigationStrategyResponse(
                 id=m.id,
                 uncertainty_id=m.uncertainty_id,
@@ -159,30 +175,34 @@ async def get_uncertainty_status(uncertainty_map=Depends(get_uncertainty_map)):
                 roi=m.roi(),
             )
             for m in mitigations
-        ]
+        ],
+        timestamp=timestamp or datetime.now(),
+    )
 
-        prediction_response = PredictiveModelResponse(
-            trend=prediction_model.trend,
-            velocity=prediction_model.velocity,
-            acceleration=prediction_model.acceleration,
-            predicted_resolution=prediction_model.predicted_resolution,
-            confidence_interval_lower=prediction_model.confidence_interval[0],
-            confidence_interval_upper=prediction_model.confidence_interval[1],
-        )
 
-        state_enum = UncertaintyStateEnum(state.value)
-        confidence_score = 1.0 - vector.magnitude()
+@router.get("/status", response_model=UncertaintyStatusResponse)
+@uncertainty_breaker
+async def get_uncertainty_status(uncertainty_map=Depends(get_uncertainty_map)):
+    """
+    Get current uncertainty status with predictions and mitigation strategies.
+    Applies lightweight TTL caching and circuit breaker for resilience.
+    """
+    try:
+        # Cache hit check
+        cached = status_cache.get("status")
+        if cached:
+            return cached
 
-        response = UncertaintyStatusResponse(
-            vector=vector_response,
-            state=state_enum,
-            confidence_score=confidence_score,
-            prediction=prediction_response,
-            mitigations=mitigation_responses,
-            timestamp=datetime.now(),
-        )
+        current_phase, context = _build_context()
+
+        vector, state = uncertainty_map.analyze_context(context)
+        prediction_model = uncertainty_map.predict_evolution(vector, phase=current_phase, hours=24)
+        mitigations = uncertainty_map.generate_mitigations(vector, state)
+        mitigations.sort(key=lambda m: m.roi(), reverse=True)
+
+        response = _to_status_response(vector, state, prediction_model, mitigations)
 
-        ttl = _get_ttl_for_state(state_enum)
+        ttl = _get_ttl_for_state(response.state)
         status_cache.set("status", response, ttl_seconds=ttl)
         return response
 
@@ -315,57 +335,57 @@ async def analyze_context(request: ContextAnalysisRequest, uncertainty_map=Depen
         mitigations = uncertainty_map.generate_mitigations(vector, state)
         mitigations.sort(key=lambda m: m.roi(), reverse=True)
 
-        # Convert to response models
-        vector_response = UncertaintyVectorResponse(
-            technical=vector.technical,
-            market=vector.market,
-            resource=vector.resource,
-            timeline=vector.timeline,
-            quality=vector.quality,
-            magnitude=vector.magnitude(),
-            dominant_dimension=vector.dominant_dimension(),
-        )
+        return _to_status_response(vector, state, prediction_model, mitigations)
 
-        mitigation_responses = [
-            MitigationStrategyResponse(
-                id=m.id,
-                uncertainty_id=m.uncertainty_id,
-                action=m.action,
-                priority=m.priority,
-                estimated_impact=m.estimated_impact,
-                estimated_cost=m.estimated_cost,
-                prerequisites=m.prerequisites,
-                success_probability=m.success_probability,
-                fallback_strategy=m.fallback_strategy,
-                roi=m.roi(),
-            )
-            for m in mitigations
+    except Exception as e:
+        logger.error(f"Failed to analyze context: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to analyze context: {str(e)}")
+
+
+@router.post("/analyze/batch", response_model=BatchUncertaintyStatusResponse)
+async def analyze_contexts_batch(request: BatchContextAnalysisRequest, uncertainty_map=Depends(get_uncertainty_map)):
+    """
+    Analyze many contexts in one call
+
+    Dimensions, states and predictions are computed for the whole batch with
+    NumPy column operations and a single predictor call; each result matches
+    what /analyze returns for the same context.
+
+    Request Body:
+        - **contexts**: List of /analyze request bodies (1-1000)
+        - **hours**: Prediction horizon in hours (default 24)
+    """
+    try:
+        contexts = [
+            {
+                "phase": item.phase,
+                "has_code": item.has_code,
+                "validation_score": item.validation_score,
+                "team_size": item.team_size,
+                "timeline_weeks": item.timeline_weeks,
+            }
+            for item in request.contexts
         ]
 
-        prediction_response = PredictiveModelResponse(
-            trend=prediction_model.trend,
-            velocity=prediction_model.velocity,
-            acceleration=prediction_model.acceleration,
-            predicted_resolution=prediction_model.predicted_resolution,
-            confidence_interval_lower=prediction_model.confidence_interval[0],
-            confidence_interval_upper=prediction_model.confidence_interval[1],
-        )
+        analyzed = uncertainty_map.analyze_contexts(contexts)
+        vectors = [vector for vector, _ in analyzed]
+        states = [state for _, state in analyzed]
 
-        state_enum = UncertaintyStateEnum(state.value)
-        confidence_score = 1.0 - vector.magnitude()
+        predictions = uncertainty_map.predict_evolution_batch(vectors, hours=request.hours)
+        mitigations = uncertainty_map.generate_mitigations_batch(vectors, states)
 
-        return UncertaintyStatusResponse(
-            vector=vector_response,
-            state=state_enum,
-            confidence_score=confidence_score,
-            prediction=prediction_response,
-            mitigations=mitigation_responses,
-            timestamp=datetime.now(),
-        )
+        timestamp = datetime.now()
+        results = [
+            _to_status_response(vector, state, prediction, strategies, timestamp)
+            for vector, state, prediction, strategies in zip(vectors, states, predictions, mitigations)
+        ]
+        return BatchUncertaintyStatusResponse(results=results, count=len(results), timestamp=timestamp)
 
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid context: {str(e)}")
     except Exception as e:
-        logger.error(f"Failed to analyze context: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to analyze context: {str(e)}")
+        logger.error(f"Failed to analyze context batch: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to analyze context batch: {str(e)}")
 
 
 @router.get("/health")
@@ -738,3 +758,65 @@ async def calculate_confidence(request: BayesianConfidenceRequest):
         # Handle unexpected errors
         logger.error(f"Failed to calculate Bayesian confidence: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to calculate confidence: {str(e)}")
+
+
+@router.post("/confidence/batch", response_model=BatchBayesianConfidenceResponse)
+@uncertainty_breaker
+async def calculate_confidence_batch(request: BatchBayesianConfidenceRequest):
+    """
+    Score many contexts in one call (e.g. nightly portfolio scoring).
+
+    Likelihoods, Beta posteriors, credible intervals and uncertainty vectors
+    are computed for the whole batch with NumPy; each result matches what
+    /confidence returns for the same item.
+
+    **Request Body:**
+    - **items**: List of /confidence request bodies (1-1000)
+    """
+    try:
+        results = calculate_bayesian_confidence_batch(request.items)
+        return BatchBayesianConfidenceResponse(results=results, count=len(results), timestamp=datetime.now())
+
+    except ValueError as e:
+        logger.error(f"Validation error in Bayesian confidence batch: {e}")
+        raise HTTPException(status_code=400, detail=f"Invalid request: {str(e)}")
+
+    except Exception as e:
+        logger.error(f"Failed to calculate Bayesian confidence batch: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to calculate confidence batch: {str(e)}")
+
+
+# ============================================================================
+# ML BATCH PREDICTION ENDPOINT
+# ============================================================================
+
+
+@router.post("/ml/predict/batch", response_model=MLBatchPredictionResponse)
+async def predict_ml_batch(request: MLBatchPredictionRequest, ml_system=Depends(get_ml_system)):
+    """
+    Score many what-if scenarios with one model call.
+
+    The feature matrix is built and scaled once; classifiers return class
+    probabilities from the same predict_proba call.
+
+    **Request Body:**
+    - **model_name**: Model to use (default confidence_predictor)
+    - **inputs**: Raw feature dicts, same keys as single predictions (1-5000)
+    """
+    try:
+        predictions, metadata = ml_system.predict_batch(request.model_name, request.inputs)
+    except ValueError as e:
+        # Unknown model, untrained model or feature mismatch
+        raise HTTPException(status_code=400, detail=f"Invalid request: {str(e)}")
+    except Exception as e:
+        logger.error(f"Failed to run ML batch prediction: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to run batch prediction: {str(e)}")
+
+    probabilities = metadata["probabilities"]
+    return MLBatchPredictionResponse(
+        model_name=request.model_name,
+        predictions=predictions.tolist(),
+        probabilities=probabilities.tolist() if probabilities is not None else None,
+        count=len(predictions),
+        timestamp=datetime.now(),
+    )
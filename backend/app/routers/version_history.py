@@ -8,10 +8,12 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException, Query
+from backend.async_database import async_db
+from fastapi import APIRouter, Depends, HTTPException, Query
 
 from ..models.version_history import VersionCommit, VersionComparison, VersionHistory
 from ..services.git_service import GitService
+from ..services.version_history_index import VersionHistoryIndex
 
 logger = logging.getLogger(__name__)
 
@@ -21,16 +23,26 @@ router = APIRouter(prefix="/api/version-history", tags=["version-history"])
 DEFAULT_PROJECT_PATH = Path(__file__).parent.parent.parent.parent
 
 
+def get_version_history_index() -> Optional[VersionHistoryIndex]:
+    """version_history table index, or None when the database is unavailable"""
+    try:
+        return VersionHistoryIndex(async_db.get_pool())
+    except RuntimeError:
+        return None
+
+
 @router.get("/", response_model=VersionHistory)
 async def get_version_history(
     project_path: Optional[str] = Query(default=None, description="Path to Git repository (default: current project)"),
     branch: Optional[str] = Query(default=None, description="Branch name (default: current branch)"),
     limit: int = Query(default=50, ge=1, le=500, description="Maximum number of commits to return"),
     skip: int = Query(default=0, ge=0, description="Number of commits to skip"),
+    cursor: Optional[str] = Query(default=None, description="next_cursor of the previous page (indexed branches)"),
     author: Optional[str] = Query(default=None, description="Filter by author email"),
     since: Optional[datetime] = Query(default=None, description="Commits after this date (ISO 8601)"),
     until: Optional[datetime] = Query(default=None, description="Commits before this date (ISO 8601)"),
     search: Optional[str] = Query(default=None, description="Search in commit messages"),
+    index: Optional[VersionHistoryIndex] = Depends(get_version_history_index),
 ):
     """
     Get version history for a project
@@ -41,12 +53,18 @@ async def get_version_history(
     - `project_path`: Path to Git repository (optional, defaults to current project)
     - `branch`: Branch to query (optional, defaults to current branch)
     - `limit`: Maximum number of commits (1-500, default: 50)
-    - `skip`: Number of commits to skip for pagination
+    - `skip`: Number of commits to skip for pagination (reads Git directly)
+    - `cursor`: Keyset pagination cursor (`next_cursor` of the previous page)
     - `author`: Filter by author email
     - `since`: Show commits after this date
     - `until`: Show commits before this date
     - `search`: Search text in commit messages
 
+    Branches imported with `POST /ingest` are served from the version_history
+    table (keyset pagination, full-text search on commit messages) and are
+    caught up with new commits on each request. Other branches, and `skip`
+    paging, read Git directly.
+
     **Example:**
     ```
     GET /api/version-history/?limit=20&branch=main&author=john@example.com
@@ -59,6 +77,30 @@ async def get_version_history(
         # Initialize Git service
         git_service = GitService(repo_path)
 
+        if index and not skip:
+            try:
+                history = await index.get_history(
+                    git_service,
+                    branch=branch,
+                    limit=limit,
+                    cursor=cursor,
+                    author=author,
+                    since=since,
+                    until=until,
+                    search=search,
+                )
+            except ValueError:
+                raise
+            except Exception as e:
+                logger.warning(f"Version history index unavailable, reading Git: {e}")
+                history = None
+
+            if history:
+                return history
+
+        if cursor:
+            raise ValueError("cursor paging is only available for branches in the version history index")
+
         # Get version history
         history = git_service.get_version_history(branch=branch, limit=limit, skip=skip)
 
@@ -84,6 +126,39 @@ async def get_version_history(
         raise HTTPException(status_code=500, detail=f"Failed to get version history: {str(e)}")
 
 
+@router.post("/ingest")
+async def ingest_version_history(
+    project_path: Optional[str] = Query(default=None, description="Path to Git repository"),
+    branch: Optional[str] = Query(default=None, description="Branch to import (default: current branch)"),
+    index: Optional[VersionHistoryIndex] = Depends(get_version_history_index),
+):
+    """
+    Import new commits of a branch into the version_history table
+
+    The first call imports the full branch history; later calls only import
+    commits since the last imported one (bulk COPY).
+
+    **Example:**
+    ```
+    POST /api/version-history/ingest?branch=main
+    ```
+    """
+    if index is None:
+        raise HTTPException(status_code=503, detail="Database not available")
+
+    try:
+        repo_path = project_path if project_path else str(DEFAULT_PROJECT_PATH)
+        git_service = GitService(repo_path)
+
+        return await index.ingest(git_service, branch=branch)
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error ingesting version history: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to ingest version history: {str(e)}")
+
+
 @router.get("/commits/{commit_hash}", response_model=VersionCommit)
 async def get_commit_details(
     commit_hash: str,
@@ -446,29 +446,22 @@ async def process_websocket_message(
 @router.get("/sessions/active")
 async def get_active_sessions(
     project_id: Optional[str] = Query(None, description="Filter by project"),
-    session_manager: SessionManager = Depends(get_session_manager),
 ):
     """Get list of active sessions"""
     redis_client = await get_redis_client()
 
     sessions = await redis_client.get_active_sessions()
 
+    # Fetch all session records in a single MGET
+    sessions_data = await redis_client.get_sessions_data(sessions)
+    all_sessions = [sessions_data[session_id] for session_id in sessions if session_id in sessions_data]
+
     if project_id:
         # Filter by project if specified
-        project_sessions = []
-        for session_id in sessions:
-            session_data = await session_manager.get_session_info(session_id)
-            if session_data and session_data.get("project_id") == project_id:
-                project_sessions.append(session_data)
+        project_sessions = [session for session in all_sessions if session.get("project_id") == project_id]
         return {"sessions": project_sessions, "count": len(project_sessions)}
 
     # Return all active sessions
-    all_sessions = []
-    for session_id in sessions:
-        session_data = await session_manager.get_session_info(session_id)
-        if session_data:
-            all_sessions.append(session_data)
-
     return {"sessions": all_sessions, "count": len(all_sessions)}
 
 
@@ -9,10 +9,11 @@ Based on Beta-Binomial conjugacy for efficient posterior updates.
 
 import logging
 import math
+import warnings
 from datetime import datetime
-from functools import lru_cache
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 from app.models.uncertainty import (
     BayesianConfidenceRequest,
     BayesianConfidenceResponse,
@@ -51,35 +52,36 @@ class OptimizedBayesianScorer:
     Production-optimized Bayesian confidence scorer.
 
     Features:
-    - LRU caching for frequent calculations
     - Fast approximation mode (<5ms)
     - Full Bayesian mode (10-20ms) with credible intervals
     - Automatic state classification
+    - Vectorized batch scoring (``*_batch`` methods)
     """
 
-    def __init__(self, cache_size: int = 128):
+    def __init__(self, cache_size: Optional[int] = None):
         """
-        Initialize Bayesian scorer with LRU cache.
+        Initialize Bayesian scorer.
 
         Args:
-            cache_size: Maximum number of cached calculations (default: 128)
+            cache_size: Deprecated and ignored. Beta moments are two arithmetic
+                operations on scalars or NumPy arrays and are no longer memoized.
         """
+        if cache_size is not None:
+            warnings.warn(
+                "OptimizedBayesianScorer(cache_size=...) is deprecated and has no effect",
+                DeprecationWarning,
+                stacklevel=2,
+            )
         self.cache_size = cache_size
-        self._init_cache()
 
-    def _init_cache(self):
-        """Initialize LRU cache for performance optimization"""
-        # Cache is implemented via @lru_cache decorator on methods
-        logger.info(f"[OK] Bayesian scorer initialized with cache_size={self.cache_size}")
-
-    @lru_cache(maxsize=128)
-    def _beta_mean(self, alpha: float, beta: float) -> float:
-        """Calculate Beta distribution mean (cached)"""
+    @staticmethod
+    def _beta_mean(alpha, beta):
+        """Calculate Beta distribution mean (scalars or arrays)"""
         return alpha / (alpha + beta)
 
-    @lru_cache(maxsize=128)
-    def _beta_variance(self, alpha: float, beta: float) -> float:
-        """Calculate Beta distribution variance (cached)"""
+    @staticmethod
+    def _beta_variance(alpha, beta):
+        """Calculate Beta distribution variance (scalars or arrays)"""
         n = alpha + beta
         return (alpha * beta) / (n * n * (n + 1))
 
@@ -241,6 +243,104 @@ class OptimizedBayesianScorer:
 
         return vector
 
+    # ------------------------------------------------------------------------
+    # Vectorized batch scoring
+    # ------------------------------------------------------------------------
+
+    @staticmethod
+    def _context_column(contexts: Sequence[dict], key: str, default: float = np.nan) -> np.ndarray:
+        """Numeric context field as a float array (``default`` where absent)"""
+        column = np.full(len(contexts), default, dtype=float)
+        for i, context in enumerate(contexts):
+            if key in context:
+                try:
+                    column[i] = float(context[key])
+                except (TypeError, ValueError):
+                    raise ValueError(f"context {i}: '{key}' must be numeric, got {context[key]!r}")
+        return column
+
+    def calculate_likelihood_batch(
+        self, contexts: Sequence[dict], historical_outcomes: Sequence[Sequence[bool]]
+    ) -> np.ndarray:
+        """
+        Vectorized calculate_likelihood for many contexts.
+
+        Args:
+            contexts: Project contexts
+            historical_outcomes: Outcome list per context (may be empty)
+
+        Returns:
+            Likelihood per context, identical to the scalar method
+        """
+        if len(contexts) != len(historical_outcomes):
+            raise ValueError("contexts and historical_outcomes must have the same length")
+
+        totals = np.fromiter((len(outcomes) for outcomes in historical_outcomes), dtype=float, count=len(contexts))
+        flat = np.fromiter(
+            (bool(outcome) for outcomes in historical_outcomes for outcome in outcomes),
+            dtype=float,
+            count=int(totals.sum()),
+        )
+        successes = np.bincount(np.repeat(np.arange(len(contexts)), totals.astype(int)), weights=flat, minlength=len(contexts))
+        base_likelihood = np.divide(successes, totals, out=np.full(len(contexts), 0.5), where=totals > 0)
+
+        team_size = self._context_column(contexts, "team_size")
+        team_adjustment = np.select(
+            [team_size == 1, team_size <= 3, team_size > 5],
+            [0.1, 0.05, -0.1],
+            default=0.0,
+        )
+
+        has_code = np.fromiter((bool(c.get("has_code", False)) for c in contexts), dtype=bool, count=len(contexts))
+        code_adjustment = np.where(has_code, 0.15, 0.0)
+
+        validation_score = self._context_column(contexts, "validation_score")
+        validation_adjustment = np.where(np.isnan(validation_score), 0.0, (validation_score - 0.5) * 0.2)
+
+        weeks = self._context_column(contexts, "timeline_weeks")
+        timeline_adjustment = np.select([weeks < 4, weeks > 12], [-0.1, 0.05], default=0.0)
+
+        # Same left-to-right summation order as sum(adjustments) in the scalar path
+        adjustments = team_adjustment + code_adjustment + validation_adjustment + timeline_adjustment
+        return np.clip(base_likelihood + adjustments, 0.0, 1.0)
+
+    def calculate_posterior_batch(
+        self,
+        prior_alpha: np.ndarray,
+        prior_beta: np.ndarray,
+        likelihood: np.ndarray,
+        evidence_strength: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorized calculate_posterior (conjugate Beta update per row)"""
+        successes = likelihood * evidence_strength
+        failures = (1 - likelihood) * evidence_strength
+        return prior_alpha + successes, prior_beta + failures
+
+    def calculate_uncertainty_vectors(self, contexts: Sequence[dict], confidence_scores: np.ndarray) -> np.ndarray:
+        """
+        Vectorized calculate_uncertainty_vector.
+
+        Returns:
+            (N, 5) array with columns technical, market, resource, timeline, quality
+        """
+        base_uncertainty = 1 - confidence_scores
+
+        has_code = np.fromiter((bool(c.get("has_code", False)) for c in contexts), dtype=bool, count=len(contexts))
+        validation_score = self._context_column(contexts, "validation_score", default=0.5)
+        team_size = self._context_column(contexts, "team_size", default=1.0)
+        weeks = self._context_column(contexts, "timeline_weeks", default=4.0)
+
+        vectors = np.column_stack(
+            [
+                base_uncertainty * np.where(has_code, 0.8, 1.2),
+                base_uncertainty * (1 - validation_score),
+                base_uncertainty * (1 + (team_size - 1) * 0.1),
+                base_uncertainty * np.where(weeks < 4, 1.5, 0.8),
+                base_uncertainty * 0.9,
+            ]
+        )
+        return np.clip(vectors, 0.0, 1.0)
+
 
 # ============================================================================
 # High-Level API Functions
@@ -269,6 +369,25 @@ def classify_uncertainty_state(magnitude: float) -> UncertaintyStateEnum:
         return UncertaintyStateEnum.VOID
 
 
+UNCERTAINTY_STATE_ORDER = [
+    UncertaintyStateEnum.DETERMINISTIC,
+    UncertaintyStateEnum.PROBABILISTIC,
+    UncertaintyStateEnum.QUANTUM,
+    UncertaintyStateEnum.CHAOTIC,
+    UncertaintyStateEnum.VOID,
+]
+UNCERTAINTY_STATE_THRESHOLDS = np.array([0.10, 0.30, 0.60, 0.90])
+
+RISK_LEVELS = ["low", "medium", "high", "critical"]
+RISK_THRESHOLDS = np.array([0.15, 0.35, 0.60])
+
+
+def classify_uncertainty_states(magnitudes: np.ndarray) -> List[UncertaintyStateEnum]:
+    """Vectorized classify_uncertainty_state"""
+    indices = np.searchsorted(UNCERTAINTY_STATE_THRESHOLDS, magnitudes, side="right")
+    return [UNCERTAINTY_STATE_ORDER[i] for i in indices]
+
+
 def _calculate_risk_level(magnitude: float, confidence_score: float) -> str:
     """
     Calculate risk level based on uncertainty and confidence.
@@ -511,3 +630,113 @@ def calculate_bayesian_confidence(
     )
 
     return response
+
+
+def calculate_bayesian_confidence_batch(
+    requests: Sequence[BayesianConfidenceRequest],
+) -> List[BayesianConfidenceResponse]:
+    """
+    Score many requests in one NumPy pass.
+
+    Likelihoods, posteriors, credible intervals, uncertainty vectors, states
+    and risk levels are computed column-wise; only the text recommendations
+    are built per row. Each response matches calculate_bayesian_confidence
+    for the same request.
+
+    Args:
+        requests: BayesianConfidenceRequest items
+
+    Returns:
+        One BayesianConfidenceResponse per request, in input order
+    """
+    start_time = datetime.now()
+    if not requests:
+        return []
+
+    scorer = OptimizedBayesianScorer()
+
+    phases = []
+    for request in requests:
+        phase = request.phase.lower()
+        if phase not in PHASE_PRIORS:
+            logger.warning(f"Unknown phase '{phase}', defaulting to 'implementation'")
+            phase = "implementation"
+        phases.append(phase)
+
+    prior_alpha = np.array([PHASE_PRIORS[phase]["alpha"] for phase in phases])
+    prior_beta = np.array([PHASE_PRIORS[phase]["beta"] for phase in phases])
+    prior_mean = [PHASE_PRIORS[phase]["mean"] for phase in phases]
+
+    contexts = [request.context for request in requests]
+    outcomes = [request.historical_outcomes for request in requests]
+    likelihood = scorer.calculate_likelihood_batch(contexts, outcomes)
+
+    evidence_strength = np.array([len(o) if o else 10 for o in outcomes], dtype=float)
+    posterior_alpha, posterior_beta = scorer.calculate_posterior_batch(prior_alpha, prior_beta, likelihood, evidence_strength)
+    confidence = scorer._beta_mean(posterior_alpha, posterior_beta)
+
+    vectors = scorer.calculate_uncertainty_vectors(contexts, confidence)
+    squares = vectors**2
+    magnitude = np.sqrt(squares[:, 0] + squares[:, 1] + squares[:, 2] + squares[:, 3] + squares[:, 4]) / math.sqrt(5)
+    dominant = np.argmax(vectors, axis=1)
+    states = classify_uncertainty_states(magnitude)
+    risk_index = np.searchsorted(RISK_THRESHOLDS, magnitude * (1 - confidence), side="right")
+
+    # Credible intervals: the fast-mode band and the full-mode normal approximation
+    variance = scorer._beta_variance(posterior_alpha, posterior_beta)
+    std = np.sqrt(variance)
+    fast = np.array([request.use_fast_mode for request in requests])
+    ci_lower = np.where(fast, np.maximum(0.0, confidence - 0.1), np.maximum(0.0, confidence - 1.96 * std))
+    ci_upper = np.where(fast, np.minimum(1.0, confidence + 0.1), np.minimum(1.0, confidence + 1.96 * std))
+    with np.errstate(divide="ignore"):
+        precision = np.where(variance > 0, 1 / variance, np.inf)
+
+    dimensions = ["technical", "market", "resource", "timeline", "quality"]
+    decisions = {
+        UncertaintyStateEnum.DETERMINISTIC: "GO",
+        UncertaintyStateEnum.PROBABILISTIC: "GO",
+        UncertaintyStateEnum.QUANTUM: "GO_WITH_CHECKPOINTS",
+    }
+
+    timestamp = datetime.now()
+    responses = []
+    for i, state in enumerate(states):
+        risk_level = RISK_LEVELS[risk_index[i]]
+        dominant_dimension = dimensions[dominant[i]]
+        confidence_score = float(confidence[i])
+        full_mode = not fast[i]
+
+        metadata = BayesianMetadata(
+            mode="fast" if fast[i] else "full",
+            prior_mean=prior_mean[i],
+            likelihood=float(likelihood[i]),
+            posterior_mean=confidence_score if full_mode else None,
+            credible_interval_lower=float(ci_lower[i]),
+            credible_interval_upper=float(ci_upper[i]),
+            effective_sample_size=int(posterior_alpha[i] + posterior_beta[i]) if full_mode else None,
+            uncertainty_magnitude=float(magnitude[i]),
+            confidence_precision=float(precision[i]) if full_mode else None,
+            risk_level=risk_level,
+            monitoring_level=_calculate_monitoring_level(risk_level, state),
+            dominant_dimension=dominant_dimension,
+        )
+        responses.append(
+            BayesianConfidenceResponse(
+                confidence_score=confidence_score,
+                state=state,
+                decision=decisions.get(state, "NO_GO"),
+                metadata=metadata,
+                recommendations=_generate_recommendations(
+                    state=state,
+                    risk_level=risk_level,
+                    dominant_dimension=dominant_dimension,
+                    confidence_score=confidence_score,
+                ),
+                timestamp=timestamp,
+            )
+        )
+
+    elapsed_ms = (datetime.now() - start_time).total_seconds() * 1000
+    logger.info(f"Bayesian batch of {len(responses)} completed in {elapsed_ms:.2f}ms")
+
+    return responses
@@ -16,6 +16,7 @@ import hashlib
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 
+from ..core.cache_manager import CacheManager
 from ..models.ck_theory import (
     RICEScore,
     DesignAlternative,
@@ -66,13 +67,23 @@ class CKTheoryService:
         self.cache_service = cache_service
         self.config = config or {}
 
-        # In-memory cache for recent designs
-        self._memory_cache: Dict[str, CKTheoryResult] = {}
-        self._max_memory_cache = self.config.get("max_memory_cache", 10)
+        # In-memory LRU tier for recent designs (count- and byte-bounded, negative caching)
+        self._memory_cache = CacheManager(
+            max_size_bytes=self.config.get("max_memory_cache_bytes", 10 * 1024 * 1024),
+            max_entries=self.config.get("max_memory_cache", 10),
+            negative_ttl_seconds=self.config.get("negative_cache_ttl", 60),
+        )
+        self._external_cache_stats = {"hits": 0, "misses": 0}
 
         # Feedback storage for learning
         self._feedback_store: Dict[str, List[DesignFeedback]] = {}
 
+        # In-flight generations by design_id (concurrent identical requests share one)
+        self._in_flight: Dict[str, "asyncio.Future[CKTheoryResult]"] = {}
+
+        # Service-wide cap on concurrent Sequential MCP calls
+        self._llm_semaphore = asyncio.Semaphore(self.config.get("max_concurrent_llm_calls", 8))
+
         logger.info("CKTheoryService initialized")
 
     async def generate_design(self, request: CKTheoryRequest) -> CKTheoryResult:
@@ -101,68 +112,92 @@ class CKTheoryService:
                 logger.info(f"Cache hit for design {design_id}")
                 return cached_result
 
-            logger.info(f"Generating design {design_id} for challenge: {request.challenge[:50]}...")
+            # Join an identical generation already in progress
+            in_flight = self._in_flight.get(design_id)
+            if in_flight is None:
+                in_flight = asyncio.ensure_future(self._run_design_generation(design_id, request, start_time))
+                self._in_flight[design_id] = in_flight
+                in_flight.add_done_callback(lambda _: self._in_flight.pop(design_id, None))
+            else:
+                logger.info(f"Joining in-flight generation for design {design_id}")
 
-            # Stage 1: Concept Exploration
-            concepts = await self._explore_concepts(challenge=request.challenge, constraints=request.constraints or {})
+            # Shield: a cancelled caller must not cancel the generation other callers await
+            return await asyncio.shield(in_flight)
 
-            # Stage 2: Generate 3 Alternatives in Parallel
-            alternatives = await self._generate_alternatives_parallel(
-                challenge=request.challenge, concepts=concepts, constraints=request.constraints or {}
-            )
+        except Exception as e:
+            logger.error(f"Failed to generate design: {e}", exc_info=True)
+            raise RuntimeError(f"Design generation failed: {str(e)}") from e
 
-            # Validate alternatives have IDs A, B, C
-            alt_ids = {alt.id for alt in alternatives}
-            if alt_ids != {"A", "B", "C"}:
-                raise ValueError(f"Expected alternatives A, B, C. Got: {alt_ids}")
+    async def _run_design_generation(self, design_id: str, request: CKTheoryRequest, start_time: datetime) -> CKTheoryResult:
+        """
+        Run the 4 C-K Theory stages for a design not found in cache
 
-            # Stage 3: RICE scoring already calculated in model validator
+        Args:
+            design_id: Unique design identifier
+            request: C-K Theory request with challenge and constraints
+            start_time: Time the first request for this design arrived
 
-            # Stage 4: Trade-off Analysis
-            tradeoff_analysis = await self._analyze_tradeoffs(
-                challenge=request.challenge, alternatives=alternatives, constraints=request.constraints or {}
-            )
+        Returns:
+            Complete C-K Theory result
+        """
+        logger.info(f"Generating design {design_id} for challenge: {request.challenge[:50]}...")
 
-            # Calculate total duration
-            end_time = datetime.now()
-            total_duration_ms = int((end_time - start_time).total_seconds() * 1000)
-
-            # Build result
-            result = CKTheoryResult(
-                id=design_id,
-                challenge=request.challenge,
-                alternatives=alternatives,
-                tradeoff_analysis=tradeoff_analysis,
-                total_duration_ms=total_duration_ms,
-                created_at=start_time,
-                project=request.project,
-                constraints=request.constraints,
-                metadata={
-                    "concepts": concepts,
-                    "alternative_scores": {alt.id: alt.rice.score for alt in alternatives},
-                },
-            )
+        # Stage 1: Concept Exploration
+        concepts = await self._explore_concepts(challenge=request.challenge, constraints=request.constraints or {})
 
-            # Cache result (async, don't wait)
-            asyncio.create_task(self._cache_design(design_id, result))
+        # Stage 2: Generate 3 Alternatives in Parallel
+        alternatives = await self._generate_alternatives_parallel(
+            challenge=request.challenge, concepts=concepts, constraints=request.constraints or {}
+        )
 
-            # Save to Obsidian (async, don't wait)
-            asyncio.create_task(self._save_to_obsidian(result))
+        # Validate alternatives have IDs A, B, C
+        alt_ids = {alt.id for alt in alternatives}
+        if alt_ids != {"A", "B", "C"}:
+            raise ValueError(f"Expected alternatives A, B, C. Got: {alt_ids}")
 
-            # Extract recommended alternative
-            recommended_id = self._extract_recommended_id(tradeoff_analysis.recommendation)
+        # Stage 3: RICE scoring already calculated in model validator
 
-            logger.info(
-                f"Generated design {design_id} in {total_duration_ms}ms "
-                f"(recommended: {recommended_id}, scores: "
-                f"{', '.join(f'{a.id}:{a.rice.score}' for a in alternatives)})"
-            )
+        # Stage 4: Trade-off Analysis
+        tradeoff_analysis = await self._analyze_tradeoffs(
+            challenge=request.challenge, alternatives=alternatives, constraints=request.constraints or {}
+        )
 
-            return result
+        # Calculate total duration
+        end_time = datetime.now()
+        total_duration_ms = int((end_time - start_time).total_seconds() * 1000)
+
+        # Build result
+        result = CKTheoryResult(
+            id=design_id,
+            challenge=request.challenge,
+            alternatives=alternatives,
+            tradeoff_analysis=tradeoff_analysis,
+            total_duration_ms=total_duration_ms,
+            created_at=start_time,
+            project=request.project,
+            constraints=request.constraints,
+            metadata={
+                "concepts": concepts,
+                "alternative_scores": {alt.id: alt.rice.score for alt in alternatives},
+            },
+        )
 
-        except Exception as e:
-            logger.error(f"Failed to generate design: {e}", exc_info=True)
-            raise RuntimeError(f"Design generation failed: {str(e)}") from e
+        # Cache result (async, don't wait)
+        asyncio.create_task(self._cache_design(design_id, result))
+
+        # Save to Obsidian (async, don't wait)
+        asyncio.create_task(self._save_to_obsidian(result))
+
+        # Extract recommended alternative
+        recommended_id = self._extract_recommended_id(tradeoff_analysis.recommendation)
+
+        logger.info(
+            f"Generated design {design_id} in {total_duration_ms}ms "
+            f"(recommended: {recommended_id}, scores: "
+            f"{', '.join(f'{a.id}:{a.rice.score}' for a in alternatives)})"
+        )
+
+        return result
 
     async def get_design(self, design_id: str) -> Optional[CKTheoryResult]:
         """
@@ -777,7 +812,8 @@ Provide:
             Reasoning result content
         """
         try:
-            result = await asyncio.wait_for(self.sequential_mcp.reason(prompt), timeout=timeout / 1000.0)
+            async with self._llm_semaphore:
+                result = await asyncio.wait_for(self.sequential_mcp.reason(prompt), timeout=timeout / 1000.0)
             return result.get("content", "")
         except asyncio.TimeoutError:
             logger.warning(f"Sequential MCP timeout after {timeout}ms")
@@ -811,19 +847,23 @@ Provide:
             Cached result or None
         """
         # Memory cache
-        if design_id in self._memory_cache:
+        result = self._memory_cache.get(design_id)
+        if result is not None:
             logger.debug(f"Memory cache hit for {design_id}")
-            return self._memory_cache[design_id]
+            return result
 
-        # External cache
-        if self.cache_service:
+        # External cache, skipped for recently confirmed misses
+        if self.cache_service and not self._memory_cache.is_missing(design_id):
             try:
                 cached_data = await self.cache_service.get(f"ck:{design_id}")
                 if cached_data:
                     logger.debug(f"External cache hit for {design_id}")
+                    self._external_cache_stats["hits"] += 1
                     result = CKTheoryResult(**cached_data)
-                    self._memory_cache[design_id] = result
+                    self._cache_in_memory(design_id, result)
                     return result
+                self._external_cache_stats["misses"] += 1
+                self._memory_cache.mark_missing(design_id)
             except Exception as e:
                 logger.error(f"Cache retrieval error: {e}")
 
@@ -838,13 +878,8 @@ Provide:
             result: Result to cache
         """
         try:
-            # Memory cache
-            self._memory_cache[design_id] = result
-
-            # Evict oldest if full
-            if len(self._memory_cache) > self._max_memory_cache:
-                oldest_id = min(self._memory_cache.keys(), key=lambda k: self._memory_cache[k].created_at)
-                del self._memory_cache[oldest_id]
+            # Memory cache (LRU eviction)
+            self._cache_in_memory(design_id, result)
 
             # External cache
             if self.cache_service:
@@ -853,6 +888,31 @@ Provide:
         except Exception as e:
             logger.error(f"Failed to cache design: {e}")
 
+    def _cache_in_memory(self, design_id: str, result: CKTheoryResult):
+        """
+        Put design in the memory tier, sized by its serialized form
+
+        Args:
+            design_id: Unique design identifier
+            result: Result to cache
+        """
+        try:
+            self._memory_cache.set(design_id, result, size=len(result.model_dump_json()))
+        except ValueError as e:
+            logger.warning(f"Design {design_id} not kept in memory cache: {e}")
+
+    def get_cache_statistics(self) -> Dict[str, Any]:
+        """
+        Hit/miss metrics of the memory tier and the external cache
+
+        Returns:
+            Memory tier statistics plus external cache hits, misses and hit rate
+        """
+        external = dict(self._external_cache_stats)
+        lookups = external["hits"] + external["misses"]
+        external["hit_rate"] = external["hits"] / lookups if lookups else 0.0
+        return {"memory": self._memory_cache.get_statistics(), "external": external}
+
     async def _save_to_obsidian(self, result: CKTheoryResult):
         """
         Save design to Obsidian vault
@@ -0,0 +1,233 @@
+"""
+Context Search Service
+
+k-nearest-neighbour retrieval over project context chunk embeddings.
+
+- PostgreSQL mode: pgvector cosine distance (``<=>``) served by the HNSW /
+  IVFFlat index from migration 005, filtered by project_id.
+- Local mode (SQLite/mock, no pool): in-memory NumPy brute-force index.
+"""
+
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+import asyncpg
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ContextMatch:
+    """A context chunk returned by similarity search"""
+
+    file_path: str
+    content: str
+    distance: float
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def similarity(self) -> float:
+        """Cosine similarity (1 - cosine distance)"""
+        return 1.0 - self.distance
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "file_path": self.file_path,
+            "content": self.content,
+            "distance": self.distance,
+            "similarity": self.similarity,
+            "metadata": self.metadata,
+        }
+
+
+def _to_pgvector(embedding: Sequence[float]) -> str:
+    """Format an embedding as a pgvector text literal"""
+    return "[" + ",".join(str(float(x)) for x in embedding) + "]"
+
+
+class LocalVectorIndex:
+    """
+    Brute-force cosine k-NN over in-memory embeddings, per project.
+
+    Vectors are kept L2-normalised in one contiguous matrix per project so a
+    query is a single matrix-vector product plus ``argpartition``.
+    """
+
+    def __init__(self):
+        self._chunks: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._matrices: Dict[str, tuple] = {}
+
+    def upsert(
+        self,
+        project_id: str,
+        file_path: str,
+        content: str,
+        embedding: Sequence[float],
+        metadata: Optional[Dict[str, Any]] = None,
+    ):
+        """Add or replace a chunk's embedding"""
+        self._chunks.setdefault(project_id, {})[file_path] = {
+            "content": content,
+            "embedding": np.asarray(embedding, dtype=np.float32),
+            "metadata": metadata or {},
+        }
+        self._matrices.pop(project_id, None)
+
+    def remove(self, project_id: str, file_path: str):
+        """Remove a chunk if present"""
+        if self._chunks.get(project_id, {}).pop(file_path, None) is not None:
+            self._matrices.pop(project_id, None)
+
+    def count(self, project_id: str) -> int:
+        return len(self._chunks.get(project_id, {}))
+
+    def _matrix(self, project_id: str):
+        cached = self._matrices.get(project_id)
+        if cached is not None:
+            return cached
+
+        chunks = self._chunks.get(project_id, {})
+        paths = list(chunks)
+        if not paths:
+            return None
+
+        matrix = np.vstack([chunks[path]["embedding"] for path in paths])
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix = matrix / np.where(norms == 0, 1.0, norms)
+
+        self._matrices[project_id] = (paths, matrix)
+        return self._matrices[project_id]
+
+    def search(self, project_id: str, query: Sequence[float], k: int = 5) -> List[ContextMatch]:
+        """Return the k chunks closest to ``query`` by cosine distance"""
+        indexed = self._matrix(project_id)
+        if indexed is None or k <= 0:
+            return []
+
+        paths, matrix = indexed
+        query_vec = np.asarray(query, dtype=np.float32)
+        if query_vec.shape[0] != matrix.shape[1]:
+            raise ValueError(f"Embedding dimension mismatch: expected {matrix.shape[1]}, got {query_vec.shape[0]}")
+
+        norm = np.linalg.norm(query_vec)
+        similarities = matrix @ (query_vec / norm if norm else query_vec)
+
+        k = min(k, len(paths))
+        top = np.argpartition(-similarities, k - 1)[:k]
+        top = top[np.argsort(-similarities[top])]
+
+        chunks = self._chunks[project_id]
+        return [
+            ContextMatch(
+                file_path=paths[i],
+                content=chunks[paths[i]]["content"],
+                distance=float(1.0 - similarities[i]),
+                metadata=chunks[paths[i]]["metadata"],
+            )
+            for i in top
+        ]
+
+
+class ContextSearchService:
+    """
+    Nearest-neighbour search over project context chunks.
+
+    Uses pgvector when a database pool is available, otherwise the local
+    NumPy index.
+    """
+
+    def __init__(self, pool: Optional[asyncpg.Pool] = None, ef_search: int = 40):
+        self.pool = pool
+        self.ef_search = ef_search
+        self.local_index = LocalVectorIndex()
+
+    @property
+    def mode(self) -> str:
+        return "postgres" if self.pool is not None else "local"
+
+    async def index_chunk(
+        self,
+        project_id: str,
+        file_path: str,
+        content: str,
+        embedding: Sequence[float],
+        metadata: Optional[Dict[str, Any]] = None,
+    ):
+        """Store a chunk embedding (local mode only; PostgreSQL is fed by DualWriteManager)"""
+        if self.pool is not None:
+            raise RuntimeError("Chunks are written to PostgreSQL through DualWriteManager")
+        self.local_index.upsert(project_id, file_path, content, embedding, metadata)
+
+    async def search(self, project_id: str, query_embedding: Sequence[float], k: int = 5) -> List[ContextMatch]:
+        """
+        Find the k chunks of a project most similar to ``query_embedding``.
+
+        Args:
+            project_id: Project to search within
+            query_embedding: Query vector (same dimension as stored embeddings)
+            k: Number of neighbours to return
+
+        Returns:
+            Matches ordered by ascending cosine distance
+        """
+        if self.pool is None:
+            return self.local_index.search(project_id, query_embedding, k)
+
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                # Candidate list size for HNSW; ignored when IVFFlat is used
+                await conn.execute(f"SET LOCAL hnsw.ef_search = {max(int(self.ef_search), k)}")
+                rows = await conn.fetch(
+                    """
+                    SELECT file_path, content_chunk, metadata, embedding <=> $2::vector AS distance
+                    FROM project_contexts
+                    WHERE project_id = $1 AND embedding IS NOT NULL
+                    ORDER BY embedding <=> $2::vector
+                    LIMIT $3
+                """,
+                    project_id,
+                    _to_pgvector(query_embedding),
+                    k,
+                )
+
+        matches = []
+        for row in rows:
+            metadata = row["metadata"] or {}
+            if isinstance(metadata, str):
+                metadata = json.loads(metadata)
+            matches.append(
+                ContextMatch(
+                    file_path=row["file_path"],
+                    content=row["content_chunk"] or "",
+                    distance=float(row["distance"]),
+                    metadata=metadata,
+                )
+            )
+        return matches
+
+
+# ============================================================
+# Singleton Instance
+# ============================================================
+
+_local_search_service: Optional[ContextSearchService] = None
+
+
+def get_context_search_service() -> ContextSearchService:
+    """Get a pgvector-backed service if the database pool is up, else the local fallback"""
+    global _local_search_service
+
+    try:
+        from backend.async_database import async_db
+
+        if async_db._initialized:
+            return ContextSearchService(pool=async_db.get_pool())
+    except Exception as e:
+        logger.debug(f"Database pool unavailable for context search, using local index: {e}")
+
+    if _local_search_service is None:
+        _local_search_service = ContextSearchService(pool=None)
+    return _local_search_service
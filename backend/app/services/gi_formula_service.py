@@ -14,9 +14,11 @@ Stages:
 import logging
 import asyncio
 import hashlib
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import AsyncIterator, Dict, List, Optional, Any, Union
 
+from ..core.cache_manager import CacheManager
 from ..models.gi_formula import (
     StageType,
     StageResult,
@@ -35,6 +37,9 @@ class GIFormulaService:
 
     Features:
     - 5-stage insight generation (O -> C -> P -> S -> B)
+    - Stage DAG: stages run as soon as their inputs are ready, independent stages concurrently
+    - Partial results streamed stage by stage (stream_insight)
+    - Stage output cache keyed by stage and formatted prompt
     - Sequential MCP integration for structured reasoning
     - 3-tier caching (Memory -> Redis -> SQLite)
     - Obsidian auto-save
@@ -59,26 +64,40 @@ class GIFormulaService:
         self.cache_service = cache_service
         self.config = config or {}
 
-        # In-memory cache for recent insights
-        self._memory_cache: Dict[str, GIFormulaResult] = {}
-        self._max_memory_cache = self.config.get("max_memory_cache", 10)
+        # In-memory LRU tier for recent insights (count- and byte-bounded, negative caching)
+        self._memory_cache = CacheManager(
+            max_size_bytes=self.config.get("max_memory_cache_bytes", 10 * 1024 * 1024),
+            max_entries=self.config.get("max_memory_cache", 10),
+            negative_ttl_seconds=self.config.get("negative_cache_ttl", 60),
+        )
+        self._external_cache_stats = {"hits": 0, "misses": 0}
+
+        # Stage output cache (stage + formatted prompt -> StageResult)
+        self._stage_cache: "OrderedDict[str, StageResult]" = OrderedDict()
+        self._max_stage_cache = self.config.get("max_stage_cache", 128)
 
         # Stage configurations
+        # "inputs" maps prompt fields to a request field ("problem", "context") or to
+        # the stage whose content feeds it; the latter define the stage DAG.
         self._stage_configs = {
             StageType.OBSERVATION: {
                 "prompt_template": "Extract key facts and constraints from: {problem}. Context: {context}",
+                "inputs": {"problem": "problem", "context": "context"},
                 "timeout": 5000,  # ms
             },
             StageType.CONNECTION: {
                 "prompt_template": "Find relationships between these observations: {observations}",
+                "inputs": {"observations": StageType.OBSERVATION},
                 "timeout": 6000,
             },
             StageType.PATTERN: {
                 "prompt_template": "Identify patterns and trends from connections: {connections}",
+                "inputs": {"connections": StageType.CONNECTION},
                 "timeout": 6000,
             },
             StageType.SYNTHESIS: {
                 "prompt_template": "Synthesize actionable insight from patterns: {patterns}",
+                "inputs": {"patterns": StageType.PATTERN},
                 "timeout": 7000,
             },
             StageType.BIAS_CHECK: {
@@ -103,6 +122,28 @@ class GIFormulaService:
             ValueError: If request validation fails
             RuntimeError: If insight generation fails
         """
+        result = None
+        async for item in self.stream_insight(request):
+            if isinstance(item, GIFormulaResult):
+                result = item
+        return result
+
+    async def stream_insight(self, request: GIFormulaRequest) -> AsyncIterator[Union[StageResult, GIFormulaResult]]:
+        """
+        Generate insight, yielding each stage result as soon as it completes
+
+        Stages run through the stage DAG (see ``_stage_configs``); the final
+        item is the complete GIFormulaResult.
+
+        Args:
+            request: GI Formula request with problem and context
+
+        Yields:
+            StageResult per completed stage, then the GIFormulaResult
+
+        Raises:
+            RuntimeError: If insight generation fails
+        """
         start_time = datetime.now()
 
         try:
@@ -113,28 +154,21 @@ class GIFormulaService:
             cached_result = await self._get_cached_insight(insight_id)
             if cached_result:
                 logger.info(f"Cache hit for insight {insight_id}")
-                return cached_result
+                for stage in cached_result.stages.values():
+                    yield stage
+                yield cached_result
+                return
 
             logger.info(f"Generating insight {insight_id} for problem: {request.problem[:50]}...")
 
-            # Execute 5 stages sequentially
+            # Stages 1-4: Observation, Connection, Pattern, Synthesis
             stages: Dict[str, StageResult] = {}
-
-            # Stage 1: Observation
-            stages["observation"] = await self._execute_stage(
-                StageType.OBSERVATION, problem=request.problem, context=request.context or {}
-            )
-
-            # Stage 2: Connection
-            stages["connection"] = await self._execute_stage(StageType.CONNECTION, observations=stages["observation"].content)
-
-            # Stage 3: Pattern
-            stages["pattern"] = await self._execute_stage(StageType.PATTERN, connections=stages["connection"].content)
-
-            # Stage 4: Synthesis
-            stages["synthesis"] = await self._execute_stage(StageType.SYNTHESIS, patterns=stages["pattern"].content)
+            async for stage_result in self._run_stage_dag(request):
+                stages[stage_result.stage.value] = stage_result
+                yield stage_result
 
             # Stage 5: Bias Check
+            bias_start = datetime.now()
             bias_check_result = await self._execute_bias_check(insight=stages["synthesis"].content)
 
             stages["bias_check"] = StageResult(
@@ -144,18 +178,15 @@ class GIFormulaService:
                     "biases": bias_check_result.biases_detected,
                     "strategies": bias_check_result.mitigation_strategies,
                 },
-                duration_ms=0,  # Will be set below
+                duration_ms=int((datetime.now() - bias_start).total_seconds() * 1000),
+                timestamp=bias_start,
             )
+            yield stages["bias_check"]
 
             # Calculate total duration
             end_time = datetime.now()
             total_duration_ms = int((end_time - start_time).total_seconds() * 1000)
 
-            # Update bias check duration
-            stages["bias_check"].duration_ms = total_duration_ms - sum(
-                s.duration_ms for s in stages.values() if s.stage != StageType.BIAS_CHECK
-            )
-
             # Build result
             result = GIFormulaResult(
                 id=insight_id,
@@ -183,7 +214,7 @@ class GIFormulaService:
                 f"(bias confidence: {bias_check_result.confidence_score:.2f})"
             )
 
-            return result
+            yield result
 
         except Exception as e:
             logger.error(f"Failed to generate insight: {e}", exc_info=True)
@@ -263,13 +294,13 @@ class GIFormulaService:
         """
         try:
             # Remove from memory cache
-            if insight_id in self._memory_cache:
-                del self._memory_cache[insight_id]
+            if self._memory_cache.delete(insight_id):
                 logger.info(f"Deleted insight {insight_id} from memory cache")
 
             # Remove from Redis/SQLite cache
             if self.cache_service:
                 await self.cache_service.delete(f"gi:{insight_id}")
+            self._memory_cache.mark_missing(insight_id)
 
             return True
 
@@ -279,6 +310,77 @@ class GIFormulaService:
 
     # Private helper methods
 
+    def _stage_dependencies(self, stage_type: StageType) -> List[StageType]:
+        """Stages whose content feeds ``stage_type``"""
+        inputs = self._stage_configs[stage_type].get("inputs", {})
+        return [source for source in inputs.values() if isinstance(source, StageType)]
+
+    async def _run_stage_dag(self, request: GIFormulaRequest) -> AsyncIterator[StageResult]:
+        """
+        Run every DAG stage, starting each one as soon as its inputs are ready
+
+        Args:
+            request: GI Formula request providing the request fields
+
+        Yields:
+            Stage results in completion order
+        """
+        values: Dict[Any, Any] = {"problem": request.problem, "context": request.context or {}}
+        pending = [stage for stage, config in self._stage_configs.items() if "inputs" in config]
+        running: Dict[asyncio.Task, StageType] = {}
+
+        try:
+            while pending or running:
+                ready = [stage for stage in pending if all(dep in values for dep in self._stage_dependencies(stage))]
+                for stage in ready:
+                    pending.remove(stage)
+                    kwargs = {name: values[source] for name, source in self._stage_configs[stage]["inputs"].items()}
+                    running[asyncio.create_task(self._execute_stage_cached(stage, **kwargs))] = stage
+
+                if not running:
+                    raise RuntimeError(f"Unsatisfiable stage dependencies: {[stage.value for stage in pending]}")
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    stage = running.pop(task)
+                    stage_result = task.result()
+                    values[stage] = stage_result.content
+                    yield stage_result
+        finally:
+            for task in running:
+                task.cancel()
+
+    async def _execute_stage_cached(self, stage_type: StageType, **kwargs) -> StageResult:
+        """
+        Execute a stage, reusing the cached output for an identical prompt
+
+        Failed stages are not cached.
+
+        Args:
+            stage_type: Stage to execute
+            **kwargs: Stage-specific parameters
+
+        Returns:
+            Stage result (metadata["cached"] is True on a cache hit)
+        """
+        prompt = self._stage_configs[stage_type]["prompt_template"].format(**kwargs)
+        cache_key = hashlib.sha256(f"{stage_type.value}:{prompt}".encode()).hexdigest()
+
+        cached = self._stage_cache.get(cache_key)
+        if cached is not None:
+            self._stage_cache.move_to_end(cache_key)
+            logger.debug(f"Stage cache hit for {stage_type.value}")
+            return cached.model_copy(
+                update={"metadata": {**cached.metadata, "cached": True}, "duration_ms": 0, "timestamp": datetime.now()}
+            )
+
+        result = await self._execute_stage(stage_type, **kwargs)
+        if "error" not in result.metadata:
+            self._stage_cache[cache_key] = result
+            if len(self._stage_cache) > self._max_stage_cache:
+                self._stage_cache.popitem(last=False)
+        return result
+
     async def _execute_stage(self, stage_type: StageType, **kwargs) -> StageResult:
         """
         Execute a single GI Formula stage
@@ -462,20 +564,24 @@ class GIFormulaService:
             Cached result or None
         """
         # Tier 1: Memory cache
-        if insight_id in self._memory_cache:
+        result = self._memory_cache.get(insight_id)
+        if result is not None:
             logger.debug(f"Memory cache hit for {insight_id}")
-            return self._memory_cache[insight_id]
+            return result
 
-        # Tier 2 & 3: External cache (Redis/SQLite)
-        if self.cache_service:
+        # Tier 2 & 3: External cache (Redis/SQLite), skipped for recently confirmed misses
+        if self.cache_service and not self._memory_cache.is_missing(insight_id):
             try:
                 cached_data = await self.cache_service.get(f"gi:{insight_id}")
                 if cached_data:
                     logger.debug(f"External cache hit for {insight_id}")
+                    self._external_cache_stats["hits"] += 1
                     result = GIFormulaResult(**cached_data)
                     # Populate memory cache
-                    self._memory_cache[insight_id] = result
+                    self._cache_in_memory(insight_id, result)
                     return result
+                self._external_cache_stats["misses"] += 1
+                self._memory_cache.mark_missing(insight_id)
             except Exception as e:
                 logger.error(f"Cache retrieval error: {e}")
 
@@ -490,13 +596,8 @@ class GIFormulaService:
             result: Result to cache
         """
         try:
-            # Tier 1: Memory cache
-            self._memory_cache[insight_id] = result
-
-            # Evict oldest if cache full
-            if len(self._memory_cache) > self._max_memory_cache:
-                oldest_id = min(self._memory_cache.keys(), key=lambda k: self._memory_cache[k].created_at)
-                del self._memory_cache[oldest_id]
+            # Tier 1: Memory cache (LRU eviction)
+            self._cache_in_memory(insight_id, result)
 
             # Tier 2 & 3: External cache
             if self.cache_service:
@@ -507,6 +608,31 @@ class GIFormulaService:
         except Exception as e:
             logger.error(f"Failed to cache insight: {e}")
 
+    def _cache_in_memory(self, insight_id: str, result: GIFormulaResult):
+        """
+        Put insight in the memory tier, sized by its serialized form
+
+        Args:
+            insight_id: Unique insight identifier
+            result: Result to cache
+        """
+        try:
+            self._memory_cache.set(insight_id, result, size=len(result.model_dump_json()))
+        except ValueError as e:
+            logger.warning(f"Insight {insight_id} not kept in memory cache: {e}")
+
+    def get_cache_statistics(self) -> Dict[str, Any]:
+        """
+        Hit/miss metrics of the memory tier and the external cache
+
+        Returns:
+            Memory tier statistics plus external cache hits, misses and hit rate
+        """
+        external = dict(self._external_cache_stats)
+        lookups = external["hits"] + external["misses"]
+        external["hit_rate"] = external["hits"] / lookups if lookups else 0.0
+        return {"memory": self._memory_cache.get_statistics(), "external": external}
+
     async def _save_to_obsidian(self, result: GIFormulaResult):
         """
         Save insight to Obsidian vault
@@ -3,16 +3,28 @@ Git Integration Service
 Provides Git repository interaction and version history extraction
 """
 
+import copy
 import logging
 import subprocess
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, Callable, List, Optional, Tuple
 
 from ..models.version_history import VersionCommit, VersionComparison, VersionHistory
 
 logger = logging.getLogger(__name__)
 
+# Machine-parseable git log records: hash, short hash, author, email, ISO date,
+# decorations (%D) and subject, separated by ASCII unit/record separators
+FIELD_SEPARATOR = "\x1f"
+RECORD_SEPARATOR = "\x1e"
+LOG_FORMAT = "%x1e" + "%x1f".join(["%H", "%h", "%an", "%ae", "%aI", "%D", "%s"])
+
+# Parsed git results shared by all GitService instances (routers create one per request)
+MAX_HISTORY_CACHE = 64
+_HISTORY_CACHE: "OrderedDict[tuple, Any]" = OrderedDict()
+
 
 class GitService:
     """Git repository service"""
@@ -87,6 +99,53 @@ class GitService:
         except ValueError:
             return 0
 
+    def resolve_ref(self, branch: Optional[str] = None) -> Tuple[str, str, Optional[str]]:
+        """
+        Resolve a ref with a single rev-parse
+
+        Args:
+            branch: Branch, tag or commit (default: HEAD)
+
+        Returns:
+            Tuple of (display name, commit sha, local branch name or None);
+            the sha is empty if the ref does not resolve
+        """
+        ref = branch or "HEAD"
+        stdout, _, returncode = self._run_git_command(["rev-parse", ref, "--symbolic-full-name", ref])
+
+        if returncode != 0 or not stdout:
+            return branch or "unknown", "", None
+
+        lines = stdout.split("\n")
+        sha = lines[0].strip()
+        full_name = lines[1].strip() if len(lines) > 1 else ""
+
+        if full_name.startswith("refs/heads/"):
+            local_branch = full_name[len("refs/heads/") :]
+            return local_branch, sha, local_branch
+
+        return ref, sha, None
+
+    def _cached(self, key: tuple, load: Callable[[], Any]) -> Any:
+        """
+        Return a copy of a cached git result, loading it on a miss
+
+        Keys include the resolved commit sha, so entries stay valid until a new
+        commit moves the ref. Tags or branches created without a new commit are
+        picked up once the sha changes.
+        """
+        key = (str(self.repo_path),) + key
+        if key in _HISTORY_CACHE:
+            _HISTORY_CACHE.move_to_end(key)
+            return copy.deepcopy(_HISTORY_CACHE[key])
+
+        value = load()
+        _HISTORY_CACHE[key] = value
+        while len(_HISTORY_CACHE) > MAX_HISTORY_CACHE:
+            _HISTORY_CACHE.popitem(last=False)
+
+        return copy.deepcopy(value)
+
     def get_commits(
         self,
         branch: Optional[str] = None,
@@ -112,21 +171,36 @@ class GitService:
         Returns:
             List of VersionCommit objects
         """
+        _, sha, local_branch = self.resolve_ref(branch)
+        if not sha:
+            return []
+
+        return self._get_commits(sha, local_branch, limit, skip, author, since, until, search)
+
+    def _get_commits(
+        self,
+        sha: str,
+        local_branch: Optional[str],
+        limit: int,
+        skip: int,
+        author: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        search: Optional[str] = None,
+    ) -> List[VersionCommit]:
+        """Load commits reachable from sha with one git log (cached per sha and query)"""
         # Build Git log arguments
         args = [
             "log",
             f"--max-count={limit}",
             f"--skip={skip}",
-            "--format=%H|%h|%an|%ae|%ai|%s|%b",
+            f"--format={LOG_FORMAT}",
+            "--decorate=full",
             "--numstat",
             "--no-merges",
+            sha,
         ]
 
-        if branch:
-            args.append(branch)
-        else:
-            args.append("HEAD")
-
         if author:
             args.append(f"--author={author}")
 
@@ -139,121 +213,113 @@ class GitService:
         if search:
             args.append(f"--grep={search}")
 
-        stdout, stderr, returncode = self._run_git_command(args)
+        def load() -> List[VersionCommit]:
+            stdout, stderr, returncode = self._run_git_command(args)
 
-        if returncode != 0:
-            logger.error(f"Failed to get commits: {stderr}")
-            return []
+            if returncode != 0:
+                logger.error(f"Failed to get commits: {stderr}")
+                return []
+
+            return self._parse_log_records(stdout, local_branch)
 
-        return self._parse_commit_log(stdout)
+        return self._cached(("commits", local_branch, tuple(args)), load)
 
-    def _parse_commit_log(self, log_output: str) -> List[VersionCommit]:
+    def _parse_log_records(self, log_output: str, local_branch: Optional[str] = None) -> List[VersionCommit]:
         """
-        Parse Git log output
+        Parse git log output written with LOG_FORMAT
+
+        Each record starts with RECORD_SEPARATOR followed by the header fields,
+        then optional --numstat lines. Tags and branches come from the %D
+        decorations, so no extra git calls are made per commit.
 
         Args:
-            log_output: Output from git log --numstat
+            log_output: Output from git log --format=LOG_FORMAT [--numstat]
+            local_branch: Branch being walked; every listed commit is on it
 
         Returns:
             List of VersionCommit objects
         """
         commits = []
-        current_commit = None
-        lines_added = 0
-        lines_deleted = 0
-        files_modified = []
-        files_added = []
-        files_deleted = []
-
-        for line in log_output.split("\n"):
-            line = line.strip()
 
-            if not line:
-                # Empty line marks end of commit stats
-                if current_commit:
-                    current_commit.lines_added = lines_added
-                    current_commit.lines_deleted = lines_deleted
-                    current_commit.files_modified = files_modified
-                    current_commit.files_added = files_added
-                    current_commit.files_deleted = files_deleted
-
-                    commits.append(current_commit)
-
-                    # Reset for next commit
-                    current_commit = None
-                    lines_added = 0
-                    lines_deleted = 0
-                    files_modified = []
-                    files_added = []
-                    files_deleted = []
+        for record in log_output.split(RECORD_SEPARATOR):
+            header, _, stats = record.partition("\n")
+            fields = header.split(FIELD_SEPARATOR)
+            if len(fields) < 6:
                 continue
 
-            if "|" in line and not current_commit:
-                # Commit header line
-                parts = line.split("|")
-                if len(parts) >= 6:
-                    commit_hash = parts[0]
-                    short_hash = parts[1]
-                    author = parts[2]
-                    author_email = parts[3]
-                    date_str = parts[4]
-                    message = parts[5]
-
-                    # Parse date
-                    try:
-                        commit_date = datetime.fromisoformat(date_str.replace(" ", "T"))
-                    except (ValueError, TypeError):
-                        commit_date = datetime.now()
-
-                    # Get tags for this commit
-                    tags = self.get_commit_tags(commit_hash)
-
-                    # Get branches for this commit
-                    branches = self.get_commit_branches(commit_hash)
-
-                    current_commit = VersionCommit(
-                        commit_hash=commit_hash,
-                        short_hash=short_hash,
-                        author=author,
-                        author_email=author_email,
-                        date=commit_date,
-                        message=message,
-                        tags=tags,
-                        branches=branches,
-                    )
-
-            elif current_commit and "\t" in line:
+            # An empty subject at the very end is lost when the output is stripped
+            commit_hash, short_hash, author, author_email, date_str, decorations, message = (fields + [""])[:7]
+
+            # Parse date
+            try:
+                commit_date = datetime.fromisoformat(date_str)
+            except (ValueError, TypeError):
+                commit_date = datetime.now()
+
+            tags, branches = self._parse_decorations(decorations)
+            if local_branch and local_branch not in branches:
+                branches.insert(0, local_branch)
+
+            commit = VersionCommit(
+                commit_hash=commit_hash,
+                short_hash=short_hash,
+                author=author,
+                author_email=author_email,
+                date=commit_date,
+                message=message,
+                tags=tags,
+                branches=branches,
+            )
+
+            for line in stats.split("\n"):
                 # File stat line: "5\t3\tfile.py"
-                parts = line.split("\t")
-                if len(parts) >= 3:
-                    added_str = parts[0]
-                    deleted_str = parts[1]
-                    filename = parts[2]
-
-                    # Track file changes
-                    if added_str == "-" and deleted_str == "-":
-                        # Binary file
-                        files_modified.append(filename)
-                    elif added_str != "0" or deleted_str != "0":
-                        # Modified file
-                        files_modified.append(filename)
-
-                        # Track lines
-                        try:
-                            lines_added += int(added_str) if added_str != "-" else 0
-                            lines_deleted += int(deleted_str) if deleted_str != "-" else 0
-                        except ValueError:
-                            pass
-
-        # Don't forget last commit
-        if current_commit:
-            current_commit.lines_added = lines_added
-            current_commit.lines_deleted = lines_deleted
-            current_commit.files_modified = files_modified
-            commits.append(current_commit)
+                parts = line.strip().split("\t")
+                if len(parts) < 3:
+                    continue
+
+                added_str, deleted_str, filename = parts[0], parts[1], parts[2]
+
+                # Track file changes
+                if added_str == "-" and deleted_str == "-":
+                    # Binary file
+                    commit.files_modified.append(filename)
+                elif added_str != "0" or deleted_str != "0":
+                    # Modified file
+                    commit.files_modified.append(filename)
+
+                    # Track lines
+                    try:
+                        commit.lines_added += int(added_str)
+                        commit.lines_deleted += int(deleted_str)
+                    except ValueError:
+                        pass
+
+            commits.append(commit)
 
         return commits
 
+    @staticmethod
+    def _parse_decorations(decorations: str) -> Tuple[List[str], List[str]]:
+        """
+        Split a --decorate=full %D string into tags and local branches
+
+        Example: "HEAD -> refs/heads/main, tag: refs/tags/v1.0, refs/remotes/origin/main"
+        """
+        tags = []
+        branches = []
+
+        for ref in decorations.split(", "):
+            ref = ref.strip()
+            if ref.startswith("HEAD -> "):
+                ref = ref[len("HEAD -> ") :]
+
+            if ref.startswith("tag: refs/tags/"):
+                tags.append(ref[len("tag: refs/tags/") :])
+            elif ref.startswith("refs/heads/"):
+                branches.append(ref[len("refs/heads/") :])
+
+        return tags, branches
+
     def get_commit_tags(self, commit_hash: str) -> List[str]:
         """Get tags pointing to a commit"""
         stdout, _, returncode = self._run_git_command(["tag", "--points-at", commit_hash])
@@ -274,10 +340,45 @@ class GitService:
         branches = [branch.strip() for branch in stdout.split("\n") if branch.strip()]
         return branches
 
+    def is_ancestor(self, ancestor: str, descendant: str) -> bool:
+        """Whether ancestor is reachable from descendant"""
+        _, _, returncode = self._run_git_command(["merge-base", "--is-ancestor", ancestor, descendant])
+        return returncode == 0
+
+    def load_commit_range(
+        self, to_sha: str, from_sha: Optional[str] = None, local_branch: Optional[str] = None
+    ) -> List[VersionCommit]:
+        """
+        Load all commits reachable from to_sha but not from from_sha (uncached)
+
+        Used for ingestion into the version_history table; one git log call.
+
+        Args:
+            to_sha: Newest commit
+            from_sha: Last commit already known (default: load the whole history)
+            local_branch: Branch being walked (added to each commit's branches)
+
+        Returns:
+            List of VersionCommit objects, newest first
+        """
+        rev_range = f"{from_sha}..{to_sha}" if from_sha else to_sha
+        stdout, stderr, returncode = self._run_git_command(
+            ["log", f"--format={LOG_FORMAT}", "--decorate=full", "--numstat", "--no-merges", rev_range]
+        )
+
+        if returncode != 0:
+            raise RuntimeError(f"Failed to read commits {rev_range}: {stderr}")
+
+        return self._parse_log_records(stdout, local_branch)
+
     def get_version_history(self, branch: Optional[str] = None, limit: int = 50, skip: int = 0) -> VersionHistory:
         """
         Get complete version history
 
+        Resolves the ref once; on a cache miss the commits, tags and branch
+        decorations come from a single git log and the total from rev-list.
+        Results are cached per commit sha, so repeated views cost one rev-parse.
+
         Args:
             branch: Branch name (default: current branch)
             limit: Maximum number of commits
@@ -286,10 +387,14 @@ class GitService:
         Returns:
             VersionHistory object
         """
-        current_branch = branch or self.get_current_branch()
-        total_commits = self.get_commit_count(current_branch)
+        current_branch, sha, local_branch = self.resolve_ref(branch)
 
-        commits = self.get_commits(branch=current_branch, limit=limit, skip=skip)
+        if sha:
+            total_commits = self._cached(("count", sha), lambda: self.get_commit_count(sha))
+            commits = self._get_commits(sha, local_branch, limit=limit, skip=skip)
+        else:
+            total_commits = 0
+            commits = []
 
         # Calculate statistics
         unique_authors = set()
@@ -367,14 +472,15 @@ class GitService:
             [
                 "log",
                 f"{from_commit}..{to_commit}",
-                "--format=%H|%h|%an|%ae|%ai|%s",
+                f"--format={LOG_FORMAT}",
+                "--decorate=full",
                 "--no-merges",
             ]
         )
 
         commits_between = []
         if returncode == 0:
-            commits_between = self._parse_commit_log(stdout)
+            commits_between = self._parse_log_records(stdout)
 
         return VersionComparison(
             from_commit=from_commit,
@@ -12,8 +12,9 @@ import asyncio
 import json
 import logging
 import os
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote, unquote, urlparse
 
 import redis.asyncio as redis
 from redis.asyncio.client import PubSub
@@ -29,6 +30,8 @@ class RedisConfig:
         self.port = int(os.getenv("REDIS_PORT", "6379"))
         self.db = int(os.getenv("REDIS_DB", "0"))
         self.password = os.getenv("REDIS_PASSWORD", None)
+        self.username = os.getenv("REDIS_USERNAME", None)
+        self.ssl = os.getenv("REDIS_SSL", "false").lower() == "true"
         self.decode_responses = True
         self.socket_timeout = 5
         self.socket_connect_timeout = 5
@@ -38,11 +41,30 @@ class RedisConfig:
             "retry_on_error": [redis.ConnectionError, redis.TimeoutError],
         }
 
+    @classmethod
+    def from_url(cls, url: str) -> "RedisConfig":
+        """Build a config from a redis:// or rediss:// (TLS) URL, keeping defaults for the rest"""
+        parsed = urlparse(url)
+        config = cls()
+        config.ssl = parsed.scheme == "rediss"
+        config.host = parsed.hostname or config.host
+        config.port = parsed.port or config.port
+        config.username = unquote(parsed.username) if parsed.username else config.username
+        config.password = unquote(parsed.password) if parsed.password else config.password
+        if parsed.path and parsed.path.strip("/"):
+            config.db = int(parsed.path.strip("/"))
+        return config
+
     def get_url(self) -> str:
         """Get Redis connection URL"""
-        if self.password:
-            return f"redis://:{self.password}@{self.host}:{self.port}/{self.db}"
-        return f"redis://{self.host}:{self.port}/{self.db}"
+        scheme = "rediss" if self.ssl else "redis"
+        auth = ""
+        if self.username or self.password:
+            auth = quote(self.username or "", safe="")
+            if self.password:
+                auth += ":" + quote(self.password, safe="")
+            auth += "@"
+        return f"{scheme}://{auth}{self.host}:{self.port}/{self.db}"
 
 
 class RedisKeys:
@@ -57,9 +79,9 @@ class RedisKeys:
     # Session keys
     SESSION_PREFIX = "udo:session:"
     SESSION_DATA = "udo:session:{}:data"
-    SESSION_HEARTBEAT = "udo:session:{}:heartbeat"
     SESSION_LOCKS = "udo:session:{}:locks"
     ACTIVE_SESSIONS = "udo:sessions:active"
+    SESSION_HEARTBEATS = "udo:sessions:heartbeats"  # ZSET: session_id -> last heartbeat (epoch seconds)
 
     # Project keys
     PROJECT_PREFIX = "udo:project:"
@@ -75,17 +97,62 @@ class RedisKeys:
     CHANNEL_BROADCAST = "udo:channel:broadcast"
 
 
+class LockScripts:
+    """
+    Server-side Lua scripts for atomic lock operations
+
+    Each script runs as a single round trip and cannot interleave with
+    other clients, so ownership checks and writes never race.
+    """
+
+    # KEYS[1] = lock key, ARGV[1] = owner token, ARGV[2] = ttl (ms)
+    # Returns 1 when acquired (or re-acquired by the same owner), 0 otherwise
+    ACQUIRE = """
+    if redis.call("SET", KEYS[1], ARGV[1], "NX", "PX", ARGV[2]) then
+        return 1
+    end
+    if redis.call("GET", KEYS[1]) == ARGV[1] then
+        redis.call("PEXPIRE", KEYS[1], ARGV[2])
+        return 1
+    end
+    return 0
+    """
+
+    # KEYS[1] = lock key, ARGV[1] = owner token
+    RELEASE = """
+    if redis.call("GET", KEYS[1]) == ARGV[1] then
+        return redis.call("DEL", KEYS[1])
+    end
+    return 0
+    """
+
+    # KEYS[1] = lock key, ARGV[1] = owner token, ARGV[2] = ttl (ms)
+    EXTEND = """
+    if redis.call("GET", KEYS[1]) == ARGV[1] then
+        return redis.call("PEXPIRE", KEYS[1], ARGV[2])
+    end
+    return 0
+    """
+
+
 class RedisClient:
     """
     Async Redis client with connection pooling and retry logic
     """
 
+    # Sessions without a heartbeat for this long are considered dead
+    HEARTBEAT_TIMEOUT = 30
+
     def __init__(self, config: Optional[RedisConfig] = None):
         self.config = config or RedisConfig()
         self._client: Optional[redis.Redis] = None
         self._pubsub: Optional[PubSub] = None
         self._connected = False
         self._lock = asyncio.Lock()
+        self._acquire_script = None
+        self._release_script = None
+        self._extend_script = None
+        self.lease_renewer = LockLeaseRenewer(self)
 
     async def connect(self) -> bool:
         """Initialize Redis connection with retry logic"""
@@ -110,6 +177,9 @@ class RedisClient:
                 # Setup pub/sub
                 self._pubsub = self._client.pubsub()
 
+                # Register lock scripts (EVALSHA with automatic reload)
+                self._register_lock_scripts()
+
                 self._connected = True
                 logger.info("Redis connection established")
                 return True
@@ -121,6 +191,8 @@ class RedisClient:
 
     async def disconnect(self):
         """Close Redis connection"""
+        await self.lease_renewer.stop()
+
         async with self._lock:
             if self._pubsub:
                 await self._pubsub.close()
@@ -147,6 +219,12 @@ class RedisClient:
 
     # ============= Lock Operations =============
 
+    def _register_lock_scripts(self):
+        """Register atomic lock scripts on the current client"""
+        self._acquire_script = self._client.register_script(LockScripts.ACQUIRE)
+        self._release_script = self._client.register_script(LockScripts.RELEASE)
+        self._extend_script = self._client.register_script(LockScripts.EXTEND)
+
     async def acquire_lock(
         self,
         key: str,
@@ -156,11 +234,14 @@ class RedisClient:
         blocking_timeout: int = 5,
     ) -> bool:
         """
-        Acquire a distributed lock using SET NX
+        Acquire a distributed lock atomically (SET NX PX with owner token)
+
+        Re-acquiring a lock already held by ``value`` succeeds and refreshes
+        its TTL, so callers never need a separate read round trip.
 
         Args:
             key: Lock key
-            value: Lock value (usually session_id)
+            value: Lock value (owner token, usually session_id)
             ttl: Lock TTL in seconds
             blocking: Whether to wait for lock
             blocking_timeout: Max wait time if blocking
@@ -171,42 +252,41 @@ class RedisClient:
         if not await self.ensure_connected():
             return False
 
+        ttl_ms = int(ttl * 1000)
+
         try:
-            if blocking:
-                # Try to acquire with retries
-                end_time = datetime.now() + timedelta(seconds=blocking_timeout)
-                while datetime.now() < end_time:
-                    success = await self._client.set(key, value, nx=True, ex=ttl)  # Only set if not exists  # Expire after TTL
-                    if success:
-                        return True
-                    await asyncio.sleep(0.1)
-                return False
-            else:
-                # Single attempt
-                return await self._client.set(key, value, nx=True, ex=ttl)
+            if not blocking:
+                return bool(await self._acquire_script(keys=[key], args=[value, ttl_ms]))
+
+            # Retry with capped exponential backoff until the deadline
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + blocking_timeout
+            delay = 0.01
+            while True:
+                if await self._acquire_script(keys=[key], args=[value, ttl_ms]):
+                    return True
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return False
+                await asyncio.sleep(min(delay, remaining))
+                delay = min(delay * 2, 0.2)
         except Exception as e:
             logger.error(f"Failed to acquire lock {key}: {e}")
             return False
 
     async def release_lock(self, key: str, value: str) -> bool:
         """
-        Release a lock if held by this session
+        Release a lock if held by this owner
 
-        Uses Lua script for atomic check-and-delete
+        Uses Lua script for atomic compare-and-delete
         """
+        self.lease_renewer.untrack(key)
+
         if not await self.ensure_connected():
             return False
 
-        lua_script = """
-        if redis.call("GET", KEYS[1]) == ARGV[1] then
-            return redis.call("DEL", KEYS[1])
-        else
-            return 0
-        end
-        """
-
         try:
-            result = await self._client.eval(lua_script, 1, key, value)
+            result = await self._release_script(keys=[key], args=[value])
             return bool(result)
         except Exception as e:
             logger.error(f"Failed to release lock {key}: {e}")
@@ -214,23 +294,15 @@ class RedisClient:
 
     async def extend_lock(self, key: str, value: str, ttl: int = 300) -> bool:
         """
-        Extend lock TTL if held by this session
+        Extend lock TTL if held by this owner
 
-        Uses Lua script for atomic check-and-extend
+        Uses Lua script for atomic compare-and-pexpire
         """
         if not await self.ensure_connected():
             return False
 
-        lua_script = """
-        if redis.call("GET", KEYS[1]) == ARGV[1] then
-            return redis.call("EXPIRE", KEYS[1], ARGV[2])
-        else
-            return 0
-        end
-        """
-
         try:
-            result = await self._client.eval(lua_script, 1, key, value, ttl)
+            result = await self._extend_script(keys=[key], args=[value, int(ttl * 1000)])
             return bool(result)
         except Exception as e:
             logger.error(f"Failed to extend lock {key}: {e}")
@@ -250,21 +322,20 @@ class RedisClient:
     # ============= Session Operations =============
 
     async def register_session(self, session_id: str, session_data: Dict[str, Any], ttl: int = 3600) -> bool:
-        """Register a new session"""
+        """Register a new session (single pipelined round trip)"""
         if not await self.ensure_connected():
             return False
 
         try:
-            # Store session data
             session_key = RedisKeys.SESSION_DATA.format(session_id)
-            await self._client.setex(session_key, ttl, json.dumps(session_data))
-
-            # Add to active sessions set
-            await self._client.sadd(RedisKeys.ACTIVE_SESSIONS, session_id)
-
-            # Set heartbeat
-            heartbeat_key = RedisKeys.SESSION_HEARTBEAT.format(session_id)
-            await self._client.setex(heartbeat_key, 30, str(datetime.now()))
+            async with self._client.pipeline(transaction=False) as pipe:
+                # Store session data
+                pipe.setex(session_key, ttl, json.dumps(session_data))
+                # Add to active sessions set
+                pipe.sadd(RedisKeys.ACTIVE_SESSIONS, session_id)
+                # Set heartbeat
+                pipe.zadd(RedisKeys.SESSION_HEARTBEATS, {session_id: datetime.now().timestamp()})
+                await pipe.execute()
 
             return True
         except Exception as e:
@@ -273,60 +344,110 @@ class RedisClient:
 
     async def update_session_heartbeat(self, session_id: str) -> bool:
         """Update session heartbeat to keep it alive"""
+        return await self.update_session_heartbeats([session_id])
+
+    async def update_session_heartbeats(self, session_ids: List[str]) -> bool:
+        """Update heartbeats for many sessions with a single ZADD"""
+        if not session_ids:
+            return True
+
         if not await self.ensure_connected():
             return False
 
         try:
-            heartbeat_key = RedisKeys.SESSION_HEARTBEAT.format(session_id)
-            await self._client.setex(heartbeat_key, 30, str(datetime.now()))
+            now = datetime.now().timestamp()
+            await self._client.zadd(RedisKeys.SESSION_HEARTBEATS, {session_id: now for session_id in session_ids})
             return True
         except Exception as e:
-            logger.error(f"Failed to update heartbeat for {session_id}: {e}")
+            logger.error(f"Failed to update heartbeats for {len(session_ids)} sessions: {e}")
             return False
 
     async def get_active_sessions(self) -> List[str]:
-        """Get list of active session IDs"""
+        """Get list of active session IDs (heartbeat within HEARTBEAT_TIMEOUT, single ZRANGEBYSCORE)"""
         if not await self.ensure_connected():
             return []
 
         try:
-            sessions = await self._client.smembers(RedisKeys.ACTIVE_SESSIONS)
-
-            # Filter out dead sessions (no heartbeat)
-            active = []
-            for session_id in sessions:
-                heartbeat_key = RedisKeys.SESSION_HEARTBEAT.format(session_id)
-                if await self._client.exists(heartbeat_key):
-                    active.append(session_id)
-                else:
-                    # Clean up dead session
-                    await self._client.srem(RedisKeys.ACTIVE_SESSIONS, session_id)
-
-            return active
+            # Stale entries are skipped by the score bound; SessionManagerV2's sweeper removes them
+            cutoff = datetime.now().timestamp() - self.HEARTBEAT_TIMEOUT
+            return list(await self._client.zrangebyscore(RedisKeys.SESSION_HEARTBEATS, cutoff, "+inf"))
         except Exception as e:
             logger.error(f"Failed to get active sessions: {e}")
             return []
 
+    async def expire_stale_sessions(self) -> List[str]:
+        """
+        Remove sessions whose last heartbeat is older than HEARTBEAT_TIMEOUT
+
+        Stale sessions are found with one range query on the heartbeat index
+        and cleaned up in one pipeline.
+
+        Returns:
+            IDs of the expired sessions
+        """
+        if not await self.ensure_connected():
+            return []
+
+        try:
+            cutoff = datetime.now().timestamp() - self.HEARTBEAT_TIMEOUT
+            stale = await self._client.zrangebyscore(RedisKeys.SESSION_HEARTBEATS, "-inf", f"({cutoff}")
+            if not stale:
+                return []
+
+            async with self._client.pipeline(transaction=False) as pipe:
+                pipe.zrem(RedisKeys.SESSION_HEARTBEATS, *stale)
+                pipe.srem(RedisKeys.ACTIVE_SESSIONS, *stale)
+                await pipe.execute()
+
+            return list(stale)
+        except Exception as e:
+            logger.error(f"Failed to expire stale sessions: {e}")
+            return []
+
+    async def get_sessions_data(self, session_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch data for many sessions with a single MGET"""
+        if not session_ids:
+            return {}
+
+        if not await self.ensure_connected():
+            return {}
+
+        try:
+            keys = [RedisKeys.SESSION_DATA.format(session_id) for session_id in session_ids]
+            values = await self._client.mget(keys)
+
+            sessions = {}
+            for session_id, raw in zip(session_ids, values):
+                if raw is None:
+                    continue
+                try:
+                    sessions[session_id] = json.loads(raw)
+                except json.JSONDecodeError:
+                    pass
+
+            return sessions
+        except Exception as e:
+            logger.error(f"Failed to get data for {len(session_ids)} sessions: {e}")
+            return {}
+
     async def remove_session(self, session_id: str) -> bool:
         """Remove session and cleanup its resources"""
         if not await self.ensure_connected():
             return False
 
         try:
-            # Remove from active sessions
-            await self._client.srem(RedisKeys.ACTIVE_SESSIONS, session_id)
-
-            # Delete session data
             session_key = RedisKeys.SESSION_DATA.format(session_id)
-            await self._client.delete(session_key)
-
-            # Delete heartbeat
-            heartbeat_key = RedisKeys.SESSION_HEARTBEAT.format(session_id)
-            await self._client.delete(heartbeat_key)
-
-            # Get and release all locks held by this session
             locks_key = RedisKeys.SESSION_LOCKS.format(session_id)
-            locks = await self._client.smembers(locks_key)
+
+            async with self._client.pipeline(transaction=False) as pipe:
+                # Remove from active sessions and heartbeat index
+                pipe.srem(RedisKeys.ACTIVE_SESSIONS, session_id)
+                pipe.zrem(RedisKeys.SESSION_HEARTBEATS, session_id)
+                # Delete session data
+                pipe.delete(session_key)
+                # Get all locks held by this session
+                pipe.smembers(locks_key)
+                *_, locks = await pipe.execute()
 
             for lock_key in locks:
                 await self.release_lock(lock_key, session_id)
@@ -440,6 +561,87 @@ class RedisClient:
             return False
 
 
+class LockLeaseRenewer:
+    """
+    Background lease renewal for long-held locks
+
+    Tracked locks are extended every ``ttl * renew_ratio`` seconds with the
+    atomic extend script. A lock whose extension fails (expired or taken
+    over) is dropped from tracking so the holder can detect the loss via
+    ``is_held``.
+    """
+
+    def __init__(self, client: "RedisClient", renew_ratio: float = 1 / 3, min_interval: float = 0.05):
+        self.client = client
+        self.renew_ratio = renew_ratio
+        self.min_interval = min_interval
+        # key -> (owner, ttl seconds, next renewal time on the loop clock)
+        self._leases: Dict[str, Tuple[str, float, float]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+
+    def _interval(self, ttl: float) -> float:
+        return max(ttl * self.renew_ratio, self.min_interval)
+
+    def track(self, key: str, value: str, ttl: int):
+        """Start renewing ``key`` on behalf of ``value``"""
+        loop = asyncio.get_running_loop()
+        self._leases[key] = (value, ttl, loop.time() + self._interval(ttl))
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        self._wakeup.set()
+
+    def untrack(self, key: str):
+        """Stop renewing ``key``"""
+        self._leases.pop(key, None)
+
+    def is_held(self, key: str) -> bool:
+        """Whether ``key`` is still tracked (renewals have not failed)"""
+        return key in self._leases
+
+    async def stop(self):
+        """Cancel the renewal task and forget all leases"""
+        self._leases.clear()
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while self._leases:
+            now = loop.time()
+            due = [(key, lease) for key, lease in self._leases.items() if lease[2] <= now]
+
+            if due:
+                results = await asyncio.gather(
+                    *(self.client.extend_lock(key, owner, ttl) for key, (owner, ttl, _) in due),
+                    return_exceptions=True,
+                )
+                now = loop.time()
+                for (key, (owner, ttl, _)), ok in zip(due, results):
+                    if self._leases.get(key, (None,))[0] != owner:
+                        continue  # Released or re-tracked while renewing
+                    if ok is True:
+                        self._leases[key] = (owner, ttl, now + self._interval(ttl))
+                    else:
+                        logger.warning(f"[LOCK] lease lost: {key}")
+                        self._leases.pop(key, None)
+
+            if not self._leases:
+                break
+
+            next_due = min(lease[2] for lease in self._leases.values())
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=max(next_due - loop.time(), 0))
+            except asyncio.TimeoutError:
+                pass
+
+
 # Singleton instance
 _redis_client: Optional[RedisClient] = None
 
@@ -9,13 +9,42 @@ import logging
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import uuid4
 
 import redis.asyncio as redis
 
 logger = logging.getLogger(__name__)
 
+# Atomic check-and-set for JSON lock records (one round trip).
+# KEYS[1] = lock key, ARGV[1] = session_id, ARGV[2] = lock record, ARGV[3] = ttl (ms)
+# Returns {1, record} when acquired, {2, record} when already held by the
+# session, {0, record} when held by another session.
+ACQUIRE_LOCK_SCRIPT = """
+local current = redis.call('get', KEYS[1])
+if not current then
+    redis.call('set', KEYS[1], ARGV[2], 'px', ARGV[3])
+    return {1, ARGV[2]}
+end
+if cjson.decode(current)['session_id'] == ARGV[1] then
+    return {2, current}
+end
+return {0, current}
+"""
+
+# Atomic compare-and-delete for JSON lock records.
+# KEYS[1] = lock key, ARGV[1] = session_id
+RELEASE_LOCK_SCRIPT = """
+local lock_data = redis.call('get', KEYS[1])
+if lock_data then
+    local lock = cjson.decode(lock_data)
+    if lock['session_id'] == ARGV[1] then
+        return redis.call('del', KEYS[1])
+    end
+end
+return 0
+"""
+
 
 class SessionStatus(Enum):
     """Session status types"""
@@ -126,6 +155,8 @@ class SessionManager:
         self.pubsub: Optional[redis.client.PubSub] = None
         self._event_handlers = {}
         self._initialized = False
+        self._acquire_lock_script = None
+        self._release_lock_script = None
 
     async def initialize(self):
         """Initialize Redis connection and pubsub"""
@@ -138,6 +169,10 @@ class SessionManager:
             # Test connection
             await self.redis_client.ping()
 
+            # Register atomic lock scripts
+            self._acquire_lock_script = self.redis_client.register_script(ACQUIRE_LOCK_SCRIPT)
+            self._release_lock_script = self.redis_client.register_script(RELEASE_LOCK_SCRIPT)
+
             # Setup pubsub for event broadcasting
             self.pubsub = self.redis_client.pubsub()
 
@@ -229,10 +264,9 @@ class SessionManager:
 
         lock_key = f"lock:{lock_type.value}:{resource_id}"
 
-        # Check for existing lock
-        existing_lock = await self._get_existing_lock(lock_key)
+        lock, existing_lock = await self._try_acquire(session_id, lock_key, resource_id, lock_type, timeout, metadata)
 
-        if existing_lock and not existing_lock.is_expired():
+        if existing_lock:
             if existing_lock.session_id == session_id:
                 # Session already has the lock
                 return existing_lock
@@ -253,36 +287,12 @@ class SessionManager:
             # Wait for lock with timeout
             return await self._wait_for_lock(session_id, lock_key, timeout, metadata)
 
-        # Create new lock
-        lock = ResourceLock(
-            resource_id=resource_id,
-            lock_type=lock_type,
-            session_id=session_id,
-            acquired_at=datetime.now(),
-            expires_at=datetime.now() + timedelta(seconds=timeout),
-            metadata=metadata or {},
-        )
-
-        # Store lock
-        if self.redis_client:
-            # Use Redis SET with NX (only if not exists) and EX (expiry)
-            success = await self.redis_client.set(
-                lock_key,
-                json.dumps(
-                    {
-                        "session_id": session_id,
-                        "acquired_at": lock.acquired_at.isoformat(),
-                        "expires_at": lock.expires_at.isoformat(),
-                        "metadata": lock.metadata,
-                    }
-                ),
-                nx=True,
-                ex=timeout,
-            )
+        return await self._register_lock(session_id, lock_key, lock)
 
-            if not success:
-                # Race condition - someone else got the lock
-                return None
+    async def _register_lock(self, session_id: str, lock_key: str, lock: ResourceLock) -> ResourceLock:
+        """Record a newly acquired lock locally and broadcast it"""
+        resource_id = lock.resource_id
+        lock_type = lock.lock_type
 
         self.locks[lock_key] = lock
 
@@ -314,30 +324,19 @@ class SessionManager:
 
         lock_key = f"lock:{lock_type.value}:{resource_id}"
 
-        # Verify session owns the lock
-        existing_lock = await self._get_existing_lock(lock_key)
-
-        if not existing_lock or existing_lock.session_id != session_id:
-            logger.warning(f"[WARN] Cannot release lock not owned by session: {session_id}")
-            return False
-
-        # Release in Redis
         if self.redis_client:
-            # Use Lua script for atomic check-and-delete
-            lua_script = """
-            local lock_data = redis.call('get', KEYS[1])
-            if lock_data then
-                local lock = cjson.decode(lock_data)
-                if lock['session_id'] == ARGV[1] then
-                    return redis.call('del', KEYS[1])
-                end
-            end
-            return 0
-            """
-
-            result = await self.redis_client.eval(lua_script, 1, lock_key, session_id)
+            # Atomic compare-and-delete; ownership is verified server-side
+            result = await self._release_lock_script(keys=[lock_key], args=[session_id])
 
             if result == 0:
+                logger.warning(f"[WARN] Cannot release lock not owned by session: {session_id}")
+                return False
+        else:
+            # Verify session owns the lock
+            existing_lock = await self._get_existing_lock(lock_key)
+
+            if not existing_lock or existing_lock.session_id != session_id:
+                logger.warning(f"[WARN] Cannot release lock not owned by session: {session_id}")
                 return False
 
         # Remove from local storage
@@ -626,18 +625,68 @@ class SessionManager:
         if self.redis_client:
             lock_data = await self.redis_client.get(lock_key)
             if lock_data:
-                data = json.loads(lock_data)
-                return ResourceLock(
-                    resource_id=lock_key.split(":")[-1],
-                    lock_type=LockType(lock_key.split(":")[1]),
-                    session_id=data["session_id"],
-                    acquired_at=datetime.fromisoformat(data["acquired_at"]),
-                    expires_at=datetime.fromisoformat(data["expires_at"]),
-                    metadata=data.get("metadata", {}),
-                )
+                return self._lock_from_record(lock_key, json.loads(lock_data))
 
         return None
 
+    def _lock_from_record(self, lock_key: str, data: Dict[str, Any]) -> ResourceLock:
+        """Build a ResourceLock from its stored JSON record"""
+        return ResourceLock(
+            resource_id=lock_key.split(":")[-1],
+            lock_type=LockType(lock_key.split(":")[1]),
+            session_id=data["session_id"],
+            acquired_at=datetime.fromisoformat(data["acquired_at"]),
+            expires_at=datetime.fromisoformat(data["expires_at"]),
+            metadata=data.get("metadata", {}),
+        )
+
+    async def _try_acquire(
+        self,
+        session_id: str,
+        lock_key: str,
+        resource_id: str,
+        lock_type: LockType,
+        timeout: int,
+        metadata: Optional[Dict],
+    ) -> Tuple[Optional[ResourceLock], Optional[ResourceLock]]:
+        """
+        Attempt to take a lock in a single atomic step
+
+        Returns:
+            (new_lock, existing_lock) - exactly one of them is set
+        """
+
+        lock = ResourceLock(
+            resource_id=resource_id,
+            lock_type=lock_type,
+            session_id=session_id,
+            acquired_at=datetime.now(),
+            expires_at=datetime.now() + timedelta(seconds=timeout),
+            metadata=metadata or {},
+        )
+
+        if self.redis_client:
+            record = json.dumps(
+                {
+                    "session_id": session_id,
+                    "acquired_at": lock.acquired_at.isoformat(),
+                    "expires_at": lock.expires_at.isoformat(),
+                    "metadata": lock.metadata,
+                }
+            )
+            status, stored = await self._acquire_lock_script(keys=[lock_key], args=[session_id, record, timeout * 1000])
+
+            if int(status) == 1:
+                return lock, None
+            return None, self._lock_from_record(lock_key, json.loads(stored))
+
+        # In-memory mode
+        existing_lock = self.locks.get(lock_key)
+        if existing_lock and not existing_lock.is_expired():
+            return None, existing_lock
+
+        return lock, None
+
     async def _wait_for_lock(
         self, session_id: str, lock_key: str, timeout: int, metadata: Optional[Dict]
     ) -> Optional[ResourceLock]:
@@ -645,25 +694,25 @@ class SessionManager:
 
         start_time = datetime.now()
         max_wait = timedelta(seconds=timeout)
+        resource_id = lock_key.split(":")[-1]
+        lock_type = LockType(lock_key.split(":")[1])
+        existing_lock = None
 
         while datetime.now() - start_time < max_wait:
-            # Check if lock is available
-            existing_lock = await self._get_existing_lock(lock_key)
-
-            if not existing_lock or existing_lock.is_expired():
-                # Try to acquire
-                return await self.acquire_lock(
-                    session_id,
-                    lock_key.split(":")[-1],
-                    LockType(lock_key.split(":")[1]),
-                    timeout,
-                    wait=False,
-                    metadata=metadata,
-                )
-
             # Wait before retry
             await asyncio.sleep(1)
 
+            # Retry the atomic acquire; a free lock is taken in the same round trip
+            lock, existing_lock = await self._try_acquire(session_id, lock_key, resource_id, lock_type, timeout, metadata)
+
+            if lock:
+                return await self._register_lock(session_id, lock_key, lock)
+            if existing_lock.session_id == session_id:
+                return existing_lock
+
+        if existing_lock:
+            logger.warning(f"[LOCK] wait timed out: {resource_id} held by {existing_lock.session_id}")
+
         return None
 
     async def _record_conflict(self, conflict_type: ConflictType, sessions: List[str], resource: str):
@@ -29,6 +29,7 @@ class SessionManagerV2:
         self.event_handlers = {}
         self._initialized = False
         self._event_listener_task = None
+        self._expiry_task = None
 
     async def initialize(self):
         """Initialize with Redis client"""
@@ -42,6 +43,8 @@ class SessionManagerV2:
             if await self.redis_client.ensure_connected():
                 # Start event listener
                 self._event_listener_task = asyncio.create_task(self._start_event_listener())
+                # Start stale session sweeper
+                self._expiry_task = asyncio.create_task(self._expire_stale_sessions_loop())
 
                 self._initialized = True
                 logger.info("[OK] SessionManagerV2 initialized with centralized Redis")
@@ -120,8 +123,15 @@ class SessionManagerV2:
         timeout: int = 300,
         wait: bool = False,
         metadata: Optional[Dict] = None,
+        auto_renew: bool = False,
     ) -> Optional[ResourceLock]:
-        """Acquire lock using centralized Redis client"""
+        """
+        Acquire lock using centralized Redis client
+
+        With ``auto_renew`` the lock lease is extended in the background
+        until it is released, so long-running operations can keep a short
+        ``timeout`` without losing the lock.
+        """
 
         # Generate lock key
         if lock_type == LockType.FILE:
@@ -167,6 +177,9 @@ class SessionManagerV2:
             locks_key = RedisKeys.SESSION_LOCKS.format(session_id)
             await self.redis_client._client.sadd(locks_key, lock_key)
 
+            if auto_renew:
+                self.redis_client.lease_renewer.track(lock_key, session_id, timeout)
+
             # Broadcast lock acquisition
             await self.redis_client.publish(
                 (
@@ -320,8 +333,11 @@ class SessionManagerV2:
         if self.redis_client:
             active_session_ids = await self.redis_client.get_active_sessions()
 
+            # Fetch all session records in one MGET instead of one GET per session
+            sessions_data = await self.redis_client.get_sessions_data(active_session_ids)
+
             for session_id in active_session_ids:
-                session_data = await self._get_session_data(session_id)
+                session_data = sessions_data.get(session_id)
 
                 if session_data:
                     session = Session.from_dict(session_data)
@@ -506,6 +522,18 @@ class SessionManagerV2:
             except Exception as e:
                 logger.error(f"Event listener error: {e}")
 
+    async def _expire_stale_sessions_loop(self):
+        """Periodically drop sessions whose heartbeat timed out from the Redis index"""
+
+        while self.redis_client:
+            await asyncio.sleep(RedisClient.HEARTBEAT_TIMEOUT)
+            try:
+                expired = await self.redis_client.expire_stale_sessions()
+                if expired:
+                    logger.info(f"[SESSION] expired {len(expired)} stale sessions")
+            except Exception as e:
+                logger.error(f"Session expiry sweep error: {e}")
+
     async def _handle_event(self, message: Dict):
         """Handle incoming Redis events"""
 
@@ -536,6 +564,10 @@ class SessionManagerV2:
         if self._event_listener_task:
             self._event_listener_task.cancel()
 
+        # Cancel stale session sweeper
+        if self._expiry_task:
+            self._expiry_task.cancel()
+
         logger.info("[OK] SessionManagerV2 cleaned up")
 
 
@@ -0,0 +1,167 @@
+"""
+Time Metrics Store
+
+Incrementally maintained, in-process aggregates of task sessions for the
+time tracking dashboards (weekly report, bottlenecks).
+
+TimeTrackingService updates the store when a session is first completed, so
+reports sum a few precomputed per-day groups instead of querying sessions.
+Like the database aggregates it is rebuilt from, it counts completed sessions
+only (pauses included). The store is process-local; it is
+(re)built from the database for a date window with TimeTrackingService.rebuild_metrics_store.
+"""
+
+from datetime import UTC, date, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+GroupKey = Tuple[date, str, str, str]  # (day, task_type, phase, ai_used)
+
+COUNTERS = (
+    "tasks",
+    "successful_tasks",
+    "duration_seconds",
+    "baseline_seconds",
+    "time_saved_seconds",
+    "overrun_tasks",
+    "pause_seconds",
+    "paused_tasks",
+)
+
+
+class TimeMetricsStore:
+    """
+    Running sums and counts per (day, task_type, phase, ai_used)
+
+    Days are session start days, matching the ROI period filter. Only days
+    from covered_from onwards are known to be complete; older ranges must be
+    read from the database.
+    """
+
+    def __init__(self, retention_days: int = 35, overrun_ratio: float = 1.2):
+        """
+        Initialize metrics store
+
+        Args:
+            retention_days: Days kept in memory (older days are pruned)
+            overrun_ratio: Duration/baseline ratio above which a task counts as an overrun
+        """
+        self.retention_days = retention_days
+        self.overrun_ratio = overrun_ratio
+        self.covered_from: Optional[date] = None
+        self.loaded_at: Optional[datetime] = None
+        self.version = 0  # Bumped on every change (report cache key)
+        self._groups: Dict[GroupKey, Dict[str, int]] = {}
+
+    def _group(self, day: date, task_type: str, phase: str, ai_used: str) -> Dict[str, int]:
+        key = (day, task_type, phase, ai_used)
+        group = self._groups.get(key)
+        if group is None:
+            group = self._groups[key] = dict.fromkeys(COUNTERS, 0)
+        return group
+
+    def record_completion(
+        self,
+        day: date,
+        task_type: str,
+        phase: str,
+        ai_used: str,
+        duration_seconds: int,
+        baseline_seconds: int,
+        success: bool,
+        pause_seconds: int = 0,
+    ) -> None:
+        """Add a completed session (call once per session)"""
+        group = self._group(day, task_type, phase, ai_used)
+        group["tasks"] += 1
+        group["successful_tasks"] += int(success)
+        group["duration_seconds"] += duration_seconds
+        group["baseline_seconds"] += baseline_seconds
+        group["time_saved_seconds"] += baseline_seconds - duration_seconds
+        if baseline_seconds and duration_seconds > baseline_seconds * self.overrun_ratio:
+            group["overrun_tasks"] += 1
+        group["pause_seconds"] += pause_seconds
+        group["paused_tasks"] += int(pause_seconds > 0)
+        self.version += 1
+
+    def covers(self, start_date: date, max_age_seconds: Optional[float] = None) -> bool:
+        """
+        Whether every day from start_date onwards is complete in the store
+
+        Args:
+            start_date: First day that must be covered
+            max_age_seconds: Also require the last load to be at most this old
+        """
+        if self.covered_from is None or start_date < self.covered_from:
+            return False
+        if max_age_seconds is not None:
+            return (datetime.now(UTC) - self.loaded_at).total_seconds() <= max_age_seconds
+        return True
+
+    def load(self, rows: Iterable[Dict[str, Any]], start_date: date) -> None:
+        """
+        Replace all days from start_date onwards with database aggregates
+
+        Args:
+            rows: Per-day group rows (day, task_type, phase, ai_used + COUNTERS; missing counters are 0)
+            start_date: First day the rows cover
+        """
+        self._groups = {key: group for key, group in self._groups.items() if key[0] < start_date}
+        for row in rows:
+            group = self._group(row["day"], row["task_type"], row["phase"], row["ai_used"])
+            for counter in COUNTERS:
+                group[counter] += int(row.get(counter) or 0)
+        self.covered_from = start_date if self.covered_from is None else min(self.covered_from, start_date)
+        self.loaded_at = datetime.now(UTC)
+        self.version += 1
+
+    def prune(self, today: date) -> None:
+        """Drop days older than the retention window"""
+        cutoff = today - timedelta(days=self.retention_days)
+        if self.covered_from is not None and self.covered_from < cutoff:
+            self.covered_from = cutoff
+        self._groups = {key: group for key, group in self._groups.items() if key[0] >= cutoff}
+
+    def aggregates(self, start_date: date, end_date: date) -> List[Dict[str, Any]]:
+        """
+        Sum per (task_type, phase, ai_used) over a date range
+
+        Returns:
+            Rows shaped like TimeTrackingService._get_period_aggregates, plus
+            overrun_tasks, pause_seconds and paused_tasks
+        """
+        totals: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+        for (day, task_type, phase, ai_used), group in self._groups.items():
+            if not start_date <= day <= end_date:
+                continue
+            row = totals.get((task_type, phase, ai_used))
+            if row is None:
+                row = totals[(task_type, phase, ai_used)] = {
+                    "task_type": task_type,
+                    "phase": phase,
+                    "ai_used": ai_used,
+                    **dict.fromkeys(COUNTERS, 0),
+                }
+            for counter in COUNTERS:
+                row[counter] += group[counter]
+        return [row for row in totals.values() if row["tasks"]]
+
+    def overrun_ratios(self, start_date: date, end_date: date, by: str = "phase") -> Dict[str, Dict[str, Any]]:
+        """
+        Share of tasks exceeding overrun_ratio x baseline, per phase or task_type
+
+        Args:
+            start_date: First day
+            end_date: Last day (inclusive)
+            by: "phase" or "task_type"
+
+        Returns:
+            {key: {"tasks", "overrun_tasks", "overrun_ratio"}}
+        """
+        stats: Dict[str, Dict[str, Any]] = {}
+        for row in self.aggregates(start_date, end_date):
+            entry = stats.setdefault(row[by], {"tasks": 0, "overrun_tasks": 0})
+            entry["tasks"] += row["tasks"]
+            entry["overrun_tasks"] += row["overrun_tasks"]
+        for entry in stats.values():
+            entry["overrun_ratio"] = entry["overrun_tasks"] / entry["tasks"] if entry["tasks"] else 0.0
+        return stats
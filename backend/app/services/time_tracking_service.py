@@ -5,6 +5,7 @@ Comprehensive time tracking and ROI measurement system for UDO Development Platf
 Tracks task execution time, calculates ROI, identifies bottlenecks, and generates reports.
 """
 
+import asyncio
 import logging
 from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
@@ -23,6 +24,7 @@ from ..models.time_tracking import (
     TaskType,
     WeeklyReport,
 )
+from .time_metrics_store import TimeMetricsStore
 
 logger = logging.getLogger(__name__)
 
@@ -64,6 +66,16 @@ class TimeTrackingService:
         self.active_sessions: Dict[str, Dict[str, Any]] = {}
         self.paused_sessions: Dict[str, datetime] = {}
 
+        # Incrementally maintained dashboard aggregates (process-local, like the sessions above)
+        store_config = self.config.get("metrics_store", {})
+        self.metrics_store = TimeMetricsStore(
+            retention_days=store_config.get("retention_days", 35),
+            overrun_ratio=store_config.get("overrun_ratio", 1.2),
+        )
+        self.metrics_store_max_age_seconds = store_config.get("max_age_seconds", 300)
+        self._metrics_store_lock = asyncio.Lock()
+        self._weekly_report_cache: Optional[Tuple[Tuple[int, date], WeeklyReport]] = None
+
         logger.info(
             "TimeTrackingService initialized with %d baseline types",
             len(self.baseline_times),
@@ -181,6 +193,9 @@ class TimeTrackingService:
             # Store in active sessions for pause/resume
             self.active_sessions[str(session_id)] = {
                 "task_id": task_id,
+                "task_type": task_type.value,
+                "phase": phase.value,
+                "ai_used": ai_used.value,
                 "start_time": start_time,
                 "pause_start": None,
                 "total_pause_duration": 0,
@@ -236,53 +251,63 @@ class TimeTrackingService:
             total_duration_seconds = int((end_time - start_time).total_seconds())
             active_duration_seconds = total_duration_seconds - total_pause_duration
 
-            # Update database
+            # Update database (time saved is computed in the same statement)
             if self.pool:
+                # was_open: the row lock makes a concurrent second end_task see the first one's end_time
                 query = """
-                    UPDATE task_sessions
+                    UPDATE task_sessions AS s
                     SET end_time = $1,
                         duration_seconds = $2,
                         pause_duration_seconds = $3,
                         success = $4,
                         error_message = $5,
-                        metadata = $6
-                    WHERE id = $7
-                    RETURNING task_id, task_type, baseline_seconds
+                        metadata = $6,
+                        time_saved_seconds = baseline_seconds - $2
+                    FROM (SELECT id, end_time IS NULL AS was_open FROM task_sessions WHERE id = $7 FOR UPDATE) AS previous
+                    WHERE s.id = previous.id
+                    RETURNING s.task_id, s.task_type, s.phase, s.ai_used, s.start_time, s.baseline_seconds, previous.was_open
                 """
                 async with self.pool.acquire() as conn:
-                    row = await conn.fetchrow(
-                        query,
-                        end_time,
-                        active_duration_seconds,
-                        total_pause_duration,
-                        success,
-                        error_message,
-                        metadata,
-                        session_id,
-                    )
+                    async with conn.transaction():
+                        row = await conn.fetchrow(
+                            query,
+                            end_time,
+                            active_duration_seconds,
+                            total_pause_duration,
+                            success,
+                            error_message,
+                            metadata,
+                            session_id,
+                        )
+
+                        if not row:
+                            raise ValueError(f"Session {session_id} not found in database")
 
-                    if not row:
-                        raise ValueError(f"Session {session_id} not found in database")
+                        task_id = row["task_id"]
+                        baseline_seconds = row["baseline_seconds"]
+                        rollup_group = (row["start_time"].date(), row["task_type"], row["phase"], row["ai_used"])
+                        await self._refresh_daily_rollup(conn, *rollup_group)
 
-                    task_id = row["task_id"]
-                    baseline_seconds = row["baseline_seconds"]
+                        # A session ended again is already counted in the metrics store
+                        metrics_group = rollup_group if row["was_open"] else None
             else:
                 # Mock mode
                 task_id = session_info["task_id"]
                 baseline_seconds = 1800  # Default
+                metrics_group = self._session_metrics_group(session_info)
+
+            if metrics_group:
+                self.metrics_store.record_completion(
+                    *metrics_group,
+                    duration_seconds=active_duration_seconds,
+                    baseline_seconds=baseline_seconds,
+                    success=success,
+                    pause_seconds=total_pause_duration,
+                )
 
             # Calculate time saved
             time_saved_seconds = baseline_seconds - active_duration_seconds
 
-            # Update time_saved in database
-            if self.pool:
-                async with self.pool.acquire() as conn:
-                    await conn.execute(
-                        "UPDATE task_sessions SET time_saved_seconds = $1 WHERE id = $2",
-                        time_saved_seconds,
-                        session_id,
-                    )
-
             # Calculate metrics
             metrics = self._calculate_task_metrics(
                 task_id=task_id,
@@ -483,17 +508,18 @@ class TimeTrackingService:
             if start_date is None or end_date is None:
                 start_date, end_date = self._calculate_period_dates(period)
 
-            # Get tasks for period
-            tasks = await self._get_tasks_for_period(start_date, end_date)
+            # Get per (task_type, phase, ai_used) aggregates for period
+            groups = await self._get_period_aggregates(start_date, end_date)
 
-            if not tasks:
+            if not groups:
                 logger.warning(f"No tasks found for period {start_date} to {end_date}")
                 return self._empty_roi_report(period, start_date, end_date)
 
             # Calculate aggregated metrics
-            total_duration = sum(t["duration_seconds"] for t in tasks)
-            total_baseline = sum(t["baseline_seconds"] for t in tasks)
-            total_saved = sum(t["time_saved_seconds"] for t in tasks)
+            tasks_completed = sum(g["tasks"] for g in groups)
+            total_duration = sum(g["duration_seconds"] for g in groups)
+            total_baseline = sum(g["baseline_seconds"] for g in groups)
+            total_saved = sum(g["time_saved_seconds"] for g in groups)
 
             # Convert to hours
             manual_time_hours = total_baseline / 3600
@@ -505,20 +531,20 @@ class TimeTrackingService:
             efficiency_gain = (total_saved / total_baseline * 100) if total_baseline > 0 else 0
 
             # Calculate success rate
-            successful_tasks = sum(1 for t in tasks if t["success"])
-            success_rate = (successful_tasks / len(tasks) * 100) if tasks else 0
+            successful_tasks = sum(g["successful_tasks"] for g in groups)
+            success_rate = (successful_tasks / tasks_completed * 100) if tasks_completed else 0
 
             # AI breakdown
-            ai_breakdown = self._calculate_ai_breakdown(tasks)
+            ai_breakdown = self._calculate_ai_breakdown(groups)
 
             # Phase breakdown
-            phase_breakdown = self._calculate_phase_breakdown(tasks)
+            phase_breakdown = self._calculate_phase_breakdown(groups)
 
             # Top time savers
-            top_time_savers = self._calculate_top_time_savers(tasks)
+            top_time_savers = self._calculate_top_time_savers(groups)
 
             # Identify bottlenecks
-            bottlenecks = await self.get_bottlenecks(start_date, end_date)
+            bottlenecks = self._calculate_bottlenecks(groups)
 
             # Calculate annual projection
             annual_projection_hours = self._project_annual(time_saved_hours, period)
@@ -536,7 +562,7 @@ class TimeTrackingService:
                 efficiency_gain=efficiency_gain,
                 annual_projection_hours=annual_projection_hours,
                 annual_projection_value=annual_projection_value,
-                tasks_completed=len(tasks),
+                tasks_completed=tasks_completed,
                 success_rate=success_rate,
                 ai_breakdown=ai_breakdown,
                 phase_breakdown=phase_breakdown,
@@ -565,64 +591,42 @@ class TimeTrackingService:
             if end_date is None:
                 end_date = date.today()
 
-            tasks = await self._get_tasks_for_period(start_date, end_date)
-
-            # Group by task type
-            task_type_stats: Dict[str, List[Dict]] = {}
-            for task in tasks:
-                task_type = task["task_type"]
-                if task_type not in task_type_stats:
-                    task_type_stats[task_type] = []
-                task_type_stats[task_type].append(task)
-
-            # Calculate bottlenecks
-            bottlenecks = []
-            thresholds = self.config.get("roi_settings", {}).get(
-                "bottleneck_thresholds",
-                {"low": 10, "medium": 25, "high": 50, "critical": 100},
-            )
-
-            for task_type, task_list in task_type_stats.items():
-                avg_duration = sum(t["duration_seconds"] for t in task_list) / len(task_list)
-                avg_baseline = sum(t["baseline_seconds"] for t in task_list) / len(task_list)
-
-                # Only consider if actually slower than baseline
-                if avg_duration > avg_baseline:
-                    overhead_seconds = int(avg_duration - avg_baseline)
-                    overhead_percentage = (overhead_seconds / avg_baseline * 100) if avg_baseline > 0 else 0
-
-                    # Determine severity
-                    if overhead_percentage >= thresholds.get("critical", 100):
-                        severity = "critical"
-                    elif overhead_percentage >= thresholds.get("high", 50):
-                        severity = "high"
-                    elif overhead_percentage >= thresholds.get("medium", 25):
-                        severity = "medium"
-                    else:
-                        severity = "low"
-
-                    bottlenecks.append(
-                        Bottleneck(
-                            task_type=TaskType(task_type),
-                            avg_duration_seconds=int(avg_duration),
-                            baseline_seconds=int(avg_baseline),
-                            overhead_seconds=overhead_seconds,
-                            overhead_percentage=overhead_percentage,
-                            frequency=len(task_list),
-                            severity=severity,
-                        )
-                    )
-
-            # Sort by severity and overhead
-            severity_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
-            bottlenecks.sort(key=lambda b: (severity_order[b.severity], -b.overhead_seconds))
-
-            return bottlenecks
+            await self._ensure_metrics_store(start_date)
+            groups = await self._get_period_aggregates(start_date, end_date)
+            return self._calculate_bottlenecks(groups)
 
         except Exception as e:
             logger.error(f"Failed to get bottlenecks: {e}")
             return []
 
+    async def get_overrun_ratios(
+        self, start_date: Optional[date] = None, end_date: Optional[date] = None, by: str = "phase"
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Share of completed tasks that overran their baseline
+
+        Args:
+            start_date: Start date for analysis
+            end_date: End date for analysis
+            by: Group by "phase" or "task_type"
+
+        Returns:
+            {phase or task type: {"tasks", "overrun_tasks", "overrun_ratio"}}
+        """
+        if start_date is None:
+            start_date = date.today() - timedelta(days=7)
+        if end_date is None:
+            end_date = date.today()
+
+        await self._ensure_metrics_store(start_date)
+        if self._metrics_store_ready(start_date):
+            return self.metrics_store.overrun_ratios(start_date, end_date, by)
+
+        # Outside the store's window: aggregate the range on its own
+        store = TimeMetricsStore(overrun_ratio=self.metrics_store.overrun_ratio)
+        store.load(await self._load_metric_rows(start_date, end_date), start_date)
+        return store.overrun_ratios(start_date, end_date, by)
+
     async def generate_weekly_report(self) -> WeeklyReport:
         """
         Generate comprehensive weekly report
@@ -635,12 +639,19 @@ class TimeTrackingService:
             today = date.today()
             week_start = today - timedelta(days=today.weekday())
             week_end = week_start + timedelta(days=6)
+            prev_week_start = week_start - timedelta(days=7)
+
+            # Reuse the last report until a session changes the aggregates
+            await self._ensure_metrics_store(prev_week_start)
+            cacheable = self._metrics_store_ready(prev_week_start)
+            cache_key = (self.metrics_store.version, week_start)
+            if cacheable and self._weekly_report_cache and self._weekly_report_cache[0] == cache_key:
+                return self._weekly_report_cache[1]
 
             # Calculate ROI
             roi_report = await self.calculate_roi("weekly", week_start, week_end)
 
             # Calculate trends (compare to previous week)
-            prev_week_start = week_start - timedelta(days=7)
             prev_week_end = week_start - timedelta(days=1)
             prev_roi = await self.calculate_roi("weekly", prev_week_start, prev_week_end)
 
@@ -649,7 +660,7 @@ class TimeTrackingService:
             # Generate recommendations
             recommendations = self._generate_recommendations(roi_report)
 
-            return WeeklyReport(
+            report = WeeklyReport(
                 week_start=week_start,
                 week_end=week_end,
                 roi_report=roi_report,
@@ -657,6 +668,11 @@ class TimeTrackingService:
                 recommendations=recommendations,
             )
 
+            if cacheable:
+                self._weekly_report_cache = (cache_key, report)
+
+            return report
+
         except Exception as e:
             logger.error(f"Failed to generate weekly report: {e}")
             raise
@@ -708,41 +724,277 @@ class TimeTrackingService:
             week_end = week_start + timedelta(days=6)
             return week_start, week_end
 
-    async def _get_tasks_for_period(self, start_date: date, end_date: date) -> List[Dict[str, Any]]:
-        """Get completed tasks for a period"""
+    async def _get_period_aggregates(self, start_date: date, end_date: date, by_day: bool = False) -> List[Dict[str, Any]]:
+        """
+        Get completed-task aggregates per (task_type, phase, ai_used) for a period
+
+        Served from the metrics store when it covers the period. Otherwise reads
+        the task_daily_rollups table; falls back to aggregating task_sessions
+        when the rollups are unavailable (migration 006 not applied).
+
+        Args:
+            start_date: First day of the period
+            end_date: Last day of the period (inclusive)
+            by_day: Also group by session start day (adds a "day" column)
+
+        Returns:
+            Rows with tasks, successful_tasks, duration_seconds, baseline_seconds
+            and time_saved_seconds totals
+        """
         if not self.pool:
             return []
 
-        try:
-            query = """
-                SELECT
-                    task_id,
-                    task_type,
-                    phase,
-                    ai_used,
-                    duration_seconds,
-                    baseline_seconds,
-                    time_saved_seconds,
-                    success,
-                    start_time,
-                    end_time
-                FROM task_sessions
-                WHERE end_time IS NOT NULL
-                    AND DATE(start_time) >= $1
-                    AND DATE(start_time) <= $2
-                ORDER BY start_time
-            """
+        if not by_day and self._metrics_store_ready(start_date):
+            return self.metrics_store.aggregates(start_date, end_date)
+
+        rollup_day = "day, " if by_day else ""
+        session_day = "DATE(start_time) AS day, " if by_day else ""
+        session_day_group = "DATE(start_time), " if by_day else ""
+
+        rollup_query = f"""
+            SELECT
+                {rollup_day}task_type,
+                phase,
+                ai_used,
+                SUM(tasks)::BIGINT AS tasks,
+                SUM(successful_tasks)::BIGINT AS successful_tasks,
+                SUM(duration_seconds)::BIGINT AS duration_seconds,
+                SUM(baseline_seconds)::BIGINT AS baseline_seconds,
+                SUM(time_saved_seconds)::BIGINT AS time_saved_seconds
+            FROM task_daily_rollups
+            WHERE day >= $1 AND day <= $2
+            GROUP BY {rollup_day}task_type, phase, ai_used
+            HAVING SUM(tasks) > 0
+        """
 
+        # Half-open range on start_time keeps the predicate sargable
+        session_query = f"""
+            SELECT
+                {session_day}task_type,
+                phase,
+                ai_used,
+                COUNT(*) AS tasks,
+                COUNT(*) FILTER (WHERE success) AS successful_tasks,
+                COALESCE(SUM(duration_seconds), 0)::BIGINT AS duration_seconds,
+                COALESCE(SUM(baseline_seconds), 0)::BIGINT AS baseline_seconds,
+                COALESCE(SUM(time_saved_seconds), 0)::BIGINT AS time_saved_seconds
+            FROM task_sessions
+            WHERE end_time IS NOT NULL
+                AND start_time >= $1::date
+                AND start_time < $2::date
+            GROUP BY {session_day_group}task_type, phase, ai_used
+        """
+
+        try:
             async with self.pool.acquire() as conn:
-                rows = await conn.fetch(query, start_date, end_date)
+                try:
+                    rows = await conn.fetch(rollup_query, start_date, end_date)
+                except Exception as e:
+                    logger.warning(f"Daily rollups unavailable, aggregating task sessions: {e}")
+                    rows = await conn.fetch(session_query, start_date, end_date + timedelta(days=1))
                 return [dict(row) for row in rows]
 
         except Exception as e:
-            logger.error(f"Failed to get tasks for period: {e}")
+            logger.error(f"Failed to get aggregates for period: {e}")
             return []
 
+    async def _refresh_daily_rollup(self, conn, day: date, task_type: str, phase: str, ai_used: str):
+        """
+        Recompute one task_daily_rollups row from its sessions
+
+        Recomputing the (day, task_type, phase, ai_used) group instead of adding
+        a delta keeps the rollup correct when a session is ended twice. Runs in a
+        savepoint so a missing rollup table never fails end_task.
+
+        Refreshes of a group are serialized with a transaction-level advisory
+        lock: under READ COMMITTED the aggregate then runs after the previous
+        refresher committed, so it sees that session too instead of overwriting
+        the row with a stale count.
+        """
+        lock_query = """
+            SELECT pg_advisory_xact_lock(
+                hashtext(concat_ws('|', 'task_daily_rollups', $1::date::text, $2::text, $3::text, $4::text))
+            )
+        """
+        query = """
+            INSERT INTO task_daily_rollups (
+                day, task_type, phase, ai_used,
+                tasks, successful_tasks, duration_seconds, baseline_seconds, time_saved_seconds
+            )
+            SELECT
+                $1::date, $2, $3, $4,
+                COUNT(*),
+                COUNT(*) FILTER (WHERE success),
+                COALESCE(SUM(duration_seconds), 0),
+                COALESCE(SUM(baseline_seconds), 0),
+                COALESCE(SUM(time_saved_seconds), 0)
+            FROM task_sessions
+            WHERE end_time IS NOT NULL
+                AND start_time >= $1::date
+                AND start_time < $1::date + 1
+                AND task_type = $2
+                AND phase = $3
+                AND ai_used = $4
+            ON CONFLICT (day, task_type, phase, ai_used) DO UPDATE SET
+                tasks = EXCLUDED.tasks,
+                successful_tasks = EXCLUDED.successful_tasks,
+                duration_seconds = EXCLUDED.duration_seconds,
+                baseline_seconds = EXCLUDED.baseline_seconds,
+                time_saved_seconds = EXCLUDED.time_saved_seconds,
+                updated_at = NOW()
+        """
+        try:
+            async with conn.transaction():
+                # Held until the end_task transaction commits
+                await conn.execute(lock_query, day, task_type, phase, ai_used)
+                await conn.execute(query, day, task_type, phase, ai_used)
+        except Exception as e:
+            logger.warning(f"Failed to refresh daily rollup for {day} ({task_type}/{phase}/{ai_used}): {e}")
+
+    async def rebuild_daily_rollups(self, start_date: date, end_date: date) -> int:
+        """
+        Rebuild task_daily_rollups for a date range from task_sessions (backfill)
+
+        Args:
+            start_date: First day to rebuild
+            end_date: Last day to rebuild (inclusive)
+
+        Returns:
+            Number of rollup rows written
+        """
+        if not self.pool:
+            logger.warning("No database pool - cannot rebuild rollups")
+            return 0
+
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute("DELETE FROM task_daily_rollups WHERE day >= $1 AND day <= $2", start_date, end_date)
+                status = await conn.execute(
+                    """
+                    INSERT INTO task_daily_rollups (
+                        day, task_type, phase, ai_used,
+                        tasks, successful_tasks, duration_seconds, baseline_seconds, time_saved_seconds
+                    )
+                    SELECT
+                        DATE(start_time), task_type, phase, ai_used,
+                        COUNT(*),
+                        COUNT(*) FILTER (WHERE success),
+                        COALESCE(SUM(duration_seconds), 0),
+                        COALESCE(SUM(baseline_seconds), 0),
+                        COALESCE(SUM(time_saved_seconds), 0)
+                    FROM task_sessions
+                    WHERE end_time IS NOT NULL
+                        AND start_time >= $1::date
+                        AND start_time < $2::date
+                    GROUP BY DATE(start_time), task_type, phase, ai_used
+                    """,
+                    start_date,
+                    end_date + timedelta(days=1),
+                )
+
+        rows = int(status.split()[-1])
+        logger.info(f"Rebuilt {rows} daily rollup rows for {start_date} to {end_date}")
+        return rows
+
+    def _session_metrics_group(self, session_info: Dict[str, Any]) -> Optional[Tuple[date, str, str, str]]:
+        """Metrics store group of an active session (None for sessions loaded from the database)"""
+        if "task_type" not in session_info:
+            return None
+        return (
+            session_info["start_time"].date(),
+            session_info["task_type"],
+            session_info["phase"],
+            session_info["ai_used"],
+        )
+
+    def _metrics_store_ready(self, start_date: date) -> bool:
+        """Whether reads from start_date onwards can be served by the metrics store"""
+        return bool(self.pool) and self.metrics_store.covers(start_date, self.metrics_store_max_age_seconds)
+
+    async def _ensure_metrics_store(self, start_date: date):
+        """
+        Load the metrics store if start_date is within its retention window
+
+        Reloads when the store is older than metrics_store_max_age_seconds so
+        completions recorded by other processes are picked up. Failures are
+        logged; callers then read the rollups as before.
+        """
+        if not self.pool or start_date < date.today() - timedelta(days=self.metrics_store.retention_days):
+            return
+
+        async with self._metrics_store_lock:
+            if self._metrics_store_ready(start_date):
+                return
+            try:
+                await self.rebuild_metrics_store()
+            except Exception as e:
+                logger.warning(f"Failed to load metrics store: {e}")
+
+    async def rebuild_metrics_store(self, start_date: Optional[date] = None) -> int:
+        """
+        Rebuild the in-process metrics store from task_sessions (backfill)
+
+        Args:
+            start_date: First day to load (default: start of the retention window)
+
+        Returns:
+            Number of per-day groups loaded
+        """
+        if not self.pool:
+            logger.warning("No database pool - cannot rebuild metrics store")
+            return 0
+
+        today = date.today()
+        if start_date is None:
+            start_date = today - timedelta(days=self.metrics_store.retention_days)
+
+        rows = await self._load_metric_rows(start_date, today)
+        self.metrics_store.load(rows, start_date)
+        self.metrics_store.prune(today)
+
+        logger.info(f"Loaded {len(rows)} metrics store groups from {start_date}")
+        return len(rows)
+
+    async def _load_metric_rows(self, start_date: date, end_date: date) -> List[Dict[str, Any]]:
+        """
+        Aggregate completed sessions per (day, task_type, phase, ai_used) with metrics store counters
+
+        Args:
+            start_date: First day
+            end_date: Last day (inclusive)
+        """
+        if not self.pool:
+            return []
+
+        query = """
+            SELECT
+                DATE(start_time) AS day,
+                task_type,
+                phase,
+                ai_used,
+                COUNT(*) AS tasks,
+                COUNT(*) FILTER (WHERE success) AS successful_tasks,
+                COALESCE(SUM(duration_seconds), 0)::BIGINT AS duration_seconds,
+                COALESCE(SUM(baseline_seconds), 0)::BIGINT AS baseline_seconds,
+                COALESCE(SUM(time_saved_seconds), 0)::BIGINT AS time_saved_seconds,
+                COUNT(*) FILTER (
+                    WHERE baseline_seconds > 0 AND duration_seconds > baseline_seconds * $3::float
+                ) AS overrun_tasks,
+                COALESCE(SUM(pause_duration_seconds), 0)::BIGINT AS pause_seconds,
+                COUNT(*) FILTER (WHERE pause_duration_seconds > 0) AS paused_tasks
+            FROM task_sessions
+            WHERE end_time IS NOT NULL
+                AND start_time >= $1::date
+                AND start_time < $2::date
+            GROUP BY DATE(start_time), task_type, phase, ai_used
+        """
+
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch(query, start_date, end_date + timedelta(days=1), self.metrics_store.overrun_ratio)
+        return [dict(row) for row in rows]
+
     def _calculate_ai_breakdown(self, tasks: List[Dict]) -> Dict[str, Dict[str, Any]]:
-        """Calculate performance breakdown by AI model"""
+        """Calculate performance breakdown by AI model (sessions or aggregate rows with a "tasks" count)"""
         ai_stats: Dict[str, Dict[str, Any]] = {}
 
         for task in tasks:
@@ -754,14 +1006,14 @@ class TimeTrackingService:
                     "time_saved_hours": 0.0,
                 }
 
-            ai_stats[ai_model]["tasks"] += 1
+            ai_stats[ai_model]["tasks"] += task.get("tasks", 1)
             ai_stats[ai_model]["time_saved_seconds"] += task["time_saved_seconds"]
             ai_stats[ai_model]["time_saved_hours"] = ai_stats[ai_model]["time_saved_seconds"] / 3600
 
         return ai_stats
 
     def _calculate_phase_breakdown(self, tasks: List[Dict]) -> Dict[str, Dict[str, Any]]:
-        """Calculate performance breakdown by phase"""
+        """Calculate performance breakdown by phase (sessions or aggregate rows with a "tasks" count)"""
         phase_stats: Dict[str, Dict[str, Any]] = {}
 
         for task in tasks:
@@ -773,14 +1025,14 @@ class TimeTrackingService:
                     "time_saved_hours": 0.0,
                 }
 
-            phase_stats[phase]["tasks"] += 1
+            phase_stats[phase]["tasks"] += task.get("tasks", 1)
             phase_stats[phase]["time_saved_seconds"] += task["time_saved_seconds"]
             phase_stats[phase]["time_saved_hours"] = phase_stats[phase]["time_saved_seconds"] / 3600
 
         return phase_stats
 
     def _calculate_top_time_savers(self, tasks: List[Dict], top_n: int = 5) -> List[Dict[str, Any]]:
-        """Calculate top time-saving task types"""
+        """Calculate top time-saving task types (sessions or aggregate rows with a "tasks" count)"""
         task_type_stats: Dict[str, Dict[str, Any]] = {}
 
         for task in tasks:
@@ -793,7 +1045,7 @@ class TimeTrackingService:
                     "time_saved_hours": 0.0,
                 }
 
-            task_type_stats[task_type]["tasks"] += 1
+            task_type_stats[task_type]["tasks"] += task.get("tasks", 1)
             task_type_stats[task_type]["time_saved_seconds"] += task["time_saved_seconds"]
             task_type_stats[task_type]["time_saved_hours"] = task_type_stats[task_type]["time_saved_seconds"] / 3600
 
@@ -806,6 +1058,62 @@ class TimeTrackingService:
 
         return sorted_stats[:top_n]
 
+    def _calculate_bottlenecks(self, groups: List[Dict[str, Any]]) -> List[Bottleneck]:
+        """Identify task types slower than baseline from per-group aggregates"""
+        # Group by task type
+        task_type_stats: Dict[str, Dict[str, int]] = {}
+        for group in groups:
+            stats = task_type_stats.setdefault(group["task_type"], {"tasks": 0, "duration": 0, "baseline": 0})
+            stats["tasks"] += group["tasks"]
+            stats["duration"] += group["duration_seconds"]
+            stats["baseline"] += group["baseline_seconds"]
+
+        # Calculate bottlenecks
+        bottlenecks = []
+        thresholds = self.config.get("roi_settings", {}).get(
+            "bottleneck_thresholds",
+            {"low": 10, "medium": 25, "high": 50, "critical": 100},
+        )
+
+        for task_type, stats in task_type_stats.items():
+            if not stats["tasks"]:
+                continue
+            avg_duration = stats["duration"] / stats["tasks"]
+            avg_baseline = stats["baseline"] / stats["tasks"]
+
+            # Only consider if actually slower than baseline
+            if avg_duration > avg_baseline:
+                overhead_seconds = int(avg_duration - avg_baseline)
+                overhead_percentage = (overhead_seconds / avg_baseline * 100) if avg_baseline > 0 else 0
+
+                # Determine severity
+                if overhead_percentage >= thresholds.get("critical", 100):
+                    severity = "critical"
+                elif overhead_percentage >= thresholds.get("high", 50):
+                    severity = "high"
+                elif overhead_percentage >= thresholds.get("medium", 25):
+                    severity = "medium"
+                else:
+                    severity = "low"
+
+                bottlenecks.append(
+                    Bottleneck(
+                        task_type=TaskType(task_type),
+                        avg_duration_seconds=int(avg_duration),
+                        baseline_seconds=int(avg_baseline),
+                        overhead_seconds=overhead_seconds,
+                        overhead_percentage=overhead_percentage,
+                        frequency=stats["tasks"],
+                        severity=severity,
+                    )
+                )
+
+        # Sort by severity and overhead
+        severity_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+        bottlenecks.sort(key=lambda b: (severity_order[b.severity], -b.overhead_seconds))
+
+        return bottlenecks
+
     def _project_annual(self, time_saved_hours: float, period: str) -> float:
         """Project annual time savings based on period"""
         if period == "daily":
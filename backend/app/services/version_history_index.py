@@ -0,0 +1,347 @@
+"""
+Version History Index
+
+Persists Git commit history to the version_history table so the version
+history API pages and searches commits in PostgreSQL instead of running git
+on every request.
+
+Ingestion is incremental: version_history_sync remembers the last imported
+commit per (project, branch), and only commits after it are read with one
+git log and bulk loaded with COPY.
+"""
+
+import asyncio
+import base64
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from ..models.version_history import VersionCommit, VersionHistory
+from .git_service import GitService
+
+logger = logging.getLogger(__name__)
+
+COLUMNS = [
+    "project_id",
+    "commit_hash",
+    "short_hash",
+    "author",
+    "author_email",
+    "commit_date",
+    "message",
+    "files_modified",
+    "files_added",
+    "files_deleted",
+    "lines_added",
+    "lines_deleted",
+    "tags",
+    "branches",
+]
+
+
+def encode_cursor(commit_date: datetime, commit_hash: str) -> str:
+    """Opaque keyset cursor for the page after (commit_date, commit_hash)"""
+    return base64.urlsafe_b64encode(f"{commit_date.isoformat()}|{commit_hash}".encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Inverse of encode_cursor; raises ValueError for malformed cursors"""
+    try:
+        commit_date, commit_hash = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(commit_date), commit_hash
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+class VersionHistoryIndex:
+    """Incremental version_history ingestion and keyset/full-text queries"""
+
+    def __init__(self, pool, copy_batch_size: int = 5000):
+        """
+        Initialize version history index
+
+        Args:
+            pool: Database connection pool (asyncpg)
+            copy_batch_size: Records per COPY call during ingestion
+        """
+        self.pool = pool
+        self.copy_batch_size = copy_batch_size
+
+    async def _get_project_id(self, conn, repo_path: Path, create: bool = False) -> Optional[UUID]:
+        """Find the project for a repository (by path, then name), optionally creating it"""
+        project_id = await conn.fetchval(
+            "SELECT id FROM projects WHERE path = $1 OR name = $2 ORDER BY (path = $1) DESC LIMIT 1",
+            str(repo_path),
+            repo_path.name,
+        )
+        if project_id or not create:
+            return project_id
+
+        return await conn.fetchval(
+            """
+            INSERT INTO projects (name, path) VALUES ($1, $2)
+            ON CONFLICT (name) DO UPDATE SET updated_at = NOW()
+            RETURNING id
+            """,
+            repo_path.name,
+            str(repo_path),
+        )
+
+    async def ingest(self, git_service: GitService, branch: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Import commits added to a branch since the last ingestion
+
+        Args:
+            git_service: GitService for the repository
+            branch: Branch to import (default: current branch)
+
+        Returns:
+            Ingestion summary (project_id, branch, head, imported, full, commit_count)
+        """
+        ref = await asyncio.to_thread(git_service.resolve_ref, branch)
+        if not ref[1]:
+            raise ValueError(f"Unknown ref: {branch or 'HEAD'}")
+        if not ref[2]:
+            raise ValueError(f"Only local branches can be indexed: {ref[0]}")
+
+        async with self.pool.acquire() as conn:
+            project_id = await self._get_project_id(conn, git_service.repo_path, create=True)
+            state = await conn.fetchrow(
+                "SELECT last_commit_hash, commit_count FROM version_history_sync WHERE project_id = $1 AND branch = $2",
+                project_id,
+                ref[0],
+            )
+
+        return await self._ingest(git_service, project_id, ref, state)
+
+    async def _ingest(
+        self,
+        git_service: GitService,
+        project_id: UUID,
+        ref: Tuple[str, str, Optional[str]],
+        state: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Import the commits between the sync state and the resolved ref"""
+        branch_name, head, local_branch = ref
+        summary = {"project_id": str(project_id), "branch": branch_name, "head": head, "imported": 0, "full": False}
+
+        if state and state["last_commit_hash"] == head:
+            summary["commit_count"] = state["commit_count"]
+            return summary
+
+        # Rewritten history (force push) is re-imported from scratch; rows no longer on the branch lose it
+        since = state["last_commit_hash"] if state else None
+        if since and not await asyncio.to_thread(git_service.is_ancestor, since, head):
+            since = None
+
+        commits = await asyncio.to_thread(git_service.load_commit_range, head, since, local_branch)
+        commit_count = (state["commit_count"] if since else 0) + len(commits)
+        records = [self._to_record(project_id, commit) for commit in commits]
+
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                if records:
+                    await conn.execute(
+                        "CREATE TEMP TABLE version_history_stage (LIKE version_history INCLUDING DEFAULTS) ON COMMIT DROP"
+                    )
+                    for start in range(0, len(records), self.copy_batch_size):
+                        await conn.copy_records_to_table(
+                            "version_history_stage",
+                            records=records[start : start + self.copy_batch_size],
+                            columns=COLUMNS,
+                        )
+                    await conn.execute(
+                        f"""
+                        INSERT INTO version_history ({", ".join(COLUMNS)})
+                        SELECT {", ".join(COLUMNS)} FROM version_history_stage
+                        ON CONFLICT (project_id, commit_hash) DO UPDATE SET
+                            tags = EXCLUDED.tags,
+                            branches = ARRAY(
+                                SELECT DISTINCT unnest(COALESCE(version_history.branches, '{{}}') || EXCLUDED.branches)
+                            ),
+                            cached_at = NOW()
+                        """
+                    )
+                    if since is None:
+                        # Commits abandoned by the rewrite keep their rows but leave the branch
+                        await conn.execute(
+                            """
+                            UPDATE version_history
+                            SET branches = array_remove(branches, $2), cached_at = NOW()
+                            WHERE project_id = $1
+                                AND $2 = ANY(branches)
+                                AND NOT EXISTS (
+                                    SELECT 1 FROM version_history_stage AS stage
+                                    WHERE stage.commit_hash = version_history.commit_hash
+                                )
+                            """,
+                            project_id,
+                            branch_name,
+                        )
+                await conn.execute(
+                    """
+                    INSERT INTO version_history_sync (project_id, branch, last_commit_hash, commit_count, synced_at)
+                    VALUES ($1, $2, $3, $4, NOW())
+                    ON CONFLICT (project_id, branch) DO UPDATE SET
+                        last_commit_hash = EXCLUDED.last_commit_hash,
+                        commit_count = EXCLUDED.commit_count,
+                        synced_at = NOW()
+                    """,
+                    project_id,
+                    branch_name,
+                    head,
+                    commit_count,
+                )
+
+        summary.update(imported=len(records), full=since is None, commit_count=commit_count)
+        logger.info(f"Imported {len(records)} commits of {branch_name} into version_history ({head[:7]})")
+        return summary
+
+    @staticmethod
+    def _to_record(project_id: UUID, commit: VersionCommit) -> tuple:
+        """COPY record in COLUMNS order (truncated to the column widths)"""
+        return (
+            project_id,
+            commit.commit_hash,
+            commit.short_hash[:7],
+            commit.author[:255],
+            commit.author_email[:255],
+            commit.date,
+            commit.message,
+            commit.files_modified,
+            commit.files_added,
+            commit.files_deleted,
+            commit.lines_added,
+            commit.lines_deleted,
+            commit.tags,
+            commit.branches,
+        )
+
+    async def get_history(
+        self,
+        git_service: GitService,
+        branch: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        author: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        search: Optional[str] = None,
+    ) -> Optional[VersionHistory]:
+        """
+        Page through an ingested branch, newest first
+
+        Catches up with new commits first (one rev-parse when nothing changed).
+        Branches that were never ingested (and tags, commits or a detached
+        HEAD) return None so callers can fall back to reading git.
+
+        Args:
+            git_service: GitService for the repository
+            branch: Branch name (default: current branch)
+            limit: Page size
+            cursor: next_cursor of the previous page
+            author: Author email or name
+            since: Commits after this date
+            until: Commits before this date
+            search: Full-text search in commit messages (websearch syntax)
+
+        Returns:
+            VersionHistory with next_cursor set when more commits follow, or None
+        """
+        ref = await asyncio.to_thread(git_service.resolve_ref, branch)
+        if not ref[2]:
+            return None
+
+        async with self.pool.acquire() as conn:
+            project_id = await self._get_project_id(conn, git_service.repo_path)
+            if project_id is None:
+                return None
+            state = await conn.fetchrow(
+                "SELECT last_commit_hash, commit_count FROM version_history_sync WHERE project_id = $1 AND branch = $2",
+                project_id,
+                ref[0],
+            )
+        if state is None:
+            return None
+
+        summary = await self._ingest(git_service, project_id, ref, state)
+
+        # Keyset pagination over idx_version_history_project_keyset
+        conditions = ["project_id = $1", "$2 = ANY(branches)"]
+        params: List[Any] = [project_id, ref[0]]
+
+        if cursor:
+            params.extend(decode_cursor(cursor))
+            conditions.append(f"(commit_date, commit_hash) < (${len(params) - 1}::timestamptz, ${len(params)}::varchar)")
+
+        if author:
+            params.append(author)
+            conditions.append(f"(author_email = ${len(params)} OR author = ${len(params)})")
+
+        if since:
+            params.append(since)
+            conditions.append(f"commit_date >= ${len(params)}")
+
+        if until:
+            params.append(until)
+            conditions.append(f"commit_date <= ${len(params)}")
+
+        if search:
+            # Same expression as idx_version_history_message_search (GIN)
+            params.append(search)
+            conditions.append(f"to_tsvector('english', message) @@ websearch_to_tsquery('english', ${len(params)})")
+
+        params.append(limit + 1)
+        query = f"""
+            SELECT commit_hash, short_hash, author, author_email, commit_date, message,
+                   files_modified, files_added, files_deleted, lines_added, lines_deleted,
+                   tags, branches, quality_metrics
+            FROM version_history
+            WHERE {" AND ".join(conditions)}
+            ORDER BY commit_date DESC, commit_hash DESC
+            LIMIT ${len(params)}
+        """
+
+        async with self.pool.acquire() as conn:
+            rows = await conn.fetch(query, *params)
+
+        commits = [self._to_commit(row) for row in rows[:limit]]
+        next_cursor = encode_cursor(commits[-1].date, commits[-1].commit_hash) if len(rows) > limit else None
+
+        dates = [commit.date for commit in commits]
+        return VersionHistory(
+            project_name=git_service.repo_path.name,
+            project_path=str(git_service.repo_path),
+            current_branch=ref[0],
+            total_commits=summary["commit_count"],
+            commits=commits,
+            total_contributors=len({commit.author_email for commit in commits}),
+            first_commit_date=min(dates, default=None),
+            last_commit_date=max(dates, default=None),
+            next_cursor=next_cursor,
+        )
+
+    @staticmethod
+    def _to_commit(row) -> VersionCommit:
+        """Build a VersionCommit from a version_history row"""
+        return VersionCommit(
+            commit_hash=row["commit_hash"],
+            short_hash=row["short_hash"],
+            author=row["author"],
+            author_email=row["author_email"],
+            date=row["commit_date"],
+            message=row["message"],
+            files_modified=row["files_modified"] or [],
+            files_added=row["files_added"] or [],
+            files_deleted=row["files_deleted"] or [],
+            lines_added=row["lines_added"] or 0,
+            lines_deleted=row["lines_deleted"] or 0,
+            quality_metrics=(
+                json.loads(row["quality_metrics"]) if isinstance(row["quality_metrics"], str) else row["quality_metrics"]
+            ),
+            tags=row["tags"] or [],
+            branches=row["branches"] or [],
+        )
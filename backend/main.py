@@ -103,6 +103,15 @@ except ImportError as e:
     PROJECT_CONTEXT_AVAILABLE = False
     logger.info(f"Project context routers not available (optional): {e}")
 
+# Import context search router for pgvector k-NN retrieval (optional)
+try:
+    from app.routers.context_search import router as context_search_router
+
+    CONTEXT_SEARCH_AVAILABLE = True
+except ImportError as e:
+    CONTEXT_SEARCH_AVAILABLE = False
+    logger.info(f"Context search router not available (optional): {e}")
+
 # Import modules router for Standard Level MDO
 try:
     from app.routers.modules import router as modules_router
@@ -533,6 +542,10 @@ if ROUTERS_AVAILABLE:
         app.include_router(projects_router)
         logger.info("[OK] Projects router included")
 
+if CONTEXT_SEARCH_AVAILABLE:
+    app.include_router(context_search_router)
+    logger.info("[OK] Context Search router included (pgvector k-NN: /api/context-search)")
+
 # Include auth router
 if AUTH_ROUTER_AVAILABLE:
     app.include_router(auth_router)
@@ -944,6 +957,18 @@ async def startup_event():
     except Exception as e:
         logger.warning(f"[WARN] Background sync not available: {e}")
 
+    # Start periodic retraining of the uncertainty ML predictor (worker process)
+    uncertainty_map = udo_system.components.get("uncertainty") if udo_system else None
+    if uncertainty_map is not None:
+        try:
+            from app.background_tasks import start_predictor_training
+
+            training_interval = int(os.getenv("UNCERTAINTY_TRAINING_INTERVAL_SECONDS", "3600"))
+            await start_predictor_training(uncertainty_map, interval_seconds=training_interval)
+            logger.info(f"[OK] Uncertainty predictor training started (every {training_interval}s)")
+        except Exception as e:
+            logger.warning(f"[WARN] Uncertainty predictor training not available: {e}")
+
 
 # Shutdown event
 @app.on_event("shutdown")
@@ -992,6 +1017,15 @@ async def shutdown_event():
     except Exception as e:
         logger.error(f"[FAIL] Failed to stop background sync: {e}")
 
+    # Stop predictor training
+    try:
+        from app.background_tasks import stop_predictor_training
+
+        await stop_predictor_training()
+        logger.info("[OK] Uncertainty predictor training stopped")
+    except Exception as e:
+        logger.error(f"[FAIL] Failed to stop predictor training: {e}")
+
 
 # Error statistics endpoint (if error handler available)
 # HIGH-04: Protected in production (internal debugging endpoint)
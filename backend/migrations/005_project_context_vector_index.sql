@@ -0,0 +1,47 @@
+-- Migration 005: Project Context Vector Index
+-- Date: 2026-10-18
+-- Purpose: Index project_contexts.embedding for k-NN context retrieval (pgvector)
+-- Dependencies: scripts/init_db.sql (project_contexts with embedding vector(1536))
+
+-- ==================================================================
+-- 1. Extension
+-- ==================================================================
+
+CREATE EXTENSION IF NOT EXISTS vector;
+
+-- ==================================================================
+-- 2. Vector Index
+-- ==================================================================
+
+-- HNSW (pgvector >= 0.5.0) gives better recall/latency than IVFFlat and
+-- needs no training data, so it stays accurate as chunks are added.
+-- Falls back to IVFFlat on older pgvector versions.
+DO $$
+BEGIN
+    DROP INDEX IF EXISTS idx_project_contexts_embedding;
+
+    BEGIN
+        CREATE INDEX IF NOT EXISTS idx_project_contexts_embedding_hnsw
+        ON project_contexts
+        USING hnsw (embedding vector_cosine_ops)
+        WITH (m = 16, ef_construction = 64);
+        RAISE NOTICE 'Created HNSW index on project_contexts.embedding';
+    EXCEPTION WHEN undefined_object OR feature_not_supported THEN
+        CREATE INDEX IF NOT EXISTS idx_project_contexts_embedding
+        ON project_contexts
+        USING ivfflat (embedding vector_cosine_ops)
+        WITH (lists = 100);
+        RAISE NOTICE 'HNSW not available, created IVFFlat index on project_contexts.embedding';
+    END;
+END $$;
+
+-- ==================================================================
+-- 3. Project Filter Index
+-- ==================================================================
+
+-- Partial index so the project_id filter only touches embedded chunks
+CREATE INDEX IF NOT EXISTS idx_project_contexts_project_embedded
+ON project_contexts(project_id)
+WHERE embedding IS NOT NULL;
+
+ANALYZE project_contexts;
@@ -0,0 +1,12 @@
+-- Rollback Migration 005: Project Context Vector Index
+-- Date: 2026-10-18
+-- Purpose: Restore the original IVFFlat index from scripts/init_db.sql
+
+DROP INDEX IF EXISTS idx_project_contexts_project_embedded;
+DROP INDEX IF EXISTS idx_project_contexts_embedding_hnsw;
+DROP INDEX IF EXISTS idx_project_contexts_embedding;
+
+CREATE INDEX idx_project_contexts_embedding
+ON project_contexts
+USING ivfflat (embedding vector_cosine_ops)
+WITH (lists = 100);
@@ -0,0 +1,68 @@
+-- Migration 006: Time Tracking Daily Rollups
+-- Date: 2026-10-18
+-- Purpose: Pre-aggregated daily metrics so ROI reports read rollup rows instead of every session
+-- Dependencies: 002_time_tracking_schema.sql (task_sessions)
+
+-- ==================================================================
+-- 1. Rollup Table
+-- ==================================================================
+
+-- One row per (day, task_type, phase, ai_used); day is DATE(start_time) to
+-- match the period filter used by ROI reports. Maintained by
+-- TimeTrackingService.end_task.
+CREATE TABLE IF NOT EXISTS task_daily_rollups (
+    day DATE NOT NULL,
+    task_type VARCHAR(50) NOT NULL,
+    phase VARCHAR(50) NOT NULL,
+    ai_used VARCHAR(50) NOT NULL,
+
+    tasks INTEGER NOT NULL DEFAULT 0,
+    successful_tasks INTEGER NOT NULL DEFAULT 0,
+    duration_seconds BIGINT NOT NULL DEFAULT 0,
+    baseline_seconds BIGINT NOT NULL DEFAULT 0,
+    time_saved_seconds BIGINT NOT NULL DEFAULT 0,
+
+    updated_at TIMESTAMP NOT NULL DEFAULT NOW(),
+
+    PRIMARY KEY (day, task_type, phase, ai_used)
+);
+
+-- ==================================================================
+-- 2. Session Index
+-- ==================================================================
+
+-- Range scans over completed sessions (rollup refresh and backfill)
+CREATE INDEX IF NOT EXISTS idx_task_sessions_completed_start
+ON task_sessions(start_time)
+WHERE end_time IS NOT NULL;
+
+-- ==================================================================
+-- 3. Backfill
+-- ==================================================================
+
+INSERT INTO task_daily_rollups (
+    day, task_type, phase, ai_used,
+    tasks, successful_tasks, duration_seconds, baseline_seconds, time_saved_seconds
+)
+SELECT
+    DATE(start_time),
+    task_type,
+    phase,
+    ai_used,
+    COUNT(*),
+    COUNT(*) FILTER (WHERE success),
+    COALESCE(SUM(duration_seconds), 0),
+    COALESCE(SUM(baseline_seconds), 0),
+    COALESCE(SUM(time_saved_seconds), 0)
+FROM task_sessions
+WHERE end_time IS NOT NULL
+GROUP BY DATE(start_time), task_type, phase, ai_used
+ON CONFLICT (day, task_type, phase, ai_used) DO UPDATE SET
+    tasks = EXCLUDED.tasks,
+    successful_tasks = EXCLUDED.successful_tasks,
+    duration_seconds = EXCLUDED.duration_seconds,
+    baseline_seconds = EXCLUDED.baseline_seconds,
+    time_saved_seconds = EXCLUDED.time_saved_seconds,
+    updated_at = NOW();
+
+COMMENT ON TABLE task_daily_rollups IS 'Daily aggregates of completed task sessions per task type, phase and AI model';
@@ -0,0 +1,6 @@
+-- Rollback Migration 006: Time Tracking Daily Rollups
+-- Date: 2026-10-18
+-- Purpose: Remove the daily rollup table (ROI reports fall back to task_sessions)
+
+DROP INDEX IF EXISTS idx_task_sessions_completed_start;
+DROP TABLE IF EXISTS task_daily_rollups;
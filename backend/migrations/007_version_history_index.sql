@@ -0,0 +1,32 @@
+-- Migration 007: Version History Index
+-- Date: 2026-10-18
+-- Purpose: Incremental Git history ingestion state and a keyset pagination index for version_history
+-- Dependencies: 001_initial_schema.sql (projects, version_history)
+
+-- ==================================================================
+-- 1. Ingestion State
+-- ==================================================================
+
+-- Last imported commit per (project, branch); VersionHistoryIndex imports
+-- only commits after it. commit_count backs total_commits in the API.
+CREATE TABLE IF NOT EXISTS version_history_sync (
+    project_id UUID NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+    branch VARCHAR(255) NOT NULL,
+
+    last_commit_hash VARCHAR(40) NOT NULL,
+    commit_count INTEGER NOT NULL DEFAULT 0,
+
+    synced_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+
+    PRIMARY KEY (project_id, branch)
+);
+
+-- ==================================================================
+-- 2. Keyset Pagination Index
+-- ==================================================================
+
+-- Newest-first pages: WHERE project_id = $1 AND (commit_date, commit_hash) < ($2, $3)
+CREATE INDEX IF NOT EXISTS idx_version_history_project_keyset
+ON version_history(project_id, commit_date DESC, commit_hash DESC);
+
+COMMENT ON TABLE version_history_sync IS 'Last Git commit imported into version_history per project branch';
@@ -0,0 +1,6 @@
+-- Rollback Migration 007: Version History Index
+-- Date: 2026-10-18
+-- Purpose: Remove ingestion state and keyset index (the API falls back to reading Git)
+
+DROP INDEX IF EXISTS idx_version_history_project_keyset;
+DROP TABLE IF EXISTS version_history_sync;
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Redis Lock Contention Benchmark
+
+Measures lock acquire/release throughput of RedisClient under contention:
+many concurrent workers competing for a small set of lock keys.
+
+Usage:
+    python backend/scripts/benchmark_redis_locks.py --workers 50 --keys 4 --duration 10
+
+Requires a reachable Redis (REDIS_HOST / REDIS_PORT / REDIS_DB env vars).
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.redis_client import RedisClient  # noqa: E402
+
+BENCH_KEY = "udo:lock:bench:{}"
+
+
+async def worker(client: RedisClient, worker_id: int, keys: int, deadline: float, stats: dict):
+    """Acquire/release random keys until the deadline"""
+    owner = f"bench-worker-{worker_id}"
+    i = worker_id
+    while time.perf_counter() < deadline:
+        key = BENCH_KEY.format(i % keys)
+        i += 1
+
+        start = time.perf_counter()
+        acquired = await client.acquire_lock(key, owner, ttl=5)
+        stats["latencies"].append(time.perf_counter() - start)
+
+        if acquired:
+            stats["acquired"] += 1
+            await client.release_lock(key, owner)
+        else:
+            stats["contended"] += 1
+
+
+async def run_benchmark(workers: int, keys: int, duration: float) -> bool:
+    client = RedisClient()
+    if not await client.connect():
+        print("Error: Redis not available")
+        return False
+
+    stats = {"acquired": 0, "contended": 0, "latencies": []}
+    deadline = time.perf_counter() + duration
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(client, n, keys, deadline, stats) for n in range(workers)))
+    elapsed = time.perf_counter() - start
+
+    await client.disconnect()
+
+    latencies = sorted(stats["latencies"])
+    attempts = len(latencies)
+    p50 = latencies[attempts // 2] * 1000 if attempts else 0.0
+    p99 = latencies[int(attempts * 0.99)] * 1000 if attempts else 0.0
+
+    print("=" * 60)
+    print(f"Redis lock benchmark: {workers} workers, {keys} keys, {elapsed:.1f}s")
+    print("=" * 60)
+    print(f"  Attempts:        {attempts}")
+    print(f"  Acquired:        {stats['acquired']}")
+    print(f"  Contended:       {stats['contended']}")
+    print(f"  Attempts/sec:    {attempts / elapsed:,.0f}")
+    print(f"  Acquire+release/sec: {stats['acquired'] / elapsed:,.0f}")
+    print(f"  Acquire p50:     {p50:.2f}ms")
+    print(f"  Acquire p99:     {p99:.2f}ms")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Redis lock ops/sec under contention")
+    parser.add_argument("--workers", type=int, default=50, help="Concurrent workers")
+    parser.add_argument("--keys", type=int, default=4, help="Distinct lock keys to contend on")
+    parser.add_argument("--duration", type=float, default=10.0, help="Benchmark duration in seconds")
+    args = parser.parse_args()
+
+    success = asyncio.run(run_benchmark(args.workers, args.keys, args.duration))
+    sys.exit(0 if success else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Version History Ingestion
+
+Imports new commits of a branch into the version_history table. The first
+run imports the full history; later runs only import commits since the last
+imported one, so it is cheap to schedule (e.g. every few minutes or from a
+post-receive hook).
+
+Usage:
+    python backend/scripts/ingest_version_history.py --repo . --branch main
+
+Requires a reachable PostgreSQL (DB_HOST / DB_PORT / DB_NAME / DB_USER / DB_PASSWORD env vars)
+with migration 007_version_history_index.sql applied.
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.git_service import GitService  # noqa: E402
+from app.services.version_history_index import VersionHistoryIndex  # noqa: E402
+from async_database import AsyncDatabase  # noqa: E402
+
+
+async def run_ingest(repo: str, branches: list) -> bool:
+    db = AsyncDatabase()
+    try:
+        await db.initialize()
+    except Exception as e:
+        print(f"Error: PostgreSQL not available ({e})")
+        return False
+
+    try:
+        git_service = GitService(repo)
+        index = VersionHistoryIndex(db.get_pool())
+        for branch in branches or [None]:
+            summary = await index.ingest(git_service, branch=branch)
+            mode = "full" if summary["full"] else "incremental"
+            print(
+                f"{summary['branch']}: imported {summary['imported']} commits ({mode}), "
+                f"{summary['commit_count']} total, head {summary['head'][:7]}"
+            )
+    finally:
+        await db.close()
+
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import new Git commits into the version_history table")
+    parser.add_argument("--repo", default=str(Path(__file__).parent.parent.parent), help="Path to Git repository")
+    parser.add_argument("--branch", action="append", help="Branch to import (repeatable, default: current branch)")
+    args = parser.parse_args()
+
+    success = asyncio.run(run_ingest(args.repo, args.branch))
+    sys.exit(0 if success else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Time Tracking Metrics Rebuild
+
+Backfills the task_daily_rollups table from task_sessions for a date range,
+e.g. after applying migration 006 or importing sessions.
+
+Usage:
+    python backend/scripts/rebuild_time_metrics.py --days 90
+    python backend/scripts/rebuild_time_metrics.py --start 2026-01-01 --end 2026-06-30
+
+Requires a reachable PostgreSQL (DB_HOST / DB_PORT / DB_NAME / DB_USER / DB_PASSWORD env vars).
+The in-memory metrics store of running API processes reloads itself; use
+POST /api/time-tracking/metrics/rebuild to force it.
+"""
+
+import argparse
+import asyncio
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.time_tracking_service import TimeTrackingService  # noqa: E402
+from async_database import AsyncDatabase  # noqa: E402
+
+
+async def run_rebuild(start_date: date, end_date: date) -> bool:
+    db = AsyncDatabase()
+    try:
+        await db.initialize()
+    except Exception as e:
+        print(f"Error: PostgreSQL not available ({e})")
+        return False
+
+    try:
+        service = TimeTrackingService(pool=db.get_pool())
+        rows = await service.rebuild_daily_rollups(start_date, end_date)
+    finally:
+        await db.close()
+
+    print(f"Rebuilt {rows} daily rollup rows for {start_date} to {end_date}")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild time tracking daily rollups from task sessions")
+    parser.add_argument("--start", type=date.fromisoformat, help="First day (YYYY-MM-DD)")
+    parser.add_argument("--end", type=date.fromisoformat, default=date.today(), help="Last day (default: today)")
+    parser.add_argument("--days", type=int, default=35, help="Days back from --end when --start is omitted")
+    args = parser.parse_args()
+
+    start_date = args.start or args.end - timedelta(days=args.days)
+    success = asyncio.run(run_rebuild(start_date, args.end))
+    sys.exit(0 if success else 1)
+
+
+if __name__ == "__main__":
+    main()
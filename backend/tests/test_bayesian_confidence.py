@@ -40,8 +40,9 @@ class TestOptimizedBayesianScorer:
     """Test OptimizedBayesianScorer class"""
 
     def test_scorer_initialization(self):
-        """Test scorer can be initialized with cache"""
-        scorer = OptimizedBayesianScorer(cache_size=64)
+        """Test scorer can be initialized with the deprecated cache_size argument"""
+        with pytest.warns(DeprecationWarning):
+            scorer = OptimizedBayesianScorer(cache_size=64)
         assert scorer.cache_size == 64
 
     def test_beta_mean_calculation(self):
@@ -0,0 +1,122 @@
+"""
+Bayesian Confidence Batch Scoring Tests
+
+Batch results must match calculate_bayesian_confidence item for item.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+BACKEND_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from app.models.uncertainty import BayesianConfidenceRequest  # noqa: E402
+from app.services.bayesian_confidence import (  # noqa: E402
+    calculate_bayesian_confidence,
+    calculate_bayesian_confidence_batch,
+    classify_uncertainty_state,
+    classify_uncertainty_states,
+)
+
+PHASES = ["ideation", "design", "mvp", "implementation", "testing", "Unknown"]
+
+
+def _requests():
+    requests = []
+    for i in range(36):
+        context = {}
+        if i % 3:
+            context["team_size"] = [1, 2, 3, 4, 6, 9][i % 6]
+        if i % 4 == 0:
+            context["has_code"] = True
+        if i % 5:
+            context["validation_score"] = (i % 7) / 6
+        if i % 2:
+            context["timeline_weeks"] = [2, 4, 8, 13, 20][i % 5]
+        requests.append(
+            BayesianConfidenceRequest(
+                phase=PHASES[i % len(PHASES)],
+                context=context,
+                historical_outcomes=[bool((i + j) % 3) for j in range(i % 8)],
+                use_fast_mode=bool(i % 2),
+            )
+        )
+    return requests
+
+
+def test_batch_matches_scalar_scoring():
+    requests = _requests()
+
+    batch = calculate_bayesian_confidence_batch(requests)
+
+    assert len(batch) == len(requests)
+    for result, request in zip(batch, requests):
+        scalar = calculate_bayesian_confidence(request)
+        assert result.confidence_score == pytest.approx(scalar.confidence_score)
+        assert result.state == scalar.state
+        assert result.decision == scalar.decision
+        assert result.recommendations == scalar.recommendations
+
+        expected = scalar.metadata.model_dump()
+        actual = result.metadata.model_dump()
+        for key, value in expected.items():
+            if isinstance(value, float):
+                assert actual[key] == pytest.approx(value), key
+            else:
+                assert actual[key] == value, key
+
+
+def test_classify_states_matches_scalar_at_boundaries():
+    magnitudes = [0.0, 0.0999, 0.1, 0.2999, 0.3, 0.6, 0.8999, 0.9, 1.0]
+    assert classify_uncertainty_states(magnitudes) == [classify_uncertainty_state(m) for m in magnitudes]
+
+
+def test_non_numeric_context_value_is_rejected():
+    request = BayesianConfidenceRequest(phase="mvp", context={"team_size": "many"})
+    with pytest.raises(ValueError):
+        calculate_bayesian_confidence_batch([request])
+
+
+class TestBatchEndpoint:
+    @pytest.fixture
+    def client(self):
+        from app.routers.uncertainty import router
+
+        app = FastAPI()
+        app.include_router(router)
+        return TestClient(app)
+
+    def test_batch_matches_single_endpoint_in_order(self, client):
+        items = [
+            {"phase": "ideation", "context": {"team_size": 8, "timeline_weeks": 2}, "historical_outcomes": [False]},
+            {
+                "phase": "testing",
+                "context": {"has_code": True, "validation_score": 0.9},
+                "historical_outcomes": [True, True, True],
+                "use_fast_mode": False,
+            },
+        ]
+
+        response = client.post("/api/uncertainty/confidence/batch", json={"items": items})
+
+        assert response.status_code == 200, response.text
+        data = response.json()
+        assert data["count"] == 2
+        for result, item in zip(data["results"], items):
+            single = client.post("/api/uncertainty/confidence", json=item).json()
+            assert result["confidence_score"] == pytest.approx(single["confidence_score"])
+            assert result["state"] == single["state"]
+            assert result["metadata"]["mode"] == single["metadata"]["mode"]
+
+    def test_empty_batch_rejected(self, client):
+        response = client.post("/api/uncertainty/confidence/batch", json={"items": []})
+        assert response.status_code == 422
+
+    def test_invalid_context_is_bad_request(self, client):
+        items = [{"phase": "mvp", "context": {"timeline_weeks": "soon"}}]
+        response = client.post("/api/uncertainty/confidence/batch", json={"items": items})
+        assert response.status_code == 400
@@ -10,6 +10,7 @@ Verifies:
 """
 
 import sys
+import time
 
 import pytest
 
@@ -265,6 +266,48 @@ class TestStatistics:
         assert stats_after["evictions"] == 0
 
 
+class TestEntryLimitAndNegativeCache:
+    """Test entry-count bound, explicit sizes and negative caching"""
+
+    def test_entry_limit_evicts_lru(self):
+        """Should evict LRU entry once max_entries is reached"""
+        cache = CacheManager(max_entries=2)
+
+        cache.set("key1", "a")
+        cache.set("key2", "b")
+        _ = cache.get("key1")
+        cache.set("key3", "c")
+
+        assert cache.count == 2
+        assert cache.get("key2") is None, "key2 should be evicted (LRU)"
+        assert cache.get("key1") == "a"
+        assert cache.get_statistics()["evictions"] == 1
+
+    def test_explicit_size_overrides_getsizeof(self):
+        """Caller-supplied size should be used for accounting"""
+        cache = CacheManager(max_size_bytes=1000)
+
+        cache.set("key1", {"nested": "x" * 2000}, size=600)
+        cache.set("key2", "small", size=600)
+
+        assert cache.size == 600
+        assert cache.get("key1") is None
+
+    def test_negative_marker_expires_and_is_cleared_by_set(self):
+        """Missing markers should expire and be replaced by real values"""
+        cache = CacheManager(negative_ttl_seconds=0.05)
+
+        cache.mark_missing("key1")
+        assert cache.is_missing("key1")
+        time.sleep(0.06)
+        assert not cache.is_missing("key1")
+
+        cache.mark_missing("key2")
+        cache.set("key2", "value2")
+        assert not cache.is_missing("key2")
+        assert cache.get_statistics()["negative_hits"] == 1
+
+
 class TestEdgeCases:
     """Test edge cases and boundary conditions"""
 
@@ -0,0 +1,110 @@
+"""
+C-K Theory in-flight de-duplication and LLM concurrency cap tests
+"""
+
+import asyncio
+
+import pytest
+
+from backend.app.models.ck_theory import CKTheoryRequest
+from backend.app.services.ck_theory_service import CKTheoryService
+
+
+class FakeSequentialMCP:
+    """Slow reasoning client that records concurrency"""
+
+    def __init__(self, delay: float = 0.02):
+        self.delay = delay
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+
+    async def reason(self, prompt):
+        self.calls += 1
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        return {"content": "Recommendation: Alternative B"}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_one_generation():
+    service = CKTheoryService()
+    runs = []
+    original = service._explore_concepts
+
+    async def explore(challenge, constraints):
+        runs.append(challenge)
+        await asyncio.sleep(0.02)
+        return await original(challenge, constraints)
+
+    service._explore_concepts = explore
+    request = CKTheoryRequest(challenge="Design a rate limiter for the public API")
+
+    results = await asyncio.gather(*(service.generate_design(request) for _ in range(5)))
+
+    assert len(runs) == 1
+    assert all(result is results[0] for result in results)
+    assert service._in_flight == {}
+
+
+@pytest.mark.asyncio
+async def test_failed_generation_is_raised_to_every_waiter_and_not_reused():
+    service = CKTheoryService()
+    attempts = []
+
+    async def explore(challenge, constraints):
+        attempts.append(challenge)
+        await asyncio.sleep(0.01)
+        raise ValueError("concept space unavailable")
+
+    service._explore_concepts = explore
+    request = CKTheoryRequest(challenge="Design a background job scheduler")
+
+    results = await asyncio.gather(*(service.generate_design(request) for _ in range(3)), return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert len(attempts) == 1
+
+    with pytest.raises(RuntimeError):
+        await service.generate_design(request)
+    assert len(attempts) == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_generation():
+    service = CKTheoryService()
+    request = CKTheoryRequest(challenge="Design an audit log retention policy")
+    original = service._explore_concepts
+
+    async def explore(challenge, constraints):
+        await asyncio.sleep(0.02)
+        return await original(challenge, constraints)
+
+    service._explore_concepts = explore
+    first = asyncio.create_task(service.generate_design(request))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(service.generate_design(request))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    result = await second
+
+    assert result.challenge == request.challenge
+
+
+@pytest.mark.asyncio
+async def test_llm_fan_out_is_capped_service_wide():
+    mcp = FakeSequentialMCP()
+    service = CKTheoryService(sequential_mcp=mcp, config={"max_concurrent_llm_calls": 2})
+
+    await asyncio.gather(
+        service.generate_design(CKTheoryRequest(challenge="Design a feature flag rollout system")),
+        service.generate_design(CKTheoryRequest(challenge="Design a multi-region failover plan")),
+    )
+
+    assert mcp.calls == 10  # (concepts + 3 alternatives + tradeoff) per design
+    assert mcp.max_active == 2
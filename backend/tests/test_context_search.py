@@ -0,0 +1,120 @@
+"""
+Context Search Tests
+
+Validates the NumPy brute-force fallback index and the context search API.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.app.routers.context_search import router
+from backend.app.services.context_search_service import (
+    ContextSearchService,
+    LocalVectorIndex,
+    get_context_search_service,
+)
+
+
+def _cosine_distance(a, b):
+    return 1.0 - float(np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b)))
+
+
+class TestLocalVectorIndex:
+    def test_matches_exhaustive_ranking(self):
+        rng = np.random.default_rng(7)
+        vectors = rng.normal(size=(200, 16))
+        index = LocalVectorIndex()
+        for i, vector in enumerate(vectors):
+            index.upsert("p1", f"file_{i}.py", f"chunk {i}", vector)
+
+        query = rng.normal(size=16)
+        results = index.search("p1", query, k=5)
+
+        expected = sorted(range(200), key=lambda i: _cosine_distance(vectors[i], query))[:5]
+        assert [r.file_path for r in results] == [f"file_{i}.py" for i in expected]
+        assert results[0].distance == pytest.approx(_cosine_distance(vectors[expected[0]], query), abs=1e-5)
+
+    def test_filters_by_project(self):
+        index = LocalVectorIndex()
+        index.upsert("p1", "a.py", "a", [1.0, 0.0])
+        index.upsert("p2", "b.py", "b", [1.0, 0.0])
+
+        assert [r.file_path for r in index.search("p1", [1.0, 0.0], k=10)] == ["a.py"]
+        assert index.search("unknown", [1.0, 0.0]) == []
+
+    def test_upsert_replaces_and_remove_invalidates(self):
+        index = LocalVectorIndex()
+        index.upsert("p1", "a.py", "old", [1.0, 0.0])
+        index.upsert("p1", "b.py", "b", [0.0, 1.0])
+        index.search("p1", [1.0, 0.0])
+
+        index.upsert("p1", "a.py", "new", [0.0, 1.0])
+        index.remove("p1", "b.py")
+
+        results = index.search("p1", [0.0, 1.0], k=5)
+        assert [(r.file_path, r.content) for r in results] == [("a.py", "new")]
+
+    def test_dimension_mismatch_raises(self):
+        index = LocalVectorIndex()
+        index.upsert("p1", "a.py", "a", [1.0, 0.0, 0.0])
+        with pytest.raises(ValueError):
+            index.search("p1", [1.0, 0.0])
+
+
+class TestPostgresMode:
+    @pytest.mark.asyncio
+    async def test_query_uses_pgvector_distance_with_project_filter(self):
+        conn = MagicMock()
+        conn.execute = AsyncMock()
+        conn.fetch = AsyncMock(
+            return_value=[{"file_path": "a.py", "content_chunk": "a", "metadata": '{"lang": "py"}', "distance": 0.1}]
+        )
+        conn.transaction = MagicMock(return_value=AsyncMock())
+        pool = MagicMock()
+        pool.acquire = MagicMock(return_value=AsyncMock(__aenter__=AsyncMock(return_value=conn)))
+
+        service = ContextSearchService(pool=pool)
+        results = await service.search("p1", [0.5, 0.25], k=3)
+
+        sql, project_id, vector, k = conn.fetch.await_args.args
+        assert "<=>" in sql and "WHERE project_id = $1" in sql
+        assert (project_id, vector, k) == ("p1", "[0.5,0.25]", 3)
+        assert results[0].metadata == {"lang": "py"}
+        assert results[0].similarity == pytest.approx(0.9)
+
+
+class TestContextSearchAPI:
+    @pytest.fixture
+    def client(self):
+        service = ContextSearchService(pool=None)
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_context_search_service] = lambda: service
+        return TestClient(app)
+
+    def test_index_then_query(self, client):
+        for path, vector in [("a.py", [1.0, 0.0]), ("b.py", [0.7, 0.7]), ("c.py", [0.0, 1.0])]:
+            response = client.post(
+                "/api/context-search/index",
+                json={"project_id": "p1", "file_path": path, "content": path, "embedding": vector},
+            )
+            assert response.status_code == 201
+
+        response = client.post("/api/context-search/query", json={"project_id": "p1", "embedding": [1.0, 0.1], "k": 2})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["mode"] == "local"
+        assert [r["file_path"] for r in body["results"]] == ["a.py", "b.py"]
+
+    def test_dimension_mismatch_is_bad_request(self, client):
+        client.post(
+            "/api/context-search/index",
+            json={"project_id": "p1", "file_path": "a.py", "embedding": [1.0, 0.0, 0.0]},
+        )
+        response = client.post("/api/context-search/query", json={"project_id": "p1", "embedding": [1.0, 0.0]})
+        assert response.status_code == 400
@@ -0,0 +1,121 @@
+"""
+GI Formula stage DAG, streaming and stage cache tests
+"""
+
+import asyncio
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.app.models.gi_formula import GIFormulaRequest, GIFormulaResult, StageResult, StageType
+from backend.app.routers import gi_formula as gi_formula_router
+from backend.app.services.gi_formula_service import GIFormulaService
+
+
+class FakeSequentialMCP:
+    """Answers by prompt prefix so downstream prompts repeat across problems"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.prompts = []
+        self.active = 0
+        self.max_active = 0
+
+    async def reason(self, prompt):
+        self.prompts.append(prompt)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        return {"content": prompt.split(":")[0]}
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_stages_then_result():
+    service = GIFormulaService()
+    request = GIFormulaRequest(problem="Reduce API latency by half", context={"current": "200ms"})
+
+    items = [item async for item in service.stream_insight(request)]
+
+    assert [item.stage for item in items[:-1]] == [
+        StageType.OBSERVATION,
+        StageType.CONNECTION,
+        StageType.PATTERN,
+        StageType.SYNTHESIS,
+        StageType.BIAS_CHECK,
+    ]
+    assert isinstance(items[-1], GIFormulaResult)
+    assert items[-1].stages["synthesis"] == items[3]
+
+
+@pytest.mark.asyncio
+async def test_independent_stages_run_concurrently():
+    mcp = FakeSequentialMCP(delay=0.05)
+    service = GIFormulaService(sequential_mcp=mcp)
+    # Make pattern detection read the observations directly, independent of connection
+    service._stage_configs[StageType.PATTERN]["inputs"] = {"connections": StageType.OBSERVATION}
+    service._stage_configs[StageType.SYNTHESIS]["prompt_template"] = "Synthesize: {patterns} {connections}"
+    service._stage_configs[StageType.SYNTHESIS]["inputs"] = {
+        "patterns": StageType.PATTERN,
+        "connections": StageType.CONNECTION,
+    }
+
+    request = GIFormulaRequest(problem="Improve code review throughput", context={})
+    stages = [stage async for stage in service._run_stage_dag(request)]
+
+    assert mcp.max_active == 2
+    assert stages[0].stage == StageType.OBSERVATION
+    assert {stage.stage for stage in stages[1:3]} == {StageType.CONNECTION, StageType.PATTERN}
+    assert stages[3].stage == StageType.SYNTHESIS
+
+
+@pytest.mark.asyncio
+async def test_identical_stage_inputs_reuse_cached_output():
+    mcp = FakeSequentialMCP()
+    service = GIFormulaService(sequential_mcp=mcp)
+
+    await service.generate_insight(GIFormulaRequest(problem="Reduce build time", context={}))
+    calls_after_first = len(mcp.prompts)
+    second = await service.generate_insight(GIFormulaRequest(problem="Reduce deploy time", context={}))
+
+    # Only observation (new problem) and the bias check reach the MCP again
+    assert len(mcp.prompts) - calls_after_first == 2
+    assert "cached" not in second.stages["observation"].metadata
+    assert second.stages["connection"].metadata["cached"] is True
+    assert second.stages["synthesis"].metadata["cached"] is True
+
+
+@pytest.mark.asyncio
+async def test_failed_stages_are_not_cached():
+    service = GIFormulaService()
+
+    async def fail(stage_type, kwargs):
+        raise RuntimeError("boom")
+
+    service._execute_fallback = fail
+    first = await service._execute_stage_cached(StageType.OBSERVATION, problem="p", context={})
+
+    assert "error" in first.metadata
+    assert service._stage_cache == {}
+
+
+def test_sse_endpoint_streams_stage_events(monkeypatch):
+    monkeypatch.setattr(gi_formula_router, "gi_formula_service", GIFormulaService())
+    app = FastAPI()
+    app.include_router(gi_formula_router.router)
+    client = TestClient(app)
+
+    response = client.post("/api/v1/gi-formula/stream", json={"problem": "How do we cut p99 latency?"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [block.split("\n") for block in response.text.strip().split("\n\n")]
+    names = [lines[0].removeprefix("event: ") for lines in events]
+    assert names == ["stage"] * 5 + ["result"]
+    result = json.loads(events[-1][1].removeprefix("data: "))
+    assert result["problem"] == "How do we cut p99 latency?"
+    assert StageResult(**json.loads(events[0][1].removeprefix("data: "))).stage == StageType.OBSERVATION
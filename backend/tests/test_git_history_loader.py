@@ -0,0 +1,104 @@
+"""
+Tests for the batched, sha-cached git history loader
+"""
+
+import subprocess
+
+import pytest
+
+from backend.app.services import git_service
+from backend.app.services.git_service import GitService
+
+
+def _git(repo, *args):
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+def _commit(repo, filename, content, message):
+    (repo / filename).write_text(content)
+    _git(repo, "add", filename)
+    _git(repo, "commit", "-q", "-m", message)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    _git(tmp_path, "init", "-q", "-b", "main")
+    _git(tmp_path, "config", "user.email", "dev@example.com")
+    _git(tmp_path, "config", "user.name", "Dev")
+    _commit(tmp_path, "a.txt", "one\n", "feat: first | with pipe")
+    _git(tmp_path, "tag", "v1.0")
+    _git(tmp_path, "checkout", "-q", "-b", "feature")
+    _commit(tmp_path, "b.txt", "two\nlines\n", "feat: on feature")
+    _git(tmp_path, "checkout", "-q", "main")
+    _commit(tmp_path, "c.txt", "three\n", "fix: on main")
+    return tmp_path
+
+
+@pytest.fixture
+def git_calls(monkeypatch):
+    git_service._HISTORY_CACHE.clear()
+    calls = []
+    run = subprocess.run
+
+    def recording_run(args, **kwargs):
+        calls.append(args[1])
+        return run(args, **kwargs)
+
+    monkeypatch.setattr(git_service.subprocess, "run", recording_run)
+    yield calls
+    git_service._HISTORY_CACHE.clear()
+
+
+def test_history_uses_one_log_call_with_decorations(repo, git_calls):
+    history = GitService(str(repo)).get_version_history()
+
+    assert git_calls == ["rev-parse", "rev-list", "log"]
+    assert history.current_branch == "main"
+    assert history.total_commits == 2
+    assert [c.message for c in history.commits] == ["fix: on main", "feat: first | with pipe"]
+    assert history.commits[1].tags == ["v1.0"]
+    assert all(c.branches == ["main"] for c in history.commits)
+    assert (history.commits[0].files_modified, history.commits[0].lines_added) == (["c.txt"], 1)
+
+
+def test_repeated_history_is_served_from_cache_until_new_commit(repo, git_calls):
+    service = GitService(str(repo))
+    first = service.get_version_history(limit=10)
+    git_calls.clear()
+
+    again = GitService(str(repo)).get_version_history(limit=10)
+    assert git_calls == ["rev-parse"]
+    assert again == first
+
+    again.commits.clear()
+    assert len(service.get_version_history(limit=10).commits) == 2
+
+    _commit(repo, "d.txt", "four\n", "feat: newer")
+    git_calls.clear()
+    updated = service.get_version_history(limit=10)
+    assert git_calls == ["rev-parse", "rev-list", "log"]
+    assert updated.total_commits == 3 and updated.commits[0].message == "feat: newer"
+
+
+def test_other_branches_and_filters(repo, git_calls):
+    service = GitService(str(repo))
+
+    feature = service.get_commits(branch="feature")
+    assert [(c.message, c.branches) for c in feature] == [
+        ("feat: on feature", ["feature"]),
+        ("feat: first | with pipe", ["feature"]),
+    ]
+    assert [c.message for c in service.get_commits(search="pipe")] == ["feat: first | with pipe"]
+    assert service.get_commits(branch="missing") == []
+
+    comparison = service.compare_commits("v1.0", "feature")
+    assert [c.message for c in comparison.commits_between] == ["feat: on feature"]
+
+
+def test_parse_decorations():
+    tags, branches = GitService._parse_decorations(
+        "HEAD -> refs/heads/main, tag: refs/tags/v2.0, refs/remotes/origin/main, refs/heads/release"
+    )
+
+    assert tags == ["v2.0"]
+    assert branches == ["main", "release"]
@@ -0,0 +1,50 @@
+"""
+ML Batch Prediction Endpoint Tests
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+BACKEND_DIR = Path(__file__).parent.parent
+REPO_ROOT = BACKEND_DIR.parent
+sys.path.insert(0, str(BACKEND_DIR))
+sys.path.insert(0, str(REPO_ROOT))
+
+from app.routers.uncertainty import get_ml_system, router  # noqa: E402
+from src.ml_training_system import MLTrainingSystem  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def ml_system(tmp_path_factory):
+    system = MLTrainingSystem(model_dir=tmp_path_factory.mktemp("models"))
+    system.train_model("confidence_predictor", system.generate_synthetic_data(size=150))
+    return system
+
+
+@pytest.fixture
+def client(ml_system):
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_ml_system] = lambda: ml_system
+    return TestClient(app)
+
+
+def test_batch_predictions_in_input_order(client, ml_system):
+    inputs = [{"phase": phase, "team_size": size} for phase, size in [("ideation", 2), ("testing", 8), ("mvp", 4)]]
+
+    response = client.post("/api/uncertainty/ml/predict/batch", json={"inputs": inputs})
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["count"] == 3
+    assert body["probabilities"] is None
+    assert body["predictions"] == pytest.approx([ml_system.predict("confidence_predictor", i)[0] for i in inputs])
+
+
+def test_unknown_model_is_bad_request(client):
+    response = client.post("/api/uncertainty/ml/predict/batch", json={"model_name": "nope", "inputs": [{}]})
+    assert response.status_code == 400
@@ -0,0 +1,118 @@
+"""
+Predictor Training Tests
+
+Background retraining of the Uncertainty Map ML predictor: fitting in a
+worker process, holdout validation and hot-swapping into the live instance.
+"""
+
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+BACKEND_DIR = Path(__file__).parent.parent
+REPO_ROOT = BACKEND_DIR.parent
+sys.path.insert(0, str(BACKEND_DIR))
+sys.path.insert(0, str(REPO_ROOT))
+
+import src.uncertainty_map_v3 as umap_module  # noqa: E402
+from app.background_tasks import PredictorTrainingTask  # noqa: E402
+from src.uncertainty_map_v3 import UncertaintyMapV3, UncertaintyVector, fit_uncertainty_predictor  # noqa: E402
+
+pytestmark = pytest.mark.skipif(not umap_module.ML_AVAILABLE, reason="scikit-learn not installed")
+
+
+def _observations(count, phase="mvp"):
+    rng = np.random.default_rng(11)
+    start = datetime(2025, 1, 1)
+    observations = []
+    for i in range(count):
+        values = rng.random(5)
+        observations.append(
+            {
+                "timestamp": (start + timedelta(hours=i)).isoformat(),
+                "phase": phase,
+                "vector": dict(zip(["technical", "market", "resource", "timeline", "quality"], values.tolist())),
+                "outcome": bool(i % 2),
+            }
+        )
+    return observations
+
+
+@pytest.fixture
+def uncertainty_map(monkeypatch, tmp_path):
+    monkeypatch.setattr(umap_module, "DEFAULT_STORAGE_DIR", tmp_path)
+    umap = UncertaintyMapV3("training-test")
+    umap.patterns = {"observations_mvp": _observations(80)}
+    return umap
+
+
+def test_training_data_pairs_consecutive_observations(uncertainty_map):
+    features, labels = uncertainty_map.training_data()
+
+    observations = uncertainty_map.patterns["observations_mvp"]
+    assert features.shape == (79, 6)
+    assert features[0, 5] == pytest.approx(1.0)
+    assert labels[0] == pytest.approx(UncertaintyVector(**observations[1]["vector"]).magnitude())
+
+
+def test_fit_reports_holdout_metrics(uncertainty_map):
+    features, labels = uncertainty_map.training_data()
+
+    fitted = fit_uncertainty_predictor(features, labels, holdout_fraction=0.25, n_estimators=10, random_state=0)
+
+    assert fitted["holdout_samples"] == 19
+    assert fitted["train_samples"] == 60
+    assert fitted["feature_count"] == 6
+    assert fitted["holdout_mae"] >= 0
+    with pytest.raises(ValueError):
+        fit_uncertainty_predictor(features[:3], labels[:3])
+
+
+@pytest.mark.asyncio
+async def test_train_once_fits_in_worker_process_and_installs(uncertainty_map):
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        task = PredictorTrainingTask(uncertainty_map, min_samples=20, min_holdout_r2=-100.0, executor=executor)
+        result = await task.train_once()
+
+    assert result["status"] == "installed"
+    assert uncertainty_map.is_trained
+    assert uncertainty_map.training_metrics["holdout_samples"] == result["holdout_samples"]
+
+    prediction = uncertainty_map.predict_evolution(UncertaintyVector(0.5, 0.5, 0.5, 0.5, 0.5), hours=1)
+    assert prediction.predicted_resolution is not None
+    assert task.get_status()["last_result"]["status"] == "installed"
+
+
+@pytest.mark.asyncio
+async def test_model_failing_validation_is_not_installed(uncertainty_map):
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        task = PredictorTrainingTask(uncertainty_map, min_samples=20, min_holdout_r2=2.0, executor=executor)
+        result = await task.train_once()
+
+    assert result["status"] == "rejected"
+    assert not uncertainty_map.is_trained
+    assert uncertainty_map._fitted_model is None
+
+
+@pytest.mark.asyncio
+async def test_too_few_samples_skips_training(uncertainty_map):
+    task = PredictorTrainingTask(uncertainty_map, min_samples=500)
+    result = await task.train_once()
+    assert result == {"status": "skipped", "samples": 79, "min_samples": 500}
+
+
+def test_synchronous_training_swaps_instead_of_refitting_live_model(uncertainty_map):
+    features, labels = uncertainty_map.training_data()
+    uncertainty_map.predictor.set_params(n_estimators=5)
+    uncertainty_map.train_predictor(features, labels)
+    first = uncertainty_map._fitted_model
+
+    uncertainty_map.train_predictor(features, labels)
+
+    assert uncertainty_map._fitted_model is not first
+    assert first[1].n_estimators == 5
+    assert hasattr(first[1], "estimators_"), "previous model must stay fitted for in-flight predictions"
@@ -0,0 +1,130 @@
+"""
+Redis Lock Tests
+
+Validates the atomic lock scripts wiring in RedisClient and the
+background lease renewer for long-held locks.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from backend.app.services.redis_client import LockLeaseRenewer, RedisClient
+
+
+@pytest.fixture
+def client():
+    """RedisClient with mocked connection and lock scripts"""
+    redis_client = RedisClient()
+    redis_client.ensure_connected = AsyncMock(return_value=True)
+    redis_client._acquire_script = AsyncMock(return_value=1)
+    redis_client._release_script = AsyncMock(return_value=1)
+    redis_client._extend_script = AsyncMock(return_value=1)
+    return redis_client
+
+
+class TestLockScripts:
+    """Acquire/release/extend go through single atomic script calls"""
+
+    @pytest.mark.asyncio
+    async def test_acquire_passes_owner_and_ttl_ms(self, client):
+        assert await client.acquire_lock("udo:lock:file:a", "session-1", ttl=30) is True
+        client._acquire_script.assert_awaited_once_with(keys=["udo:lock:file:a"], args=["session-1", 30000])
+
+    @pytest.mark.asyncio
+    async def test_acquire_contended_returns_false(self, client):
+        client._acquire_script.return_value = 0
+        assert await client.acquire_lock("udo:lock:file:a", "session-2") is False
+
+    @pytest.mark.asyncio
+    async def test_blocking_acquire_retries_until_free(self, client):
+        client._acquire_script.side_effect = [0, 0, 1]
+        assert await client.acquire_lock("udo:lock:file:a", "session-2", blocking=True, blocking_timeout=2) is True
+        assert client._acquire_script.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_blocking_acquire_times_out(self, client):
+        client._acquire_script.return_value = 0
+        assert await client.acquire_lock("udo:lock:file:a", "session-2", blocking=True, blocking_timeout=0.05) is False
+
+    @pytest.mark.asyncio
+    async def test_release_and_extend_compare_owner(self, client):
+        client._release_script.return_value = 0
+        assert await client.release_lock("udo:lock:file:a", "intruder") is False
+        client._release_script.assert_awaited_once_with(keys=["udo:lock:file:a"], args=["intruder"])
+
+        assert await client.extend_lock("udo:lock:file:a", "session-1", ttl=10) is True
+        client._extend_script.assert_awaited_once_with(keys=["udo:lock:file:a"], args=["session-1", 10000])
+
+    @pytest.mark.asyncio
+    async def test_script_error_returns_false(self, client):
+        client._acquire_script.side_effect = ConnectionError("boom")
+        assert await client.acquire_lock("udo:lock:file:a", "session-1") is False
+
+
+class TestLockLeaseRenewer:
+    """Background renewal of long-held locks"""
+
+    @pytest.mark.asyncio
+    async def test_tracked_lock_is_renewed(self, client):
+        renewer = LockLeaseRenewer(client, min_interval=0.01)
+        renewer.track("udo:lock:file:a", "session-1", ttl=0.03)
+
+        await asyncio.sleep(0.1)
+
+        assert client._extend_script.await_count >= 2
+        assert renewer.is_held("udo:lock:file:a")
+        await renewer.stop()
+
+    @pytest.mark.asyncio
+    async def test_failed_renewal_drops_lease(self, client):
+        client._extend_script.return_value = 0
+        renewer = LockLeaseRenewer(client, min_interval=0.01)
+        renewer.track("udo:lock:file:a", "session-1", ttl=0.03)
+
+        await asyncio.sleep(0.05)
+
+        assert not renewer.is_held("udo:lock:file:a")
+        await renewer.stop()
+
+    @pytest.mark.asyncio
+    async def test_release_stops_renewal(self, client):
+        client.lease_renewer.min_interval = 0.01
+        client.lease_renewer.track("udo:lock:file:a", "session-1", ttl=0.03)
+
+        assert await client.release_lock("udo:lock:file:a", "session-1") is True
+        await asyncio.sleep(0.05)
+
+        assert not client.lease_renewer.is_held("udo:lock:file:a")
+        client._extend_script.assert_not_awaited()
+        await client.lease_renewer.stop()
+
+
+class TestSessionManagerWait:
+    """Waiting for a held lock retries the atomic acquire directly"""
+
+    @pytest.mark.asyncio
+    async def test_wait_retries_until_holder_releases(self, monkeypatch):
+        from backend.app.services import session_manager as session_manager_module
+        from backend.app.services.session_manager import SessionManager
+
+        manager = SessionManager()
+        manager._broadcast_event = AsyncMock()
+        manager._record_conflict = AsyncMock()
+        assert await manager.acquire_lock("session-1", "a.py")
+
+        polls = []
+
+        async def fake_sleep(seconds):
+            polls.append(seconds)
+            if len(polls) == 2:
+                manager.locks.pop("lock:file:a.py")
+
+        monkeypatch.setattr(session_manager_module.asyncio, "sleep", fake_sleep)
+        manager._get_existing_lock = AsyncMock(side_effect=AssertionError("holder read while polling"))
+
+        lock = await manager.acquire_lock("session-2", "a.py", timeout=5, wait=True)
+
+        assert lock.session_id == "session-2" and len(polls) == 2
+        assert manager.locks["lock:file:a.py"] is lock
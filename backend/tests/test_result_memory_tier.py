@@ -0,0 +1,78 @@
+"""
+Memory tier tests for C-K Theory designs and GI Formula insights
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from backend.app.models.ck_theory import CKTheoryRequest
+from backend.app.models.gi_formula import GIFormulaRequest
+from backend.app.services.ck_theory_service import CKTheoryService
+from backend.app.services.gi_formula_service import GIFormulaService
+
+
+def _external_cache():
+    cache_service = AsyncMock()
+    cache_service.get.return_value = None
+    return cache_service
+
+
+@pytest.mark.asyncio
+async def test_design_tier_evicts_least_recently_used():
+    generator = CKTheoryService()
+    designs = [
+        await generator.generate_design(CKTheoryRequest(challenge=f"Design a caching layer variant {i}")) for i in range(3)
+    ]
+
+    service = CKTheoryService(config={"max_memory_cache": 2})
+    for design in designs:
+        await service._cache_design(design.id, design)
+
+    assert await service._get_cached_design(designs[0].id) is None
+    assert {d.id for d in service._memory_cache.values()} == {designs[1].id, designs[2].id}
+    assert service.get_cache_statistics()["memory"]["evictions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_design_external_miss_is_negatively_cached():
+    cache_service = _external_cache()
+    service = CKTheoryService(cache_service=cache_service)
+
+    assert await service._get_cached_design("ck-2025-01-01-abcdef") is None
+    assert await service._get_cached_design("ck-2025-01-01-abcdef") is None
+
+    cache_service.get.assert_awaited_once_with("ck:ck-2025-01-01-abcdef")
+    stats = service.get_cache_statistics()
+    assert stats["external"]["misses"] == 1
+    assert stats["memory"]["negative_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_insight_clears_negative_marker():
+    cache_service = _external_cache()
+    service = GIFormulaService(cache_service=cache_service)
+    request = GIFormulaRequest(problem="Reduce API latency by half")
+    insight_id = service._generate_insight_id(request.problem)
+
+    result = await service.generate_insight(request)
+    assert service._memory_cache.is_missing(insight_id)
+    await service._cache_insight(insight_id, result)
+
+    assert not service._memory_cache.is_missing(insight_id)
+    assert await service.get_insight(insight_id) is result
+    assert service.get_cache_statistics()["memory"]["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_deleted_insight_is_not_refetched():
+    cache_service = _external_cache()
+    service = GIFormulaService(cache_service=cache_service)
+    result = await service.generate_insight(GIFormulaRequest(problem="Improve test coverage"))
+    await service._cache_insight(result.id, result)
+
+    assert await service.delete_insight(result.id) is True
+    cache_service.get.reset_mock()
+
+    assert await service.get_insight(result.id) is None
+    cache_service.get.assert_not_awaited()
@@ -0,0 +1,111 @@
+"""
+Session Batching Tests
+
+Validates batched heartbeats, MGET session listing and the sorted-set
+heartbeat index used for expiry sweeps.
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.app.services.redis_client import RedisClient, RedisKeys
+
+
+class FakePipeline:
+    """Records queued commands and returns canned results on execute()"""
+
+    def __init__(self, results=None):
+        self.commands = []
+        self.results = results or []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((name, args))
+
+        return queue
+
+    async def execute(self):
+        return self.results
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+@pytest.fixture
+def client():
+    """RedisClient with a mocked underlying connection"""
+    redis_client = RedisClient()
+    redis_client.ensure_connected = AsyncMock(return_value=True)
+    redis_client._client = MagicMock()
+    return redis_client
+
+
+class TestHeartbeats:
+    @pytest.mark.asyncio
+    async def test_batch_heartbeat_is_single_zadd(self, client):
+        client._client.zadd = AsyncMock(return_value=3)
+
+        assert await client.update_session_heartbeats(["s1", "s2", "s3"]) is True
+
+        client._client.zadd.assert_awaited_once()
+        key, mapping = client._client.zadd.await_args.args
+        assert key == RedisKeys.SESSION_HEARTBEATS
+        assert set(mapping) == {"s1", "s2", "s3"}
+        assert len(set(mapping.values())) == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_skips_redis(self, client):
+        client._client.zadd = AsyncMock()
+        assert await client.update_session_heartbeats([]) is True
+        client._client.zadd.assert_not_awaited()
+
+
+class TestSessionListing:
+    @pytest.mark.asyncio
+    async def test_get_sessions_data_uses_one_mget(self, client):
+        client._client.mget = AsyncMock(return_value=[json.dumps({"id": "s1"}), None, "not-json"])
+
+        data = await client.get_sessions_data(["s1", "s2", "s3"])
+
+        client._client.mget.assert_awaited_once_with([RedisKeys.SESSION_DATA.format(s) for s in ("s1", "s2", "s3")])
+        assert data == {"s1": {"id": "s1"}}
+
+    @pytest.mark.asyncio
+    async def test_active_sessions_is_single_range_query(self, client):
+        client._client.zrangebyscore = AsyncMock(return_value=["s1", "s2"])
+        client._client.pipeline = MagicMock()
+
+        assert await client.get_active_sessions() == ["s1", "s2"]
+
+        client._client.zrangebyscore.assert_awaited_once()
+        key, cutoff, upper = client._client.zrangebyscore.await_args.args
+        assert key == RedisKeys.SESSION_HEARTBEATS
+        assert cutoff > 0
+        assert upper == "+inf"
+        client._client.pipeline.assert_not_called()
+
+
+class TestExpirySweep:
+    @pytest.mark.asyncio
+    async def test_stale_sessions_removed_in_one_pipeline(self, client):
+        pipe = FakePipeline()
+        client._client.zrangebyscore = AsyncMock(return_value=["old1", "old2"])
+        client._client.pipeline = MagicMock(return_value=pipe)
+
+        assert await client.expire_stale_sessions() == ["old1", "old2"]
+
+        assert ("zrem", (RedisKeys.SESSION_HEARTBEATS, "old1", "old2")) in pipe.commands
+        assert ("srem", (RedisKeys.ACTIVE_SESSIONS, "old1", "old2")) in pipe.commands
+
+    @pytest.mark.asyncio
+    async def test_no_stale_sessions_skips_pipeline(self, client):
+        client._client.zrangebyscore = AsyncMock(return_value=[])
+        client._client.pipeline = MagicMock()
+
+        assert await client.expire_stale_sessions() == []
+        client._client.pipeline.assert_not_called()
@@ -0,0 +1,216 @@
+"""
+Tests for the incrementally updated time tracking metrics store
+"""
+
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from backend.app.models.time_tracking import AIModel, Phase, TaskType
+from backend.app.services.time_metrics_store import TimeMetricsStore
+from backend.app.services.time_tracking_service import TimeTrackingService
+
+CONFIG_PATH = Path(__file__).parent.parent / "config" / "baseline_times.yaml"
+DAY = date(2026, 10, 12)
+
+
+def _service(conn):
+    conn.transaction = MagicMock(return_value=AsyncMock())
+    pool = MagicMock()
+    pool.acquire = MagicMock(return_value=AsyncMock(__aenter__=AsyncMock(return_value=conn)))
+    return TimeTrackingService(pool=pool, config_path=CONFIG_PATH)
+
+
+def _row(day, task_type="implementation", phase="implementation", ai_used="claude", **counters):
+    return {"day": day, "task_type": task_type, "phase": phase, "ai_used": ai_used, **counters}
+
+
+class TestTimeMetricsStore:
+    def test_completions_update_sums_counts_and_overruns(self):
+        store = TimeMetricsStore()
+        store.record_completion(DAY, "testing", "testing", "claude", 600, 3600, True)
+        store.record_completion(DAY, "testing", "testing", "claude", 5000, 3600, False)
+        store.record_completion(DAY, "debugging", "testing", "none", 100, 2700, True)
+
+        [testing, _debugging] = sorted(store.aggregates(DAY, DAY), key=lambda row: row["task_type"], reverse=True)
+
+        assert testing["tasks"] == 2 and testing["successful_tasks"] == 1
+        assert testing["time_saved_seconds"] == 3600 * 2 - 5600
+        assert testing["overrun_tasks"] == 1
+        assert store.overrun_ratios(DAY, DAY)["testing"] == {"tasks": 3, "overrun_tasks": 1, "overrun_ratio": 1 / 3}
+        assert store.overrun_ratios(DAY, DAY, by="task_type")["debugging"]["overrun_ratio"] == 0.0
+
+    def test_pauses_are_counted_with_the_completion(self):
+        store = TimeMetricsStore()
+        store.record_completion(DAY, "testing", "testing", "claude", 600, 3600, True, pause_seconds=120)
+        store.record_completion(DAY, "testing", "testing", "claude", 600, 3600, True)
+
+        [row] = store.aggregates(DAY, DAY)
+        assert (row["tasks"], row["paused_tasks"], row["pause_seconds"]) == (2, 1, 120)
+
+    def test_load_replaces_days_from_start_and_prune_applies_retention(self):
+        store = TimeMetricsStore(retention_days=7)
+        store.record_completion(DAY - timedelta(days=1), "testing", "testing", "claude", 600, 3600, True)
+        store.record_completion(DAY, "testing", "testing", "claude", 600, 3600, True)
+
+        store.load([_row(DAY, tasks=4, duration_seconds=100)], DAY)
+
+        assert store.covers(DAY) and not store.covers(DAY - timedelta(days=1))
+        assert sorted(row["tasks"] for row in store.aggregates(DAY - timedelta(days=1), DAY)) == [1, 4]
+
+        store.prune(DAY + timedelta(days=7))
+        assert store.aggregates(DAY - timedelta(days=1), DAY) == store.aggregates(DAY, DAY)
+        store.prune(DAY + timedelta(days=8))
+        assert store.aggregates(date.min, date.max) == []
+
+    def test_covers_respects_max_age(self):
+        store = TimeMetricsStore()
+        store.load([], DAY)
+        assert store.covers(DAY, max_age_seconds=60)
+
+        store.loaded_at -= timedelta(seconds=61)
+        assert not store.covers(DAY, max_age_seconds=60)
+
+
+class TestServiceIntegration:
+    @pytest.mark.asyncio
+    async def test_session_lifecycle_updates_store(self):
+        service = TimeTrackingService(pool=None, config_path=CONFIG_PATH)
+        session_id = await service.start_task("t1", TaskType.TESTING, Phase.TESTING, AIModel.CODEX)
+
+        assert await service.pause_task(session_id)
+        service.paused_sessions[str(session_id)] -= timedelta(seconds=30)
+        assert await service.resume_task(session_id)
+        await service.end_task(session_id, success=False)
+
+        today = datetime.now(UTC).date()
+        [row] = service.metrics_store.aggregates(today, today)
+        assert (row["task_type"], row["phase"], row["ai_used"]) == ("testing", "testing", "codex")
+        assert (row["tasks"], row["successful_tasks"], row["paused_tasks"]) == (1, 0, 1)
+        assert row["pause_seconds"] >= 30
+
+    @pytest.mark.asyncio
+    async def test_sessions_in_progress_are_not_counted(self):
+        service = TimeTrackingService(pool=None, config_path=CONFIG_PATH)
+        session_id = await service.start_task("t1", TaskType.TESTING, Phase.TESTING, AIModel.CODEX)
+
+        assert await service.pause_task(session_id)
+        service.paused_sessions[str(session_id)] -= timedelta(seconds=30)
+        assert await service.resume_task(session_id)
+
+        today = datetime.now(UTC).date()
+        assert service.metrics_store.aggregates(today, today) == []
+
+    @pytest.mark.asyncio
+    async def test_session_ended_twice_is_recorded_once(self):
+        conn = MagicMock()
+        session_id = uuid4()
+        row = {
+            "task_id": "t1",
+            "task_type": "testing",
+            "phase": "testing",
+            "ai_used": "claude",
+            "start_time": datetime.now(UTC),
+            "baseline_seconds": 3600,
+        }
+        conn.fetchrow = AsyncMock(side_effect=[{**row, "was_open": True}, {**row, "was_open": False}])
+        conn.execute = AsyncMock()
+        service = _service(conn)
+        service._load_session_from_db = AsyncMock(
+            return_value={"task_id": "t1", "start_time": datetime.now(UTC) - timedelta(minutes=5), "total_pause_duration": 0}
+        )
+        service.active_sessions[str(session_id)] = {
+            "task_id": "t1",
+            "start_time": datetime.now(UTC) - timedelta(minutes=10),
+            "total_pause_duration": 0,
+        }
+
+        await service.end_task(session_id)
+        await service.end_task(session_id)
+
+        today = datetime.now(UTC).date()
+        [aggregate] = service.metrics_store.aggregates(today, today)
+        assert aggregate["tasks"] == 1
+        assert "was_open" in conn.fetchrow.await_args.args[0] and "FOR UPDATE" in conn.fetchrow.await_args.args[0]
+        # The rollup is recomputed from task_sessions both times
+        assert sum("INSERT INTO task_daily_rollups" in call.args[0] for call in conn.execute.await_args_list) == 2
+
+    @pytest.mark.asyncio
+    async def test_dashboards_load_store_once_and_reuse_weekly_report(self):
+        today = date.today()
+        conn = MagicMock()
+        conn.fetch = AsyncMock(
+            return_value=[
+                _row(
+                    today,
+                    "debugging",
+                    tasks=4,
+                    successful_tasks=2,
+                    duration_seconds=21600,
+                    baseline_seconds=10800,
+                    time_saved_seconds=-10800,
+                    overrun_tasks=3,
+                )
+            ]
+        )
+        service = _service(conn)
+
+        bottlenecks = await service.get_bottlenecks()
+        first = await service.generate_weekly_report()
+        second = await service.generate_weekly_report()
+        overruns = await service.get_overrun_ratios(by="task_type")
+
+        conn.fetch.assert_awaited_once()
+        sql, start, end, ratio = conn.fetch.await_args.args
+        assert "overrun_tasks" in sql and ratio == 1.2
+        assert (start, end) == (today - timedelta(days=35), today + timedelta(days=1))
+        assert [b.frequency for b in bottlenecks] == [4]
+        assert second is first and first.roi_report.tasks_completed == 4
+        assert overruns == {"debugging": {"tasks": 4, "overrun_tasks": 3, "overrun_ratio": 0.75}}
+
+    @pytest.mark.asyncio
+    async def test_completion_invalidates_cached_weekly_report(self):
+        conn = MagicMock()
+        conn.fetch = AsyncMock(return_value=[])
+        session_id = uuid4()
+        conn.fetchrow = AsyncMock(
+            return_value={
+                "task_id": "t1",
+                "task_type": "testing",
+                "phase": "testing",
+                "ai_used": "claude",
+                "start_time": datetime.now(UTC),
+                "baseline_seconds": 3600,
+                "was_open": True,
+            }
+        )
+        conn.execute = AsyncMock()
+        service = _service(conn)
+        service.active_sessions[str(session_id)] = {
+            "task_id": "t1",
+            "start_time": datetime.now(UTC) - timedelta(minutes=10),
+            "total_pause_duration": 0,
+        }
+
+        empty = await service.generate_weekly_report()
+        await service.end_task(session_id)
+        report = await service.generate_weekly_report()
+
+        assert empty.roi_report.tasks_completed == 0
+        assert report.roi_report.tasks_completed == 1
+        conn.fetch.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_ranges_outside_retention_are_read_from_database(self):
+        conn = MagicMock()
+        conn.fetch = AsyncMock(return_value=[_row(date(2025, 1, 6), tasks=2, overrun_tasks=1)])
+        service = _service(conn)
+
+        overruns = await service.get_overrun_ratios(date(2025, 1, 1), date(2025, 1, 31))
+
+        assert overruns["implementation"]["overrun_ratio"] == 0.5
+        assert conn.fetch.await_args.args[1:3] == (date(2025, 1, 1), date(2025, 2, 1))
+        assert service.metrics_store.covered_from is None
@@ -0,0 +1,237 @@
+"""
+Tests for SQL-side ROI aggregation and the daily rollup table
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from backend.app.models.time_tracking import AIModel, Phase, TaskType
+from backend.app.services.time_tracking_service import TimeTrackingService
+
+CONFIG_PATH = Path(__file__).parent.parent / "config" / "baseline_times.yaml"
+
+
+def _service(conn):
+    conn.transaction = MagicMock(return_value=AsyncMock())
+    pool = MagicMock()
+    pool.acquire = MagicMock(return_value=AsyncMock(__aenter__=AsyncMock(return_value=conn)))
+    return TimeTrackingService(pool=pool, config_path=CONFIG_PATH)
+
+
+def _group(task_type, phase, ai_used, tasks, successful, duration, baseline):
+    return {
+        "task_type": task_type,
+        "phase": phase,
+        "ai_used": ai_used,
+        "tasks": tasks,
+        "successful_tasks": successful,
+        "duration_seconds": duration,
+        "baseline_seconds": baseline,
+        "time_saved_seconds": baseline - duration,
+    }
+
+
+GROUPS = [
+    _group("implementation", "implementation", "claude", 10, 9, 36000, 144000),
+    _group("implementation", "testing", "codex", 5, 5, 18000, 72000),
+    _group("debugging", "implementation", "none", 4, 2, 21600, 10800),
+]
+
+
+class TestRollupAggregation:
+    @pytest.mark.asyncio
+    async def test_roi_report_is_built_from_one_grouped_rollup_query(self):
+        conn = MagicMock()
+        conn.fetch = AsyncMock(return_value=GROUPS)
+        service = _service(conn)
+
+        report = await service.calculate_roi("annual", date(2026, 1, 1), date(2026, 12, 31))
+
+        conn.fetch.assert_awaited_once()
+        sql, start, end = conn.fetch.await_args.args
+        assert "FROM task_daily_rollups" in sql and "GROUP BY task_type, phase, ai_used" in sql
+        assert (start, end) == (date(2026, 1, 1), date(2026, 12, 31))
+        assert report.tasks_completed == 19
+        assert report.success_rate == pytest.approx(16 / 19 * 100)
+        assert report.time_saved_hours == pytest.approx((108000 + 54000 - 10800) / 3600)
+        assert report.ai_breakdown["claude"]["tasks"] == 10
+        assert report.phase_breakdown["implementation"]["tasks"] == 14
+        assert report.top_time_savers[0] == {
+            "task_type": "implementation",
+            "tasks": 15,
+            "time_saved_seconds": 162000,
+            "time_saved_hours": 45.0,
+        }
+        assert [(b.task_type, b.frequency, b.avg_duration_seconds) for b in report.bottlenecks] == [
+            (TaskType.DEBUGGING, 4, 5400)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_sargable_session_aggregation_without_rollups(self):
+        conn = MagicMock()
+        conn.fetch = AsyncMock(side_effect=[RuntimeError('relation "task_daily_rollups" does not exist'), GROUPS])
+        service = _service(conn)
+
+        groups = await service._get_period_aggregates(date(2026, 3, 1), date(2026, 3, 31))
+
+        sql, start, end = conn.fetch.await_args.args
+        assert "FROM task_sessions" in sql and "DATE(start_time)" not in sql
+        assert "start_time >= $1::date" in sql and "start_time < $2::date" in sql
+        assert (start, end) == (date(2026, 3, 1), date(2026, 4, 1))
+        assert groups == GROUPS
+
+
+class TestRollupMaintenance:
+    @pytest.mark.asyncio
+    async def test_end_task_updates_session_and_refreshes_its_rollup_group(self):
+        session_id = uuid4()
+        start_time = datetime(2026, 10, 18, 9, 30)
+        conn = MagicMock()
+        conn.fetchrow = AsyncMock(
+            return_value={
+                "task_id": "t1",
+                "task_type": "testing",
+                "phase": "testing",
+                "ai_used": "claude",
+                "start_time": start_time,
+                "baseline_seconds": 3600,
+                "was_open": True,
+            }
+        )
+        conn.execute = AsyncMock()
+        service = _service(conn)
+        service.active_sessions[str(session_id)] = {
+            "task_id": "t1",
+            "start_time": datetime.now(UTC) - timedelta(minutes=10),
+            "total_pause_duration": 0,
+        }
+
+        metrics = await service.end_task(session_id)
+
+        update_sql = conn.fetchrow.await_args.args[0]
+        assert "time_saved_seconds = baseline_seconds - $2" in update_sql
+        lock_call, refresh_call = conn.execute.await_args_list
+        assert "pg_advisory_xact_lock" in lock_call.args[0]
+        refresh_sql, *params = refresh_call.args
+        assert "INSERT INTO task_daily_rollups" in refresh_sql and "ON CONFLICT" in refresh_sql
+        assert params == [date(2026, 10, 18), "testing", "testing", "claude"]
+        assert list(lock_call.args[1:]) == params
+        assert metrics.time_saved_seconds == 3600 - metrics.duration_seconds
+
+    @pytest.mark.asyncio
+    async def test_rollup_refresh_failure_is_logged_not_raised(self):
+        conn = MagicMock()
+        conn.execute = AsyncMock(side_effect=RuntimeError("no rollup table"))
+        service = _service(conn)
+
+        await service._refresh_daily_rollup(conn, date(2026, 10, 18), "testing", "testing", "claude")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_refreshes_of_a_group_are_serialized(self):
+        locks = {}
+        events = []
+
+        class LockingConn:
+            """Advisory locks are held until the outermost transaction ends"""
+
+            def __init__(self, name):
+                self.name = name
+                self.depth = 0
+                self.held = []
+
+            @asynccontextmanager
+            async def _transaction(self):
+                self.depth += 1
+                try:
+                    yield
+                finally:
+                    self.depth -= 1
+                    if self.depth == 0:
+                        for lock in self.held:
+                            lock.release()
+                        self.held.clear()
+
+            def transaction(self):
+                return self._transaction()
+
+            async def execute(self, sql, *params):
+                if "pg_advisory_xact_lock" in sql:
+                    lock = locks.setdefault(params, asyncio.Lock())
+                    await lock.acquire()
+                    self.held.append(lock)
+                    return
+                events.append(f"{self.name} aggregate")
+                await asyncio.sleep(0.01)
+                events.append(f"{self.name} written")
+
+        service = _service(MagicMock())
+        group = (date(2026, 10, 18), "testing", "testing", "claude")
+
+        async def end_task(conn):
+            async with conn.transaction():
+                await service._refresh_daily_rollup(conn, *group)
+                await asyncio.sleep(0.01)  # commit happens after the refresh
+
+        await asyncio.gather(end_task(LockingConn("a")), end_task(LockingConn("b")))
+
+        assert events == ["a aggregate", "a written", "b aggregate", "b written"]
+
+    @pytest.mark.asyncio
+    async def test_rebuild_replaces_range_and_reports_rows(self):
+        conn = MagicMock()
+        conn.execute = AsyncMock(side_effect=["DELETE 3", "INSERT 0 7"])
+        service = _service(conn)
+
+        rows = await service.rebuild_daily_rollups(date(2026, 1, 1), date(2026, 1, 31))
+
+        assert rows == 7
+        delete_call, insert_call = conn.execute.await_args_list
+        assert delete_call.args[1:] == (date(2026, 1, 1), date(2026, 1, 31))
+        assert insert_call.args[1:] == (date(2026, 1, 1), date(2026, 2, 1))
+
+    @pytest.mark.asyncio
+    async def test_mock_mode_keeps_working(self):
+        service = TimeTrackingService(pool=None, config_path=CONFIG_PATH)
+        session_id = await service.start_task("t2", TaskType.TESTING, Phase.TESTING, AIModel.CLAUDE)
+
+        metrics = await service.end_task(session_id)
+
+        assert metrics.baseline_seconds == 1800
+        assert await service._get_period_aggregates(date.today(), date.today()) == []
+
+
+class TestTrendsEndpoint:
+    def test_trends_are_built_from_per_day_aggregates(self):
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from backend.app.core.dependencies import get_time_tracking_service
+        from backend.app.routers.time_tracking import router
+
+        today = date.today()
+        conn = MagicMock()
+        conn.fetch = AsyncMock(
+            return_value=[
+                {**GROUPS[0], "day": today - timedelta(days=1)},
+                {**GROUPS[2], "day": today - timedelta(days=1)},
+                {**GROUPS[1], "day": today},
+            ]
+        )
+        service = _service(conn)
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_time_tracking_service] = lambda: service
+
+        response = TestClient(app).get("/api/time-tracking/trends", params={"days": 7})
+
+        assert response.status_code == 200, response.text
+        assert "GROUP BY day, task_type, phase, ai_used" in conn.fetch.await_args.args[0]
+        body = response.json()
+        assert [point["tasks_completed"] for point in body["data_points"]] == [14, 5]
+        assert body["total_tasks"] == 19
@@ -0,0 +1,168 @@
+"""
+Uncertainty Batch Analysis Tests
+
+Batch results must match the scalar analyze_context / predict_evolution /
+generate_mitigations path row for row.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+BACKEND_DIR = Path(__file__).parent.parent
+REPO_ROOT = BACKEND_DIR.parent
+sys.path.insert(0, str(BACKEND_DIR))
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.uncertainty_map_v3 import ML_AVAILABLE, UncertaintyMapV3  # noqa: E402
+
+PHASES = ["ideation", "design", "mvp", "implementation", "testing", "unknown"]
+
+
+def _contexts():
+    contexts = []
+    for i, phase in enumerate(PHASES * 4):
+        contexts.append(
+            {
+                "phase": phase,
+                "files": ["main.py"] if i % 2 else [],
+                "market_validation": (i % 5) / 4,
+                "team_size": 1 + i % 6,
+                "timeline_weeks": [2, 4, 6, 8, 12, 20][i % 6],
+            }
+        )
+    return contexts
+
+
+@pytest.fixture
+def uncertainty_map():
+    return UncertaintyMapV3(project_name="batch-test")
+
+
+def _assert_vectors_match(batch_vector, scalar_vector):
+    assert np.allclose(
+        [
+            batch_vector.technical,
+            batch_vector.market,
+            batch_vector.resource,
+            batch_vector.timeline,
+            batch_vector.quality,
+        ],
+        [
+            scalar_vector.technical,
+            scalar_vector.market,
+            scalar_vector.resource,
+            scalar_vector.timeline,
+            scalar_vector.quality,
+        ],
+    )
+
+
+def test_analyze_contexts_matches_scalar(uncertainty_map):
+    contexts = _contexts()
+
+    batch = uncertainty_map.analyze_contexts(contexts)
+
+    assert len(batch) == len(contexts)
+    for (vector, state), context in zip(batch, contexts):
+        scalar_vector, scalar_state = uncertainty_map.analyze_context(context)
+        _assert_vectors_match(vector, scalar_vector)
+        assert state == scalar_state
+        assert vector.dominant_dimension() == scalar_vector.dominant_dimension()
+
+
+def test_classify_states_matches_scalar_at_boundaries(uncertainty_map):
+    magnitudes = np.array([0.0, 0.0999, 0.1, 0.2999, 0.3, 0.6, 0.7999, 0.8, 1.0])
+    assert uncertainty_map.classify_states(magnitudes) == [uncertainty_map.classify_state(m) for m in magnitudes]
+
+
+def test_analyze_contexts_validates_rows(uncertainty_map):
+    with pytest.raises(ValueError):
+        uncertainty_map.analyze_contexts([{"phase": "mvp"}, {"phase": "mvp", "team_size": 0}])
+    with pytest.raises(ValueError):
+        uncertainty_map.analyze_contexts([{"team_size": 2}])
+    assert uncertainty_map.analyze_contexts([]) == []
+
+
+def test_rule_based_predictions_match_scalar(uncertainty_map):
+    vectors = [vector for vector, _ in uncertainty_map.analyze_contexts(_contexts())]
+
+    batch = uncertainty_map.predict_evolution_batch(vectors, hours=12)
+
+    for model, vector in zip(batch, vectors):
+        scalar = uncertainty_map.predict_evolution(vector, hours=12)
+        assert model.trend == scalar.trend
+        assert model.velocity == pytest.approx(scalar.velocity)
+        assert model.confidence_interval == pytest.approx(scalar.confidence_interval)
+
+
+@pytest.mark.skipif(not ML_AVAILABLE, reason="scikit-learn not installed")
+def test_ml_predictions_use_single_predict_call(uncertainty_map):
+    rng = np.random.default_rng(3)
+    features = np.column_stack([rng.random((60, 5)), rng.integers(1, 72, 60)])
+    uncertainty_map.predictor.set_params(n_estimators=10, random_state=0)
+    uncertainty_map.train_predictor(features, rng.random(60))
+
+    calls = []
+    predict = uncertainty_map.predictor.predict
+
+    def counting_predict(x):
+        calls.append(x.shape)
+        return predict(x)
+
+    vectors = [vector for vector, _ in uncertainty_map.analyze_contexts(_contexts())]
+    uncertainty_map.predictor.predict = counting_predict
+    batch = uncertainty_map.predict_evolution_batch(vectors, hours=24)
+
+    assert calls == [(len(vectors), 6)]
+    for model, vector in zip(batch, vectors):
+        scalar = uncertainty_map.predict_evolution(vector, hours=24)
+        assert model.trend == scalar.trend
+        assert model.velocity == pytest.approx(scalar.velocity)
+
+
+def test_generate_mitigations_batch_matches_scalar(uncertainty_map):
+    analyzed = uncertainty_map.analyze_contexts(_contexts())
+    vectors = [vector for vector, _ in analyzed]
+    states = [state for _, state in analyzed]
+
+    batch = uncertainty_map.generate_mitigations_batch(vectors, states)
+
+    for strategies, vector, state in zip(batch, vectors, states):
+        assert [s.id for s in strategies] == [s.id for s in uncertainty_map.generate_mitigations(vector, state)]
+
+
+class TestBatchEndpoint:
+    @pytest.fixture
+    def client(self, uncertainty_map):
+        from app.routers.uncertainty import get_uncertainty_map, router
+
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_uncertainty_map] = lambda: uncertainty_map
+        return TestClient(app)
+
+    def test_batch_matches_single_analyze(self, client):
+        bodies = [
+            {"phase": "design", "team_size": 2, "timeline_weeks": 3},
+            {"phase": "testing", "has_code": True, "team_size": 5, "timeline_weeks": 12},
+        ]
+
+        response = client.post("/api/uncertainty/analyze/batch", json={"contexts": bodies})
+
+        assert response.status_code == 200, response.text
+        data = response.json()
+        assert data["count"] == 2
+        for result, body in zip(data["results"], bodies):
+            single = client.post("/api/uncertainty/analyze", json=body).json()
+            assert result["vector"] == single["vector"]
+            assert result["state"] == single["state"]
+            assert [m["id"] for m in result["mitigations"]] == [m["id"] for m in single["mitigations"]]
+
+    def test_empty_batch_rejected(self, client):
+        response = client.post("/api/uncertainty/analyze/batch", json={"contexts": []})
+        assert response.status_code == 422
@@ -0,0 +1,191 @@
+"""
+Tests for incremental version_history ingestion and keyset/full-text queries
+"""
+
+import subprocess
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.app.routers import version_history as version_history_router
+from backend.app.services import git_service
+from backend.app.services.git_service import GitService
+from backend.app.services.version_history_index import VersionHistoryIndex, decode_cursor, encode_cursor
+
+PROJECT_ID = uuid4()
+
+
+def _git(repo, *args):
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+def _commit(repo, filename, message):
+    (repo / filename).write_text(message + "\n")
+    _git(repo, "add", filename)
+    _git(repo, "commit", "-q", "-m", message)
+    return subprocess.run(["git", "rev-parse", "HEAD"], cwd=repo, capture_output=True, text=True).stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path):
+    git_service._HISTORY_CACHE.clear()
+    _git(tmp_path, "init", "-q", "-b", "main")
+    _git(tmp_path, "config", "user.email", "dev@example.com")
+    _git(tmp_path, "config", "user.name", "Dev")
+    _commit(tmp_path, "a.txt", "feat: first")
+    _commit(tmp_path, "b.txt", "fix: second")
+    return tmp_path
+
+
+def _index(state=None, rows=()):
+    conn = MagicMock()
+    conn.fetchval = AsyncMock(return_value=PROJECT_ID)
+    conn.fetchrow = AsyncMock(return_value=state)
+    conn.fetch = AsyncMock(return_value=list(rows))
+    conn.execute = AsyncMock()
+    conn.copy_records_to_table = AsyncMock()
+    conn.transaction = MagicMock(return_value=AsyncMock())
+    pool = MagicMock()
+    pool.acquire = MagicMock(return_value=AsyncMock(__aenter__=AsyncMock(return_value=conn)))
+    return VersionHistoryIndex(pool, copy_batch_size=1), conn
+
+
+def _row(commit_hash, message, day):
+    return {
+        "commit_hash": commit_hash,
+        "short_hash": commit_hash[:7],
+        "author": "Dev",
+        "author_email": "dev@example.com",
+        "commit_date": datetime(2026, 10, day, tzinfo=UTC),
+        "message": message,
+        "files_modified": None,
+        "files_added": None,
+        "files_deleted": None,
+        "lines_added": 1,
+        "lines_deleted": 0,
+        "tags": None,
+        "branches": ["main"],
+        "quality_metrics": '{"test_coverage": 85.2}',
+    }
+
+
+class TestIngestion:
+    @pytest.mark.asyncio
+    async def test_first_ingest_copies_full_branch_history(self, repo):
+        index, conn = _index()
+
+        summary = await index.ingest(GitService(str(repo)))
+
+        assert summary["full"] is True and summary["imported"] == 2 and summary["commit_count"] == 2
+        records = [call.kwargs["records"][0] for call in conn.copy_records_to_table.await_args_list]
+        assert [record[6] for record in records] == ["fix: second", "feat: first"]
+        assert all(record[0] == PROJECT_ID and record[13] == ["main"] for record in records)
+        upsert_sql = conn.execute.await_args_list[1].args[0]
+        assert "FROM version_history_stage" in upsert_sql and "ON CONFLICT (project_id, commit_hash)" in upsert_sql
+        assert conn.execute.await_args.args[1:] == (PROJECT_ID, "main", summary["head"], 2)
+
+    @pytest.mark.asyncio
+    async def test_incremental_ingest_imports_only_new_commits(self, repo):
+        head = subprocess.run(["git", "rev-parse", "HEAD"], cwd=repo, capture_output=True, text=True).stdout.strip()
+        new_head = _commit(repo, "c.txt", "feat: third")
+        index, conn = _index(state={"last_commit_hash": head, "commit_count": 2})
+
+        summary = await index.ingest(GitService(str(repo)))
+
+        assert (summary["full"], summary["imported"], summary["commit_count"]) == (False, 1, 3)
+        assert conn.copy_records_to_table.await_args.kwargs["records"][0][1] == new_head
+        assert not any("array_remove" in call.args[0] for call in conn.execute.await_args_list)
+
+    @pytest.mark.asyncio
+    async def test_rewritten_history_removes_branch_from_abandoned_commits(self, repo):
+        old_head = subprocess.run(["git", "rev-parse", "HEAD"], cwd=repo, capture_output=True, text=True).stdout.strip()
+        _git(repo, "commit", "-q", "--amend", "-m", "fix: second (rewritten)")
+        index, conn = _index(state={"last_commit_hash": old_head, "commit_count": 2})
+
+        summary = await index.ingest(GitService(str(repo)))
+
+        assert (summary["full"], summary["imported"], summary["commit_count"]) == (True, 2, 2)
+        sqls = [call.args[0] for call in conn.execute.await_args_list]
+        [cleanup] = [call for call in conn.execute.await_args_list if "array_remove(branches, $2)" in call.args[0]]
+        assert "FROM version_history_stage" in cleanup.args[0]
+        assert cleanup.args[1:] == (PROJECT_ID, "main")
+        # Same transaction, after the upsert and before the sync state moves to the new head
+        assert sqls.index(cleanup.args[0]) == len(sqls) - 2
+        assert conn.transaction.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_up_to_date_branch_is_not_reimported(self, repo):
+        head = subprocess.run(["git", "rev-parse", "HEAD"], cwd=repo, capture_output=True, text=True).stdout.strip()
+        index, conn = _index(state={"last_commit_hash": head, "commit_count": 2})
+
+        summary = await index.ingest(GitService(str(repo)))
+
+        assert summary["imported"] == 0
+        conn.execute.assert_not_awaited()
+        conn.copy_records_to_table.assert_not_awaited()
+
+
+class TestQueries:
+    @pytest.mark.asyncio
+    async def test_keyset_page_with_full_text_search(self, repo):
+        head = subprocess.run(["git", "rev-parse", "HEAD"], cwd=repo, capture_output=True, text=True).stdout.strip()
+        rows = [_row("c" * 40, "fix: cache", 3), _row("b" * 40, "fix: cache again", 2), _row("a" * 40, "x", 1)]
+        index, conn = _index(state={"last_commit_hash": head, "commit_count": 40}, rows=rows)
+        cursor = encode_cursor(datetime(2026, 10, 9, tzinfo=UTC), "f" * 40)
+
+        history = await index.get_history(GitService(str(repo)), limit=2, cursor=cursor, search="cache")
+
+        sql, *params = conn.fetch.await_args.args
+        assert "(commit_date, commit_hash) <" in sql and "OFFSET" not in sql
+        assert "to_tsvector('english', message) @@ websearch_to_tsquery('english', $5)" in sql
+        assert params == [PROJECT_ID, "main", datetime(2026, 10, 9, tzinfo=UTC), "f" * 40, "cache", 3]
+        assert history.total_commits == 40
+        assert [c.message for c in history.commits] == ["fix: cache", "fix: cache again"]
+        assert history.commits[0].quality_metrics == {"test_coverage": 85.2}
+        assert decode_cursor(history.next_cursor) == (datetime(2026, 10, 2, tzinfo=UTC), "b" * 40)
+
+    @pytest.mark.asyncio
+    async def test_unindexed_branch_returns_none(self, repo):
+        index, conn = _index(state=None)
+
+        assert await index.get_history(GitService(str(repo))) is None
+        conn.fetch.assert_not_awaited()
+
+    def test_invalid_cursor_is_rejected(self):
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor")
+
+
+class TestRouter:
+    def _client(self, index):
+        app = FastAPI()
+        app.include_router(version_history_router.router)
+        app.dependency_overrides[version_history_router.get_version_history_index] = lambda: index
+        return TestClient(app)
+
+    def test_router_falls_back_to_git_without_index(self, repo):
+        response = self._client(None).get("/api/version-history/", params={"project_path": str(repo)})
+
+        assert response.status_code == 200
+        assert [c["message"] for c in response.json()["commits"]] == ["fix: second", "feat: first"]
+        assert response.json()["next_cursor"] is None
+
+    def test_router_serves_indexed_branch_from_table(self, repo):
+        head = subprocess.run(["git", "rev-parse", "HEAD"], cwd=repo, capture_output=True, text=True).stdout.strip()
+        index, _ = _index(state={"last_commit_hash": head, "commit_count": 1}, rows=[_row("d" * 40, "from table", 5)])
+
+        response = self._client(index).get("/api/version-history/", params={"project_path": str(repo)})
+
+        assert response.status_code == 200
+        assert [c["message"] for c in response.json()["commits"]] == ["from table"]
+
+    def test_cursor_without_index_is_a_bad_request(self, repo):
+        response = self._client(None).get(
+            "/api/version-history/", params={"project_path": str(repo), "cursor": encode_cursor(datetime.now(UTC), "a")}
+        )
+
+        assert response.status_code == 400
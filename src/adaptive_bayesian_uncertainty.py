@@ -40,7 +40,7 @@ from collections import deque
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Deque, Dict, List, Optional, Tuple
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 
@@ -68,6 +68,34 @@ if sys.platform == "win32":
 
 logger = logging.getLogger(__name__)
 
+# ============================================================
+# Persistent state format
+# ============================================================
+# {project}_bayesian_state.npz       - fixed-size snapshot (beliefs, bias, Kalman, metrics)
+# {project}_bayesian_observations.bin - header + fixed-width observation records, append-only
+# {project}_bayesian_state.pkl       - legacy pickle, migrated on first load
+
+STATE_SCHEMA_VERSION = 1
+OBSERVATION_FILE_MAGIC = b"UDOBOBS"
+MAX_PERSISTED_OBSERVATIONS = 1000
+
+DIMENSIONS = ("technical", "market", "resource", "timeline", "quality")
+
+OBSERVATION_DTYPE = np.dtype(
+    [
+        ("timestamp", "<f8"),
+        ("phase", "u1"),
+        ("success", "?"),
+        ("accuracy", "<f8"),
+        ("predicted_magnitude", "<f8"),
+        ("predicted", "<f8", (len(DIMENSIONS),)),
+        ("observed", "<f8", (len(DIMENSIONS),)),
+    ]
+)
+
+# magic (7 bytes) + schema version (1 byte)
+OBSERVATION_HEADER_SIZE = len(OBSERVATION_FILE_MAGIC) + 1
+
 
 @dataclass
 class BayesianBelief:
@@ -229,6 +257,7 @@ class AdaptiveBayesianUncertainty:
 
         # Historical observations for pattern learning
         self.observation_history: List[Dict] = []
+        self._persisted_observations = 0  # observation_history entries already on disk
 
         # Kalman filter state for smooth predictions
         self.kalman_state = {
@@ -480,6 +509,202 @@ class AdaptiveBayesianUncertainty:
             f"Improvement rate: {self.metrics['improvement_rate']:.2%}"
         )
 
+    def update_beliefs_batch(
+        self,
+        phase: str,
+        dimensions: Sequence[str],
+        predicted: Sequence[float],
+        actual: Sequence[float],
+        learning_rate: float = 0.1,
+    ):
+        """
+        Apply many (predicted, actual, dimension) observations at once
+
+        Equivalent to calling, for each row in order,
+        ``beliefs[phase][dimension].update_with_observation(actual)`` and
+        ``bias_profiles[phase].update(predicted, actual)``.
+
+        Args:
+            phase: Development phase the observations belong to
+            dimensions: Dimension name per row
+            predicted: Predicted value per row
+            actual: Observed value per row
+            learning_rate: Beta update learning rate
+        """
+        if phase not in self.beliefs:
+            raise ValueError(f"Unknown phase: {phase}")
+
+        dimensions = np.asarray(dimensions)
+        predicted = np.asarray(predicted, dtype=float)
+        actual = np.asarray(actual, dtype=float)
+        if not (len(dimensions) == len(predicted) == len(actual)):
+            raise ValueError("dimensions, predicted and actual must have the same length")
+        if len(actual) == 0:
+            return
+
+        unknown = set(dimensions.tolist()) - set(self.beliefs[phase])
+        if unknown:
+            raise ValueError(f"Unknown dimensions: {sorted(unknown)}")
+
+        # Beta-Binomial updates: each step depends on the previous mean, so
+        # every belief is replayed over its own rows with plain float math
+        now = datetime.now()
+        for dimension in dict.fromkeys(dimensions.tolist()):
+            belief = self.beliefs[phase][dimension]
+            alpha, beta, mean = belief.alpha, belief.beta, belief.mean
+            values = actual[dimensions == dimension].tolist()
+            for observed_value in values:
+                error = abs(observed_value - mean)
+                if error <= 0.25:
+                    alpha += learning_rate * max(0.1, 1 - (error / 0.25))
+                else:
+                    beta += learning_rate
+                mean = alpha / (alpha + beta)
+
+            belief.alpha, belief.beta, belief.mean = alpha, beta, mean
+            belief.variance = (alpha * beta) / ((alpha + beta) ** 2 * (alpha + beta + 1))
+            belief.observations += len(values)
+            belief.confidence = min(1.0, math.log10(belief.observations + 1) / 3)
+            belief.last_updated = now
+
+        # Bias profile: one profile per phase, updated in row order
+        self._update_bias_batch(self.bias_profiles[phase], predicted, actual)
+
+    @staticmethod
+    def _update_bias_batch(profile: BiasProfile, predicted: np.ndarray, actual: np.ndarray, threshold: float = 0.1):
+        """Vectorized equivalent of BiasProfile.update() applied row by row"""
+        errors = predicted - actual
+        abs_errors = np.abs(errors)
+
+        accurate = abs_errors <= threshold
+        profile.accurate_count += int(np.count_nonzero(accurate))
+        profile.optimistic_count += int(np.count_nonzero(~accurate & (errors > threshold)))
+        profile.pessimistic_count += int(np.count_nonzero(~accurate & (errors <= threshold)))
+
+        # cumsum accumulates left to right, matching repeated +=
+        profile.total_error = float(np.cumsum(np.concatenate([[profile.total_error], abs_errors]))[-1])
+
+        profile.error_history.extend(errors.tolist())
+        profile.mean_error = sum(profile.error_history) / len(profile.error_history)
+
+    def update_with_observations_batch(
+        self,
+        phase: str,
+        predictions: List[Dict[str, Any]],
+        observed_vectors: List["UncertaintyVector"],
+        outcome_success: Optional[Sequence[bool]] = None,
+    ):
+        """
+        Batch variant of update_with_observation for replaying history
+
+        Produces the same beliefs, bias profiles, metrics, observation history
+        and Kalman noise parameters as calling update_with_observation for
+        each pair in order, but saves state once.
+        """
+        if len(predictions) != len(observed_vectors):
+            raise ValueError("predictions and observed_vectors must have the same length")
+        if not predictions:
+            return
+        if outcome_success is None:
+            outcome_success = [True] * len(predictions)
+
+        observed = [
+            {
+                "technical": v.technical,
+                "market": v.market,
+                "resource": v.resource,
+                "timeline": v.timeline,
+                "quality": v.quality,
+            }
+            for v in observed_vectors
+        ]
+
+        # Long-form rows in the same (observation, dimension) order as sequential updates
+        dimensions = [d for _ in observed for d in DIMENSIONS]
+        predicted_values = [p["dimension_predictions"][d]["predicted"] for p in predictions for d in DIMENSIONS]
+        actual_values = [o[d] for o in observed for d in DIMENSIONS]
+        self.update_beliefs_batch(phase, dimensions, predicted_values, actual_values)
+
+        accuracies = np.array(
+            [1.0 - abs(p["predicted_magnitude"] - v.magnitude()) for p, v in zip(predictions, observed_vectors)]
+        )
+        self.metrics["successful_predictions"] += int(np.count_nonzero(accuracies > 0.8))
+        self.metrics["accuracy_history"].extend(accuracies.tolist())
+
+        # Only the final value of the moving-average improvement rate survives replay
+        if len(self.metrics["accuracy_history"]) > 10:
+            recent_avg = np.mean(list(self.metrics["accuracy_history"])[-10:])
+            older_avg = (
+                np.mean(list(self.metrics["accuracy_history"])[-20:-10]) if len(self.metrics["accuracy_history"]) > 20 else 0.5
+            )
+            self.metrics["improvement_rate"] = (recent_avg - older_avg) / max(older_avg, 0.01)
+
+        timestamp = datetime.now().isoformat()
+        start = len(self.observation_history)
+        for pred, vector, obs, success, accuracy in zip(
+            predictions, observed_vectors, observed, outcome_success, accuracies.tolist()
+        ):
+            self.observation_history.append(
+                {
+                    "timestamp": timestamp,
+                    "phase": phase,
+                    "predicted": pred,
+                    "observed": (asdict(vector) if hasattr(vector, "__dict__") else obs),
+                    "outcome_success": success,
+                    "accuracy": accuracy,
+                }
+            )
+
+        # Re-run model optimization at every point sequential replay would have
+        for length in range(start + 1, len(self.observation_history) + 1):
+            if length % 10 == 0:
+                self._optimize_model_parameters(history_length=length)
+
+        self.save_state()
+
+        logger.info(
+            f"Bayesian batch update completed - Phase: {phase}, "
+            f"Observations: {len(predictions)}, "
+            f"Mean accuracy: {float(np.mean(accuracies)):.2%}"
+        )
+
+    def kalman_filter_batch(self, measurements: Sequence[float], predictions: Sequence[float]) -> np.ndarray:
+        """
+        Run _kalman_filter_update over arrays of (measurement, prediction)
+
+        The gain sequence does not depend on the data and the blending/clipping
+        is elementwise, so only the state recursion remains a scalar loop.
+        Returns the same values, and leaves the same filter state, as
+        sequential calls.
+        """
+        measurements = np.asarray(measurements, dtype=float)
+        predictions = np.asarray(predictions, dtype=float)
+        count = len(measurements)
+        if count == 0:
+            return np.zeros(0)
+
+        q, r = self.kalman_state["Q"], self.kalman_state["R"]
+        gains = np.empty(count)
+        p = self.kalman_state["P"]
+        for i in range(count):
+            p_pred = p + q
+            gains[i] = p_pred / (p_pred + r)
+            p = (1 - gains[i]) * p_pred
+
+        states = np.empty(count)
+        x = self.kalman_state["x"]
+        for i, (gain, measurement) in enumerate(zip(gains.tolist(), measurements.tolist())):
+            x = x + gain * (measurement - x)
+            states[i] = x
+
+        self.kalman_state["x"] = x
+        self.kalman_state["P"] = p
+
+        blended = 0.7 * predictions + 0.3 * states
+        lower = np.minimum(measurements, predictions) - 0.1
+        upper = np.maximum(measurements, predictions) + 0.1
+        return np.clip(blended, lower, upper)
+
     def _kalman_filter_update(self, measurement: float, prediction: float) -> float:
         """
         Apply Kalman filtering for smooth prediction updates
@@ -689,39 +914,23 @@ class AdaptiveBayesianUncertainty:
 
         return recommendations
 
-    def _optimize_model_parameters(self):
+    def _optimize_model_parameters(self, history_length: Optional[int] = None):
         """
         Periodically optimize model parameters based on observed performance
+
+        Args:
+            history_length: Treat only the first N observations as seen
+                (used when replaying a batch; defaults to the full history)
         """
-        if len(self.observation_history) < 20:
+        if history_length is None:
+            history_length = len(self.observation_history)
+        if history_length < 20:
             return
 
         # Analyze recent prediction errors
-        recent_observations = self.observation_history[-20:]
-        errors = []
-
-        for obs in recent_observations:
-            if "predicted" in obs and "observed" in obs:
-                pred_mag = obs["predicted"].get("predicted_magnitude", 0.5)
-                obs_values = obs["observed"]
-                if isinstance(obs_values, dict):
-                    obs_mag = math.sqrt(
-                        sum(
-                            v**2
-                            for v in [
-                                obs_values.get("technical", 0),
-                                obs_values.get("market", 0),
-                                obs_values.get("resource", 0),
-                                obs_values.get("timeline", 0),
-                                obs_values.get("quality", 0),
-                            ]
-                        )
-                    ) / math.sqrt(5)
-                else:
-                    obs_mag = 0.5
-                errors.append(pred_mag - obs_mag)
+        errors = self._prediction_errors(self.observation_history[history_length - 20 : history_length])
 
-        if errors:
+        if errors.size:
             # Adjust Kalman filter parameters based on error patterns
             mean_abs_error = np.mean(np.abs(errors))
             error_variance = np.var(errors)
@@ -740,6 +949,26 @@ class AdaptiveBayesianUncertainty:
 
             logger.debug(f"Model parameters optimized - R: {self.kalman_state['R']:.3f}, Q: {self.kalman_state['Q']:.3f}")
 
+    @staticmethod
+    def _prediction_errors(observations: List[Dict]) -> np.ndarray:
+        """Predicted minus observed magnitude for observations that carry both"""
+        usable = [obs for obs in observations if "predicted" in obs and "observed" in obs]
+        if not usable:
+            return np.zeros(0)
+
+        predicted = np.array([obs["predicted"].get("predicted_magnitude", 0.5) for obs in usable], dtype=float)
+        observed = np.array(
+            [
+                [obs["observed"].get(d, 0) for d in DIMENSIONS] if isinstance(obs["observed"], dict) else [np.nan] * 5
+                for obs in usable
+            ],
+            dtype=float,
+        )
+        magnitudes = np.sqrt(np.sum(observed * observed, axis=1)) / math.sqrt(5)
+        # Non-dict observations count as magnitude 0.5
+        magnitudes = np.where(np.isnan(magnitudes), 0.5, magnitudes)
+        return predicted - magnitudes
+
     def get_performance_report(self) -> Dict[str, Any]:
         """
         Get comprehensive performance report of the Bayesian system
@@ -794,53 +1023,245 @@ class AdaptiveBayesianUncertainty:
         else:
             return "needs_recalibration"
 
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    @property
+    def state_file(self) -> Path:
+        return self.storage_dir / f"{self.project_name}_bayesian_state.npz"
+
+    @property
+    def observations_file(self) -> Path:
+        return self.storage_dir / f"{self.project_name}_bayesian_observations.bin"
+
+    @property
+    def legacy_state_file(self) -> Path:
+        return self.storage_dir / f"{self.project_name}_bayesian_state.pkl"
+
     def save_state(self):
         """
         Save Bayesian system state to disk
-        """
-        state_file = self.storage_dir / f"{self.project_name}_bayesian_state.pkl"
-        state = {
-            "beliefs": self.beliefs,
-            "bias_profiles": self.bias_profiles,
-            "observation_history": self.observation_history[-1000:],  # Keep last 1000 observations
-            "kalman_state": self.kalman_state,
-            "metrics": dict(self.metrics),
-        }
 
+        Rewrites the fixed-size snapshot and appends only observations
+        recorded since the last save, so the cost does not grow with history.
+        """
         try:
-            with open(state_file, "wb") as f:
-                pickle.dump(state, f)
-            logger.debug(f"Bayesian state saved to {state_file}")
+            self._write_snapshot()
+            self._append_observations()
+            logger.debug(f"Bayesian state saved to {self.state_file}")
         except Exception as e:
             logger.error(f"Failed to save Bayesian state: {e}")
 
     def load_state(self):
         """
-        Load previous Bayesian system state
+        Load previous Bayesian system state (migrating a legacy pickle if present)
         """
-        state_file = self.storage_dir / f"{self.project_name}_bayesian_state.pkl"
+        try:
+            if self.state_file.exists():
+                self._read_snapshot()
+                self.observation_history = self._read_observations()
+            elif self.legacy_state_file.exists():
+                self._migrate_legacy_pickle()
+            else:
+                return
+
+            self._persisted_observations = len(self.observation_history)
+            logger.info(f"Bayesian state loaded - {self.metrics['predictions_made']} historical predictions")
+        except Exception as e:
+            logger.warning(f"Could not load previous state: {e}")
+
+    def _write_snapshot(self):
+        phases = list(self.beliefs.keys())
+        beliefs = [[self.beliefs[phase][dim] for dim in DIMENSIONS] for phase in phases]
+        profiles = [self.bias_profiles[phase] for phase in phases]
+
+        # Rolling windows are NaN-padded to their maxlen so the snapshot size is fixed
+        error_history = np.full((len(phases), 100), np.nan)
+        for i, profile in enumerate(profiles):
+            history = list(profile.error_history)[-100:]
+            error_history[i, : len(history)] = history
+        accuracy_history = np.full(100, np.nan)
+        recent_accuracy = list(self.metrics["accuracy_history"])[-100:]
+        accuracy_history[: len(recent_accuracy)] = recent_accuracy
+
+        arrays = {
+            "schema_version": np.array(STATE_SCHEMA_VERSION),
+            "phases": np.array(phases),
+            "dimensions": np.array(DIMENSIONS),
+            "belief_params": np.array(
+                [[[b.mean, b.variance, b.alpha, b.beta, b.confidence] for b in row] for row in beliefs], dtype=float
+            ),
+            "belief_observations": np.array([[b.observations for b in row] for row in beliefs], dtype=np.int64),
+            "belief_updated": np.array([[b.last_updated.timestamp() for b in row] for row in beliefs], dtype=float),
+            "bias_counts": np.array(
+                [[p.optimistic_count, p.pessimistic_count, p.accurate_count] for p in profiles], dtype=np.int64
+            ),
+            "bias_errors": np.array([[p.total_error, p.mean_error] for p in profiles], dtype=float),
+            "bias_error_history": error_history,
+            "kalman": np.array([self.kalman_state[k] for k in ("x", "P", "Q", "R")], dtype=float),
+            "metric_counts": np.array(
+                [self.metrics["predictions_made"], self.metrics["successful_predictions"]], dtype=np.int64
+            ),
+            "improvement_rate": np.array(float(self.metrics["improvement_rate"])),
+            "accuracy_history": accuracy_history,
+        }
 
-        if state_file.exists():
-            try:
-                with open(state_file, "rb") as f:
-                    state = pickle.load(f)
+        # Write-then-rename so a crash never leaves a truncated snapshot
+        tmp_file = self.state_file.with_suffix(".npz.tmp")
+        with open(tmp_file, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_file, self.state_file)
+
+    def _read_snapshot(self):
+        with np.load(self.state_file, allow_pickle=False) as data:
+            version = int(data["schema_version"])
+            if version > STATE_SCHEMA_VERSION:
+                raise ValueError(f"State schema v{version} is newer than supported v{STATE_SCHEMA_VERSION}")
+
+            dimensions = [str(d) for d in data["dimensions"]]
+            for i, phase in enumerate(str(p) for p in data["phases"]):
+                if phase not in self.beliefs:
+                    continue
+                for j, dim in enumerate(dimensions):
+                    mean, variance, alpha, beta, confidence = data["belief_params"][i, j].tolist()
+                    self.beliefs[phase][dim] = BayesianBelief(
+                        mean=mean,
+                        variance=variance,
+                        alpha=alpha,
+                        beta=beta,
+                        confidence=confidence,
+                        observations=int(data["belief_observations"][i, j]),
+                        last_updated=datetime.fromtimestamp(float(data["belief_updated"][i, j])),
+                    )
+
+                optimistic, pessimistic, accurate = data["bias_counts"][i].tolist()
+                total_error, mean_error = data["bias_errors"][i].tolist()
+                history = data["bias_error_history"][i]
+                self.bias_profiles[phase] = BiasProfile(
+                    optimistic_count=optimistic,
+                    pessimistic_count=pessimistic,
+                    accurate_count=accurate,
+                    total_error=total_error,
+                    mean_error=mean_error,
+                    error_history=deque(history[~np.isnan(history)].tolist(), maxlen=100),
+                )
 
-                self.beliefs = state.get("beliefs", self.beliefs)
-                self.bias_profiles = state.get("bias_profiles", self.bias_profiles)
-                self.observation_history = state.get("observation_history", [])
-                self.kalman_state = state.get("kalman_state", self.kalman_state)
+            self.kalman_state.update(zip(("x", "P", "Q", "R"), data["kalman"].tolist()))
+            predictions_made, successful = data["metric_counts"].tolist()
+            self.metrics["predictions_made"] = predictions_made
+            self.metrics["successful_predictions"] = successful
+            self.metrics["improvement_rate"] = float(data["improvement_rate"])
+            accuracy_history = data["accuracy_history"]
+            self.metrics["accuracy_history"] = deque(accuracy_history[~np.isnan(accuracy_history)].tolist(), maxlen=100)
+
+    def _observation_records(self, observations: List[Dict]) -> np.ndarray:
+        """Pack observation dicts into fixed-width records"""
+        phases = list(self.beliefs.keys())
+        records = np.zeros(len(observations), dtype=OBSERVATION_DTYPE)
+        for i, obs in enumerate(observations):
+            predicted = obs.get("predicted") or {}
+            dimension_predictions = predicted.get("dimension_predictions", {})
+            observed = obs.get("observed") or {}
+
+            records[i]["timestamp"] = datetime.fromisoformat(obs["timestamp"]).timestamp()
+            records[i]["phase"] = phases.index(obs["phase"]) if obs.get("phase") in phases else 255
+            records[i]["success"] = bool(obs.get("outcome_success", True))
+            records[i]["accuracy"] = obs.get("accuracy", np.nan)
+            records[i]["predicted_magnitude"] = predicted.get("predicted_magnitude", np.nan)
+            records[i]["predicted"] = [dimension_predictions.get(d, {}).get("predicted", np.nan) for d in DIMENSIONS]
+            records[i]["observed"] = [observed.get(d, np.nan) for d in DIMENSIONS]
+        return records
+
+    def _observation_dicts(self, records: np.ndarray) -> List[Dict]:
+        """Expand records into the observation dicts used in memory"""
+        phases = list(self.beliefs.keys())
+        observations = []
+        for record in records:
+            observations.append(
+                {
+                    "timestamp": datetime.fromtimestamp(float(record["timestamp"])).isoformat(),
+                    "phase": phases[record["phase"]] if record["phase"] < len(phases) else "unknown",
+                    "predicted": {
+                        "predicted_magnitude": float(record["predicted_magnitude"]),
+                        "dimension_predictions": {d: {"predicted": float(v)} for d, v in zip(DIMENSIONS, record["predicted"])},
+                    },
+                    "observed": dict(zip(DIMENSIONS, record["observed"].tolist())),
+                    "outcome_success": bool(record["success"]),
+                    "accuracy": float(record["accuracy"]),
+                }
+            )
+        return observations
+
+    def _write_observations(self, records: np.ndarray):
+        tmp_file = self.observations_file.with_suffix(".bin.tmp")
+        with open(tmp_file, "wb") as f:
+            f.write(OBSERVATION_FILE_MAGIC + bytes([STATE_SCHEMA_VERSION]))
+            records.tofile(f)
+        os.replace(tmp_file, self.observations_file)
+
+    def _append_observations(self):
+        """Append observations recorded since the last save"""
+        persisted = self._persisted_observations
+        if persisted > len(self.observation_history) or not self.observations_file.exists():
+            # History was replaced or the file is missing: rewrite the retained tail
+            self._write_observations(self._observation_records(self.observation_history[-MAX_PERSISTED_OBSERVATIONS:]))
+            self._persisted_observations = len(self.observation_history)
+            return
 
-                # Restore metrics
-                metrics = state.get("metrics", {})
-                self.metrics["predictions_made"] = metrics.get("predictions_made", 0)
-                self.metrics["successful_predictions"] = metrics.get("successful_predictions", 0)
-                if "accuracy_history" in metrics:
-                    self.metrics["accuracy_history"] = deque(metrics["accuracy_history"], maxlen=100)
-                self.metrics["improvement_rate"] = metrics.get("improvement_rate", 0.0)
+        pending = self.observation_history[persisted:]
+        if not pending:
+            return
 
-                logger.info(f"Bayesian state loaded - {self.metrics['predictions_made']} historical predictions")
-            except Exception as e:
-                logger.warning(f"Could not load previous state: {e}")
+        with open(self.observations_file, "ab") as f:
+            self._observation_records(pending).tofile(f)
+        self._persisted_observations = len(self.observation_history)
+
+        # Trim once the file holds twice the retention window (amortised O(1) per append)
+        stored = (self.observations_file.stat().st_size - OBSERVATION_HEADER_SIZE) // OBSERVATION_DTYPE.itemsize
+        if stored > 2 * MAX_PERSISTED_OBSERVATIONS:
+            self._write_observations(self._read_observation_records()[-MAX_PERSISTED_OBSERVATIONS:])
+
+    def _read_observation_records(self) -> np.ndarray:
+        if not self.observations_file.exists():
+            return np.zeros(0, dtype=OBSERVATION_DTYPE)
+
+        with open(self.observations_file, "rb") as f:
+            header = f.read(OBSERVATION_HEADER_SIZE)
+            if header[:-1] != OBSERVATION_FILE_MAGIC:
+                raise ValueError(f"Not an observation file: {self.observations_file}")
+            if header[-1] > STATE_SCHEMA_VERSION:
+                raise ValueError(f"Observation schema v{header[-1]} is newer than supported v{STATE_SCHEMA_VERSION}")
+            payload = f.read()
+
+        # Ignore a partially written trailing record
+        usable = len(payload) - len(payload) % OBSERVATION_DTYPE.itemsize
+        return np.frombuffer(payload[:usable], dtype=OBSERVATION_DTYPE)
+
+    def _read_observations(self) -> List[Dict]:
+        return self._observation_dicts(self._read_observation_records()[-MAX_PERSISTED_OBSERVATIONS:])
+
+    def _migrate_legacy_pickle(self):
+        """Load a pre-v1 pickle state and rewrite it in the compact format"""
+        with open(self.legacy_state_file, "rb") as f:
+            state = pickle.load(f)
+
+        self.beliefs = state.get("beliefs", self.beliefs)
+        self.bias_profiles = state.get("bias_profiles", self.bias_profiles)
+        self.observation_history = state.get("observation_history", [])[-MAX_PERSISTED_OBSERVATIONS:]
+        self.kalman_state = state.get("kalman_state", self.kalman_state)
+
+        metrics = state.get("metrics", {})
+        self.metrics["predictions_made"] = metrics.get("predictions_made", 0)
+        self.metrics["successful_predictions"] = metrics.get("successful_predictions", 0)
+        if "accuracy_history" in metrics:
+            self.metrics["accuracy_history"] = deque(metrics["accuracy_history"], maxlen=100)
+        self.metrics["improvement_rate"] = metrics.get("improvement_rate", 0.0)
+
+        self._write_snapshot()
+        self._write_observations(self._observation_records(self.observation_history))
+        self.legacy_state_file.rename(self.legacy_state_file.with_suffix(".pkl.migrated"))
+        logger.info(f"Migrated legacy Bayesian state {self.legacy_state_file.name} to schema v{STATE_SCHEMA_VERSION}")
 
 
 def demonstrate_bayesian_learning():
@@ -13,6 +13,11 @@ from datetime import datetime
 from enum import Enum
 import logging
 
+try:
+    from src.response_cache import ResponseCache, make_cache_key
+except ImportError:
+    from response_cache import ResponseCache, make_cache_key
+
 # Windows Unicode 인코딩 문제 해결
 if sys.platform == "win32":
     os.environ["PYTHONIOENCODING"] = "utf-8"
@@ -146,11 +151,16 @@ class GeminiAPIConnector:
 class AICollaborationConnector:
     """통합 AI 협업 연결 관리자"""
 
-    def __init__(self):
+    # 로컬 폴백은 캐시하지 않음
+    CACHED_SERVICES = (AIService.CODEX, AIService.GEMINI, AIService.CLAUDE)
+
+    def __init__(self, response_cache: Optional[ResponseCache] = None):
         self.codex = CodexMCPConnector()
         self.gemini = GeminiAPIConnector()
         self.services_status = {}
         self.execution_history = []
+        # 동일한 (서비스, 프롬프트, 컨텍스트) 요청은 디스크 캐시에서 응답
+        self.response_cache = response_cache if response_cache is not None else ResponseCache()
 
         # 서비스 초기화
         self._initialize_services()
@@ -179,6 +189,22 @@ class AICollaborationConnector:
         """AI 요청 실행"""
         start_time = datetime.now()
 
+        cache_key = None
+        if request.service in self.CACHED_SERVICES:
+            generation = {"context": request.context, "max_tokens": request.max_tokens, "temperature": request.temperature}
+            cache_key = make_cache_key(request.service.value, "request", request.prompt, generation)
+            cached = self.response_cache.get(cache_key, provider=request.service.value)
+            if cached is not None:
+                response = AIResponse(
+                    service=request.service,
+                    content=cached["content"],
+                    metadata={**cached["metadata"], "cached": True},
+                    execution_time=(datetime.now() - start_time).total_seconds(),
+                    success=True,
+                )
+                self._save_to_history(request, response)
+                return response
+
         try:
             # 서비스별 실행
             if request.service == AIService.CODEX:
@@ -203,6 +229,12 @@ class AICollaborationConnector:
                 error=result.get("error"),
             )
 
+            # 성공한 응답만 캐시
+            if cache_key is not None and response.success:
+                self.response_cache.put(
+                    cache_key, {"content": response.content, "metadata": response.metadata}, provider=request.service.value
+                )
+
             # 히스토리 저장
             self._save_to_history(request, response)
 
@@ -307,6 +339,7 @@ class AICollaborationConnector:
             },
             "history_count": len(self.execution_history),
             "last_execution": self.execution_history[-1] if self.execution_history else None,
+            "response_cache": self.response_cache.stats(),
         }
 
 
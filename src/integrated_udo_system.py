@@ -155,6 +155,8 @@ class IntegratedUDOSystem:
         if ML_SYSTEM_AVAILABLE:
             try:
                 self.components["ml_system"] = MLTrainingSystem()
+                # 저장된 모델은 등록만 하고 첫 예측 시 mmap 으로 로드
+                self.components["ml_system"].load_models(lazy=True)
                 logger.info("[OK] ML Training System initialized")
             except Exception as e:
                 logger.error(f"Failed to initialize ML System: {e}")
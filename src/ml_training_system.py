@@ -10,17 +10,25 @@ import os
 import json
 import numpy as np
 from typing import Dict, List, Tuple, Optional, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from datetime import datetime
 from pathlib import Path
 import logging
+from sklearn.base import clone
 from sklearn.ensemble import RandomForestRegressor, RandomForestClassifier
 from sklearn.model_selection import train_test_split, cross_val_score
 from sklearn.preprocessing import StandardScaler
 from sklearn.metrics import mean_squared_error, accuracy_score, r2_score
+import threading
+import time
 import joblib
 from filelock import FileLock
 
+try:
+    from src.model_registry import MappedForest, ModelRegistry
+except ImportError:
+    from model_registry import MappedForest, ModelRegistry
+
 # Windows Unicode 인코딩 문제 해결
 if sys.platform == "win32":
     os.environ["PYTHONIOENCODING"] = "utf-8"
@@ -63,7 +71,11 @@ class ModelMetrics:
     r2: float
     cross_val_scores: List[float]
     feature_importance: Dict[str, float]
-    training_time: float
+    training_time: float  # wall-clock 초
+    stage_timings: Dict[str, float] = field(default_factory=dict)  # 단계별 초 (split/scale/fit/...)
+    n_jobs: Optional[int] = None
+    incremental: bool = False  # warm-start 로 트리를 추가했는지
+    n_estimators: int = 0
 
 
 class MLTrainingSystem:
@@ -71,12 +83,18 @@ class MLTrainingSystem:
 
     def __init__(self, model_dir: Optional[Any] = None):
         self.model_dir = _resolve_model_dir(model_dir)
+        self.registry = ModelRegistry(self.model_dir / "registry")
 
         self.models = {}
         self.scalers = {}
         self.training_history = []
         self.feature_names = []
 
+        # 지연 로드 대기 중인 모델: model_name -> registry version (레거시 .pkl은 Path)
+        self._pending_loads: Dict[str, Any] = {}
+        self.loaded_versions: Dict[str, int] = {}
+        self._load_lock = threading.Lock()
+
         # 기본 모델 초기화
         self._initialize_models()
 
@@ -103,6 +121,14 @@ class MLTrainingSystem:
 
     def prepare_features(self, raw_data: Dict) -> np.ndarray:
         """원시 데이터를 특징 벡터로 변환"""
+        return np.array(self._feature_row(raw_data)).reshape(1, -1)
+
+    def prepare_features_batch(self, inputs: List[Dict]) -> np.ndarray:
+        """여러 입력을 하나의 (N, n_features) 특징 행렬로 변환"""
+        return np.array([self._feature_row(raw_data) for raw_data in inputs], dtype=float)
+
+    def _feature_row(self, raw_data: Dict) -> List[float]:
+        """입력 하나의 특징 값 목록"""
         features = []
 
         # Phase 인코딩
@@ -147,52 +173,126 @@ class MLTrainingSystem:
                 "dependency_count",
             ]
 
-        return np.array(features).reshape(1, -1)
-
-    def train_model(self, model_name: str, training_data: TrainingData, test_size: float = 0.2) -> ModelMetrics:
-        """모델 훈련"""
-        if model_name not in self.models:
+        return features
+
+    def train_model(
+        self,
+        model_name: str,
+        training_data: TrainingData,
+        test_size: float = 0.2,
+        n_jobs: Optional[int] = None,
+        warm_start_trees: int = 0,
+        cv_folds: int = 5,
+    ) -> ModelMetrics:
+        """
+        모델 훈련
+
+        Args:
+            model_name: 훈련할 모델
+            training_data: 훈련 데이터
+            test_size: 평가용 데이터 비율
+            n_jobs: 포레스트 학습/예측과 교차 검증 폴드에 사용할 병렬 작업 수
+                (-1 = 모든 코어, None = 모델 기본값 유지)
+            warm_start_trees: 0 보다 크면 이미 학습된 포레스트에 새 데이터로
+                트리를 이만큼 추가 (기존 트리와 스케일러 유지)
+            cv_folds: 교차 검증 폴드 수 (0 이면 생략)
+        """
+        if model_name not in self.models and model_name not in self._pending_loads:
             raise ValueError(f"Unknown model: {model_name}")
-
-        logger.info(f"Training {model_name}...")
-        start_time = datetime.now()
-
-        # 데이터 분할
-        X_train, X_test, y_train, y_test = train_test_split(
-            training_data.features, training_data.labels, test_size=test_size, random_state=42
-        )
-
-        # 스케일링
-        X_train_scaled = self.scalers[model_name].fit_transform(X_train)
-        X_test_scaled = self.scalers[model_name].transform(X_test)
-
-        # 모델 훈련
-        self.models[model_name].fit(X_train_scaled, y_train)
-
-        # 예측
-        y_pred = self.models[model_name].predict(X_test_scaled)
-
-        # 메트릭 계산
-        if hasattr(self.models[model_name], "predict_proba"):
-            # 분류 모델
-            accuracy = accuracy_score(y_test, y_pred)
-            mse = mean_squared_error(y_test, y_pred)
-            r2 = 0.0  # 분류에는 R2 사용 안함
+        if warm_start_trees:
+            self._ensure_loaded(model_name)
         else:
-            # 회귀 모델
-            accuracy = 0.0  # 회귀에는 정확도 사용 안함
-            mse = mean_squared_error(y_test, y_pred)
-            r2 = r2_score(y_test, y_pred)
+            self._pending_loads.pop(model_name, None)
+
+        model = self.models[model_name]
+        if isinstance(model, MappedForest):
+            # 매핑된 읽기 전용 포레스트는 학습 전에 전체 sklearn 모델로 교체
+            model = self.models[model_name] = model.to_estimator()
+        incremental = warm_start_trees > 0 and hasattr(model, "estimators_")
+        if warm_start_trees > 0 and "warm_start" not in model.get_params():
+            raise ValueError(f"{model_name} does not support warm-start training")
+        if warm_start_trees > 0 and not incremental:
+            logger.warning(
+                f"{model_name} has no trained trees to extend; "
+                f"ignoring warm_start_trees={warm_start_trees} and fitting from scratch"
+            )
 
-        # 교차 검증
-        cv_scores = cross_val_score(self.models[model_name], X_train_scaled, y_train, cv=5)
+        logger.info(f"Training {model_name} (n_jobs={n_jobs}, incremental={incremental})...")
+        start_time = datetime.now()
+        stage_timings: Dict[str, float] = {}
+        stage_start = time.perf_counter()
+
+        def _stage(name: str) -> None:
+            nonlocal stage_start
+            now = time.perf_counter()
+            stage_timings[name] = now - stage_start
+            stage_start = now
+
+        # 저장되는 모델에 n_jobs 가 남지 않도록 훈련 후 원래 값으로 복원
+        previous_n_jobs = model.get_params().get("n_jobs")
+        override_n_jobs = n_jobs is not None and "n_jobs" in model.get_params()
+        if override_n_jobs:
+            model.set_params(n_jobs=n_jobs)
+
+        try:
+            # 데이터 분할
+            X_train, X_test, y_train, y_test = train_test_split(
+                training_data.features, training_data.labels, test_size=test_size, random_state=42
+            )
+            _stage("split")
+
+            # 스케일링 (증분 학습 시 기존 트리가 사용하는 스케일을 유지)
+            if incremental:
+                X_train_scaled = self.scalers[model_name].transform(X_train)
+            else:
+                X_train_scaled = self.scalers[model_name].fit_transform(X_train)
+            X_test_scaled = self.scalers[model_name].transform(X_test)
+            _stage("scale")
+
+            # 모델 훈련
+            if incremental:
+                model.set_params(warm_start=True, n_estimators=len(model.estimators_) + warm_start_trees)
+                try:
+                    model.fit(X_train_scaled, y_train)
+                finally:
+                    model.set_params(warm_start=False)
+            else:
+                model.fit(X_train_scaled, y_train)
+            _stage("fit")
+
+            # 예측
+            y_pred = model.predict(X_test_scaled)
+
+            # 메트릭 계산
+            if hasattr(model, "predict_proba"):
+                # 분류 모델
+                accuracy = accuracy_score(y_test, y_pred)
+                mse = mean_squared_error(y_test, y_pred)
+                r2 = 0.0  # 분류에는 R2 사용 안함
+            else:
+                # 회귀 모델
+                accuracy = 0.0  # 회귀에는 정확도 사용 안함
+                mse = mean_squared_error(y_test, y_pred)
+                r2 = r2_score(y_test, y_pred)
+            _stage("evaluate")
+
+            # 교차 검증 (폴드 병렬 실행; 복제본은 처음부터 학습)
+            cv_scores = np.array([])
+            if cv_folds:
+                cv_model = clone(model).set_params(warm_start=False) if incremental else model
+                cv_scores = cross_val_score(cv_model, X_train_scaled, y_train, cv=cv_folds, n_jobs=n_jobs)
+            _stage("cross_validation")
+        finally:
+            if override_n_jobs:
+                model.set_params(n_jobs=previous_n_jobs)
 
         # 특징 중요도
         feature_importance = {}
-        if hasattr(self.models[model_name], "feature_importances_"):
-            importances = self.models[model_name].feature_importances_
+        if hasattr(model, "feature_importances_"):
+            importances = model.feature_importances_
             for i, name in enumerate(self.feature_names[: len(importances)]):
                 feature_importance[name] = float(importances[i])
+        _stage("feature_importance")
 
         # 훈련 시간
         training_time = (datetime.now() - start_time).total_seconds()
@@ -205,6 +305,10 @@ class MLTrainingSystem:
             cross_val_scores=cv_scores.tolist(),
             feature_importance=feature_importance,
             training_time=training_time,
+            stage_timings=stage_timings,
+            n_jobs=n_jobs,
+            incremental=incremental,
+            n_estimators=len(getattr(model, "estimators_", [])),
         )
 
         # 히스토리 저장
@@ -217,27 +321,21 @@ class MLTrainingSystem:
             }
         )
 
-        logger.info(f"Training completed: R2={r2:.3f}, MSE={mse:.3f}")
+        logger.info(
+            f"Training completed: R2={r2:.3f}, MSE={mse:.3f}, "
+            + ", ".join(f"{stage}={seconds:.2f}s" for stage, seconds in stage_timings.items())
+        )
 
         return metrics
 
     def predict(self, model_name: str, input_data: Dict) -> Tuple[float, Dict]:
         """예측 수행"""
-        if model_name not in self.models:
+        if model_name not in self.models and model_name not in self._pending_loads:
             raise ValueError(f"Unknown model: {model_name}")
+        self._ensure_loaded(model_name)
 
-        # 특징 준비
-        features = self.prepare_features(input_data)
-
-        # 스케일링
-        if model_name in self.scalers:
-            try:
-                features_scaled = self.scalers[model_name].transform(features)
-            except Exception:
-                # 스케일러가 아직 fit되지 않은 경우
-                features_scaled = features
-        else:
-            features_scaled = features
+        # 특징 준비 및 스케일링
+        features_scaled = self._scale_features(model_name, self.prepare_features(input_data))
 
         # 예측
         prediction = self.models[model_name].predict(features_scaled)[0]
@@ -258,6 +356,54 @@ class MLTrainingSystem:
 
         return float(prediction), metadata
 
+    def predict_batch(self, model_name: str, inputs: List[Dict]) -> Tuple[np.ndarray, Dict]:
+        """
+        여러 입력에 대한 일괄 예측
+
+        특징 행렬을 한 번 만들고 한 번 스케일링한 뒤 모델을 한 번만 호출한다.
+        분류 모델은 ``predict_proba`` 한 번으로 확률과 예측 클래스를 함께 얻는다
+        (RandomForestClassifier.predict 와 동일한 argmax 규칙).
+
+        Returns:
+            (행별 예측값 배열, 메타데이터) - 메타데이터의 ``probabilities`` 는
+            분류 모델이면 (N, n_classes) 배열, 아니면 None
+        """
+        if model_name not in self.models and model_name not in self._pending_loads:
+            raise ValueError(f"Unknown model: {model_name}")
+        self._ensure_loaded(model_name)
+
+        model = self.models[model_name]
+        features_scaled = self._scale_features(model_name, self.prepare_features_batch(inputs))
+
+        probabilities = None
+        if len(inputs) == 0:
+            predictions = np.empty(0)
+        elif hasattr(model, "predict_proba") and hasattr(model, "classes_"):
+            probabilities = model.predict_proba(features_scaled)
+            predictions = model.classes_.take(np.argmax(probabilities, axis=1), axis=0)
+        else:
+            predictions = model.predict(features_scaled)
+
+        metadata = {
+            "model": model_name,
+            "timestamp": datetime.now().isoformat(),
+            "features_used": self.feature_names,
+            "probabilities": probabilities,
+            "count": len(inputs),
+        }
+
+        return np.asarray(predictions, dtype=float), metadata
+
+    def _scale_features(self, model_name: str, features: np.ndarray) -> np.ndarray:
+        """모델 스케일러 적용 (아직 fit되지 않았으면 원본 사용)"""
+        if model_name not in self.scalers:
+            return features
+        try:
+            return self.scalers[model_name].transform(features)
+        except Exception:
+            # 스케일러가 아직 fit되지 않은 경우
+            return features
+
     def generate_synthetic_data(self, size: int = 1000) -> TrainingData:
         """합성 훈련 데이터 생성"""
         np.random.seed(42)
@@ -301,45 +447,64 @@ class MLTrainingSystem:
         return TrainingData(features=np.array(features), labels=np.array(labels), metadata={"synthetic": True, "size": size})
 
     def save_models(self, directory: Optional[Any] = None) -> Dict[str, Path]:
-        """모든 모델 저장"""
-        target_dir = _resolve_model_dir(directory or self.model_dir)
-        saved_paths: Dict[str, Path] = {}
-        for model_name, model in self.models.items():
-            model_path = target_dir / f"{model_name}.pkl"
-            lock = FileLock(str(model_path) + ".lock")
-            with lock:
-                joblib.dump(model, model_path)
-            saved_paths[model_name] = model_path
-
-            if model_name in self.scalers:
-                scaler_path = target_dir / f"{model_name}_scaler.pkl"
-                scaler_lock = FileLock(str(scaler_path) + ".lock")
-                with scaler_lock:
-                    joblib.dump(self.scalers[model_name], scaler_path)
+        """
+        모든 모델을 레지스트리에 새 버전으로 저장
+
+        Returns:
+            model_name -> 새 버전의 model.joblib 경로
+        """
+        registry = self.registry
+        if directory is not None:
+            export_root = _resolve_model_dir(directory) / "registry"
+            if export_root.resolve() != self.registry.root.resolve():
+                registry = ModelRegistry(export_root)
+        exporting = registry is not self.registry
 
+        saved_paths: Dict[str, Path] = {}
+        for model_name in dict.fromkeys([*self.models, *self._pending_loads]):
+            if not exporting and isinstance(self._pending_loads.get(model_name), int):
+                # 로드되지 않은 모델은 이미 자체 레지스트리에 있음 (내보내기는 로드 후 게시)
+                continue
+            self._ensure_loaded(model_name)  # 레거시 .pkl 은 레지스트리로 이전
+            version = registry.publish(model_name, self.models[model_name], scaler=self.scalers.get(model_name))
+            if not exporting:
+                self.loaded_versions[model_name] = version
+            saved_paths[model_name] = registry._version_dir(model_name, version) / ModelRegistry.MODEL_FILE
+
+        target_dir = registry.root.parent
         history_path = target_dir / "training_history.json"
         history_lock = FileLock(str(history_path) + ".lock")
         with history_lock:
             with open(history_path, "w", encoding="utf-8") as f:
                 json.dump(self.training_history, f, indent=2)
 
-        logger.info("Saved %d models to %s", len(self.models), target_dir)
+        logger.info("Saved %d models to %s", len(saved_paths), registry.root)
         return saved_paths
 
-    def load_models(self):
-        """저장된 모델 로드"""
-        loaded = 0
+    def load_models(self, lazy: bool = True) -> int:
+        """
+        저장된 모델 로드
+
+        레지스트리의 활성 버전(없으면 레거시 ``*.pkl``)을 등록만 하고, 실제
+        로드는 첫 ``predict`` 에서 mmap 으로 수행한다 (포레스트는 노드 배열을
+        매핑한 ``MappedForest``). 여러 워커가 같은 버전을 읽기 전용으로
+        매핑하므로 배열 메모리가 워커 수만큼 늘어나지 않는다.
+
+        Args:
+            lazy: False 이면 즉시 로드
+
+        Returns:
+            등록된 모델 수
+        """
+        pending: Dict[str, Any] = {}
         for model_file in self.model_dir.glob("*.pkl"):
             if "_scaler" not in model_file.stem:
-                model_name = model_file.stem
-                self.models[model_name] = joblib.load(model_file)
-
-                # 스케일러 로드
-                scaler_file = self.model_dir / f"{model_name}_scaler.pkl"
-                if scaler_file.exists():
-                    self.scalers[model_name] = joblib.load(scaler_file)
+                pending[model_file.stem] = model_file
+        for model_name in self.registry.model_names():
+            pending[model_name] = self.registry.current_version(model_name)
 
-                loaded += 1
+        with self._load_lock:
+            self._pending_loads.update(pending)
 
         # 훈련 히스토리 로드
         history_path = self.model_dir / "training_history.json"
@@ -347,7 +512,35 @@ class MLTrainingSystem:
             with open(history_path, "r") as f:
                 self.training_history = json.load(f)
 
-        logger.info(f"Loaded {loaded} models from {self.model_dir}")
+        if not lazy:
+            for model_name in pending:
+                self._ensure_loaded(model_name)
+
+        logger.info(f"Registered {len(pending)} models from {self.model_dir} (lazy={lazy})")
+        return len(pending)
+
+    def _ensure_loaded(self, model_name: str) -> None:
+        """대기 중인 모델을 처음 사용할 때 한 번만 로드"""
+        if model_name not in self._pending_loads:
+            return
+        with self._load_lock:
+            source = self._pending_loads.get(model_name)
+            if source is None:
+                return
+            if isinstance(source, Path):
+                # 레거시 단일 파일은 메모리로 로드 (save_models 에서 레지스트리로 이전)
+                self.models[model_name] = joblib.load(source)
+                scaler_file = source.with_name(f"{model_name}_scaler.pkl")
+                if scaler_file.exists():
+                    self.scalers[model_name] = joblib.load(scaler_file)
+            else:
+                model, scaler, manifest = self.registry.load(model_name, source)
+                self.models[model_name] = model
+                if scaler is not None:
+                    self.scalers[model_name] = scaler
+                self.loaded_versions[model_name] = manifest["version"]
+            del self._pending_loads[model_name]
+            logger.info(f"Loaded {model_name} on first use")
 
     def get_model_report(self) -> Dict:
         """모델 상태 보고서"""
@@ -355,11 +548,24 @@ class MLTrainingSystem:
 
         for model_name, model in self.models.items():
             report["models"][model_name] = {
-                "type": model.__class__.__name__,
+                "type": getattr(model, "estimator_type", model.__class__.__name__),
                 "trained": hasattr(model, "n_features_in_"),
                 "features": getattr(model, "n_features_in_", 0),
             }
 
+        # 아직 로드되지 않은 레지스트리 모델은 매니페스트로 보고 (로드 유발 없음)
+        for model_name, source in list(self._pending_loads.items()):
+            if isinstance(source, Path):
+                continue
+            manifest = self.registry.manifest(model_name, source)
+            report["models"][model_name] = {
+                "type": manifest["type"],
+                "trained": manifest["n_features_in"] > 0,
+                "features": manifest["n_features_in"],
+                "version": source,
+                "loaded": False,
+            }
+
         if self.training_history:
             report["last_training"] = self.training_history[-1]
 
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Versioned model registry with memory-mapped loading
+
+Each published version is an immutable directory of uncompressed joblib
+artifacts, so ``joblib.load(..., mmap_mode="r")`` maps their NumPy arrays
+straight from the page cache instead of copying them into every process.
+
+That does not help tree ensembles: sklearn's ``Tree.__setstate__`` copies
+the node arrays into memory owned by each tree. Random forests are
+therefore also written as flat ``.npy`` node arrays and loaded as a
+``MappedForest`` that predicts from the mapped arrays directly. Several
+uvicorn workers loading the same version share one read-only copy.
+
+Layout::
+
+    registry/
+        confidence_predictor/
+            CURRENT                 # active version number
+            v000003/
+                model.joblib        # full estimator (training, export)
+                forest/*.npy        # node arrays of forests (prediction)
+                scaler.joblib
+                manifest.json
+"""
+
+import json
+import logging
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import joblib
+import numpy as np
+from filelock import FileLock
+from sklearn.ensemble import ExtraTreesClassifier, ExtraTreesRegressor, RandomForestClassifier, RandomForestRegressor
+
+logger = logging.getLogger(__name__)
+
+FORESTS = (RandomForestRegressor, RandomForestClassifier, ExtraTreesRegressor, ExtraTreesClassifier)
+TREE_LEAF = -1
+
+
+class MappedForest:
+    """
+    Read-only forest regressor predicting from (memory-mapped) node arrays
+
+    The nodes of all trees are concatenated, with child indices offset to
+    the flat arrays and ``roots`` holding the first node of every tree.
+    Predictions follow sklearn: features are compared as float32 and the
+    tree outputs are averaged.
+    """
+
+    ARRAYS = ("roots", "left", "right", "feature", "threshold", "value", "feature_importances")
+
+    def __init__(self, source: Path, arrays: Dict[str, np.ndarray], estimator_type: str):
+        self.source = Path(source)
+        self.estimator_type = estimator_type
+        self.roots = arrays["roots"]
+        self.left = arrays["left"]
+        self.right = arrays["right"]
+        self.feature = arrays["feature"]
+        self.threshold = arrays["threshold"]
+        self.value = arrays["value"]
+        self.feature_importances_ = arrays["feature_importances"]
+        self.n_features_in_ = len(self.feature_importances_)
+        self.n_outputs_ = self.value.shape[1]
+
+    @staticmethod
+    def supports(model: Any) -> bool:
+        """Fitted single-output forests (multi-output regressors too)"""
+        if not isinstance(model, FORESTS) or not hasattr(model, "estimators_"):
+            return False
+        return isinstance(model, (RandomForestRegressor, ExtraTreesRegressor)) or model.n_outputs_ == 1
+
+    @staticmethod
+    def dump(model: Any, directory: Path) -> None:
+        """Write the node arrays of a fitted forest to ``directory``"""
+        directory.mkdir()
+        trees = [estimator.tree_ for estimator in model.estimators_]
+        roots = np.concatenate(([0], np.cumsum([tree.node_count for tree in trees])[:-1])).astype(np.int64)
+
+        def _children(name: str) -> np.ndarray:
+            parts = []
+            for tree, root in zip(trees, roots):
+                children = getattr(tree, name).astype(np.int64)
+                parts.append(np.where(children == TREE_LEAF, TREE_LEAF, children + root))
+            return np.concatenate(parts)
+
+        arrays = {
+            "roots": roots,
+            "left": _children("children_left"),
+            "right": _children("children_right"),
+            # Leaves have feature -2; they read column 0 and the result is ignored
+            "feature": np.maximum(np.concatenate([tree.feature for tree in trees]), 0).astype(np.int64),
+            "threshold": np.concatenate([tree.threshold for tree in trees]),
+            "value": np.concatenate([tree.value for tree in trees]),
+            "feature_importances": model.feature_importances_,
+        }
+        for name, array in arrays.items():
+            np.save(directory / f"{name}.npy", np.ascontiguousarray(array))
+        if hasattr(model, "classes_"):
+            np.save(directory / "classes.npy", model.classes_)
+
+    @classmethod
+    def load(cls, version_dir: Path, estimator_type: str, mmap_mode: Optional[str]) -> "MappedForest":
+        """Map the node arrays that ``dump`` wrote into a version directory"""
+        directory = version_dir / ModelRegistry.FOREST_DIR
+        arrays = {name: np.load(directory / f"{name}.npy", mmap_mode=mmap_mode) for name in cls.ARRAYS}
+        classes_file = directory / "classes.npy"
+        if classes_file.exists():
+            return MappedForestClassifier(version_dir, arrays, estimator_type, np.load(classes_file, allow_pickle=True))
+        return cls(version_dir, arrays, estimator_type)
+
+    def to_estimator(self) -> Any:
+        """Load the full sklearn estimator of the same version (e.g. to train it further)"""
+        return joblib.load(self.source / ModelRegistry.MODEL_FILE)
+
+    def _leaf_values(self, X: Any) -> np.ndarray:
+        """Leaf values per (sample, tree): shape (n_samples, n_trees, n_outputs, n_values)"""
+        X = np.asarray(X, dtype=np.float32)
+        rows = np.arange(X.shape[0])[:, None]
+        nodes = np.broadcast_to(self.roots, (X.shape[0], len(self.roots)))
+        while True:
+            left = self.left[nodes]
+            internal = left != TREE_LEAF
+            if not internal.any():
+                return self.value[nodes]
+            go_left = X[rows, self.feature[nodes]] <= self.threshold[nodes]
+            nodes = np.where(internal, np.where(go_left, left, self.right[nodes]), nodes)
+
+    def predict(self, X: Any) -> np.ndarray:
+        predictions = self._leaf_values(X)[..., 0].mean(axis=1)
+        return predictions.ravel() if self.n_outputs_ == 1 else predictions
+
+
+class MappedForestClassifier(MappedForest):
+    """Read-only single-output forest classifier (soft voting, like sklearn)"""
+
+    def __init__(self, source: Path, arrays: Dict[str, np.ndarray], estimator_type: str, classes: np.ndarray):
+        super().__init__(source, arrays, estimator_type)
+        self.classes_ = classes
+
+    def predict_proba(self, X: Any) -> np.ndarray:
+        proba = self._leaf_values(X)[:, :, 0, :]
+        normalizer = proba.sum(axis=2, keepdims=True)
+        normalizer[normalizer == 0.0] = 1.0
+        return (proba / normalizer).mean(axis=1)
+
+    def predict(self, X: Any) -> np.ndarray:
+        return self.classes_.take(np.argmax(self.predict_proba(X), axis=1), axis=0)
+
+
+class ModelRegistry:
+    """Immutable, versioned joblib artifacts per model name"""
+
+    MODEL_FILE = "model.joblib"
+    SCALER_FILE = "scaler.joblib"
+    FOREST_DIR = "forest"
+    MANIFEST_FILE = "manifest.json"
+    CURRENT_FILE = "CURRENT"
+
+    def __init__(self, root: Path, keep_versions: int = 5, mmap_mode: Optional[str] = "r"):
+        self.root = Path(root)
+        self.keep_versions = keep_versions
+        self.mmap_mode = mmap_mode
+
+    # ------------------------------------------------------------------
+    # Paths
+    # ------------------------------------------------------------------
+
+    def _model_dir(self, model_name: str) -> Path:
+        return self.root / model_name
+
+    def _version_dir(self, model_name: str, version: int) -> Path:
+        return self._model_dir(model_name) / f"v{version:06d}"
+
+    def _lock(self, model_name: str) -> FileLock:
+        return FileLock(str(self.root / f"{model_name}.lock"))
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def model_names(self) -> List[str]:
+        """Models with an active version"""
+        if not self.root.exists():
+            return []
+        return sorted(path.name for path in self.root.iterdir() if (path / self.CURRENT_FILE).exists())
+
+    def versions(self, model_name: str) -> List[int]:
+        """Published versions, oldest first"""
+        model_dir = self._model_dir(model_name)
+        if not model_dir.exists():
+            return []
+        numbers = [path.name[1:] for path in model_dir.glob("v*") if path.is_dir()]
+        return sorted(int(number) for number in numbers if number.isdigit())
+
+    def current_version(self, model_name: str) -> Optional[int]:
+        """Active version, or None if nothing has been published"""
+        current = self._model_dir(model_name) / self.CURRENT_FILE
+        try:
+            return int(current.read_text(encoding="utf-8").strip())
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def manifest(self, model_name: str, version: Optional[int] = None) -> Dict[str, Any]:
+        """Manifest of a version (default: the active one)"""
+        version = version if version is not None else self.current_version(model_name)
+        if version is None:
+            raise KeyError(f"No published version of {model_name}")
+        with open(self._version_dir(model_name, version) / self.MANIFEST_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    # ------------------------------------------------------------------
+    # Publish / load
+    # ------------------------------------------------------------------
+
+    def publish(
+        self,
+        model_name: str,
+        model: Any,
+        scaler: Any = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """
+        Write a new version and make it active
+
+        Artifacts are written to a temporary directory and renamed into
+        place, so readers never observe a partially written version.
+
+        Returns:
+            The new version number
+        """
+        if isinstance(model, MappedForest):
+            model = model.to_estimator()
+        self._model_dir(model_name).mkdir(parents=True, exist_ok=True)
+        with self._lock(model_name):
+            existing = self.versions(model_name)
+            version = existing[-1] + 1 if existing else 1
+            final_dir = self._version_dir(model_name, version)
+            tmp_dir = final_dir.with_name(final_dir.name + ".tmp")
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            tmp_dir.mkdir()
+
+            # compress=0 keeps arrays in the mmap-compatible raw layout
+            joblib.dump(model, tmp_dir / self.MODEL_FILE, compress=0)
+            mapped_forest = MappedForest.supports(model)
+            if mapped_forest:
+                MappedForest.dump(model, tmp_dir / self.FOREST_DIR)
+            if scaler is not None:
+                joblib.dump(scaler, tmp_dir / self.SCALER_FILE, compress=0)
+
+            manifest = {
+                "model": model_name,
+                "version": version,
+                "type": model.__class__.__name__,
+                "n_features_in": int(getattr(model, "n_features_in_", 0)),
+                "has_scaler": scaler is not None,
+                "mapped_forest": mapped_forest,
+                "created_at": datetime.now().isoformat(),
+                "metadata": metadata or {},
+            }
+            with open(tmp_dir / self.MANIFEST_FILE, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=2)
+
+            os.replace(tmp_dir, final_dir)
+            self._set_current(model_name, version)
+            self._prune(model_name)
+
+        logger.info("Published %s v%d", model_name, version)
+        return version
+
+    def _set_current(self, model_name: str, version: int) -> None:
+        current = self._model_dir(model_name) / self.CURRENT_FILE
+        tmp_path = current.with_suffix(".tmp")
+        tmp_path.write_text(str(version), encoding="utf-8")
+        os.replace(tmp_path, current)
+
+    def _prune(self, model_name: str) -> None:
+        """Drop the oldest versions beyond ``keep_versions`` (never the active one)"""
+        current = self.current_version(model_name)
+        stale = [v for v in self.versions(model_name) if v != current]
+        for version in stale[: max(0, len(stale) - (self.keep_versions - 1))]:
+            shutil.rmtree(self._version_dir(model_name, version), ignore_errors=True)
+
+    def activate(self, model_name: str, version: int) -> None:
+        """Point the active version at an existing one (e.g. rollback)"""
+        if version not in self.versions(model_name):
+            raise KeyError(f"{model_name} has no version {version}")
+        with self._lock(model_name):
+            self._set_current(model_name, version)
+
+    def load(self, model_name: str, version: Optional[int] = None) -> Tuple[Any, Any, Dict[str, Any]]:
+        """
+        Load (model, scaler, manifest) with arrays memory-mapped read-only
+
+        Forests are returned as a ``MappedForest`` over the mapped node
+        arrays (``to_estimator()`` loads the full sklearn model).
+
+        Args:
+            model_name: Registered model name
+            version: Version to load (default: the active one)
+        """
+        manifest = self.manifest(model_name, version)
+        version_dir = self._version_dir(model_name, manifest["version"])
+        if manifest.get("mapped_forest") and self.mmap_mode:
+            model = MappedForest.load(version_dir, manifest["type"], self.mmap_mode)
+        else:
+            model = joblib.load(version_dir / self.MODEL_FILE, mmap_mode=self.mmap_mode)
+        scaler = None
+        if manifest.get("has_scaler"):
+            scaler = joblib.load(version_dir / self.SCALER_FILE, mmap_mode=self.mmap_mode)
+        return model, scaler, manifest
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Append-only observation log with snapshot compaction
+
+Records are appended as JSON lines to numbered segment files next to a JSON
+snapshot. Segments rotate once they reach ``segment_max_bytes``; when
+``max_segments`` sealed segments accumulate they are folded into the
+snapshot and deleted. Appends therefore cost one short write, and loading
+reads one snapshot plus at most ``max_segments`` segments regardless of how
+much history has been recorded.
+
+Layout for snapshot ``uncertainty_history_demo.json``::
+
+    uncertainty_history_demo.json            # snapshot (state + "log_segment")
+    uncertainty_history_demo.000007.jsonl    # sealed segment
+    uncertainty_history_demo.000008.jsonl    # active segment
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from filelock import FileLock
+
+logger = logging.getLogger(__name__)
+
+# fold(state, record) applies one record to the snapshot state in place
+FoldFn = Callable[[Dict[str, Any], Dict[str, Any]], None]
+
+
+class ObservationLog:
+    """Segment-rotated JSONL log folded into a JSON snapshot"""
+
+    SNAPSHOT_SEGMENT_KEY = "log_segment"
+
+    def __init__(
+        self,
+        snapshot_path: Path,
+        fold: FoldFn,
+        segment_max_bytes: int = 1024 * 1024,
+        max_segments: int = 8,
+    ):
+        self.snapshot_path = Path(snapshot_path)
+        self.fold = fold
+        self.segment_max_bytes = segment_max_bytes
+        self.max_segments = max_segments
+        self.lock = FileLock(str(self.snapshot_path) + ".lock")
+        # Stale segments are cleared before this instance's first append
+        self._stale_checked = False
+
+    # ------------------------------------------------------------------
+    # Segment bookkeeping
+    # ------------------------------------------------------------------
+
+    def _segment_path(self, number: int) -> Path:
+        return self.snapshot_path.with_name(f"{self.snapshot_path.stem}.{number:06d}.jsonl")
+
+    def _segments(self) -> List[Tuple[int, Path]]:
+        """Existing segments ordered by number"""
+        prefix = self.snapshot_path.stem + "."
+        segments = []
+        if not self.snapshot_path.parent.exists():
+            return segments
+        for path in self.snapshot_path.parent.glob(f"{self.snapshot_path.stem}.*.jsonl"):
+            number = path.name[len(prefix) : -len(".jsonl")]
+            if number.isdigit():
+                segments.append((int(number), path))
+        return sorted(segments)
+
+    def _read_snapshot(self) -> Dict[str, Any]:
+        if not self.snapshot_path.exists():
+            return {}
+        with open(self.snapshot_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    @staticmethod
+    def _read_segment(path: Path) -> Iterator[Dict[str, Any]]:
+        with open(path, "r", encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn final line from a crash mid-append; later lines are still valid
+                    logger.warning("Skipping corrupt record %s:%d", path.name, line_no)
+
+    def _load_unlocked(self) -> Tuple[Dict[str, Any], int, List[Tuple[int, Path]]]:
+        """Return (state, last folded segment number, segments applied on top)"""
+        state = self._read_snapshot()
+        folded = state.pop(self.SNAPSHOT_SEGMENT_KEY, 0)
+        # Segments numbered <= folded were left by a compaction interrupted after the
+        # snapshot was written; they are skipped here and deleted by writers
+        pending = [(number, path) for number, path in self._segments() if number > folded]
+        for _, path in pending:
+            for record in self._read_segment(path):
+                self.fold(state, record)
+        return state, folded, pending
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def load(self) -> Dict[str, Any]:
+        """Snapshot state with all unfolded segments applied (read-only)"""
+        with self.lock:
+            state, _, _ = self._load_unlocked()
+        return state
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Append one record (O(1); compacts when too many segments are sealed)"""
+        self.append_many([record])
+
+    def append_many(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Append records to the active segment in one write"""
+        payload = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+        if not payload:
+            return
+
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.lock:
+            if not self._stale_checked:
+                # Never append to a segment the snapshot already covers
+                self._delete_folded_segments(self._read_snapshot().get(self.SNAPSHOT_SEGMENT_KEY, 0))
+                self._stale_checked = True
+
+            segments = self._segments()
+            if segments:
+                number, path = segments[-1]
+            else:
+                number = self._read_snapshot().get(self.SNAPSHOT_SEGMENT_KEY, 0) + 1
+                path = self._segment_path(number)
+
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(payload)
+                size = f.tell()
+
+            if size >= self.segment_max_bytes:
+                # Rotate: the next append goes to the following (empty) segment
+                self._segment_path(number + 1).touch()
+                sealed = len(self._segments()) - 1
+                if sealed >= self.max_segments:
+                    self._compact_unlocked()
+
+    def compact(self, extra: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Fold every segment into the snapshot and delete the folded segments
+
+        Args:
+            extra: Top-level fields to store in the snapshot alongside the
+                folded state (e.g. metadata that is not journaled)
+
+        Returns:
+            The snapshot state
+        """
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.lock:
+            return self._compact_unlocked(extra)
+
+    def _compact_unlocked(self, extra: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        state, folded, pending = self._load_unlocked()
+        if extra:
+            state.update(extra)
+        if pending:
+            folded = pending[-1][0]
+
+        snapshot = dict(state)
+        snapshot[self.SNAPSHOT_SEGMENT_KEY] = folded
+        tmp_path = self.snapshot_path.with_suffix(self.snapshot_path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.snapshot_path)
+        self._delete_folded_segments(folded)
+
+        return state
+
+    def _delete_folded_segments(self, folded: int) -> None:
+        """Delete segments the snapshot already covers (caller holds the lock)"""
+        for number, path in self._segments():
+            if number <= folded:
+                path.unlink(missing_ok=True)
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Persistent, content-addressed cache for AI responses
+
+Entries are keyed by a SHA-256 of (provider, role, normalized prompt,
+context digest), so iterative collaboration patterns and re-runs of the
+same task reuse earlier answers instead of spending latency and quota on
+identical calls. Entries live in a single SQLite file shared by every
+process using the same storage directory; each has a TTL, and the oldest
+entries (by last access) are evicted once the entry or byte budget is
+exceeded.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _default_cache_path() -> Path:
+    env_dir = os.environ.get("UDO_STORAGE_DIR") or os.environ.get("UDO_HOME")
+    base_dir = Path(env_dir).expanduser() if env_dir else Path.home() / ".udo"
+    return base_dir / "ai_response_cache.sqlite3"
+
+
+def context_digest(context: Any) -> str:
+    """Stable digest of a JSON-like context (key order independent)"""
+    payload = json.dumps(context, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def make_cache_key(provider: str, role: str, prompt: str, context: Any = None) -> str:
+    """Content address of an AI call; whitespace-only prompt differences share a key"""
+    normalized_prompt = " ".join(prompt.split())
+    payload = json.dumps([provider, role, normalized_prompt, context_digest(context)], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """SQLite-backed response cache with TTL and LRU eviction"""
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            provider TEXT NOT NULL,
+            value TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            created_at REAL NOT NULL,
+            expires_at REAL NOT NULL,
+            last_access REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses (last_access);
+        CREATE INDEX IF NOT EXISTS idx_responses_expires_at ON responses (expires_at);
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        ttl_seconds: float = 24 * 3600,
+        max_entries: int = 5000,
+        max_bytes: int = 64 * 1024 * 1024,
+    ):
+        """
+        Args:
+            path: SQLite file (default: ``ai_response_cache.sqlite3`` in the UDO storage dir)
+            ttl_seconds: Default lifetime of an entry
+            max_entries: Entry budget; least recently used entries are evicted beyond it
+            max_bytes: Budget for the summed size of cached values
+        """
+        self.path = Path(path) if path is not None else _default_cache_path()
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._stats_lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "expired": 0, "evicted": 0}
+        self._provider_stats: Dict[str, Dict[str, int]] = {}
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(self._SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        # One short-lived connection per call keeps the cache safe to share across threads
+        return sqlite3.connect(str(self.path), timeout=5.0, isolation_level=None)
+
+    def _count(self, provider: str, event: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[event] += amount
+            if event in ("hits", "misses"):
+                counts = self._provider_stats.setdefault(provider, {"hits": 0, "misses": 0})
+                counts[event] += amount
+
+    # ------------------------------------------------------------------
+    # Lookup / store
+    # ------------------------------------------------------------------
+
+    def get(self, key: str, provider: str = "") -> Optional[Dict[str, Any]]:
+        """Cached value for ``key``, or None on a miss or an expired entry"""
+        now = time.time()
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute("SELECT value, expires_at FROM responses WHERE key = ?", (key,)).fetchone()
+                if row is not None and row[1] <= now:
+                    conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self._count(provider, "expired")
+                    row = None
+                if row is None:
+                    self._count(provider, "misses")
+                    return None
+                conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache lookup failed: {e}")
+            self._count(provider, "misses")
+            return None
+
+        self._count(provider, "hits")
+        return json.loads(row[0])
+
+    def put(self, key: str, value: Dict[str, Any], provider: str = "", ttl_seconds: Optional[float] = None) -> None:
+        """Store ``value`` (JSON-serializable) and evict beyond the budgets"""
+        payload = json.dumps(value, ensure_ascii=False, default=str)
+        now = time.time()
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        try:
+            with closing(self._connect()) as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, provider, value, size, created_at, expires_at, last_access) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, provider, payload, len(payload.encode("utf-8")), now, now + ttl, now),
+                )
+                self._count(provider, "stores")
+                self._evict(conn, now)
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache store failed: {e}")
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        """Drop expired entries, then the least recently used ones beyond the budgets"""
+        expired = conn.execute("DELETE FROM responses WHERE expires_at <= ?", (now,)).rowcount
+        count, total = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        evicted = 0
+        if count > self.max_entries or total > self.max_bytes:
+            evicted = conn.execute(
+                """
+                DELETE FROM responses WHERE key IN (
+                    SELECT key FROM (
+                        SELECT key,
+                               ROW_NUMBER() OVER (ORDER BY last_access DESC) AS position,
+                               SUM(size) OVER (ORDER BY last_access DESC ROWS UNBOUNDED PRECEDING) AS kept_bytes
+                        FROM responses
+                    )
+                    WHERE position > ? OR kept_bytes > ?
+                )
+                """,
+                (self.max_entries, self.max_bytes),
+            ).rowcount
+        if expired:
+            self._count("", "expired", expired)
+        if evicted:
+            self._count("", "evicted", evicted)
+
+    def clear(self) -> None:
+        """Delete every entry (statistics are kept)"""
+        with closing(self._connect()) as conn:
+            conn.execute("DELETE FROM responses")
+
+    # ------------------------------------------------------------------
+    # Statistics
+    # ------------------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this process plus the current size of the cache"""
+        with self._stats_lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            by_provider = {
+                provider: {**counts, "hit_rate": counts["hits"] / max(1, counts["hits"] + counts["misses"])}
+                for provider, counts in self._provider_stats.items()
+            }
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        stats["by_provider"] = by_provider
+        try:
+            with closing(self._connect()) as conn:
+                entries, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        except sqlite3.Error:
+            entries, size = None, None
+        stats.update({"entries": entries, "bytes": size, "max_entries": self.max_entries, "max_bytes": self.max_bytes})
+        return stats
@@ -19,13 +19,19 @@ Expected Impact:
 - Automation Rate: 85% -> 92% (+7%)
 """
 
+import bisect
 import json
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+try:
+    from src.observation_log import ObservationLog
+except ImportError:
+    from observation_log import ObservationLog
 
 logger = logging.getLogger(__name__)
 
@@ -172,6 +178,28 @@ class GroupRelativeScorer:
         max_time = max((p.resolution_time_minutes for p in all_patterns), default=1)
         max_recurrence = max((p.recurrence_count for p in all_patterns), default=1)
 
+        return self.score_with_bounds(pattern, max_time, max_recurrence)
+
+    def score_with_bounds(
+        self,
+        pattern: KnowledgePattern,
+        max_time: int,
+        max_recurrence: int,
+    ) -> float:
+        """
+        Score a pattern against precomputed group maxima.
+
+        Lets callers that track the group's maxima incrementally score one
+        pattern without rescanning the whole group.
+
+        Args:
+            pattern: The pattern to score
+            max_time: Largest resolution_time_minutes in the group
+            max_recurrence: Largest recurrence_count in the group
+
+        Returns:
+            Group Relative Score between 0.0 and 1.0
+        """
         # Avoid division by zero
         max_time = max(max_time, 1)
         max_recurrence = max(max_recurrence, 1)
@@ -238,12 +266,42 @@ class GroupRelativeScorer:
 # =============================================================================
 
 
+def _trigrams(text: str) -> Set[str]:
+    """Character trigrams of a lowercased string."""
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+@dataclass
+class _DomainIndex:
+    """
+    Lookup structures for one domain.
+
+    ranking holds (-score, registration_order, pattern_id) in ascending
+    order, i.e. best first with ties in registration order - the same order
+    score_all_patterns produces with its stable descending sort.
+    """
+
+    patterns: List[KnowledgePattern] = field(default_factory=list)
+    by_id: Dict[str, KnowledgePattern] = field(default_factory=dict)
+    order: Dict[str, int] = field(default_factory=dict)
+    search_text: Dict[str, Tuple[str, str]] = field(default_factory=dict)  # id -> (name, description) lowered
+    trigrams: Dict[str, Set[str]] = field(default_factory=dict)  # trigram -> pattern ids
+    max_time: int = 1
+    max_recurrence: int = 1
+    ranking: List[Tuple[float, int, str]] = field(default_factory=list)
+    rank_keys: Dict[str, Tuple[float, int, str]] = field(default_factory=dict)
+
+
 class PolicyOptimizer:
     """
     Optimizes solution selection policy based on Group Relative Scores.
 
     Implements the policy update rule:
         policy(problem) = argmax_solution [TokenPrior(s) * GroupRelative(s)]
+
+    Patterns are indexed by id and, per domain, by keyword trigrams. Each
+    domain keeps a ranking that is updated only for the affected pattern,
+    unless a new group maximum changes every pattern's score.
     """
 
     def __init__(self, scorer: Optional[GroupRelativeScorer] = None):
@@ -255,6 +313,10 @@ class PolicyOptimizer:
         """
         self.scorer = scorer or GroupRelativeScorer()
         self._pattern_store: Dict[str, List[KnowledgePattern]] = {}  # domain -> patterns
+        # pattern_id -> pattern; an id registered in several domains resolves to the
+        # earliest domain (the first match when scanning _pattern_store in order)
+        self._pattern_index: Dict[str, KnowledgePattern] = {}
+        self._domain_index: Dict[str, _DomainIndex] = {}
         self._policy_cache: Dict[str, str] = {}  # problem_hash -> best_pattern_id
 
     def register_pattern(self, pattern: KnowledgePattern) -> None:
@@ -264,18 +326,120 @@ class PolicyOptimizer:
         Args:
             pattern: Pattern to register
         """
-        if pattern.domain not in self._pattern_store:
-            self._pattern_store[pattern.domain] = []
+        index = self._domain_index.get(pattern.domain)
+        if index is None:
+            index = _DomainIndex()
+            self._domain_index[pattern.domain] = index
+            self._pattern_store[pattern.domain] = index.patterns
 
         # Check for duplicates
-        existing_ids = {p.id for p in self._pattern_store[pattern.domain]}
-        if pattern.id not in existing_ids:
-            self._pattern_store[pattern.domain].append(pattern)
+        if pattern.id not in index.by_id:
+            index.order[pattern.id] = len(index.patterns)
+            index.patterns.append(pattern)
+            index.by_id[pattern.id] = pattern
+            existing = self._pattern_index.get(pattern.id)
+            if existing is None or self._domain_precedes(pattern.domain, existing.domain):
+                self._pattern_index[pattern.id] = pattern
+
+            name, description = pattern.name.lower(), pattern.description.lower()
+            index.search_text[pattern.id] = (name, description)
+            for trigram in _trigrams(name) | _trigrams(description):
+                index.trigrams.setdefault(trigram, set()).add(pattern.id)
+
+            if pattern.resolution_time_minutes > index.max_time or pattern.recurrence_count > index.max_recurrence:
+                index.max_time = max(index.max_time, pattern.resolution_time_minutes)
+                index.max_recurrence = max(index.max_recurrence, pattern.recurrence_count)
+                self._rebuild_ranking(index)
+            else:
+                self._rank(index, pattern)
+
             logger.info(f"Registered pattern: {pattern.name} in domain {pattern.domain}")
 
         # Invalidate policy cache for this domain
         self._invalidate_domain_cache(pattern.domain)
 
+    def _domain_precedes(self, domain: str, other: str) -> bool:
+        """Whether ``domain`` was created before ``other``."""
+        domains = list(self._domain_index)
+        return domains.index(domain) < domains.index(other)
+
+    def get_pattern(self, pattern_id: str) -> Optional[KnowledgePattern]:
+        """Look up a pattern by id (earliest domain wins for duplicated ids)."""
+        return self._pattern_index.get(pattern_id)
+
+    def _rank(self, index: _DomainIndex, pattern: KnowledgePattern) -> None:
+        """(Re)score one pattern and move it to its ranking position."""
+        old_key = index.rank_keys.get(pattern.id)
+        if old_key is not None:
+            del index.ranking[bisect.bisect_left(index.ranking, old_key)]
+
+        score = self.scorer.score_with_bounds(pattern, index.max_time, index.max_recurrence)
+        key = (-score, index.order[pattern.id], pattern.id)
+        bisect.insort(index.ranking, key)
+        index.rank_keys[pattern.id] = key
+
+    def _rebuild_ranking(self, index: _DomainIndex) -> None:
+        """Rescore every pattern of a domain (group maxima changed)."""
+        index.rank_keys = {
+            p.id: (-self.scorer.score_with_bounds(p, index.max_time, index.max_recurrence), index.order[p.id], p.id)
+            for p in index.patterns
+        }
+        index.ranking = sorted(index.rank_keys.values())
+
+    def rescore_domain(self, domain: str) -> None:
+        """
+        Recompute maxima and ranking for a domain.
+
+        Only needed after pattern fields were changed directly instead of
+        through update_pattern_stats.
+        """
+        index = self._domain_index.get(domain)
+        if index is None:
+            return
+        index.max_time = max((p.resolution_time_minutes for p in index.patterns), default=1)
+        index.max_recurrence = max((p.recurrence_count for p in index.patterns), default=1)
+        self._rebuild_ranking(index)
+        self._invalidate_domain_cache(domain)
+
+    def match_keywords(
+        self,
+        domain: str,
+        keywords: List[str],
+        include_description: bool = True,
+    ) -> Set[str]:
+        """
+        Ids of domain patterns whose name (or description) contains any keyword.
+
+        Keywords of three or more characters are narrowed through the trigram
+        index and then verified; shorter ones fall back to a domain scan.
+        Matching is case-insensitive substring matching.
+        """
+        index = self._domain_index.get(domain)
+        if index is None:
+            return set()
+
+        matched: Set[str] = set()
+        for keyword in keywords:
+            keyword = keyword.lower()
+            if len(keyword) < 3:
+                candidates = index.by_id.keys()
+            else:
+                postings = sorted((index.trigrams.get(t, set()) for t in _trigrams(keyword)), key=len)
+                candidates = set.intersection(*postings) if postings[0] else set()
+            for pattern_id in candidates:
+                name, description = index.search_text[pattern_id]
+                if keyword in name or (include_description and keyword in description):
+                    matched.add(pattern_id)
+        return matched
+
+    def iter_ranked(self, problem_domain: str) -> Iterator[Tuple[KnowledgePattern, float]]:
+        """Yield (pattern, score) best first from the cached ranking."""
+        index = self._domain_index.get(problem_domain)
+        if index is None:
+            return
+        for neg_score, _, pattern_id in index.ranking:
+            yield index.by_id[pattern_id], -neg_score
+
     def get_best_solution(
         self,
         problem_domain: str,
@@ -291,52 +455,50 @@ class PolicyOptimizer:
         Returns:
             Tuple of (best_pattern, score) or None if no patterns found
         """
-        patterns = self._pattern_store.get(problem_domain, [])
+        index = self._domain_index.get(problem_domain)
 
-        if not patterns:
+        if index is None or not index.patterns:
             logger.info(f"No patterns found for domain: {problem_domain}")
             return None
 
-        # Filter by keywords if provided
         if problem_keywords:
-            patterns = [
-                p
-                for p in patterns
-                if any(kw.lower() in p.name.lower() or kw.lower() in p.description.lower() for kw in problem_keywords)
-            ]
-
-        if not patterns:
-            logger.info(f"No patterns match keywords: {problem_keywords}")
-            return None
-
-        # Score and select best
-        scored = self.scorer.score_all_patterns(patterns)
-
-        if scored:
-            best_pattern, best_score = scored[0]
-            logger.info(f"[POLICY] Selected: {best_pattern.name} (score: {best_score:.2f})")
-            if len(scored) > 1:
-                alternatives = [(p.name, s) for p, s in scored[1:3]]
-                logger.info(f"[POLICY] Alternatives: {alternatives}")
-            return best_pattern, best_score
+            # Keyword-filtered patterns are scored relative to each other
+            matched = self.match_keywords(problem_domain, problem_keywords)
+            if not matched:
+                logger.info(f"No patterns match keywords: {problem_keywords}")
+                return None
+            patterns = sorted((index.by_id[pattern_id] for pattern_id in matched), key=lambda p: index.order[p.id])
+            scored = self.scorer.score_all_patterns(patterns)
+        else:
+            scored = self.get_all_solutions_ranked(problem_domain, limit=3)
 
-        return None
+        best_pattern, best_score = scored[0]
+        logger.info(f"[POLICY] Selected: {best_pattern.name} (score: {best_score:.2f})")
+        if len(scored) > 1:
+            alternatives = [(p.name, s) for p, s in scored[1:3]]
+            logger.info(f"[POLICY] Alternatives: {alternatives}")
+        return best_pattern, best_score
 
     def get_all_solutions_ranked(
         self,
         problem_domain: str,
+        limit: Optional[int] = None,
     ) -> List[Tuple[KnowledgePattern, float]]:
         """
         Get all solutions for a domain, ranked by Group Relative Score.
 
         Args:
             problem_domain: Domain to search
+            limit: Return only the top ``limit`` solutions
 
         Returns:
             List of (pattern, score) tuples, sorted by score descending
         """
-        patterns = self._pattern_store.get(problem_domain, [])
-        return self.scorer.score_all_patterns(patterns)
+        index = self._domain_index.get(problem_domain)
+        if index is None:
+            return []
+        ranking = index.ranking if limit is None else index.ranking[:limit]
+        return [(index.by_id[pattern_id], -neg_score) for neg_score, _, pattern_id in ranking]
 
     def update_pattern_stats(
         self,
@@ -348,40 +510,49 @@ class PolicyOptimizer:
         """
         Update pattern statistics after application.
 
+        An id registered in several domains resolves to the pattern in the
+        earliest-created domain, as a scan of the pattern store would.
+
         Args:
             pattern_id: ID of the pattern that was applied
             success: Whether the application was successful
             actual_time_minutes: Actual resolution time (updates average)
             had_side_effects: Whether side effects occurred
         """
-        for domain_patterns in self._pattern_store.values():
-            for pattern in domain_patterns:
-                if pattern.id == pattern_id:
-                    pattern.times_applied += 1
-
-                    if success:
-                        pattern.success_count += 1
-                        # Successful application means problem is solved
-                        # Don't increment recurrence
-                    else:
-                        pattern.failure_count += 1
-                        # Failed application means problem recurred
-                        pattern.recurrence_count += 1
-
-                    if had_side_effects:
-                        # Escalate side effect severity
-                        current = pattern.side_effects.value
-                        if current < 3:
-                            pattern.side_effects = SideEffectLevel(current + 1)
-
-                    logger.info(
-                        f"Updated pattern {pattern.name}: "
-                        f"applied={pattern.times_applied}, "
-                        f"success_rate={pattern.success_rate:.1%}"
-                    )
-                    return
+        pattern = self._pattern_index.get(pattern_id)
+        if pattern is None:
+            logger.warning(f"Pattern not found: {pattern_id}")
+            return
 
-        logger.warning(f"Pattern not found: {pattern_id}")
+        pattern.times_applied += 1
+
+        if success:
+            pattern.success_count += 1
+            # Successful application means problem is solved
+            # Don't increment recurrence
+        else:
+            pattern.failure_count += 1
+            # Failed application means problem recurred
+            pattern.recurrence_count += 1
+
+        if had_side_effects:
+            # Escalate side effect severity
+            current = pattern.side_effects.value
+            if current < 3:
+                pattern.side_effects = SideEffectLevel(current + 1)
+
+        # Re-rank only this pattern unless it raised the domain's recurrence maximum
+        index = self._domain_index[pattern.domain]
+        if pattern.recurrence_count > index.max_recurrence:
+            index.max_recurrence = pattern.recurrence_count
+            self._rebuild_ranking(index)
+        else:
+            self._rank(index, pattern)
+        self._invalidate_domain_cache(pattern.domain)
+
+        logger.info(
+            f"Updated pattern {pattern.name}: applied={pattern.times_applied}, success_rate={pattern.success_rate:.1%}"
+        )
 
     def _invalidate_domain_cache(self, domain: str) -> None:
         """Invalidate policy cache entries for a domain."""
@@ -404,7 +575,7 @@ class PolicyOptimizer:
         if not patterns:
             return {"domain": domain, "patterns": 0}
 
-        scored = self.scorer.score_all_patterns(patterns)
+        scored = self.get_all_solutions_ranked(domain)
 
         return {
             "domain": domain,
@@ -430,6 +601,10 @@ class MultiRolloutTracker:
     1. Recording all attempts (not just the winning one)
     2. Building Token Prior from failed approaches
     3. Enabling "skip known failures" in future
+
+    Experiment starts and attempts are appended as events to a JSONL journal
+    next to ``storage_path``; the journal is periodically folded into the
+    ``storage_path`` snapshot, which keeps the original JSON layout.
     """
 
     def __init__(self, storage_path: Optional[Path] = None):
@@ -441,6 +616,7 @@ class MultiRolloutTracker:
         """
         self.storage_path = storage_path or Path(".udo/experiments.json")
         self.experiments: Dict[str, MultiRolloutExperiment] = {}
+        self.journal = ObservationLog(self.storage_path, self._fold_event)
         self._load_experiments()
 
     def start_experiment(
@@ -466,6 +642,15 @@ class MultiRolloutTracker:
             domain=domain,
         )
         self.experiments[problem_id] = experiment
+        self._append_event(
+            {
+                "event": "start",
+                "problem_id": problem_id,
+                "problem_description": problem_description,
+                "domain": domain,
+                "created_at": experiment.created_at.isoformat(),
+            }
+        )
         logger.info(f"Started experiment: {problem_id}")
         return experiment
 
@@ -507,7 +692,7 @@ class MultiRolloutTracker:
 
         logger.info(f"Recorded attempt: {approach} -> {result}" f"{f' ({reason})' if reason else ''}")
 
-        self._save_experiments()
+        self._append_event({"event": "attempt", "problem_id": problem_id, **self._attempt_record(attempt)})
 
     def get_failed_approaches(self, problem_id: str) -> List[str]:
         """
@@ -565,54 +750,88 @@ class MultiRolloutTracker:
             "attempts": [{"approach": a.approach, "result": a.result, "reason": a.reason} for a in exp.attempts],
         }
 
-    def _load_experiments(self) -> None:
-        """Load experiments from storage."""
-        if self.storage_path.exists():
-            try:
-                with open(self.storage_path) as f:
-                    data = json.load(f)
-                    # Deserialize experiments
-                    for pid, exp_data in data.items():
-                        attempts = [ExperimentAttempt(**a) for a in exp_data.get("attempts", [])]
-                        self.experiments[pid] = MultiRolloutExperiment(
-                            problem_id=exp_data["problem_id"],
-                            problem_description=exp_data["problem_description"],
-                            domain=exp_data["domain"],
-                            attempts=attempts,
-                            winning_approach=exp_data.get("winning_approach"),
-                            total_time_minutes=exp_data.get("total_time_minutes", 0),
-                        )
-                logger.info(f"Loaded {len(self.experiments)} experiments")
-            except Exception as e:
-                logger.warning(f"Failed to load experiments: {e}")
+    @staticmethod
+    def _attempt_record(attempt: ExperimentAttempt) -> Dict[str, Any]:
+        return {
+            "approach": attempt.approach,
+            "result": attempt.result,
+            "reason": attempt.reason,
+            "time_minutes": attempt.time_minutes,
+            "timestamp": attempt.timestamp.isoformat(),
+        }
 
-    def _save_experiments(self) -> None:
-        """Save experiments to storage."""
-        self.storage_path.parent.mkdir(parents=True, exist_ok=True)
+    @staticmethod
+    def _fold_event(state: Dict[str, Any], event: Dict[str, Any]) -> None:
+        """Apply one journal event to the snapshot state (problem_id -> experiment dict)."""
+        problem_id = event["problem_id"]
+        if event["event"] == "start":
+            state[problem_id] = {
+                "problem_id": problem_id,
+                "problem_description": event["problem_description"],
+                "domain": event["domain"],
+                "winning_approach": None,
+                "total_time_minutes": 0,
+                "created_at": event.get("created_at"),
+                "attempts": [],
+            }
+        elif event["event"] == "attempt" and problem_id in state:
+            experiment = state[problem_id]
+            attempt = {k: v for k, v in event.items() if k not in ("event", "problem_id")}
+            experiment["attempts"].append(attempt)
+            experiment["total_time_minutes"] += attempt.get("time_minutes", 0)
+            if attempt["result"] == "success":
+                experiment["winning_approach"] = attempt["approach"]
+
+    def _append_event(self, event: Dict[str, Any]) -> None:
+        """Append one event to the journal (O(1); the journal compacts itself)."""
         try:
-            data = {}
-            for pid, exp in self.experiments.items():
-                data[pid] = {
-                    "problem_id": exp.problem_id,
-                    "problem_description": exp.problem_description,
-                    "domain": exp.domain,
-                    "winning_approach": exp.winning_approach,
-                    "total_time_minutes": exp.total_time_minutes,
-                    "attempts": [
-                        {
-                            "approach": a.approach,
-                            "result": a.result,
-                            "reason": a.reason,
-                            "time_minutes": a.time_minutes,
-                        }
-                        for a in exp.attempts
-                    ],
-                }
-            with open(self.storage_path, "w") as f:
-                json.dump(data, f, indent=2)
+            self.journal.append(event)
         except Exception as e:
             logger.warning(f"Failed to save experiments: {e}")
 
+    def compact(self) -> None:
+        """Fold the journal into the snapshot file."""
+        try:
+            self.journal.compact()
+        except Exception as e:
+            logger.warning(f"Failed to compact experiments: {e}")
+
+    def _load_experiments(self) -> None:
+        """Load experiments from the snapshot plus the journal tail."""
+        try:
+            data = self.journal.load()
+        except Exception as e:
+            logger.warning(f"Failed to load experiments: {e}")
+            return
+
+        for pid, exp_data in data.items():
+            try:
+                attempts = []
+                for a in exp_data.get("attempts", []):
+                    attempt = ExperimentAttempt(
+                        approach=a["approach"],
+                        result=a["result"],
+                        reason=a.get("reason"),
+                        time_minutes=a.get("time_minutes", 0),
+                    )
+                    if a.get("timestamp"):
+                        attempt.timestamp = datetime.fromisoformat(a["timestamp"])
+                    attempts.append(attempt)
+                experiment = MultiRolloutExperiment(
+                    problem_id=exp_data["problem_id"],
+                    problem_description=exp_data["problem_description"],
+                    domain=exp_data["domain"],
+                    attempts=attempts,
+                    winning_approach=exp_data.get("winning_approach"),
+                    total_time_minutes=exp_data.get("total_time_minutes", 0),
+                )
+                if exp_data.get("created_at"):
+                    experiment.created_at = datetime.fromisoformat(exp_data["created_at"])
+                self.experiments[pid] = experiment
+            except Exception as e:
+                logger.warning(f"Skipping unreadable experiment {pid}: {e}")
+        logger.info(f"Loaded {len(self.experiments)} experiments")
+
 
 # =============================================================================
 # Integration Facade
@@ -669,26 +888,24 @@ class RLKnowledgeOptimizer:
         Returns:
             Best solution and score, or None
         """
-        # Get all solutions
-        all_solutions = self.policy.get_all_solutions_ranked(domain)
-
-        if not all_solutions:
+        if not self.policy._pattern_store.get(domain):
             return None
 
-        # Filter by keywords
-        if keywords:
-            all_solutions = [(p, s) for p, s in all_solutions if any(kw.lower() in p.name.lower() for kw in keywords)]
-
-        # Skip previously failed approaches
-        if skip_failed and problem_id:
-            failed = self.tracker.get_failed_approaches(problem_id)
-            all_solutions = [(p, s) for p, s in all_solutions if p.name not in failed]
+        # Walk the cached ranking best-first and stop at the first acceptable pattern
+        name_matches = self.policy.match_keywords(domain, keywords, include_description=False) if keywords else None
+        failed = self.tracker.get_failed_approaches(problem_id) if skip_failed and problem_id else []
 
-        if not all_solutions:
+        best = next(
+            (
+                (p, s)
+                for p, s in self.policy.iter_ranked(domain)
+                if (name_matches is None or p.id in name_matches) and p.name not in failed
+            ),
+            None,
+        )
+        if best is None:
             return None
 
-        # Return best solution
-        best = all_solutions[0]
         logger.info(
             f"[RL RESOLVE] Best: {best[0].name} (score: {best[1]:.2f}), "
             f"skipped {len(failed) if skip_failed and problem_id else 0} failed approaches"
@@ -752,17 +969,19 @@ class RLKnowledgeOptimizer:
     def get_domain_patterns(
         self,
         domain: str,
+        limit: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
         Get all patterns for a domain with their scores.
 
         Args:
             domain: Domain to query
+            limit: Return only the top ``limit`` patterns
 
         Returns:
-            List of dicts with 'pattern' and 'score' keys
+            List of dicts with 'pattern' and 'score' keys, best first
         """
-        ranked = self.policy.get_all_solutions_ranked(domain)
+        ranked = self.policy.get_all_solutions_ranked(domain, limit=limit)
         return [{"pattern": p, "score": s} for p, s in ranked]
 
     def add_pattern(self, pattern: KnowledgePattern) -> None:
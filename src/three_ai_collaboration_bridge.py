@@ -18,17 +18,24 @@ import logging
 import os
 import subprocess
 import tempfile
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
 from filelock import FileLock
 
+try:
+    from src.response_cache import ResponseCache, make_cache_key
+except ImportError:
+    from response_cache import ResponseCache, make_cache_key
+
 logger = logging.getLogger(__name__)
 
 
@@ -41,6 +48,90 @@ def _get_storage_dir() -> Path:
 
 DEFAULT_STORAGE_DIR = _get_storage_dir()
 GEMINI_USAGE_FILE = DEFAULT_STORAGE_DIR / "gemini_usage.json"
+RESPONSE_CACHE_FILE = DEFAULT_STORAGE_DIR / "ai_response_cache.sqlite3"
+
+# Per-AI CLI timeout (seconds)
+DEFAULT_AI_TIMEOUT = 30.0
+
+
+class CommandCancelled(Exception):
+    """A CLI call was stopped because its result is no longer needed"""
+
+
+class CommandFailed(Exception):
+    """A CLI call exited with an error or printed nothing"""
+
+
+def _run_command(
+    args: List[str],
+    timeout: float = DEFAULT_AI_TIMEOUT,
+    cancel_event: Optional[threading.Event] = None,
+    poll_interval: float = 0.05,
+) -> subprocess.CompletedProcess:
+    """
+    subprocess.run(capture_output=True, text=True) that another thread can cancel
+
+    The child is killed when ``timeout`` expires (raising TimeoutExpired, like
+    subprocess.run) or when ``cancel_event`` is set (raising CommandCancelled).
+    """
+    proc = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            stdout, stderr = proc.communicate(timeout=poll_interval)
+            return subprocess.CompletedProcess(args, proc.returncode, stdout, stderr)
+        except subprocess.TimeoutExpired:
+            cancelled = cancel_event is not None and cancel_event.is_set()
+            if cancelled or time.monotonic() >= deadline:
+                proc.kill()
+                proc.communicate()
+                if cancelled:
+                    raise CommandCancelled(f"{args[0]} cancelled")
+                raise subprocess.TimeoutExpired(args, timeout)
+
+
+def _command_output(result: subprocess.CompletedProcess) -> str:
+    """stdout of a successful CLI call; failures raise CommandFailed so they become error responses"""
+    if result.returncode != 0:
+        detail = (result.stderr or "").strip() or f"exit code {result.returncode}"
+        raise CommandFailed(f"{result.args[0]} failed: {detail}")
+    if not (result.stdout or "").strip():
+        raise CommandFailed(f"{result.args[0]} returned no output")
+    return result.stdout
+
+
+def _cache_key(ai_name: str, role: "AIRole", prompt: str, context: "AIContext") -> str:
+    """Response cache key; run-specific fields (task_id, timestamp, metadata) are excluded"""
+    relevant = {
+        "phase": context.phase,
+        "previous_outputs": context.previous_outputs,
+        "constraints": context.constraints,
+        "success_criteria": context.success_criteria,
+    }
+    return make_cache_key(ai_name, role.value, prompt, relevant)
+
+
+def _cached_response(cached: Dict[str, Any], role: "AIRole", lookup_time: float) -> "AIResponse":
+    """Rebuild an AIResponse from a cache entry"""
+    return AIResponse(
+        ai_name=cached["ai_name"],
+        role=role,
+        output=cached["output"],
+        confidence=cached["confidence"],
+        issues_found=cached["issues_found"],
+        suggestions=cached["suggestions"],
+        execution_time=lookup_time,
+        metadata={**cached["metadata"], "cached": True, "original_execution_time": cached["execution_time"]},
+    )
+
+
+def _store_response(cache: Optional[ResponseCache], key: str, response: "AIResponse") -> None:
+    """Cache a successful response"""
+    if cache is None or "error" in response.metadata:
+        return
+    entry = asdict(response)
+    entry.pop("role")
+    cache.put(key, entry, provider=response.ai_name)
 
 
 class AIRole(Enum):
@@ -115,9 +206,10 @@ class AIResponse:
 class CodexInterface:
     """Interface for Codex (GPT Pro) integration"""
 
-    def __init__(self):
+    def __init__(self, cache: Optional[ResponseCache] = None):
         self.api_key = os.getenv("OPENAI_API_KEY")
         self.available = self._check_availability()
+        self.cache = cache
 
     def _check_availability(self) -> bool:
         """Check if Codex is available"""
@@ -129,7 +221,14 @@ class CodexInterface:
             # Fall back to API key check
             return bool(self.api_key)
 
-    def execute(self, task: str, role: AIRole, context: AIContext) -> AIResponse:
+    def execute(
+        self,
+        task: str,
+        role: AIRole,
+        context: AIContext,
+        timeout: float = DEFAULT_AI_TIMEOUT,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> AIResponse:
         """Execute Codex with specific role"""
         if not self.available:
             return AIResponse(
@@ -148,17 +247,23 @@ class CodexInterface:
         # Create specialized prompt based on role
         prompt = self._create_role_prompt(task, role, context)
 
+        cache_key = _cache_key("codex", role, prompt, context)
+        cached = self.cache.get(cache_key, provider="codex") if self.cache else None
+        if cached is not None:
+            return _cached_response(cached, role, time.time() - start_time)
+
         try:
             # Execute via CLI or API
-            if self._has_cli():
-                output = self._execute_cli(prompt)
+            use_cli = self._has_cli()
+            if use_cli:
+                output = self._execute_cli(prompt, timeout=timeout, cancel_event=cancel_event)
             else:
                 output = self._execute_api(prompt)
 
             # Parse Codex output for issues and suggestions
             issues, suggestions = self._parse_output(output)
 
-            return AIResponse(
+            response = AIResponse(
                 ai_name="codex",
                 role=role,
                 output=output,
@@ -166,8 +271,10 @@ class CodexInterface:
                 issues_found=issues,
                 suggestions=suggestions,
                 execution_time=time.time() - start_time,
-                metadata={"method": "cli" if self._has_cli() else "api"},
+                metadata={"method": "cli" if use_cli else "api"},
             )
+            _store_response(self.cache, cache_key, response)
+            return response
 
         except Exception as e:
             return AIResponse(
@@ -255,20 +362,20 @@ Output Format:
 
         return base_prompt
 
-    def _execute_cli(self, prompt: str) -> str:
+    def _execute_cli(
+        self,
+        prompt: str,
+        timeout: float = DEFAULT_AI_TIMEOUT,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> str:
         """Execute via Codex CLI"""
         with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
             f.write(prompt)
             temp_file = f.name
 
         try:
-            result = subprocess.run(
-                ["codex", "exec", "--prompt", temp_file],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-            return result.stdout
+            result = _run_command(["codex", "exec", "--prompt", temp_file], timeout=timeout, cancel_event=cancel_event)
+            return _command_output(result)
         finally:
             os.unlink(temp_file)
 
@@ -303,10 +410,11 @@ Output Format:
 class GeminiInterface:
     """Interface for Gemini CLI integration"""
 
-    def __init__(self):
+    def __init__(self, cache: Optional[ResponseCache] = None):
         self.available = self._check_availability()
         self.daily_limit = 100  # Free tier limit
         self.usage_count = self._load_usage_count()
+        self.cache = cache
 
     def _check_availability(self) -> bool:
         """Check if Gemini CLI is available"""
@@ -345,7 +453,14 @@ class GeminiInterface:
                     f,
                 )
 
-    def execute(self, task: str, role: AIRole, context: AIContext) -> AIResponse:
+    def execute(
+        self,
+        task: str,
+        role: AIRole,
+        context: AIContext,
+        timeout: float = DEFAULT_AI_TIMEOUT,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> AIResponse:
         """Execute Gemini with specific role"""
         if not self.available:
             return AIResponse(
@@ -359,6 +474,15 @@ class GeminiInterface:
                 metadata={"error": "Gemini not configured"},
             )
 
+        start_time = time.time()
+        prompt = self._create_role_prompt(task, role, context)
+
+        # Cache hits are checked first: they do not count against the daily limit
+        cache_key = _cache_key("gemini", role, prompt, context)
+        cached = self.cache.get(cache_key, provider="gemini") if self.cache else None
+        if cached is not None:
+            return _cached_response(cached, role, time.time() - start_time)
+
         if self.usage_count >= self.daily_limit:
             return AIResponse(
                 ai_name="gemini",
@@ -371,20 +495,17 @@ class GeminiInterface:
                 metadata={"error": "Daily limit exceeded"},
             )
 
-        start_time = time.time()
-        prompt = self._create_role_prompt(task, role, context)
-
         try:
             # Execute Gemini CLI
-            result = subprocess.run(["gemini", prompt], capture_output=True, text=True, timeout=30)
+            result = _run_command(["gemini", prompt], timeout=timeout, cancel_event=cancel_event)
 
             self.usage_count += 1
             self._save_usage_count()
 
-            output = result.stdout
+            output = _command_output(result)
             creativity_score = self._assess_creativity(output)
 
-            return AIResponse(
+            response = AIResponse(
                 ai_name="gemini",
                 role=role,
                 output=output,
@@ -394,6 +515,8 @@ class GeminiInterface:
                 execution_time=time.time() - start_time,
                 metadata={"creativity_score": creativity_score},
             )
+            _store_response(self.cache, cache_key, response)
+            return response
 
         except Exception as e:
             return AIResponse(
@@ -475,9 +598,20 @@ Find optimization opportunities:
 class ThreeAICollaborationBridge:
     """Main orchestrator for 3-AI collaboration"""
 
-    def __init__(self):
-        self.codex = CodexInterface()
-        self.gemini = GeminiInterface()
+    _AI_NAMES = ("claude", "codex", "gemini")
+
+    def __init__(
+        self,
+        ai_timeout: float = DEFAULT_AI_TIMEOUT,
+        max_parallel_workers: int = 3,
+        response_cache: Optional[ResponseCache] = None,
+    ):
+        # Identical (provider, role, prompt, context) calls are answered from disk
+        self.response_cache = response_cache if response_cache is not None else ResponseCache(RESPONSE_CACHE_FILE)
+        self.codex = CodexInterface(cache=self.response_cache)
+        self.gemini = GeminiInterface(cache=self.response_cache)
+        self.ai_timeout = ai_timeout
+        self.max_parallel_workers = max_parallel_workers
         self.context_store = DEFAULT_STORAGE_DIR / "ai_collaboration_context"
         self.context_store.mkdir(exist_ok=True)
 
@@ -515,6 +649,24 @@ class ThreeAICollaborationBridge:
                 ],
                 "mode": ExecutionMode.ITERATIVE,
             },
+            "review": {
+                "sequence": [
+                    (AIRole.CLAUDE_ARCHITECT, "claude"),
+                    (AIRole.CODEX_REVIEW, "codex"),
+                    (AIRole.GEMINI_OPTIMIZE, "gemini"),
+                ],
+                "mode": ExecutionMode.PARALLEL,
+                # Two independent reviews are enough; don't wait on the slowest
+                "quorum": 2,
+            },
+        }
+
+    def get_status_report(self) -> Dict[str, Any]:
+        """AI availability and response cache statistics"""
+        return {
+            "ai_available": {"claude": True, "codex": self.codex.available, "gemini": self.gemini.available},
+            "gemini_usage": {"count": self.gemini.usage_count, "daily_limit": self.gemini.daily_limit},
+            "response_cache": self.response_cache.stats(),
         }
 
     def collaborate(self, task: str, pattern: str = "implementation", max_iterations: int = 3) -> Dict[str, Any]:
@@ -550,7 +702,7 @@ class ThreeAICollaborationBridge:
         elif mode == ExecutionMode.ITERATIVE:
             return self._execute_iterative(task, sequence, context, max_iterations)
         elif mode == ExecutionMode.PARALLEL:
-            return self._execute_parallel(task, sequence, context)
+            return self._execute_parallel(task, sequence, context, quorum=collab_pattern.get("quorum"))
         else:
             return self._execute_adaptive(task, sequence, context)
 
@@ -639,25 +791,99 @@ class ThreeAICollaborationBridge:
 
         return self._compile_results(results, context)
 
-    def _execute_parallel(self, task: str, sequence: List[Tuple[AIRole, str]], context: AIContext) -> Dict[str, Any]:
-        """Execute AIs in parallel (simulated)"""
-        # In production, use threading or async
-        logger.info("Executing AIs in parallel")
+    def _execute_parallel(
+        self,
+        task: str,
+        sequence: List[Tuple[AIRole, str]],
+        context: AIContext,
+        quorum: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Execute AIs concurrently on a bounded thread pool
+
+        Args:
+            quorum: Stop once this many AIs answered without error (default: all);
+                CLI calls still running are killed
+            timeout: Per-AI timeout in seconds (default: ``self.ai_timeout``)
+        """
+        calls = [(index, role, ai_name) for index, (role, ai_name) in enumerate(sequence) if ai_name in self._AI_NAMES]
+        if not calls:
+            return self._compile_results([], context, wall_clock_time=0.0)
+
+        quorum = len(calls) if quorum is None else max(1, min(quorum, len(calls)))
+        timeout = timeout if timeout is not None else self.ai_timeout
+        logger.info("Executing %d AIs in parallel (quorum=%d, timeout=%.0fs)", len(calls), quorum, timeout)
+
+        start = time.perf_counter()
+        # Grace period on top of the per-AI timeout for process teardown
+        deadline = start + timeout + 1.0
+        cancel_event = threading.Event()
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, min(len(calls), self.max_parallel_workers)), thread_name_prefix="ai-bridge"
+        )
+        futures = {
+            executor.submit(self._dispatch, ai_name, task, role, context, timeout, cancel_event): (index, ai_name)
+            for index, role, ai_name in calls
+        }
+
+        responses: Dict[int, AIResponse] = {}
+        answered = 0
+        pending = set(futures)
+        try:
+            while pending and answered < quorum:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, _ = futures[future]
+                    responses[index] = future.result()
+                    if "error" not in responses[index].metadata:
+                        answered += 1
+        finally:
+            # Kill stragglers' subprocesses and drop calls that have not started
+            cancel_event.set()
+            executor.shutdown(wait=False, cancel_futures=True)
 
-        results = []
-        for role, ai_name in sequence:
-            if ai_name == "claude":
-                response = self._execute_claude(task, role, context)
-            elif ai_name == "codex":
-                response = self.codex.execute(task, role, context)
-            elif ai_name == "gemini":
-                response = self.gemini.execute(task, role, context)
-            else:
-                continue
+        if pending:
+            stragglers = sorted(futures[future][1] for future in pending)
+            reason = "quorum" if answered >= quorum else "timeout"
+            context.metadata["cancelled_ais"] = stragglers
+            logger.info("Cancelled %s after %s", ", ".join(stragglers), reason)
+        context.metadata["quorum_reached"] = answered >= quorum
 
-            results.append(response)
+        results = [responses[index] for index in sorted(responses)]
+        return self._compile_results(results, context, wall_clock_time=time.perf_counter() - start)
 
-        return self._compile_results(results, context)
+    def _dispatch(
+        self,
+        ai_name: str,
+        task: str,
+        role: AIRole,
+        context: AIContext,
+        timeout: float,
+        cancel_event: threading.Event,
+    ) -> AIResponse:
+        """Run one AI call (worker thread entry point)"""
+        start = time.perf_counter()
+        try:
+            if ai_name == "claude":
+                return self._execute_claude(task, role, context)
+            elif ai_name == "codex":
+                return self.codex.execute(task, role, context, timeout=timeout, cancel_event=cancel_event)
+            return self.gemini.execute(task, role, context, timeout=timeout, cancel_event=cancel_event)
+        except Exception as e:
+            return AIResponse(
+                ai_name=ai_name,
+                role=role,
+                output=f"Error: {str(e)}",
+                confidence=0.0,
+                issues_found=[],
+                suggestions=[],
+                execution_time=time.perf_counter() - start,
+                metadata={"error": str(e)},
+            )
 
     def _execute_adaptive(self, task: str, sequence: List[Tuple[AIRole, str]], context: AIContext) -> Dict[str, Any]:
         """Adaptively choose execution based on results"""
@@ -764,8 +990,19 @@ Output: [Implementation would go here]
             with open(context_file, "w", encoding="utf-8") as f:
                 f.write(context.to_yaml())
 
-    def _compile_results(self, responses: List[AIResponse], context: AIContext) -> Dict[str, Any]:
-        """Compile results from all AIs"""
+    def _compile_results(
+        self,
+        responses: List[AIResponse],
+        context: AIContext,
+        wall_clock_time: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Compile results from all AIs
+
+        Args:
+            wall_clock_time: Elapsed time of the whole collaboration; defaults to
+                the sum of per-AI times (sequential execution)
+        """
 
         # Aggregate issues and suggestions
         all_issues = []
@@ -789,11 +1026,21 @@ Output: [Implementation would go here]
         else:
             status = "partial_success"
 
+        total_time = sum(r.execution_time for r in responses)
+        timing = {
+            "wall_clock": total_time if wall_clock_time is None else wall_clock_time,
+            "sum": total_time,
+            "max": max((r.execution_time for r in responses), default=0.0),
+            "per_ai": [{"ai": r.ai_name, "role": r.role.value, "seconds": r.execution_time} for r in responses],
+        }
+
         return {
             "task_id": context.task_id,
             "status": status,
             "overall_confidence": avg_confidence,
-            "total_execution_time": sum(r.execution_time for r in responses),
+            "total_execution_time": total_time,
+            "wall_clock_time": timing["wall_clock"],
+            "timing": timing,
             "ai_responses": [asdict(r) for r in responses],
             "aggregated_issues": list(set(all_issues)),
             "aggregated_suggestions": list(set(all_suggestions)),
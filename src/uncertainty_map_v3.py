@@ -29,6 +29,11 @@ import math
 import logging
 from filelock import FileLock
 
+try:
+    from src.observation_log import ObservationLog
+except ImportError:
+    from observation_log import ObservationLog
+
 # Windows Unicode 인코딩 문제 근본 해결
 if sys.platform == "win32":
     # 환경변수 설정
@@ -52,7 +57,9 @@ def _get_storage_dir() -> Path:
 DEFAULT_STORAGE_DIR = _get_storage_dir()
 
 try:
+    from sklearn.base import clone
     from sklearn.ensemble import RandomForestRegressor
+    from sklearn.metrics import mean_absolute_error, r2_score
     from sklearn.preprocessing import StandardScaler
 
     ML_AVAILABLE = True
@@ -61,6 +68,50 @@ except Exception:
     logger.warning("ML libraries not available, using fallback prediction")
 
 
+def fit_uncertainty_predictor(
+    features: np.ndarray,
+    labels: np.ndarray,
+    holdout_fraction: float = 0.2,
+    n_estimators: int = 100,
+    random_state: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Fit a fresh scaler + RandomForest and score it on a random holdout
+
+    Module-level so it can run in a worker process; the caller installs the
+    returned models with UncertaintyMapV3.install_predictor().
+
+    Returns:
+        Dict with "scaler", "predictor", "feature_count" and holdout metrics
+        ("holdout_r2", "holdout_mae", "train_samples", "holdout_samples")
+    """
+    if not ML_AVAILABLE:
+        raise RuntimeError("ML libraries are not available for training")
+
+    sample_count = features.shape[0]
+    holdout_count = int(sample_count * holdout_fraction)
+    if holdout_count < 2 or sample_count - holdout_count < 2:
+        raise ValueError(f"Not enough samples for a holdout split: {sample_count}")
+
+    order = np.random.default_rng(random_state).permutation(sample_count)
+    holdout, train = order[:holdout_count], order[holdout_count:]
+
+    scaler = StandardScaler().fit(features[train])
+    predictor = RandomForestRegressor(n_estimators=n_estimators, random_state=random_state)
+    predictor.fit(scaler.transform(features[train]), labels[train])
+
+    predicted = predictor.predict(scaler.transform(features[holdout]))
+    return {
+        "scaler": scaler,
+        "predictor": predictor,
+        "feature_count": features.shape[1],
+        "holdout_r2": float(r2_score(labels[holdout], predicted)),
+        "holdout_mae": float(mean_absolute_error(labels[holdout], predicted)),
+        "train_samples": len(train),
+        "holdout_samples": holdout_count,
+    }
+
+
 class UncertaintyState(Enum):
     """Quantum-inspired uncertainty states"""
 
@@ -153,16 +204,30 @@ class UncertaintyMapV3:
     - Quantum states
     """
 
+    # Per-phase base uncertainty (unknown phases default to 0.5)
+    TECHNICAL_BASE = {"ideation": 0.9, "design": 0.7, "mvp": 0.5, "implementation": 0.4, "testing": 0.2}
+    MARKET_BASE = {"ideation": 0.9, "design": 0.7}
+    TIMELINE_BASE = {"ideation": 0.3, "design": 0.5, "mvp": 0.7, "implementation": 0.8, "testing": 0.4}
+    QUALITY_BASE = {"ideation": 0.4, "design": 0.5, "mvp": 0.7, "implementation": 0.6, "testing": 0.3}
+
+    # Upper magnitude bounds for DETERMINISTIC..CHAOTIC; anything above is VOID
+    STATE_THRESHOLDS = (0.1, 0.3, 0.6, 0.8)
+
+    # Observations retained per phase for learning; totals are kept in observation_counts
+    MAX_OBSERVATIONS_PER_PHASE = 1000
+
     def __init__(self, project_name: str):
         self.project_name = project_name
         self.uncertainties: Dict[str, UncertaintyVector] = {}
         self.predictions: Dict[str, PredictiveModel] = {}
         self.mitigations: Dict[str, List[MitigationStrategy]] = {}
         self.patterns: Dict[str, Any] = {}
+        self.observation_counts: Dict[str, Dict[str, int]] = {}
 
-        # Historical data for learning
+        # Historical data for learning: snapshot + append-only observation segments
         self.storage_dir = DEFAULT_STORAGE_DIR
         self.history_file = self.storage_dir / f"uncertainty_history_{project_name}.json"
+        self.observation_log = ObservationLog(self.history_file, self._fold_observation)
         self.load_history()
 
         # ML models for prediction
@@ -177,6 +242,11 @@ class UncertaintyMapV3:
             self.is_trained = False
             self._predictor_feature_count = 0
 
+        # (scaler, predictor, feature_count) used for inference; replaced as one
+        # reference so predictions never see a half-installed model
+        self._fitted_model: Optional[Tuple[Any, Any, int]] = None
+        self.training_metrics: Optional[Dict[str, Any]] = None
+
         # Pattern database
         self.known_patterns = self._load_known_patterns()
 
@@ -194,27 +264,63 @@ class UncertaintyMapV3:
         if features.shape[0] != labels.shape[0]:
             raise ValueError("Features and labels must have the same number of samples")
 
-        self.scaler.fit(features)
-        scaled_features = self.scaler.transform(features)
-        self.predictor.fit(scaled_features, labels)
+        # Fit copies so concurrent predictions keep using the current model
+        scaler = clone(self.scaler).fit(features)
+        predictor = clone(self.predictor).fit(scaler.transform(features), labels)
+        self.install_predictor(scaler, predictor, features.shape[1])
+
+    def install_predictor(self, scaler, predictor, feature_count: int, metrics: Optional[Dict[str, Any]] = None) -> None:
+        """Atomically swap in a fitted scaler + predictor (e.g. from background training)"""
+        self._fitted_model = (scaler, predictor, feature_count)
+        self.scaler = scaler
+        self.predictor = predictor
+        self._predictor_feature_count = feature_count
+        self.training_metrics = metrics
         self.is_trained = True
-        self._predictor_feature_count = features.shape[1]
+
+    def training_data(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Build (features, labels) from recorded observations
+
+        Consecutive observations of the same phase form one sample: the
+        earlier vector plus the hours between them predict the later
+        magnitude, matching the N x 6 layout used at inference.
+        """
+        features, labels = [], []
+        for key, observations in list(self.patterns.items()):
+            if not key.startswith("observations_"):
+                continue
+            ordered = sorted(observations, key=lambda o: o.get("timestamp", ""))
+            for earlier, later in zip(ordered, ordered[1:]):
+                try:
+                    hours = (
+                        datetime.fromisoformat(later["timestamp"]) - datetime.fromisoformat(earlier["timestamp"])
+                    ).total_seconds() / 3600
+                    vector = UncertaintyVector(**earlier["vector"])
+                    features.append([vector.technical, vector.market, vector.resource, vector.timeline, vector.quality, hours])
+                    labels.append(UncertaintyVector(**later["vector"]).magnitude())
+                except (KeyError, TypeError, ValueError):
+                    continue
+
+        return np.array(features, dtype=float).reshape(-1, 6), np.array(labels, dtype=float)
 
     def _predict_with_ml(self, vector: UncertaintyVector, hours: int) -> Optional[Tuple[str, float, datetime, float]]:
         """Use the trained ML model for predictions if available."""
-        if not (ML_AVAILABLE and getattr(self, "is_trained", False)):
+        fitted = self._fitted_model
+        if not (ML_AVAILABLE and fitted):
             return None
 
+        scaler, predictor, feature_count = fitted
         try:
             feature_vector = np.array(
                 [[vector.technical, vector.market, vector.resource, vector.timeline, vector.quality, hours]]
             )
 
-            if self._predictor_feature_count and feature_vector.shape[1] != self._predictor_feature_count:
+            if feature_count and feature_vector.shape[1] != feature_count:
                 raise ValueError("Feature vector does not match trained model shape")
 
-            scaled_features = self.scaler.transform(feature_vector)
-            predicted_magnitude = float(self.predictor.predict(scaled_features)[0])
+            scaled_features = scaler.transform(feature_vector)
+            predicted_magnitude = float(predictor.predict(scaled_features)[0])
             current_magnitude = vector.magnitude()
             delta = predicted_magnitude - current_magnitude
 
@@ -327,7 +433,7 @@ class UncertaintyMapV3:
 
     def _calc_technical_uncertainty(self, phase: str, has_code: bool) -> float:
         """Calculate technical uncertainty"""
-        base_uncertainty = {"ideation": 0.9, "design": 0.7, "mvp": 0.5, "implementation": 0.4, "testing": 0.2}.get(phase, 0.5)
+        base_uncertainty = self.TECHNICAL_BASE.get(phase, 0.5)
 
         # Reduce if we have code
         if has_code:
@@ -337,12 +443,7 @@ class UncertaintyMapV3:
 
     def _calc_market_uncertainty(self, phase: str, validation: float) -> float:
         """Calculate market uncertainty"""
-        if phase == "ideation":
-            return 0.9 * (1 - validation)
-        elif phase == "design":
-            return 0.7 * (1 - validation)
-        else:
-            return 0.5 * (1 - validation)
+        return self.MARKET_BASE.get(phase, 0.5) * (1 - validation)
 
     def _calc_resource_uncertainty(self, team_size: int, timeline_weeks: int) -> float:
         """Calculate resource uncertainty"""
@@ -356,9 +457,7 @@ class UncertaintyMapV3:
 
     def _calc_timeline_uncertainty(self, phase: str, timeline_weeks: int) -> float:
         """Calculate timeline uncertainty"""
-        phase_factors = {"ideation": 0.3, "design": 0.5, "mvp": 0.7, "implementation": 0.8, "testing": 0.4}
-
-        base = phase_factors.get(phase, 0.5)
+        base = self.TIMELINE_BASE.get(phase, 0.5)
 
         # Urgent timelines increase uncertainty
         if timeline_weeks < 4:
@@ -373,7 +472,7 @@ class UncertaintyMapV3:
         if not has_code and phase in ["implementation", "testing"]:
             return 0.9  # High uncertainty without code
 
-        return {"ideation": 0.4, "design": 0.5, "mvp": 0.7, "implementation": 0.6, "testing": 0.3}.get(phase, 0.5)
+        return self.QUALITY_BASE.get(phase, 0.5)
 
     def add_observation(self, phase: str, vector: UncertaintyVector, outcome: bool):
         """
@@ -388,10 +487,12 @@ class UncertaintyMapV3:
         observation = {"timestamp": datetime.now().isoformat(), "phase": phase, "vector": asdict(vector), "outcome": outcome}
 
         # Add to patterns for learning
-        phase_key = f"observations_{phase}"
-        if phase_key not in self.patterns:
-            self.patterns[phase_key] = []
-        self.patterns[phase_key].append(observation)
+        self._fold_observation({"patterns": self.patterns, "observation_counts": self.observation_counts}, observation)
+
+        try:
+            self.observation_log.append(observation)
+        except OSError as e:
+            logger.warning("Failed to persist observation for phase %s: %s", phase, e)
 
         logger.debug("Added observation for phase %s: outcome=%s", phase, outcome)
 
@@ -592,6 +693,170 @@ class UncertaintyMapV3:
 
         return strategies[:3]  # Return top 3 strategies
 
+    # ------------------------------------------------------------------
+    # Batch API: N contexts per call, dimensions computed as NumPy columns
+    # ------------------------------------------------------------------
+
+    def uncertainty_matrix(self, contexts: List[Dict]) -> np.ndarray:
+        """
+        Compute the uncertainty dimensions of N contexts as an N x 5 array
+
+        Columns follow UncertaintyVector field order (technical, market,
+        resource, timeline, quality); row i equals ``analyze_context(contexts[i])``.
+        """
+        count = len(contexts)
+        phases = []
+        has_code = np.zeros(count, dtype=bool)
+        validation = np.zeros(count)
+        team_size = np.ones(count)
+        timeline = np.full(count, 12.0)
+
+        for i, context in enumerate(contexts):
+            phase = context.get("phase")
+            if not phase:
+                raise ValueError(f"Context {i} must include a phase")
+            phases.append(phase)
+            has_code[i] = len(context.get("files", [])) > 0
+            validation[i] = context.get("market_validation", 0)
+            team_size[i] = context.get("team_size", 1)
+            timeline[i] = context.get("timeline_weeks", 12)
+
+        if count == 0:
+            return np.empty((0, 5))
+        if np.any(team_size <= 0):
+            raise ValueError("team_size must be greater than zero")
+        if np.any(timeline <= 0):
+            raise ValueError("timeline_weeks must be greater than zero")
+
+        # One dict lookup per distinct phase, broadcast back to rows
+        unique_phases, phase_index = np.unique(np.array(phases), return_inverse=True)
+
+        def lookup(table: Dict[str, float]) -> np.ndarray:
+            return np.array([table.get(phase, 0.5) for phase in unique_phases])[phase_index]
+
+        technical = lookup(self.TECHNICAL_BASE) * np.where(has_code, 0.7, 1.0)
+        market = lookup(self.MARKET_BASE) * (1 - validation)
+        resource = np.minimum(1.0, (1.0 / np.sqrt(team_size)) * (12.0 / timeline) * 0.7)
+
+        timeline_base = lookup(self.TIMELINE_BASE)
+        timeline_unc = np.where(
+            timeline < 4,
+            np.minimum(1.0, timeline_base * 2),
+            np.where(timeline < 8, np.minimum(1.0, timeline_base * 1.5), timeline_base),
+        )
+
+        needs_code = np.isin(unique_phases, ["implementation", "testing"])[phase_index]
+        quality = np.where(~has_code & needs_code, 0.9, lookup(self.QUALITY_BASE))
+
+        return np.column_stack([technical, market, resource, timeline_unc, quality])
+
+    @staticmethod
+    def magnitudes(matrix: np.ndarray) -> np.ndarray:
+        """Row-wise UncertaintyVector.magnitude() for an N x 5 matrix"""
+        return np.sqrt(np.square(matrix).sum(axis=1)) / math.sqrt(5)
+
+    def classify_states(self, magnitudes: np.ndarray) -> List[UncertaintyState]:
+        """Vectorized classify_state()"""
+        states = list(UncertaintyState)
+        indices = np.searchsorted(self.STATE_THRESHOLDS, magnitudes, side="right")
+        return [states[i] for i in indices]
+
+    def analyze_contexts(self, contexts: List[Dict]) -> List[Tuple[UncertaintyVector, UncertaintyState]]:
+        """
+        Batch variant of analyze_context
+
+        Args:
+            contexts: Context dicts with the same keys as analyze_context
+
+        Returns:
+            One (vector, state) pair per context, in input order
+        """
+        matrix = self.uncertainty_matrix(contexts)
+        states = self.classify_states(self.magnitudes(matrix))
+        return [(UncertaintyVector(*row), state) for row, state in zip(matrix.tolist(), states)]
+
+    def _predict_with_ml_batch(self, matrix: np.ndarray, hours: int) -> Optional[np.ndarray]:
+        """Predict N magnitudes with a single predictor call, or None to use heuristics"""
+        fitted = self._fitted_model
+        if not (ML_AVAILABLE and fitted):
+            return None
+
+        scaler, predictor, feature_count = fitted
+        try:
+            features = np.column_stack([matrix, np.full(len(matrix), hours)])
+            if feature_count and features.shape[1] != feature_count:
+                raise ValueError("Feature matrix does not match trained model shape")
+
+            return np.asarray(predictor.predict(scaler.transform(features)), dtype=float)
+        except Exception as ml_error:
+            logger.warning("Batch ML prediction failed, falling back to heuristics: %s", ml_error)
+            return None
+
+    def _predict_with_rules_batch(
+        self, matrix: np.ndarray, magnitudes: np.ndarray, hours: int
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Vectorized _match_pattern + _predict_with_rules; returns (trend, velocity, predicted)"""
+        typical = np.array([list(asdict(p["typical_vector"]).values()) for p in self.known_patterns.values()])
+        distances = np.sqrt(np.square(matrix[:, None, :] - typical[None, :, :]).sum(axis=2))
+        best = distances.argmin(axis=1)
+        matched = distances[np.arange(len(matrix)), best] < 0.3
+
+        diff = magnitudes - self.magnitudes(typical)[best]
+        settled = np.abs(diff) < 0.1
+        trend = np.where(
+            matched,
+            np.where(settled, "stable", np.where(diff > 0, "increasing", "decreasing")),
+            "decreasing",
+        )
+        velocity = np.where(matched, np.where(settled, 0.0, diff / 24), -0.01)
+        predicted = np.clip(magnitudes + velocity * hours, 0.0, 1.0)
+        return trend, velocity, predicted
+
+    def predict_evolution_batch(self, vectors: List[UncertaintyVector], hours: int = 24) -> List[PredictiveModel]:
+        """
+        Batch variant of predict_evolution
+
+        Runs one ``predictor.predict`` over the N x 6 feature matrix when the
+        ML model is trained, otherwise matches all vectors against the known
+        patterns at once.
+        """
+        if not vectors:
+            return []
+
+        matrix = np.array([list(asdict(vector).values()) for vector in vectors], dtype=float)
+        magnitudes = self.magnitudes(matrix)
+
+        predicted = self._predict_with_ml_batch(matrix, hours)
+        if predicted is not None:
+            delta = predicted - magnitudes
+            trend = np.where(np.abs(delta) < 0.01, "stable", np.where(delta > 0, "increasing", "decreasing"))
+            velocity = delta / max(hours, 1)
+            predicted_resolution = datetime.now() + timedelta(hours=hours)
+        else:
+            trend, velocity, predicted = self._predict_with_rules_batch(matrix, magnitudes, hours)
+            predicted_resolution = datetime.now() + timedelta(hours=hours * 3)
+
+        lower = np.maximum(0, np.minimum(magnitudes, predicted) - 0.2)
+        upper = np.minimum(1, np.maximum(magnitudes, predicted) + 0.2)
+
+        return [
+            PredictiveModel(
+                trend=str(trend[i]),
+                velocity=float(velocity[i]),
+                acceleration=-0.0001,  # Tend toward stability
+                inflection_points=[],
+                confidence_interval=(float(lower[i]), float(upper[i])),
+                predicted_resolution=predicted_resolution,
+            )
+            for i in range(len(vectors))
+        ]
+
+    def generate_mitigations_batch(
+        self, vectors: List[UncertaintyVector], states: List[UncertaintyState]
+    ) -> List[List[MitigationStrategy]]:
+        """Batch variant of generate_mitigations (top 3 strategies per vector)"""
+        return [self.generate_mitigations(vector, state) for vector, state in zip(vectors, states)]
+
     def visualize_map(self, vector: UncertaintyVector, state: UncertaintyState) -> str:
         """
         Create ASCII visualization of uncertainty map
@@ -642,16 +907,48 @@ class UncertaintyMapV3:
 
         return "\n".join(lines)
 
+    @staticmethod
+    def _count_observations(observations: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Per-phase counts derived from a raw observation list"""
+        return {"total": len(observations), "successes": sum(1 for o in observations if o.get("outcome"))}
+
+    @classmethod
+    def _fold_observation(cls, state: Dict[str, Any], observation: Dict[str, Any]) -> None:
+        """Apply one observation to a history state (in place), keeping per-phase retention bounded"""
+        phase = observation["phase"]
+        observations = state.setdefault("patterns", {}).setdefault(f"observations_{phase}", [])
+        all_counts = state.setdefault("observation_counts", {})
+        if phase not in all_counts:
+            # Seed from the lists of a pre-log history file before appending to them
+            all_counts[phase] = cls._count_observations(observations)
+        observations.append(observation)
+        if len(observations) > cls.MAX_OBSERVATIONS_PER_PHASE:
+            del observations[: len(observations) - cls.MAX_OBSERVATIONS_PER_PHASE]
+
+        counts = all_counts[phase]
+        counts["total"] += 1
+        counts["successes"] += int(bool(observation.get("outcome")))
+
     def save_state(self, filepath: Optional[Path] = None):
-        """Save current state to file"""
-        state = {
+        """
+        Save current state to file
+
+        Without ``filepath`` this compacts the observation log into the
+        history snapshot (observations are already persisted by
+        add_observation). With ``filepath`` a full standalone export is written.
+        """
+        metadata = {
             "project": self.project_name,
             "timestamp": datetime.now().isoformat(),
             "uncertainties": {k: asdict(v) for k, v in self.uncertainties.items()},
-            "patterns": self.patterns,
         }
 
-        target = Path(filepath).expanduser() if filepath else self.history_file
+        if not filepath:
+            self.observation_log.compact(extra=metadata)
+            return
+
+        state = {**metadata, "patterns": self.patterns, "observation_counts": self.observation_counts}
+        target = Path(filepath).expanduser()
         target.parent.mkdir(parents=True, exist_ok=True)
         lock = FileLock(str(target) + ".lock")
         with lock:
@@ -659,13 +956,20 @@ class UncertaintyMapV3:
                 json.dump(state, f, indent=2, ensure_ascii=False)
 
     def load_history(self):
-        """Load historical data"""
-        if self.history_file.exists():
-            lock = FileLock(str(self.history_file) + ".lock")
-            with lock:
-                with open(self.history_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    self.patterns = data.get("patterns", {})
+        """Load historical data (snapshot plus unfolded log segments)"""
+        data = self.observation_log.load()
+        self.patterns = data.get("patterns", {})
+        self.observation_counts = data.get("observation_counts", {})
+
+        for key, observations in self.patterns.items():
+            if not key.startswith("observations_") or not isinstance(observations, list):
+                continue
+            phase = key[len("observations_") :]
+            if phase not in self.observation_counts:
+                # Pre-log history files carry only the raw observation lists
+                self.observation_counts[phase] = self._count_observations(observations)
+            if len(observations) > self.MAX_OBSERVATIONS_PER_PHASE:
+                del observations[: len(observations) - self.MAX_OBSERVATIONS_PER_PHASE]
 
 
 def demo():
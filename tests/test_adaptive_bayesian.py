@@ -384,6 +384,184 @@ class TestAdaptiveBayesianUncertainty(unittest.TestCase):
         self.assertIsNotNone(report)
 
 
+class TestStatePersistenceFormat(unittest.TestCase):
+    """Test the compact versioned state format"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.bayesian = AdaptiveBayesianUncertainty("state-project", storage_dir=Path(self.temp_dir))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _observe(self, bayesian, count):
+        vector = UncertaintyVector(0.5, 0.6, 0.4, 0.5, 0.5)
+        for _ in range(count):
+            pred = bayesian.predict_uncertainty(vector, "mvp", 24)
+            bayesian.update_with_observation("mvp", pred, UncertaintyVector(0.4, 0.5, 0.4, 0.4, 0.5))
+
+    def test_round_trip_restores_beliefs_bias_and_kalman(self):
+        self._observe(self.bayesian, 12)
+
+        restored = AdaptiveBayesianUncertainty("state-project", storage_dir=Path(self.temp_dir))
+
+        original = self.bayesian.beliefs["mvp"]["technical"]
+        loaded = restored.beliefs["mvp"]["technical"]
+        self.assertAlmostEqual(loaded.alpha, original.alpha)
+        self.assertEqual(loaded.observations, original.observations)
+        self.assertEqual(
+            list(restored.bias_profiles["mvp"].error_history), list(self.bayesian.bias_profiles["mvp"].error_history)
+        )
+        self.assertEqual(restored.kalman_state, self.bayesian.kalman_state)
+        self.assertEqual(restored.metrics["successful_predictions"], self.bayesian.metrics["successful_predictions"])
+        self.assertEqual(len(restored.observation_history), 12)
+        self.assertAlmostEqual(
+            restored.observation_history[-1]["predicted"]["predicted_magnitude"],
+            self.bayesian.observation_history[-1]["predicted"]["predicted_magnitude"],
+        )
+        self.assertFalse(self.bayesian.legacy_state_file.exists())
+
+    def test_observations_are_appended_not_rewritten(self):
+        self._observe(self.bayesian, 1)
+        snapshot_size = self.bayesian.state_file.stat().st_size
+        record_size = self.bayesian.observations_file.stat().st_size
+
+        self._observe(self.bayesian, 3)
+
+        from adaptive_bayesian_uncertainty import OBSERVATION_DTYPE
+
+        self.assertEqual(self.bayesian.state_file.stat().st_size, snapshot_size)
+        self.assertEqual(self.bayesian.observations_file.stat().st_size, record_size + 3 * OBSERVATION_DTYPE.itemsize)
+
+    def test_legacy_pickle_is_migrated(self):
+        import pickle
+
+        self._observe(self.bayesian, 2)
+        legacy_state = {
+            "beliefs": self.bayesian.beliefs,
+            "bias_profiles": self.bayesian.bias_profiles,
+            "observation_history": self.bayesian.observation_history,
+            "kalman_state": self.bayesian.kalman_state,
+            "metrics": dict(self.bayesian.metrics),
+        }
+        legacy_dir = Path(self.temp_dir) / "legacy"
+        legacy_dir.mkdir()
+        with open(legacy_dir / "old-project_bayesian_state.pkl", "wb") as f:
+            pickle.dump(legacy_state, f)
+
+        migrated = AdaptiveBayesianUncertainty("old-project", storage_dir=legacy_dir)
+
+        self.assertEqual(len(migrated.observation_history), 2)
+        self.assertEqual(migrated.metrics["predictions_made"], self.bayesian.metrics["predictions_made"])
+        self.assertTrue(migrated.state_file.exists())
+        self.assertTrue((legacy_dir / "old-project_bayesian_state.pkl.migrated").exists())
+
+        reloaded = AdaptiveBayesianUncertainty("old-project", storage_dir=legacy_dir)
+        self.assertEqual(len(reloaded.observation_history), 2)
+
+    def test_newer_schema_is_not_loaded(self):
+        self._observe(self.bayesian, 1)
+        with np.load(self.bayesian.state_file) as data:
+            arrays = dict(data)
+        arrays["schema_version"] = np.array(99)
+        with open(self.bayesian.state_file, "wb") as f:
+            np.savez(f, **arrays)
+
+        restored = AdaptiveBayesianUncertainty("state-project", storage_dir=Path(self.temp_dir))
+
+        self.assertEqual(restored.metrics["predictions_made"], 0)
+
+    def test_torn_trailing_record_is_ignored(self):
+        self._observe(self.bayesian, 2)
+        with open(self.bayesian.observations_file, "ab") as f:
+            f.write(b"\x00" * 7)
+
+        restored = AdaptiveBayesianUncertainty("state-project", storage_dir=Path(self.temp_dir))
+
+        self.assertEqual(len(restored.observation_history), 2)
+
+
+class TestBatchUpdates(unittest.TestCase):
+    """Batch updates must match sequential replay exactly"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.sequential = AdaptiveBayesianUncertainty("seq", storage_dir=Path(self.temp_dir))
+        self.batched = AdaptiveBayesianUncertainty("batch", storage_dir=Path(self.temp_dir))
+
+        rng = np.random.default_rng(5)
+        source = AdaptiveBayesianUncertainty("source", storage_dir=Path(self.temp_dir))
+        self.predictions, self.observed = [], []
+        for _ in range(45):
+            current = UncertaintyVector(*rng.random(5).tolist())
+            self.predictions.append(source.predict_uncertainty(current, "implementation", 24))
+            self.observed.append(UncertaintyVector(*rng.random(5).tolist()))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_batch_matches_sequential_replay(self):
+        for pred, observed in zip(self.predictions, self.observed):
+            self.sequential.update_with_observation("implementation", pred, observed)
+
+        self.batched.update_with_observations_batch("implementation", self.predictions, self.observed)
+
+        for dimension, belief in self.sequential.beliefs["implementation"].items():
+            batch_belief = self.batched.beliefs["implementation"][dimension]
+            self.assertEqual(
+                (batch_belief.alpha, batch_belief.beta, batch_belief.mean, batch_belief.variance),
+                (belief.alpha, belief.beta, belief.mean, belief.variance),
+            )
+            self.assertEqual(batch_belief.observations, belief.observations)
+            self.assertEqual(batch_belief.confidence, belief.confidence)
+
+        seq_bias = self.sequential.bias_profiles["implementation"]
+        batch_bias = self.batched.bias_profiles["implementation"]
+        self.assertEqual(
+            (batch_bias.accurate_count, batch_bias.optimistic_count, batch_bias.pessimistic_count),
+            (seq_bias.accurate_count, seq_bias.optimistic_count, seq_bias.pessimistic_count),
+        )
+        self.assertEqual(batch_bias.total_error, seq_bias.total_error)
+        self.assertEqual(batch_bias.mean_error, seq_bias.mean_error)
+        self.assertEqual(list(batch_bias.error_history), list(seq_bias.error_history))
+
+        self.assertEqual(self.batched.kalman_state, self.sequential.kalman_state)
+        for key in ("successful_predictions", "improvement_rate"):
+            self.assertEqual(self.batched.metrics[key], self.sequential.metrics[key])
+        self.assertEqual(list(self.batched.metrics["accuracy_history"]), list(self.sequential.metrics["accuracy_history"]))
+        self.assertEqual(len(self.batched.observation_history), 45)
+
+    def test_long_form_rows_match_per_row_updates(self):
+        dimensions = ["market", "technical", "market", "quality", "market"]
+        predicted = [0.4, 0.7, 0.5, 0.2, 0.9]
+        actual = [0.45, 0.2, 0.1, 0.25, 0.8]
+
+        for dimension, pred, obs in zip(dimensions, predicted, actual):
+            self.sequential.beliefs["mvp"][dimension].update_with_observation(obs)
+            self.sequential.bias_profiles["mvp"].update(pred, obs)
+
+        self.batched.update_beliefs_batch("mvp", dimensions, predicted, actual)
+
+        for dimension in set(dimensions):
+            batch_belief = self.batched.beliefs["mvp"][dimension]
+            seq_belief = self.sequential.beliefs["mvp"][dimension]
+            self.assertEqual((batch_belief.alpha, batch_belief.beta), (seq_belief.alpha, seq_belief.beta))
+        self.assertEqual(self.batched.bias_profiles["mvp"].mean_error, self.sequential.bias_profiles["mvp"].mean_error)
+
+        with self.assertRaises(ValueError):
+            self.batched.update_beliefs_batch("mvp", ["velocity"], [0.1], [0.2])
+
+    def test_kalman_batch_matches_sequential(self):
+        rng = np.random.default_rng(9)
+        measurements, predictions = rng.random(200), rng.random(200)
+
+        expected = [self.sequential._kalman_filter_update(m, p) for m, p in zip(measurements, predictions)]
+        result = self.batched.kalman_filter_batch(measurements, predictions)
+
+        self.assertEqual(result.tolist(), expected)
+        self.assertEqual(self.batched.kalman_state, self.sequential.kalman_state)
+
+
 class TestIntegration(unittest.TestCase):
     """Integration tests with full workflow"""
 
@@ -448,6 +626,8 @@ def run_tests():
     suite.addTests(loader.loadTestsFromTestCase(TestBayesianBelief))
     suite.addTests(loader.loadTestsFromTestCase(TestBiasProfile))
     suite.addTests(loader.loadTestsFromTestCase(TestAdaptiveBayesianUncertainty))
+    suite.addTests(loader.loadTestsFromTestCase(TestStatePersistenceFormat))
+    suite.addTests(loader.loadTestsFromTestCase(TestBatchUpdates))
     suite.addTests(loader.loadTestsFromTestCase(TestIntegration))
 
     # Run tests
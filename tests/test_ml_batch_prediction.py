@@ -0,0 +1,78 @@
+"""Tests for MLTrainingSystem.predict_batch."""
+
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_DIR) not in os.sys.path:
+    os.sys.path.append(str(SRC_DIR))
+
+from ml_training_system import MLTrainingSystem, TrainingData  # noqa: E402
+
+PHASES = ["ideation", "design", "mvp", "implementation", "testing"]
+
+
+def _scenarios(count=40):
+    return [
+        {
+            "phase": PHASES[i % 5],
+            "timeline_weeks": 4 + i,
+            "team_size": 1 + i % 9,
+            "budget": 20000 + 1000 * i,
+            "technical_uncertainty": (i % 10) / 10,
+            "test_coverage": (i % 4) / 4,
+            "files": ["a.py"] * (i % 3),
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def system(tmp_path):
+    system = MLTrainingSystem(model_dir=tmp_path)
+    data = system.generate_synthetic_data(size=200)
+    system.train_model("confidence_predictor", data)
+    phases = TrainingData(features=data.features, labels=data.features[:, 0].astype(int), metadata={})
+    system.train_model("phase_classifier", phases)
+    return system
+
+
+def test_regressor_batch_matches_single_predictions(system):
+    scenarios = _scenarios()
+
+    predictions, metadata = system.predict_batch("confidence_predictor", scenarios)
+
+    expected = [system.predict("confidence_predictor", scenario)[0] for scenario in scenarios]
+    assert predictions.tolist() == pytest.approx(expected)
+    assert metadata["probabilities"] is None
+    assert metadata["count"] == len(scenarios)
+
+
+def test_classifier_batch_returns_predictions_and_probabilities_from_one_call(system, monkeypatch):
+    scenarios = _scenarios()
+    model = system.models["phase_classifier"]
+    calls = []
+    predict_proba = model.predict_proba
+    monkeypatch.setattr(model, "predict_proba", lambda x: calls.append(x.shape) or predict_proba(x))
+    monkeypatch.setattr(model, "predict", lambda x: pytest.fail("predict must not be called"))
+
+    predictions, metadata = system.predict_batch("phase_classifier", scenarios)
+
+    assert calls == [(len(scenarios), 14)]
+    monkeypatch.undo()
+    for row, scenario in enumerate(scenarios):
+        prediction, single = system.predict("phase_classifier", scenario)
+        assert predictions[row] == prediction
+        assert metadata["probabilities"][row].tolist() == pytest.approx(list(single["probabilities"].values()))
+
+
+def test_unknown_model_and_empty_input(system):
+    with pytest.raises(ValueError):
+        system.predict_batch("missing", _scenarios(2))
+
+    predictions, _ = system.predict_batch("confidence_predictor", [])
+    assert predictions.shape == (0,)
+    assert np.array_equal(system.prepare_features_batch(_scenarios(1)), system.prepare_features(_scenarios(1)[0]))
@@ -0,0 +1,89 @@
+"""Tests for parallel and warm-start training in MLTrainingSystem."""
+
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_DIR) not in os.sys.path:
+    os.sys.path.append(str(SRC_DIR))
+
+from ml_training_system import MLTrainingSystem, TrainingData  # noqa: E402
+
+
+@pytest.fixture
+def system(tmp_path):
+    system = MLTrainingSystem(model_dir=tmp_path)
+    system.models["uncertainty_predictor"].set_params(n_estimators=20)
+    return system
+
+
+def _shifted(data, offset):
+    return TrainingData(features=data.features + offset, labels=data.labels, metadata={})
+
+
+def test_parallel_training_reports_stage_timings(system):
+    data = system.generate_synthetic_data(size=150)
+
+    default_n_jobs = system.models["uncertainty_predictor"].n_jobs
+
+    metrics = system.train_model("uncertainty_predictor", data, n_jobs=-1)
+
+    # The persisted model keeps its own setting so API workers don't predict on every core
+    assert system.models["uncertainty_predictor"].n_jobs == default_n_jobs
+    assert metrics.n_jobs == -1
+    assert list(metrics.stage_timings) == [
+        "split",
+        "scale",
+        "fit",
+        "evaluate",
+        "cross_validation",
+        "feature_importance",
+    ]
+    assert all(seconds >= 0 for seconds in metrics.stage_timings.values())
+    assert sum(metrics.stage_timings.values()) <= metrics.training_time + 0.05
+    assert len(metrics.cross_val_scores) == 5
+    assert system.training_history[-1]["metrics"]["stage_timings"] == metrics.stage_timings
+
+
+def test_warm_start_adds_trees_and_keeps_scaler(system):
+    data = system.generate_synthetic_data(size=150)
+    system.train_model("uncertainty_predictor", data)
+    model = system.models["uncertainty_predictor"]
+    first_trees = list(model.estimators_)
+    scaler_mean = system.scalers["uncertainty_predictor"].mean_.copy()
+
+    metrics = system.train_model("uncertainty_predictor", _shifted(data, 0.5), warm_start_trees=10, cv_folds=0)
+
+    assert metrics.incremental
+    assert metrics.n_estimators == 30
+    assert model.estimators_[:20] == first_trees
+    assert not model.warm_start
+    assert np.array_equal(system.scalers["uncertainty_predictor"].mean_, scaler_mean)
+    assert metrics.cross_val_scores == []
+
+
+def test_warm_start_on_untrained_model_fits_from_scratch(system, caplog):
+    with caplog.at_level("WARNING", logger="ml_training_system"):
+        metrics = system.train_model(
+            "uncertainty_predictor", system.generate_synthetic_data(size=150), warm_start_trees=10, cv_folds=0
+        )
+
+    assert not metrics.incremental
+    assert metrics.n_estimators == 20
+    assert "ignoring warm_start_trees=10" in caplog.text
+
+
+def test_warm_start_resumes_registry_model(system, tmp_path):
+    data = system.generate_synthetic_data(size=150)
+    system.train_model("uncertainty_predictor", data, cv_folds=0)
+    system.save_models()
+
+    worker = MLTrainingSystem(model_dir=tmp_path)
+    worker.load_models()
+    metrics = worker.train_model("uncertainty_predictor", data, warm_start_trees=5, cv_folds=0)
+
+    assert metrics.incremental
+    assert metrics.n_estimators == 25
@@ -0,0 +1,153 @@
+"""Tests for the versioned model registry and lazy MLTrainingSystem loading."""
+
+import os
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_DIR) not in os.sys.path:
+    os.sys.path.append(str(SRC_DIR))
+
+from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor  # noqa: E402
+from sklearn.preprocessing import StandardScaler  # noqa: E402
+
+from ml_training_system import MLTrainingSystem  # noqa: E402
+from model_registry import MappedForest, ModelRegistry  # noqa: E402
+
+
+def test_publish_and_load_maps_arrays_read_only(tmp_path):
+    registry = ModelRegistry(tmp_path)
+    scaler = StandardScaler().fit(np.arange(20, dtype=float).reshape(-1, 2))
+
+    assert registry.publish("demo", scaler, scaler=scaler, metadata={"note": "x"}) == 1
+
+    model, loaded_scaler, manifest = registry.load("demo")
+    assert isinstance(model.mean_, np.memmap)
+    assert not model.mean_.flags.writeable
+    assert np.array_equal(loaded_scaler.scale_, scaler.scale_)
+    assert manifest["type"] == "StandardScaler"
+    assert manifest["metadata"] == {"note": "x"}
+
+
+@pytest.mark.parametrize("forest_class", [RandomForestRegressor, RandomForestClassifier])
+def test_forests_predict_from_memory_mapped_node_arrays(tmp_path, forest_class):
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(200, 5))
+    y = (X[:, 0] + X[:, 1] > 0).astype(int) if forest_class is RandomForestClassifier else X[:, 0] * 2 + X[:, 2]
+    forest = forest_class(n_estimators=10, max_depth=6, random_state=0).fit(X, y)
+    registry = ModelRegistry(tmp_path)
+    registry.publish("forest", forest)
+
+    model, _, manifest = registry.load("forest")
+
+    assert isinstance(model, MappedForest)
+    assert manifest["mapped_forest"] is True
+    for array in (model.left, model.right, model.feature, model.threshold, model.value):
+        assert isinstance(array, np.memmap)
+        assert not array.flags.writeable
+    X_new = rng.normal(size=(50, 5))
+    if forest_class is RandomForestClassifier:
+        assert np.allclose(model.predict_proba(X_new), forest.predict_proba(X_new))
+        assert np.array_equal(model.predict(X_new), forest.predict(X_new))
+    else:
+        assert np.allclose(model.predict(X_new), forest.predict(X_new))
+    assert np.allclose(model.feature_importances_, forest.feature_importances_)
+    assert isinstance(model.to_estimator(), forest_class)
+
+
+def test_versions_are_pruned_and_can_be_rolled_back(tmp_path):
+    registry = ModelRegistry(tmp_path, keep_versions=2)
+    for i in range(4):
+        registry.publish("demo", {"i": i})
+
+    assert registry.versions("demo") == [3, 4]
+    assert registry.current_version("demo") == 4
+
+    registry.activate("demo", 3)
+    assert registry.load("demo")[0] == {"i": 2}
+    with pytest.raises(KeyError):
+        registry.activate("demo", 1)
+
+
+class TestLazyLoading:
+    def test_models_load_on_first_predict(self, tmp_path):
+        trainer = MLTrainingSystem(model_dir=tmp_path)
+        trainer.train_model("confidence_predictor", trainer.generate_synthetic_data(size=100))
+        expected, _ = trainer.predict("confidence_predictor", {"phase": "mvp"})
+        trainer.save_models()
+
+        worker = MLTrainingSystem(model_dir=tmp_path)
+        assert worker.load_models() == 3
+        report = worker.get_model_report()
+        assert report["models"]["confidence_predictor"]["loaded"] is False
+        assert report["models"]["confidence_predictor"]["trained"] is True
+        assert not hasattr(worker.models["confidence_predictor"], "n_features_in_")
+
+        prediction, _ = worker.predict("confidence_predictor", {"phase": "mvp"})
+
+        assert prediction == pytest.approx(expected)
+        assert worker.loaded_versions == {"confidence_predictor": 1}
+        assert isinstance(worker.models["confidence_predictor"].value, np.memmap)
+        assert isinstance(worker.scalers["confidence_predictor"].mean_, np.memmap)
+        assert worker.get_model_report()["models"]["confidence_predictor"]["type"] == "RandomForestRegressor"
+
+    def test_mapped_forest_is_replaced_before_warm_start(self, tmp_path):
+        trainer = MLTrainingSystem(model_dir=tmp_path)
+        trainer.models["uncertainty_predictor"].set_params(n_estimators=10)
+        trainer.train_model("uncertainty_predictor", trainer.generate_synthetic_data(size=100))
+        trainer.save_models()
+
+        worker = MLTrainingSystem(model_dir=tmp_path)
+        worker.load_models(lazy=False)
+        # ml_training_system may import the registry as src.model_registry
+        assert type(worker.models["uncertainty_predictor"]).__name__ == "MappedForest"
+
+        metrics = worker.train_model("uncertainty_predictor", worker.generate_synthetic_data(size=100), warm_start_trees=5)
+
+        assert metrics.incremental is True
+        assert metrics.n_estimators == 15
+
+    def test_training_supersedes_pending_load(self, tmp_path):
+        MLTrainingSystem(model_dir=tmp_path).save_models()
+        worker = MLTrainingSystem(model_dir=tmp_path)
+        worker.load_models()
+
+        worker.train_model("uncertainty_predictor", worker.generate_synthetic_data(size=100))
+        paths = worker.save_models()
+
+        assert set(paths) == {"uncertainty_predictor"}
+        assert worker.registry.current_version("uncertainty_predictor") == 2
+
+    def test_export_includes_models_not_loaded_yet(self, tmp_path):
+        trainer = MLTrainingSystem(model_dir=tmp_path / "source")
+        trainer.train_model("confidence_predictor", trainer.generate_synthetic_data(size=100))
+        expected, _ = trainer.predict("confidence_predictor", {"phase": "mvp"})
+        trainer.save_models()
+
+        worker = MLTrainingSystem(model_dir=tmp_path / "source")
+        worker.load_models()
+        paths = worker.save_models(directory=tmp_path / "export")
+
+        assert set(paths) == {"uncertainty_predictor", "phase_classifier", "confidence_predictor"}
+        assert worker.registry.current_version("confidence_predictor") == 1
+
+        exported = MLTrainingSystem(model_dir=tmp_path / "export")
+        exported.load_models()
+        prediction, _ = exported.predict("confidence_predictor", {"phase": "mvp"})
+        assert prediction == pytest.approx(expected)
+
+    def test_legacy_pickles_are_loaded_and_migrated(self, tmp_path):
+        trainer = MLTrainingSystem(model_dir=tmp_path)
+        trainer.train_model("uncertainty_predictor", trainer.generate_synthetic_data(size=100))
+        joblib.dump(trainer.models["uncertainty_predictor"], tmp_path / "uncertainty_predictor.pkl")
+        joblib.dump(trainer.scalers["uncertainty_predictor"], tmp_path / "uncertainty_predictor_scaler.pkl")
+
+        worker = MLTrainingSystem(model_dir=tmp_path)
+        worker.load_models(lazy=False)
+        assert hasattr(worker.models["uncertainty_predictor"], "n_features_in_")
+
+        worker.save_models()
+        assert worker.registry.current_version("uncertainty_predictor") == 1
@@ -0,0 +1,157 @@
+"""Tests for the append-only observation log and UncertaintyMapV3 history persistence."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_DIR) not in os.sys.path:
+    os.sys.path.append(str(SRC_DIR))
+
+import uncertainty_map_v3 as umap_module  # noqa: E402
+from observation_log import ObservationLog  # noqa: E402
+from uncertainty_map_v3 import UncertaintyMapV3, UncertaintyVector  # noqa: E402
+
+
+def _count_fold(state, record):
+    state["count"] = state.get("count", 0) + 1
+    state["last"] = record["n"]
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    return tmp_path / "history.json"
+
+
+def _segments(path):
+    return sorted(path.parent.glob(f"{path.stem}.*.jsonl"))
+
+
+def test_append_then_load_replays_records(log_path):
+    log = ObservationLog(log_path, _count_fold)
+    for n in range(5):
+        log.append({"n": n})
+
+    assert log.load() == {"count": 5, "last": 4}
+    assert not log_path.exists(), "appends must not rewrite the snapshot"
+
+
+def test_segments_rotate_and_compact_automatically(log_path):
+    log = ObservationLog(log_path, _count_fold, segment_max_bytes=64, max_segments=3)
+
+    for n in range(200):
+        log.append({"n": n, "pad": "x" * 20})
+
+    assert len(_segments(log_path)) <= 4
+    assert log_path.exists()
+    assert log.load() == {"count": 200, "last": 199}
+
+
+def test_compact_folds_segments_into_snapshot(log_path):
+    log = ObservationLog(log_path, _count_fold)
+    log.append_many([{"n": 1}, {"n": 2}])
+
+    state = log.compact(extra={"project": "demo"})
+
+    assert state == {"count": 2, "last": 2, "project": "demo"}
+    assert _segments(log_path) == []
+    assert json.loads(log_path.read_text())["log_segment"] == 1
+
+    log.append({"n": 3})
+    assert log.load() == {"count": 3, "last": 3, "project": "demo"}
+
+
+def test_torn_line_is_skipped(log_path):
+    log = ObservationLog(log_path, _count_fold)
+    log.append({"n": 1})
+    with open(_segments(log_path)[-1], "a", encoding="utf-8") as f:
+        f.write('{"n": 2')
+
+    assert log.load() == {"count": 1, "last": 1}
+
+
+def test_segments_left_by_interrupted_compaction_are_ignored(log_path):
+    log = ObservationLog(log_path, _count_fold)
+    log.append({"n": 1})
+    stale = _segments(log_path)[0]
+    stale_content = stale.read_text()
+    log.compact()
+    stale.write_text(stale_content)
+
+    assert log.load() == {"count": 1, "last": 1}
+    assert stale.exists(), "load() must not modify the log directory"
+
+    restarted = ObservationLog(log_path, _count_fold)
+    restarted.append({"n": 2})
+
+    assert not stale.exists()
+    assert restarted.load() == {"count": 2, "last": 2}
+
+
+class TestUncertaintyMapHistory:
+    @pytest.fixture(autouse=True)
+    def storage(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(umap_module, "DEFAULT_STORAGE_DIR", tmp_path)
+        return tmp_path
+
+    def test_observations_survive_restart_without_save(self):
+        umap = UncertaintyMapV3("log-test")
+        vector = UncertaintyVector(0.5, 0.4, 0.3, 0.2, 0.1)
+        umap.add_observation("mvp", vector, True)
+        umap.add_observation("mvp", vector, False)
+
+        restored = UncertaintyMapV3("log-test")
+
+        assert len(restored.patterns["observations_mvp"]) == 2
+        assert restored.observation_counts["mvp"] == {"total": 2, "successes": 1}
+
+    def test_save_state_compacts_into_history_file(self, storage):
+        umap = UncertaintyMapV3("log-test")
+        umap.add_observation("design", UncertaintyVector(0.5, 0.4, 0.3, 0.2, 0.1), True)
+
+        umap.save_state()
+
+        data = json.loads((storage / "uncertainty_history_log-test.json").read_text())
+        assert data["project"] == "log-test"
+        assert data["observation_counts"]["design"]["total"] == 1
+        assert _segments(storage / "uncertainty_history_log-test.json") == []
+
+    def test_retention_is_bounded_but_counts_are_not(self, monkeypatch):
+        monkeypatch.setattr(UncertaintyMapV3, "MAX_OBSERVATIONS_PER_PHASE", 3)
+        umap = UncertaintyMapV3("log-test")
+        for _ in range(5):
+            umap.add_observation("testing", UncertaintyVector(0.1, 0.1, 0.1, 0.1, 0.1), True)
+
+        restored = UncertaintyMapV3("log-test")
+
+        assert len(restored.patterns["observations_testing"]) == 3
+        assert restored.observation_counts["testing"]["total"] == 5
+
+    def test_compacting_legacy_history_keeps_counts(self, storage):
+        legacy = {
+            "project": "legacy",
+            "patterns": {"observations_design": [{"phase": "design", "outcome": i % 2 == 0} for i in range(50)]},
+        }
+        (storage / "uncertainty_history_legacy.json").write_text(json.dumps(legacy))
+
+        umap = UncertaintyMapV3("legacy")
+        umap.add_observation("design", UncertaintyVector(0.5, 0.4, 0.3, 0.2, 0.1), True)
+        umap.save_state()
+
+        data = json.loads((storage / "uncertainty_history_legacy.json").read_text())
+        assert data["observation_counts"]["design"] == {"total": 51, "successes": 26}
+        assert UncertaintyMapV3("legacy").observation_counts["design"] == {"total": 51, "successes": 26}
+
+    def test_legacy_history_file_is_read(self, storage):
+        legacy = {
+            "project": "legacy",
+            "patterns": {"observations_mvp": [{"phase": "mvp", "outcome": True}, {"phase": "mvp", "outcome": False}]},
+        }
+        (storage / "uncertainty_history_legacy.json").write_text(json.dumps(legacy))
+
+        umap = UncertaintyMapV3("legacy")
+
+        assert len(umap.patterns["observations_mvp"]) == 2
+        assert umap.observation_counts["mvp"] == {"total": 2, "successes": 1}
@@ -0,0 +1,182 @@
+"""Tests for the persistent AI response cache and its use by the AI connectors."""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_DIR) not in os.sys.path:
+    os.sys.path.append(str(SRC_DIR))
+
+from ai_collaboration_connector import AICollaborationConnector, AIRequest, AIService  # noqa: E402
+from response_cache import ResponseCache, make_cache_key  # noqa: E402
+from three_ai_collaboration_bridge import AIContext, AIRole, CodexInterface, GeminiInterface  # noqa: E402
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(tmp_path / "cache.sqlite3", ttl_seconds=60)
+
+
+def _context(**overrides):
+    fields = {
+        "task_id": "t1",
+        "phase": "design",
+        "previous_outputs": {},
+        "constraints": ["fast"],
+        "success_criteria": [],
+        "metadata": {},
+    }
+    fields.update(overrides)
+    return AIContext(**fields)
+
+
+def test_key_ignores_whitespace_and_context_key_order():
+    a = make_cache_key("codex", "review", "Review  this\n code", {"x": 1, "y": [1, 2]})
+    b = make_cache_key("codex", "review", " Review this code ", {"y": [1, 2], "x": 1})
+
+    assert a == b
+    assert a != make_cache_key("gemini", "review", "Review this code", {"x": 1, "y": [1, 2]})
+    assert a != make_cache_key("codex", "review", "Review this code", {"x": 2, "y": [1, 2]})
+
+
+def test_entries_persist_across_instances_and_count_hits(cache, tmp_path):
+    cache.put("k", {"output": "answer"}, provider="codex")
+
+    reopened = ResponseCache(tmp_path / "cache.sqlite3")
+
+    assert reopened.get("k", provider="codex") == {"output": "answer"}
+    assert reopened.get("other", provider="codex") is None
+    stats = reopened.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+    assert stats["hit_rate"] == pytest.approx(0.5)
+    assert stats["by_provider"]["codex"]["hits"] == 1
+
+
+def test_expired_entries_are_misses(cache):
+    cache.put("k", {"output": "old"}, ttl_seconds=0.01)
+    time.sleep(0.02)
+
+    assert cache.get("k") is None
+    assert cache.stats()["expired"] == 1
+    assert cache.stats()["entries"] == 0
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite3", max_entries=3)
+    for key in ("a", "b", "c"):
+        cache.put(key, {"v": key})
+        time.sleep(0.002)
+    cache.get("a")
+    time.sleep(0.002)
+
+    cache.put("d", {"v": "d"})
+
+    assert cache.get("b") is None
+    assert [cache.get(key) is not None for key in ("a", "c", "d")] == [True, True, True]
+    assert cache.stats()["evicted"] == 1
+
+
+def test_byte_budget_is_enforced(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite3", max_bytes=100)
+    for i in range(5):
+        cache.put(f"k{i}", {"v": "x" * 30})
+        time.sleep(0.002)
+
+    stats = cache.stats()
+    assert stats["bytes"] <= 100
+    assert cache.get("k4") is not None
+
+
+class TestBridgeInterfaces:
+    def test_codex_reuses_response_for_identical_call(self, cache):
+        codex = CodexInterface(cache=cache)
+        codex.available = True
+        codex._has_cli = lambda: False
+        calls = []
+        codex._execute_api = lambda prompt: calls.append(prompt) or "- Critical Issues:\n- leak"
+
+        first = codex.execute("task", AIRole.CODEX_REVIEW, _context())
+        second = codex.execute("task", AIRole.CODEX_REVIEW, _context(task_id="t2"))
+        codex.execute("task", AIRole.CODEX_REVIEW, _context(constraints=["secure"]))
+
+        assert len(calls) == 2
+        assert second.output == first.output
+        assert second.metadata["cached"] is True
+        assert "cached" not in first.metadata
+
+    def test_gemini_cache_hit_does_not_use_quota(self, cache, monkeypatch, tmp_path):
+        import three_ai_collaboration_bridge as bridge_module
+
+        monkeypatch.setattr(bridge_module, "GEMINI_USAGE_FILE", tmp_path / "usage.json")
+        gemini = GeminiInterface(cache=cache)
+        gemini.available = True
+        gemini.usage_count = 0
+        monkeypatch.setattr(
+            bridge_module,
+            "_run_command",
+            lambda args, timeout, cancel_event: bridge_module.subprocess.CompletedProcess(args, 0, "idea", ""),
+        )
+
+        gemini.execute("task", AIRole.GEMINI_CREATE, _context())
+        gemini.usage_count = gemini.daily_limit
+        cached = gemini.execute("task", AIRole.GEMINI_CREATE, _context())
+
+        assert cached.output == "idea"
+        assert cached.metadata["cached"] is True
+
+    def test_errors_are_not_cached(self, cache):
+        codex = CodexInterface(cache=cache)
+        codex.available = True
+        codex._has_cli = lambda: False
+
+        def fail(prompt):
+            raise RuntimeError("down")
+
+        codex._execute_api = fail
+        codex.execute("task", AIRole.CODEX_DEBUG, _context())
+
+        assert cache.stats()["entries"] == 0
+
+    @pytest.mark.parametrize("returncode, stdout", [(1, "partial"), (0, "  \n")])
+    def test_failed_cli_runs_are_errors_and_not_cached(self, cache, monkeypatch, tmp_path, returncode, stdout):
+        import three_ai_collaboration_bridge as bridge_module
+
+        monkeypatch.setattr(bridge_module, "GEMINI_USAGE_FILE", tmp_path / "usage.json")
+        monkeypatch.setattr(
+            bridge_module,
+            "_run_command",
+            lambda args, timeout, cancel_event: bridge_module.subprocess.CompletedProcess(args, returncode, stdout, "boom"),
+        )
+        codex = CodexInterface(cache=cache)
+        codex.available = True
+        codex._has_cli = lambda: True
+        gemini = GeminiInterface(cache=cache)
+        gemini.available = True
+        gemini.usage_count = 0
+
+        responses = [
+            codex.execute("task", AIRole.CODEX_DEBUG, _context()),
+            gemini.execute("task", AIRole.GEMINI_CREATE, _context()),
+        ]
+
+        for response in responses:
+            assert "error" in response.metadata
+            assert response.confidence == 0.0
+        assert cache.stats()["entries"] == 0
+
+
+def test_connector_caches_successful_requests_and_reports_stats(cache):
+    connector = AICollaborationConnector(response_cache=cache)
+    request = AIRequest(service=AIService.CLAUDE, prompt="Summarize the plan", context={"phase": "design"})
+
+    first = connector.execute_request(request)
+    second = connector.execute_request(request)
+    connector.execute_request(AIRequest(service=AIService.LOCAL, prompt="Summarize the plan", context={}))
+
+    assert second.content == first.content
+    assert second.metadata["cached"] is True
+    report = connector.get_status_report()["response_cache"]
+    assert (report["hits"], report["misses"], report["entries"]) == (1, 1, 1)
@@ -0,0 +1,141 @@
+"""Tests for the indexed pattern store in PolicyOptimizer."""
+
+import os
+import random
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_DIR) not in os.sys.path:
+    os.sys.path.append(str(SRC_DIR))
+
+from rl_knowledge_optimizer import (  # noqa: E402
+    GroupRelativeScorer,
+    KnowledgePattern,
+    PolicyOptimizer,
+    RLKnowledgeOptimizer,
+    SideEffectLevel,
+)
+
+WORDS = ["timeout", "retry", "cache", "circuit breaker", "pool", "index", "token", "refresh", "jwt", "batch"]
+
+
+def _patterns(count, seed=1):
+    rng = random.Random(seed)
+    return [
+        KnowledgePattern(
+            id=f"p{i}",
+            name=" ".join(rng.sample(WORDS, 2)),
+            domain=rng.choice(["api", "auth"]),
+            description=rng.choice(WORDS) + " fix",
+            resolution_time_minutes=rng.randint(0, 90),
+            recurrence_count=rng.randint(0, 6),
+            side_effects=SideEffectLevel(rng.randint(0, 2)),
+        )
+        for i in range(count)
+    ]
+
+
+def _expected_ranking(patterns):
+    """Full rescan, as the policy computed it before indexing."""
+    return [(p.id, s) for p, s in GroupRelativeScorer().score_all_patterns(list(patterns))]
+
+
+def _ranking(policy, domain):
+    return [(p.id, s) for p, s in policy.get_all_solutions_ranked(domain)]
+
+
+@pytest.fixture
+def policy():
+    policy = PolicyOptimizer()
+    for pattern in _patterns(200):
+        policy.register_pattern(pattern)
+    return policy
+
+
+def test_ranking_matches_full_rescan_after_updates(policy):
+    rng = random.Random(7)
+    for _ in range(300):
+        policy.update_pattern_stats(f"p{rng.randrange(200)}", success=rng.random() < 0.6, had_side_effects=rng.random() < 0.1)
+
+    for domain in ("api", "auth"):
+        assert _ranking(policy, domain) == _expected_ranking(policy._pattern_store[domain])
+
+
+def test_update_rescores_only_affected_pattern(policy, monkeypatch):
+    domain_patterns = policy._pattern_store["api"]
+    target = min(domain_patterns, key=lambda p: p.recurrence_count)
+    calls = []
+    score = policy.scorer.score_with_bounds
+    monkeypatch.setattr(policy.scorer, "score_with_bounds", lambda p, t, r: calls.append(p.id) or score(p, t, r))
+
+    policy.update_pattern_stats(target.id, success=False)
+
+    assert calls == [target.id]
+    assert _ranking(policy, "api") == _expected_ranking(domain_patterns)
+
+
+def test_keyword_lookup_matches_substring_scan(policy):
+    for keywords in (["time"], ["breaker", "jwt"], ["FIX"], ["a"], ["nothing"], ["ch"]):
+        patterns = policy._pattern_store["api"]
+        expected = [
+            p for p in patterns if any(k.lower() in p.name.lower() or k.lower() in p.description.lower() for k in keywords)
+        ]
+
+        result = policy.get_best_solution("api", keywords)
+
+        if not expected:
+            assert result is None
+            continue
+        best, best_score = GroupRelativeScorer().score_all_patterns(expected)[0]
+        assert result == (best, best_score)
+
+
+def test_best_solution_without_keywords_uses_cached_top(policy):
+    best, score = policy.get_best_solution("auth")
+    assert (best.id, score) == _expected_ranking(policy._pattern_store["auth"])[0]
+    assert policy.get_best_solution("missing") is None
+    assert len(policy.get_all_solutions_ranked("auth", limit=5)) == 5
+
+
+def test_duplicate_registration_and_id_lookup():
+    policy = PolicyOptimizer()
+    pattern = KnowledgePattern(id="x", name="retry", domain="api")
+    policy.register_pattern(pattern)
+    policy.register_pattern(KnowledgePattern(id="x", name="other", domain="api"))
+
+    assert policy._pattern_store["api"] == [pattern]
+    assert policy.get_pattern("x") is pattern
+    policy.update_pattern_stats("missing", success=True)
+
+
+def test_id_shared_across_domains_resolves_to_earliest_domain():
+    policy = PolicyOptimizer()
+    policy.register_pattern(KnowledgePattern(id="seed", name="seed", domain="api"))
+    late_domain = KnowledgePattern(id="x", name="auth copy", domain="auth")
+    early_domain = KnowledgePattern(id="x", name="api copy", domain="api")
+    policy.register_pattern(late_domain)
+    policy.register_pattern(early_domain)
+
+    policy.update_pattern_stats("x", success=True)
+
+    assert policy.get_pattern("x") is early_domain
+    assert (early_domain.times_applied, late_domain.times_applied) == (1, 0)
+
+
+def test_resolve_problem_skips_failed_and_filters_names(tmp_path):
+    optimizer = RLKnowledgeOptimizer(storage_path=tmp_path / "experiments.json")
+    for pattern in _patterns(60, seed=3):
+        optimizer.add_pattern(pattern)
+
+    ranked = optimizer.policy.get_all_solutions_ranked("api")
+    top_name = ranked[0][0].name
+    optimizer.record_outcome(ranked[0][0].id, "prob-1", success=False)
+
+    result = optimizer.resolve_problem("api", problem_id="prob-1")
+
+    expected = [(p, s) for p, s in optimizer.policy.get_all_solutions_ranked("api") if p.name != top_name][0]
+    assert result == expected
+    matched = optimizer.resolve_problem("api", keywords=["retry"])
+    assert matched is None or "retry" in matched[0].name
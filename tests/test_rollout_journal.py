@@ -0,0 +1,88 @@
+"""Tests for the MultiRolloutTracker experiment journal."""
+
+import json
+import os
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+if str(SRC_DIR) not in os.sys.path:
+    os.sys.path.append(str(SRC_DIR))
+
+from rl_knowledge_optimizer import MultiRolloutTracker  # noqa: E402
+
+
+def _summary(tracker, problem_id):
+    summary = tracker.get_experiment_summary(problem_id)
+    summary["created_at"] = tracker.experiments[problem_id].created_at
+    summary["timestamps"] = [a.timestamp for a in tracker.experiments[problem_id].attempts]
+    return summary
+
+
+def test_attempts_are_journaled_and_replayed(tmp_path):
+    path = tmp_path / "experiments.json"
+    tracker = MultiRolloutTracker(path)
+    tracker.start_experiment("p1", "login loop", "auth")
+    tracker.record_attempt("p1", "clear cookies", "failed", reason="still loops", time_minutes=5)
+    tracker.record_attempt("p1", "fix redirect", "success", time_minutes=12)
+
+    assert not path.exists(), "recording must append, not rewrite the snapshot"
+
+    restored = MultiRolloutTracker(path)
+
+    assert _summary(restored, "p1") == _summary(tracker, "p1")
+    assert restored.get_failed_approaches("p1") == ["clear cookies"]
+    assert restored.get_winning_approach("p1") == "fix redirect"
+    assert restored.experiments["p1"].total_time_minutes == 17
+
+
+def test_compacted_snapshot_keeps_legacy_layout(tmp_path):
+    path = tmp_path / "experiments.json"
+    tracker = MultiRolloutTracker(path)
+    tracker.start_experiment("p1", "slow query", "database")
+    tracker.record_attempt("p1", "add index", "success", time_minutes=3)
+
+    tracker.compact()
+
+    snapshot = json.loads(path.read_text())
+    assert snapshot["p1"]["winning_approach"] == "add index"
+    assert snapshot["p1"]["attempts"][0]["approach"] == "add index"
+    assert list(tmp_path.glob("experiments.*.jsonl")) == []
+    assert _summary(MultiRolloutTracker(path), "p1") == _summary(tracker, "p1")
+
+
+def test_legacy_snapshot_plus_new_attempts(tmp_path):
+    path = tmp_path / "experiments.json"
+    legacy = {
+        "p0": {
+            "problem_id": "p0",
+            "problem_description": "flaky test",
+            "domain": "testing",
+            "winning_approach": None,
+            "total_time_minutes": 4,
+            "attempts": [{"approach": "retry", "result": "failed", "reason": None, "time_minutes": 4}],
+        }
+    }
+    path.write_text(json.dumps(legacy, indent=2))
+
+    tracker = MultiRolloutTracker(path)
+    tracker.record_attempt("p0", "mock clock", "success", time_minutes=6)
+
+    restored = MultiRolloutTracker(path)
+    assert restored.get_failed_approaches("p0") == ["retry"]
+    assert restored.get_winning_approach("p0") == "mock clock"
+    assert restored.experiments["p0"].total_time_minutes == 10
+
+
+def test_journal_rotates_into_snapshots(tmp_path):
+    path = tmp_path / "experiments.json"
+    tracker = MultiRolloutTracker(path)
+    tracker.journal.segment_max_bytes = 256
+    tracker.journal.max_segments = 2
+    tracker.start_experiment("p1", "memory leak", "backend")
+    for i in range(50):
+        tracker.record_attempt("p1", f"approach {i}", "failed", time_minutes=1)
+
+    assert path.exists()
+    assert len(list(tmp_path.glob("experiments.*.jsonl"))) <= 3
+    restored = MultiRolloutTracker(path)
+    assert restored.get_failed_approaches("p1") == [f"approach {i}" for i in range(50)]
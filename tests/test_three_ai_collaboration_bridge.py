@@ -6,6 +6,9 @@ Tests for the 3-AI Collaboration Bridge
 
 import sys
 import os
+import subprocess
+import threading
+import time
 from pathlib import Path
 import unittest
 
@@ -19,7 +22,14 @@ if sys.platform == "win32":
 # 경로 추가
 sys.path.append(str(Path(__file__).parent.parent / "src"))
 
-from three_ai_collaboration_bridge import ThreeAICollaborationBridge  # noqa: E402
+from three_ai_collaboration_bridge import (  # noqa: E402
+    AIContext,
+    AIResponse,
+    AIRole,
+    CommandCancelled,
+    ThreeAICollaborationBridge,
+    _run_command,
+)
 
 
 class TestThreeAICollaborationBridge(unittest.TestCase):
@@ -57,5 +67,102 @@ class TestThreeAICollaborationBridge(unittest.TestCase):
         self.assertIn("overall_confidence", result)
 
 
+def _sleeping_ai(name, seconds, finished):
+    """Fake AI execute() that sleeps (or stops early when cancelled)"""
+
+    def execute(task, role, context, timeout=30.0, cancel_event=None):
+        if cancel_event is not None and cancel_event.wait(seconds):
+            raise CommandCancelled(name)
+        time.sleep(0 if cancel_event is not None else seconds)
+        finished.append(name)
+        return AIResponse(
+            ai_name=name,
+            role=role,
+            output="ok",
+            confidence=0.8,
+            issues_found=[],
+            suggestions=[],
+            execution_time=seconds,
+            metadata={},
+        )
+
+    return execute
+
+
+class TestParallelExecution(unittest.TestCase):
+    """ExecutionMode.PARALLEL runs the AIs concurrently"""
+
+    def setUp(self):
+        self.bridge = ThreeAICollaborationBridge()
+        self.finished = []
+        self.context = AIContext(
+            task_id="parallel",
+            phase="review",
+            previous_outputs={},
+            constraints=[],
+            success_criteria=[],
+            metadata={},
+        )
+        self.sequence = [(AIRole.CODEX_REVIEW, "codex"), (AIRole.GEMINI_OPTIMIZE, "gemini")]
+
+    def test_wall_clock_is_bounded_by_slowest_ai(self):
+        self.bridge.codex.execute = _sleeping_ai("codex", 0.4, self.finished)
+        self.bridge.gemini.execute = _sleeping_ai("gemini", 0.4, self.finished)
+
+        result = self.bridge._execute_parallel("task", self.sequence, self.context)
+
+        self.assertEqual(sorted(self.finished), ["codex", "gemini"])
+        self.assertEqual([r["ai"] for r in result["timing"]["per_ai"]], ["codex", "gemini"])
+        self.assertAlmostEqual(result["total_execution_time"], 0.8)
+        self.assertLess(result["wall_clock_time"], 0.75)
+
+    def test_quorum_cancels_straggler(self):
+        self.bridge.codex.execute = _sleeping_ai("codex", 0.05, self.finished)
+        self.bridge.gemini.execute = _sleeping_ai("gemini", 10, self.finished)
+
+        start = time.perf_counter()
+        result = self.bridge._execute_parallel("task", self.sequence, self.context, quorum=1)
+
+        self.assertLess(time.perf_counter() - start, 2)
+        self.assertEqual(len(result["ai_responses"]), 1)
+        self.assertEqual(self.context.metadata["cancelled_ais"], ["gemini"])
+        self.assertTrue(self.context.metadata["quorum_reached"])
+
+    def test_failing_ai_becomes_error_response(self):
+        def broken(task, role, context, timeout=30.0, cancel_event=None):
+            raise RuntimeError("boom")
+
+        self.bridge.codex.execute = broken
+        self.bridge.gemini.execute = _sleeping_ai("gemini", 0.01, self.finished)
+
+        result = self.bridge._execute_parallel("task", self.sequence, self.context)
+
+        self.assertEqual(len(result["ai_responses"]), 2)
+        self.assertEqual(result["ai_responses"][0]["metadata"]["error"], "boom")
+
+
+class TestRunCommand(unittest.TestCase):
+    SLEEP = [sys.executable, "-c", "import time; time.sleep(10)"]
+
+    def test_output_is_captured(self):
+        result = _run_command([sys.executable, "-c", "print('hi')"], timeout=10)
+        self.assertEqual(result.returncode, 0)
+        self.assertEqual(result.stdout.strip(), "hi")
+
+    def test_timeout_kills_process(self):
+        start = time.perf_counter()
+        with self.assertRaises(subprocess.TimeoutExpired):
+            _run_command(self.SLEEP, timeout=0.2)
+        self.assertLess(time.perf_counter() - start, 5)
+
+    def test_cancel_event_kills_process(self):
+        cancel = threading.Event()
+        threading.Timer(0.2, cancel.set).start()
+        start = time.perf_counter()
+        with self.assertRaises(CommandCancelled):
+            _run_command(self.SLEEP, timeout=10, cancel_event=cancel)
+        self.assertLess(time.perf_counter() - start, 5)
+
+
 if __name__ == "__main__":
     unittest.main()